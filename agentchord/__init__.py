@@ -14,46 +14,68 @@ For more examples, see https://github.com/agentchord/agentchord
 
 __version__ = "0.2.0"
 
-# Core exports
-from agentchord.core.agent import Agent
-from agentchord.core.config import AgentConfig, CostConfig, RetryConfig
-from agentchord.core.types import (
-    AgentResult,
-    LLMResponse,
-    Message,
-    MessageRole,
-    ToolCall,
-    Usage,
-)
-from agentchord.core.state import WorkflowState, WorkflowResult, WorkflowStatus
-from agentchord.core.workflow import Workflow
-from agentchord.core.executor import MergeStrategy
-
-# Error exports
-from agentchord.errors.exceptions import (
-    AgentError,
-    AgentExecutionError,
-    AgentTimeoutError,
-    AgentChordError,
-    APIError,
-    AuthenticationError,
-    ConfigurationError,
-    CostLimitExceededError,
-    InvalidConfigError,
-    LLMError,
-    MissingAPIKeyError,
-    ModelNotFoundError,
-    RateLimitError,
-    TimeoutError,
-    WorkflowError,
-    WorkflowExecutionError,
-    InvalidFlowError,
-    AgentNotFoundInFlowError,
-    EmptyWorkflowError,
-)
-
-# LLM Provider exports
-from agentchord.llm.base import BaseLLMProvider
+# Public names are loaded on first access (see __getattr__ below), so
+# ``import agentchord`` stays cheap for CLI and serverless entry points.
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agentchord.core.agent import Agent
+    from agentchord.core.config import AgentConfig, CostConfig, RetryConfig
+    from agentchord.core.types import (
+        AgentResult,
+        LLMResponse,
+        Message,
+        MessageRole,
+        ToolCall,
+        Usage,
+    )
+    from agentchord.core.state import WorkflowState, WorkflowResult, WorkflowStatus
+    from agentchord.core.workflow import Workflow
+    from agentchord.core.executor import MergeStrategy
+    from agentchord.errors.exceptions import (
+        AgentError,
+        AgentExecutionError,
+        AgentTimeoutError,
+        AgentChordError,
+        APIError,
+        AuthenticationError,
+        ConfigurationError,
+        CostLimitExceededError,
+        InvalidConfigError,
+        LLMError,
+        MissingAPIKeyError,
+        ModelNotFoundError,
+        RateLimitError,
+        TimeoutError,
+        WorkflowError,
+        WorkflowExecutionError,
+        InvalidFlowError,
+        AgentNotFoundInFlowError,
+        EmptyWorkflowError,
+    )
+    from agentchord.llm.base import BaseLLMProvider
+
+_ERRORS = frozenset({
+    "AgentError",
+    "AgentExecutionError",
+    "AgentTimeoutError",
+    "AgentChordError",
+    "APIError",
+    "AuthenticationError",
+    "ConfigurationError",
+    "CostLimitExceededError",
+    "InvalidConfigError",
+    "LLMError",
+    "MissingAPIKeyError",
+    "ModelNotFoundError",
+    "RateLimitError",
+    "TimeoutError",
+    "WorkflowError",
+    "WorkflowExecutionError",
+    "InvalidFlowError",
+    "AgentNotFoundInFlowError",
+    "EmptyWorkflowError",
+})
 
 __all__ = [
     # Version
@@ -114,9 +136,68 @@ __all__ = [
 
 
 def __getattr__(name: str):
-    """Lazy import for optional components."""
+    """Lazy import for public components."""
+    # Core
+    if name == "Agent":
+        from agentchord.core.agent import Agent
+        return Agent
+    elif name == "AgentConfig":
+        from agentchord.core.config import AgentConfig
+        return AgentConfig
+    elif name == "CostConfig":
+        from agentchord.core.config import CostConfig
+        return CostConfig
+    elif name == "RetryConfig":
+        from agentchord.core.config import RetryConfig
+        return RetryConfig
+
+    # Types
+    elif name == "AgentResult":
+        from agentchord.core.types import AgentResult
+        return AgentResult
+    elif name == "LLMResponse":
+        from agentchord.core.types import LLMResponse
+        return LLMResponse
+    elif name == "Message":
+        from agentchord.core.types import Message
+        return Message
+    elif name == "MessageRole":
+        from agentchord.core.types import MessageRole
+        return MessageRole
+    elif name == "ToolCall":
+        from agentchord.core.types import ToolCall
+        return ToolCall
+    elif name == "Usage":
+        from agentchord.core.types import Usage
+        return Usage
+
+    # Workflow
+    elif name == "Workflow":
+        from agentchord.core.workflow import Workflow
+        return Workflow
+    elif name == "WorkflowState":
+        from agentchord.core.state import WorkflowState
+        return WorkflowState
+    elif name == "WorkflowResult":
+        from agentchord.core.state import WorkflowResult
+        return WorkflowResult
+    elif name == "WorkflowStatus":
+        from agentchord.core.state import WorkflowStatus
+        return WorkflowStatus
+    elif name == "MergeStrategy":
+        from agentchord.core.executor import MergeStrategy
+        return MergeStrategy
+
+    # Errors
+    elif name in _ERRORS:
+        from agentchord.errors import exceptions
+        return getattr(exceptions, name)
+
     # LLM Providers
-    if name == "OpenAIProvider":
+    elif name == "BaseLLMProvider":
+        from agentchord.llm.base import BaseLLMProvider
+        return BaseLLMProvider
+    elif name == "OpenAIProvider":
         from agentchord.llm.openai import OpenAIProvider
         return OpenAIProvider
     elif name == "AnthropicProvider":
@@ -134,6 +215,18 @@ def __getattr__(name: str):
     elif name == "get_registry":
         from agentchord.llm.registry import get_registry
         return get_registry
+    elif name == "CachedProvider":
+        from agentchord.llm.cache import CachedProvider
+        return CachedProvider
+    elif name == "ResponseCache":
+        from agentchord.llm.cache import ResponseCache
+        return ResponseCache
+    elif name == "RoutedProvider":
+        from agentchord.llm.router import RoutedProvider
+        return RoutedProvider
+    elif name == "CascadeProvider":
+        from agentchord.llm.cascade import CascadeProvider
+        return CascadeProvider
 
     # MCP (requires mcp package)
     elif name == "MCPClient":
@@ -192,6 +285,12 @@ def __getattr__(name: str):
     elif name == "ResilienceConfig":
         from agentchord.resilience import ResilienceConfig
         return ResilienceConfig
+    elif name == "AdaptiveConcurrencyLimiter":
+        from agentchord.resilience import AdaptiveConcurrencyLimiter
+        return AdaptiveConcurrencyLimiter
+    elif name == "HedgePolicy":
+        from agentchord.resilience import HedgePolicy
+        return HedgePolicy
 
     # Tools
     elif name == "Tool":
@@ -219,12 +318,28 @@ def __getattr__(name: str):
     elif name == "StreamChunk":
         from agentchord.core.types import StreamChunk
         return StreamChunk
+    elif name == "FastStreamChunk":
+        from agentchord.core.streaming import FastStreamChunk
+        return FastStreamChunk
+    elif name == "coalesce_chunks":
+        from agentchord.core.streaming import coalesce_chunks
+        return coalesce_chunks
+
+    # Transcript retention
+    elif name == "TranscriptPolicy":
+        from agentchord.core.transcript import TranscriptPolicy
+        return TranscriptPolicy
 
     # Structured Output
     elif name == "OutputSchema":
         from agentchord.core.structured import OutputSchema
         return OutputSchema
 
+    # Context
+    elif name == "ContextBuilder":
+        from agentchord.core.context import ContextBuilder
+        return ContextBuilder
+
     # Memory Stores (persistent backends)
     elif name == "MemoryStore":
         from agentchord.memory.stores import MemoryStore
@@ -285,3 +400,7 @@ def __getattr__(name: str):
         return BM25Search
 
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
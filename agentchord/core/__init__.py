@@ -1,24 +1,43 @@
 """AgentChord core components."""
 
-from agentchord.core.types import (
-    Message,
-    MessageRole,
-    ToolCall,
-    Usage,
-    LLMResponse,
-    AgentResult,
-)
-from agentchord.core.config import AgentConfig
-from agentchord.core.state import WorkflowState, WorkflowResult, WorkflowStatus
-from agentchord.core.workflow import Workflow
-from agentchord.core.executor import (
-    BaseExecutor,
-    SequentialExecutor,
-    ParallelExecutor,
-    CompositeExecutor,
-    MergeStrategy,
-)
-from agentchord.core.structured import OutputSchema
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agentchord.core.types import (
+        Message,
+        MessageRole,
+        ToolCall,
+        Usage,
+        LLMResponse,
+        AgentResult,
+    )
+    from agentchord.core.config import AgentConfig
+    from agentchord.core.context import ContextBuilder, ContextReport
+    from agentchord.core.conversation import Conversation
+    from agentchord.core.state import History, WorkflowState, WorkflowResult, WorkflowStatus
+    from agentchord.core.workflow import Workflow
+    from agentchord.core.executor import (
+        BaseExecutor,
+        SequentialExecutor,
+        ParallelExecutor,
+        CompositeExecutor,
+        DAGExecutor,
+        MergeStrategy,
+    )
+    from agentchord.core.structured import OutputSchema
+    from agentchord.core.batch import BatchProgress, BatchResult
+    from agentchord.core.streaming import (
+        FastStreamChunk,
+        coalesce_chunks,
+        to_stream_chunk,
+        validate_chunks,
+    )
+    from agentchord.core.transcript import (
+        FileTranscriptSpool,
+        SQLiteTranscriptSpool,
+        TranscriptPolicy,
+        TranscriptSpool,
+    )
 
 __all__ = [
     "Message",
@@ -28,6 +47,10 @@ __all__ = [
     "LLMResponse",
     "AgentResult",
     "AgentConfig",
+    "ContextBuilder",
+    "ContextReport",
+    "Conversation",
+    "History",
     "WorkflowState",
     "WorkflowResult",
     "WorkflowStatus",
@@ -36,6 +59,67 @@ __all__ = [
     "SequentialExecutor",
     "ParallelExecutor",
     "CompositeExecutor",
+    "DAGExecutor",
     "MergeStrategy",
     "OutputSchema",
+    "BatchProgress",
+    "BatchResult",
+    "FastStreamChunk",
+    "coalesce_chunks",
+    "to_stream_chunk",
+    "validate_chunks",
+    "TranscriptPolicy",
+    "TranscriptSpool",
+    "FileTranscriptSpool",
+    "SQLiteTranscriptSpool",
 ]
+
+# Submodule of each public name, imported on first access so that
+# importing one core module doesn't load the rest
+_EXPORTS = {
+    "Message": "types",
+    "MessageRole": "types",
+    "ToolCall": "types",
+    "Usage": "types",
+    "LLMResponse": "types",
+    "AgentResult": "types",
+    "AgentConfig": "config",
+    "ContextBuilder": "context",
+    "ContextReport": "context",
+    "Conversation": "conversation",
+    "History": "state",
+    "WorkflowState": "state",
+    "WorkflowResult": "state",
+    "WorkflowStatus": "state",
+    "Workflow": "workflow",
+    "BaseExecutor": "executor",
+    "SequentialExecutor": "executor",
+    "ParallelExecutor": "executor",
+    "CompositeExecutor": "executor",
+    "DAGExecutor": "executor",
+    "MergeStrategy": "executor",
+    "OutputSchema": "structured",
+    "BatchProgress": "batch",
+    "BatchResult": "batch",
+    "FastStreamChunk": "streaming",
+    "coalesce_chunks": "streaming",
+    "to_stream_chunk": "streaming",
+    "validate_chunks": "streaming",
+    "TranscriptPolicy": "transcript",
+    "TranscriptSpool": "transcript",
+    "FileTranscriptSpool": "transcript",
+    "SQLiteTranscriptSpool": "transcript",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import for core components."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
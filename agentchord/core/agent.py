@@ -9,9 +9,13 @@ from __future__ import annotations
 import asyncio
 import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, TYPE_CHECKING
 
 from agentchord.core.config import AgentConfig
+from agentchord.core.context import ContextBuilder, ContextWindow
+from agentchord.core.conversation import Conversation
+from agentchord.core.streaming import AnyStreamChunk, to_stream_chunk
 from agentchord.core.types import (
     AgentResult,
     LLMResponse,
@@ -24,18 +28,49 @@ from agentchord.core.types import (
 from agentchord.errors.exceptions import AgentExecutionError, ModelNotFoundError
 from agentchord.llm.base import BaseLLMProvider
 from agentchord.llm.registry import get_registry
+from agentchord.llm.tool_format import request_for_provider
+from agentchord.utils.http import get_http_client_manager
 
 if TYPE_CHECKING:
+    from agentchord.core.batch import BatchResult, ProgressCallback
     from agentchord.core.structured import OutputSchema
+    from agentchord.core.transcript import TranscriptPolicy
+    from agentchord.llm.cache import ResponseCache
     from agentchord.memory.base import BaseMemory
     from agentchord.protocols.mcp.client import MCPClient
     from agentchord.tracking.cost import CostTracker
     from agentchord.tracking.callbacks import CallbackManager
     from agentchord.resilience.config import ResilienceConfig
+    from agentchord.resilience.hedge import HedgePolicy
     from agentchord.tools.base import Tool
     from agentchord.tools.executor import ToolExecutor
 
 
+async def _aclose(stream: AsyncIterator[Any]) -> None:
+    """Close an async generator; plain async iterators have nothing to close."""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+@dataclass
+class _HedgeLedger:
+    """Spend on hedged requests during one run.
+
+    ``served`` holds winning responses from the hedge provider; they are
+    tracked and priced at that provider's rates, not the agent's. Winners
+    served from a response cache are left out and counted as cache hits.
+    """
+
+    hedges: int = 0
+    cost: float = 0.0
+    served: list[LLMResponse] = field(default_factory=list)
+
+    def billed(self, response: LLMResponse) -> bool:
+        """Whether ``response`` was already tracked and priced here."""
+        return any(r is response for r in self.served)
+
+
 class Agent:
     """An AI Agent that can process inputs and generate responses.
 
@@ -75,6 +110,10 @@ class Agent:
         tools: "list[Tool] | None" = None,
         callbacks: "CallbackManager | None" = None,
         mcp_client: "MCPClient | None" = None,
+        max_concurrent_tools: int | None = None,
+        cache: "ResponseCache | None" = None,
+        context: ContextBuilder | None = None,
+        transcript: "TranscriptPolicy | None" = None,
     ) -> None:
         """Initialize an Agent.
 
@@ -93,7 +132,22 @@ class Agent:
             tools: List of tools the agent can use.
             callbacks: Callback manager for event notifications.
             mcp_client: MCP client for external tool integration.
+            max_concurrent_tools: Maximum tool calls from one LLM response
+                executed at the same time. None means no limit; 1 runs
+                them sequentially.
+            cache: Response cache. If set, the provider is wrapped in a
+                ``CachedProvider`` so repeated deterministic requests
+                (temperature 0) are served without an API call.
+            context: Builds the prompt from the system prompt, memory and
+                input within a token budget. Defaults to a
+                ``ContextBuilder`` budgeted to the model's context window.
+            transcript: How much of each run's transcript
+                ``AgentResult.messages`` keeps, and where the rest is
+                spooled. None keeps every message.
         """
+        if max_concurrent_tools is not None and max_concurrent_tools < 1:
+            raise ValueError("max_concurrent_tools must be at least 1")
+
         self.name = name
         self.role = role
         self.model = model
@@ -105,6 +159,9 @@ class Agent:
         )
         self._system_prompt = system_prompt
         self._provider = llm_provider or get_registry().create_provider(model)
+        if cache is not None:
+            from agentchord.llm.cache import CachedProvider
+            self._provider = CachedProvider(self._provider, cache)
 
         # Integration components
         self._memory = memory
@@ -112,9 +169,13 @@ class Agent:
         self._resilience = resilience
         self._callbacks = callbacks
         self._mcp_client = mcp_client
+        self._max_concurrent_tools = max_concurrent_tools
+        self._context = context or ContextBuilder()
+        self._transcript = transcript
 
         # Lifecycle
         self._closed = False
+        self._http_acquired = False
 
         # Tool executor
         self._tool_executor: "ToolExecutor | None" = None
@@ -183,21 +244,39 @@ Guidelines:
 - Ask for clarification if needed
 - Provide actionable responses when possible"""
 
-    def _build_messages(self, input: str) -> list[Message]:
-        """Build message list including memory context."""
-        messages = [
-            Message(role=MessageRole.SYSTEM, content=self.system_prompt),
-        ]
+    def _build_messages(self, input: str) -> Conversation:
+        """Build message list including memory context.
 
-        # Add memory context if available
-        if self._memory is not None:
-            recent = self._memory.get_recent(limit=10)
-            for entry in recent:
-                role = MessageRole.USER if entry.role == "user" else MessageRole.ASSISTANT
-                messages.append(Message(role=role, content=entry.content))
+        Returns a ``Conversation`` so providers convert each message to
+        their wire format once, not again on every tool round.
+        """
+        return self._build_context(input, tools=self._tool_schemas()).messages
 
-        messages.append(Message(role=MessageRole.USER, content=input))
-        return messages
+    def _build_context(
+        self,
+        input: str,
+        *,
+        system_prompt: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> ContextWindow:
+        """Build the prompt within the context builder's token budget."""
+        return self._context.build(
+            system_prompt=system_prompt if system_prompt is not None else self.system_prompt,
+            input=input,
+            memory=self._memory,
+            tools=tools,
+            model=self.model,
+            max_output_tokens=self.config.max_tokens,
+        )
+
+    def _tool_schemas(self) -> list[dict[str, Any]] | None:
+        """Tool definitions in the provider's format, or None without tools."""
+        if not self._tool_executor:
+            return None
+        if self._provider.provider_name == "anthropic":
+            return self._tool_executor.to_anthropic_tools()
+        # OpenAI, Gemini, Ollama, and other OpenAI-compatible providers
+        return self._tool_executor.to_openai_tools()
 
     async def _emit_callback(self, event: str, **kwargs: Any) -> None:
         """Emit callback event if callbacks are configured."""
@@ -215,6 +294,8 @@ Guidelines:
     async def _execute_llm(
         self,
         messages: list[Message],
+        *,
+        ledger: _HedgeLedger | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
         """Execute LLM call with optional resilience."""
@@ -227,9 +308,255 @@ Guidelines:
             )
 
         if self._resilience:
+            policy = self._resilience.get_hedge_policy()
+            if policy is not None:
+                return await self._execute_hedged(
+                    policy, messages, ledger or _HedgeLedger(), kwargs
+                )
             return await self._resilience.execute(_call, model=self.model)
         return await _call()
 
+    async def _stream_llm(
+        self, messages: list[Message], **kwargs: Any
+    ) -> AsyncIterator[AnyStreamChunk]:
+        """Stream one LLM call with optional resilience.
+
+        Opening the stream and waiting for its first chunk run through the
+        resilience layers (timeout, circuit breaker, retry, concurrency
+        limit), so a call that fails before producing output is retried.
+        A stream that fails after chunks were yielded is not retried.
+        Hedging does not apply to streams.
+        """
+        def _open() -> AsyncIterator[AnyStreamChunk]:
+            return self._provider.stream_chunks(
+                messages=messages,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                **kwargs,
+            )
+
+        if not self._resilience:
+            async for chunk in _open():
+                yield chunk
+            return
+
+        async def _first() -> tuple[AsyncIterator[AnyStreamChunk], AnyStreamChunk | None]:
+            stream = _open()
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, None
+            except BaseException:
+                await _aclose(stream)
+                raise
+
+        stream, first = await self._resilience.execute(_first, model=self.model)
+        try:
+            if first is None:
+                return
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await _aclose(stream)
+
+    async def _execute_hedged(
+        self,
+        policy: "HedgePolicy",
+        messages: list[Message],
+        ledger: _HedgeLedger,
+        kwargs: dict[str, Any],
+    ) -> LLMResponse:
+        """Execute LLM call with a hedged backup request.
+
+        Both calls are paid for, so the losing call is recorded in the cost
+        tracker and ``ledger``: with its usage if it finished, otherwise
+        with an estimate of its prompt tokens (cancelled requests still
+        bill their input).
+        """
+        assert self._resilience is not None
+        backup = policy.provider or self._provider
+        responses: dict[str, LLMResponse] = {}
+        hedged = False
+
+        async def _call(provider: BaseLLMProvider, leg: str) -> LLMResponse:
+            # The backup may be a different provider than the one the
+            # request was built for
+            call_messages, call_kwargs = request_for_provider(provider, messages, kwargs)
+            response = await provider.complete(
+                messages=call_messages,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                **call_kwargs,
+            )
+            responses[leg] = response
+            return response
+
+        async def _primary() -> LLMResponse:
+            return await _call(self._provider, "primary")
+
+        async def _hedge() -> LLMResponse:
+            nonlocal hedged
+            hedged = True
+            return await _call(backup, "hedge")
+
+        response = await self._resilience.execute(
+            _primary, model=self.model, hedge=_hedge
+        )
+        if not hedged:
+            return response
+
+        ledger.hedges += 1
+        if response is responses.get("hedge"):
+            loser, loser_leg = self._provider, "primary"
+            # A cached answer is counted once, as the run's cache hit
+            if backup is not self._provider and not response.cache_hit:
+                ledger.served.append(response)
+                self._track_hedge_usage(backup, response, messages, ledger, "won")
+        else:
+            loser, loser_leg = backup, "hedge"
+        self._track_hedge_usage(
+            loser, responses.get(loser_leg), messages, ledger, "lost"
+        )
+        return response
+
+    def _track_hedge_usage(
+        self,
+        provider: BaseLLMProvider,
+        response: LLMResponse | None,
+        messages: list[Message],
+        ledger: _HedgeLedger,
+        outcome: str,
+    ) -> None:
+        """Price one hedge call into ``ledger`` and the cost tracker."""
+        from agentchord.tracking.models import CostEntry, TokenUsage
+
+        if response is not None:
+            usage = TokenUsage(
+                prompt_tokens=response.usage.prompt_tokens,
+                completion_tokens=response.usage.completion_tokens,
+                cache_read_tokens=response.usage.cache_read_tokens,
+                cache_write_tokens=response.usage.cache_write_tokens,
+            )
+            cache_hit = response.cache_hit
+        else:
+            from agentchord.utils.tokens import estimate_message_tokens
+            usage = TokenUsage(
+                prompt_tokens=sum(
+                    estimate_message_tokens(m, provider.model) for m in messages
+                ),
+                completion_tokens=0,
+            )
+            cache_hit = False
+
+        if response is not None:
+            cost = provider.response_cost(response)
+        else:
+            cost = provider.calculate_cost(usage.prompt_tokens, usage.completion_tokens)
+        ledger.cost += cost
+        if self._cost_tracker and response is not None and response.cost is not None:
+            # Priced by the provider, e.g. at the routed model's rates
+            self._cost_tracker.track(CostEntry(
+                model=response.model,
+                usage=usage,
+                cost_usd=cost,
+                agent_name=self.name,
+                cache_hit=cache_hit,
+                metadata={"hedge": outcome, "estimated": False},
+            ))
+        elif self._cost_tracker:
+            self._cost_tracker.track_usage(
+                model=provider.model,
+                usage=usage,
+                agent_name=self.name,
+                cache_hit=cache_hit,
+                hedge=outcome,
+                estimated=response is None,
+            )
+
+    def _tool_runner(self) -> Callable[[ToolCall], Awaitable[Message]]:
+        """Create the per-call tool runner for one round.
+
+        Calls made through the returned runner share one round's
+        ``max_concurrent_tools`` bound; each tool's own ``max_concurrency``
+        is enforced by the executor. ``tool_start``/``tool_end`` callbacks
+        fire per call as it starts and finishes.
+        """
+        executor = self._tool_executor
+        assert executor is not None
+
+        semaphore = (
+            asyncio.Semaphore(self._max_concurrent_tools)
+            if self._max_concurrent_tools is not None
+            else None
+        )
+
+        async def _run_one(tc: ToolCall) -> Message:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                await self._emit_callback(
+                    "tool_start", tool_name=tc.name, arguments=tc.arguments
+                )
+                tool_result = await executor.execute(
+                    tc.name, tool_call_id=tc.id, **tc.arguments
+                )
+                await self._emit_callback(
+                    "tool_end",
+                    tool_name=tc.name,
+                    result=tool_result.result if tool_result.success else tool_result.error,
+                    success=tool_result.success,
+                )
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+            result_content = (
+                str(tool_result.result) if tool_result.success
+                else f"Error: {tool_result.error}"
+            )
+            return Message(
+                role=MessageRole.TOOL,
+                content=result_content,
+                tool_call_id=tc.id,
+            )
+
+        return _run_one
+
+    async def _execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[Message]:
+        """Execute one round of tool calls concurrently.
+
+        Calls run concurrently, bounded by ``max_concurrent_tools`` and by
+        each tool's own ``max_concurrency``, while the returned TOOL
+        messages keep the original ``tool_calls`` order.
+
+        Args:
+            tool_calls: Tool calls requested by the LLM in this round.
+
+        Returns:
+            One TOOL message per call, in request order.
+        """
+        run_one = self._tool_runner()
+        if len(tool_calls) == 1:
+            return [await run_one(tool_calls[0])]
+        return list(await asyncio.gather(*(run_one(tc) for tc in tool_calls)))
+
+    def _track_stream_usage(self, chunk: AnyStreamChunk) -> None:
+        """Record usage reported by a stream chunk in the cost tracker."""
+        if chunk.usage and self._cost_tracker:
+            from agentchord.tracking.models import TokenUsage
+            self._cost_tracker.track_usage(
+                model=self.model,
+                usage=TokenUsage(
+                    prompt_tokens=chunk.usage.prompt_tokens,
+                    completion_tokens=chunk.usage.completion_tokens,
+                    cache_read_tokens=chunk.usage.cache_read_tokens,
+                    cache_write_tokens=chunk.usage.cache_write_tokens,
+                ),
+                agent_name=self.name,
+                cache_hit=chunk.cache_hit,
+            )
+
     async def run(
         self, input: str, *, max_tool_rounds: int = 10, output_schema: "OutputSchema | None" = None, **kwargs: Any
     ) -> AgentResult:
@@ -248,10 +575,11 @@ Guidelines:
             AgentExecutionError: If execution fails.
         """
         start_time = time.perf_counter()
+        self._acquire_http()
 
         await self._emit_callback("agent_start", input=input)
 
-        messages = self._build_messages(input)
+        system_prompt = self.system_prompt
 
         # Handle structured output
         if output_schema is not None:
@@ -260,27 +588,29 @@ Guidelines:
                 kwargs["response_format"] = output_schema.to_openai_response_format()
             else:
                 # For non-OpenAI providers, inject schema into system prompt
-                instruction = output_schema.to_system_prompt_instruction()
-                if messages and messages[0].role == MessageRole.SYSTEM:
-                    messages[0] = Message(
-                        role=MessageRole.SYSTEM,
-                        content=messages[0].content + instruction,
-                    )
+                system_prompt += output_schema.to_system_prompt_instruction()
 
         # Add tools if available
-        if self._tool_executor:
-            provider_name = self._provider.provider_name
-            if provider_name == "openai":
-                kwargs["tools"] = self._tool_executor.to_openai_tools()
-            elif provider_name == "anthropic":
-                kwargs["tools"] = self._tool_executor.to_anthropic_tools()
-            else:
-                # Gemini, Ollama, and other OpenAI-compatible providers
-                kwargs["tools"] = self._tool_executor.to_openai_tools()
+        tools = self._tool_schemas()
+        if tools is not None:
+            kwargs["tools"] = tools
+
+        context = self._build_context(input, system_prompt=system_prompt, tools=tools)
+        messages = context.messages
 
         # Accumulate usage across tool-calling rounds
         total_prompt_tokens = 0
         total_completion_tokens = 0
+        cached_prompt_tokens = 0
+        cached_completion_tokens = 0
+        cache_read_tokens = 0
+        cache_write_tokens = 0
+        hedged_prompt_tokens = 0
+        hedged_completion_tokens = 0
+        llm_calls = 0
+        cache_hits = 0
+        ledger = _HedgeLedger()
+        priced: list[LLMResponse] = []
         response: LLMResponse | None = None
         tools_were_used = False
         loop_broke_naturally = False
@@ -288,9 +618,24 @@ Guidelines:
         try:
             for _round in range(max_tool_rounds):
                 await self._emit_callback("llm_start", model=self.model)
-                response = await self._execute_llm(messages, **kwargs)
+                response = await self._execute_llm(messages, ledger=ledger, **kwargs)
                 total_prompt_tokens += response.usage.prompt_tokens
                 total_completion_tokens += response.usage.completion_tokens
+                llm_calls += 1
+                if response.cache_hit:
+                    cache_hits += 1
+                    cached_prompt_tokens += response.usage.prompt_tokens
+                    cached_completion_tokens += response.usage.completion_tokens
+                elif ledger.billed(response):
+                    # Served by the hedge provider and priced at its rates
+                    hedged_prompt_tokens += response.usage.prompt_tokens
+                    hedged_completion_tokens += response.usage.completion_tokens
+                elif response.cost is not None:
+                    # Priced by the provider, e.g. at the routed model's rates
+                    priced.append(response)
+                else:
+                    cache_read_tokens += response.usage.cache_read_tokens
+                    cache_write_tokens += response.usage.cache_write_tokens
                 await self._emit_callback(
                     "llm_end", model=self.model, tokens=response.usage.total_tokens
                 )
@@ -309,38 +654,30 @@ Guidelines:
                     tool_calls=response.tool_calls,
                 ))
 
-                # Execute each tool call
-                for tc in response.tool_calls:
-                    await self._emit_callback(
-                        "tool_start", tool_name=tc.name, arguments=tc.arguments
-                    )
-                    tool_result = await self._tool_executor.execute(
-                        tc.name, tool_call_id=tc.id, **tc.arguments
-                    )
-                    await self._emit_callback(
-                        "tool_end",
-                        tool_name=tc.name,
-                        result=tool_result.result if tool_result.success else tool_result.error,
-                        success=tool_result.success,
-                    )
-
-                    # Append tool result message
-                    result_content = (
-                        str(tool_result.result) if tool_result.success
-                        else f"Error: {tool_result.error}"
-                    )
-                    messages.append(Message(
-                        role=MessageRole.TOOL,
-                        content=result_content,
-                        tool_call_id=tc.id,
-                    ))
+                # Execute the round's tool calls concurrently
+                messages.extend(await self._execute_tool_calls(response.tool_calls))
 
             if response is not None and not response.content and tools_were_used and loop_broke_naturally:
                 synth_kwargs = {k: v for k, v in kwargs.items() if k != "tools"}
                 await self._emit_callback("llm_start", model=self.model)
-                response = await self._execute_llm(messages, **synth_kwargs)
+                response = await self._execute_llm(messages, ledger=ledger, **synth_kwargs)
                 total_prompt_tokens += response.usage.prompt_tokens
                 total_completion_tokens += response.usage.completion_tokens
+                llm_calls += 1
+                if response.cache_hit:
+                    cache_hits += 1
+                    cached_prompt_tokens += response.usage.prompt_tokens
+                    cached_completion_tokens += response.usage.completion_tokens
+                elif ledger.billed(response):
+                    # Served by the hedge provider and priced at its rates
+                    hedged_prompt_tokens += response.usage.prompt_tokens
+                    hedged_completion_tokens += response.usage.completion_tokens
+                elif response.cost is not None:
+                    # Priced by the provider, e.g. at the routed model's rates
+                    priced.append(response)
+                else:
+                    cache_read_tokens += response.usage.cache_read_tokens
+                    cache_write_tokens += response.usage.cache_write_tokens
                 await self._emit_callback(
                     "llm_end", model=self.model, tokens=response.usage.total_tokens
                 )
@@ -364,23 +701,67 @@ Guidelines:
         total_usage = Usage(
             prompt_tokens=total_prompt_tokens,
             completion_tokens=total_completion_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
-        cost = self._provider.calculate_cost(
-            input_tokens=total_prompt_tokens,
-            output_tokens=total_completion_tokens,
+        # Responses served from a response cache cost nothing; hedge
+        # spend was already priced into the ledger, and priced responses
+        # carry their own cost
+        billed_prompt_tokens = (
+            total_prompt_tokens
+            - cached_prompt_tokens
+            - hedged_prompt_tokens
+            - sum(r.usage.prompt_tokens for r in priced)
+        )
+        billed_completion_tokens = (
+            total_completion_tokens
+            - cached_completion_tokens
+            - hedged_completion_tokens
+            - sum(r.usage.completion_tokens for r in priced)
         )
+        cost = self._provider.calculate_cost(
+            input_tokens=billed_prompt_tokens,
+            output_tokens=billed_completion_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+        ) + ledger.cost + sum(r.cost for r in priced)
 
         # Track cost if tracker is configured
         if self._cost_tracker:
-            from agentchord.tracking.models import TokenUsage
-            self._cost_tracker.track_usage(
-                model=self.model,
-                usage=TokenUsage(
-                    prompt_tokens=total_prompt_tokens,
-                    completion_tokens=total_completion_tokens,
-                ),
-                agent_name=self.name,
-            )
+            from agentchord.tracking.models import CostEntry, TokenUsage
+            for priced_response in priced:
+                self._cost_tracker.track(CostEntry(
+                    model=priced_response.model,
+                    usage=TokenUsage(
+                        prompt_tokens=priced_response.usage.prompt_tokens,
+                        completion_tokens=priced_response.usage.completion_tokens,
+                        cache_read_tokens=priced_response.usage.cache_read_tokens,
+                        cache_write_tokens=priced_response.usage.cache_write_tokens,
+                    ),
+                    cost_usd=priced_response.cost,
+                    agent_name=self.name,
+                ))
+            if llm_calls > cache_hits + len(ledger.served) + len(priced):
+                self._cost_tracker.track_usage(
+                    model=self.model,
+                    usage=TokenUsage(
+                        prompt_tokens=billed_prompt_tokens,
+                        completion_tokens=billed_completion_tokens,
+                        cache_read_tokens=cache_read_tokens,
+                        cache_write_tokens=cache_write_tokens,
+                    ),
+                    agent_name=self.name,
+                )
+            if cache_hits:
+                self._cost_tracker.track_usage(
+                    model=self.model,
+                    usage=TokenUsage(
+                        prompt_tokens=cached_prompt_tokens,
+                        completion_tokens=cached_completion_tokens,
+                    ),
+                    agent_name=self.name,
+                    cache_hit=True,
+                )
 
         # Save to memory if configured
         if self._memory is not None:
@@ -412,6 +793,13 @@ Guidelines:
                 "provider": self._provider.provider_name,
                 "tool_rounds": _round + 1,
                 "output_schema": output_schema.model_class.__name__ if output_schema else None,
+                "cache_hits": cache_hits,
+                "cached_tokens": cached_prompt_tokens + cached_completion_tokens,
+                "cache_read_tokens": cache_read_tokens,
+                "cache_write_tokens": cache_write_tokens,
+                "hedged_requests": ledger.hedges,
+                "hedge_cost": ledger.cost,
+                "context": context.report.to_dict(),
             },
         )
 
@@ -422,6 +810,8 @@ Guidelines:
             cost=cost,
         )
 
+        if self._transcript is not None:
+            result = await self._transcript.apply(result)
         return result
 
     async def stream(
@@ -429,10 +819,12 @@ Guidelines:
     ) -> AsyncIterator[StreamChunk]:
         """Stream the agent's response with tool calling support.
 
-        If tools are available and the LLM requests tool calls,
-        tools are executed between streaming rounds. Non-streaming
-        LLM calls are used for tool-calling rounds, with the final
-        text response streamed.
+        If the provider streams tool calls (``supports_streaming_tool_calls``),
+        every round is streamed: text is yielded token by token, chunks
+        carrying completed ``tool_calls`` are passed through, and each tool
+        starts running as soon as its own call is complete. Other providers
+        use non-streaming ``complete()`` calls for tool-calling rounds and
+        yield the final text response as one chunk.
 
         Args:
             input: User input to process.
@@ -440,32 +832,73 @@ Guidelines:
             **kwargs: Additional parameters passed to the LLM.
 
         Yields:
-            StreamChunk with incremental content.
+            StreamChunk with incremental content. Provider chunks are read
+            unvalidated and validated only here.
         """
+        self._acquire_http()
         await self._emit_callback("agent_start", input=input)
-        messages = self._build_messages(input)
 
         # Add tools if available
-        if self._tool_executor:
-            provider_name = self._provider.provider_name
-            if provider_name == "openai":
-                kwargs["tools"] = self._tool_executor.to_openai_tools()
-            elif provider_name == "anthropic":
-                kwargs["tools"] = self._tool_executor.to_anthropic_tools()
-            else:
-                # Gemini, Ollama, and other OpenAI-compatible providers
-                kwargs["tools"] = self._tool_executor.to_openai_tools()
+        tools = self._tool_schemas()
+        if tools is not None:
+            kwargs["tools"] = tools
+
+        messages = self._build_context(input, tools=tools).messages
 
         tools_were_used = False
-        loop_broke_naturally = False
+        ledger = _HedgeLedger()
+        streaming_tools = (
+            self._tool_executor is not None
+            and self._provider.supports_streaming_tool_calls
+        )
 
         try:
-            # Handle tool calling rounds using non-streaming complete()
             for _round in range(max_tool_rounds):
-                # First try non-streaming to check for tool calls
+                if streaming_tools:
+                    run_one = self._tool_runner()
+                    tool_calls: list[ToolCall] = []
+                    tool_tasks: list[asyncio.Task[Message]] = []
+                    content = ""
+
+                    await self._emit_callback("llm_start", model=self.model)
+                    try:
+                        async for chunk in self._stream_llm(messages, **kwargs):
+                            # Start each tool as soon as its call is complete
+                            for tc in chunk.tool_calls or ():
+                                tool_calls.append(tc)
+                                tool_tasks.append(asyncio.create_task(run_one(tc)))
+                            content = chunk.content
+                            self._track_stream_usage(chunk)
+                            yield to_stream_chunk(chunk)
+                        tool_messages = list(await asyncio.gather(*tool_tasks))
+                    except BaseException:
+                        # Stream failed or the consumer stopped early
+                        for task in tool_tasks:
+                            task.cancel()
+                        if tool_tasks:
+                            await asyncio.gather(*tool_tasks, return_exceptions=True)
+                        raise
+                    await self._emit_callback("llm_end", model=self.model)
+
+                    if tool_calls:
+                        tools_were_used = True
+                        messages.append(Message(
+                            role=MessageRole.ASSISTANT,
+                            content=content,
+                            tool_calls=tool_calls,
+                        ))
+                        messages.extend(tool_messages)
+                        continue
+
+                    if not content and tools_were_used:
+                        async for chunk in self._stream_synthesis(messages, kwargs):
+                            yield to_stream_chunk(chunk)
+                    break
+
+                # Handle tool calling rounds using non-streaming complete()
                 if self._tool_executor:
                     await self._emit_callback("llm_start", model=self.model)
-                    response = await self._execute_llm(messages, **kwargs)
+                    response = await self._execute_llm(messages, ledger=ledger, **kwargs)
                     await self._emit_callback(
                         "llm_end", model=self.model, tokens=response.usage.total_tokens
                     )
@@ -478,53 +911,14 @@ Guidelines:
                             content=response.content,
                             tool_calls=response.tool_calls,
                         ))
-                        for tc in response.tool_calls:
-                            await self._emit_callback(
-                                "tool_start", tool_name=tc.name, arguments=tc.arguments
-                            )
-                            tool_result = await self._tool_executor.execute(
-                                tc.name, tool_call_id=tc.id, **tc.arguments
-                            )
-                            await self._emit_callback(
-                                "tool_end",
-                                tool_name=tc.name,
-                                result=tool_result.result if tool_result.success else tool_result.error,
-                                success=tool_result.success,
-                            )
-                            result_content = (
-                                str(tool_result.result) if tool_result.success
-                                else f"Error: {tool_result.error}"
-                            )
-                            messages.append(Message(
-                                role=MessageRole.TOOL,
-                                content=result_content,
-                                tool_call_id=tc.id,
-                            ))
+                        messages.extend(
+                            await self._execute_tool_calls(response.tool_calls)
+                        )
                         continue
 
-                    loop_broke_naturally = True
-
-                    if not response.content and tools_were_used and loop_broke_naturally:
-                        synth_kwargs = {k: v for k, v in kwargs.items() if k != "tools"}
-                        await self._emit_callback("llm_start", model=self.model)
-                        async for chunk in self._provider.stream(
-                            messages=messages,
-                            temperature=self.config.temperature,
-                            max_tokens=self.config.max_tokens,
-                            **synth_kwargs,
-                        ):
-                            yield chunk
-                            if chunk.usage and self._cost_tracker:
-                                from agentchord.tracking.models import TokenUsage
-                                self._cost_tracker.track_usage(
-                                    model=self.model,
-                                    usage=TokenUsage(
-                                        prompt_tokens=chunk.usage.prompt_tokens,
-                                        completion_tokens=chunk.usage.completion_tokens,
-                                    ),
-                                    agent_name=self.name,
-                                )
-                        await self._emit_callback("llm_end", model=self.model)
+                    if not response.content and tools_were_used:
+                        async for chunk in self._stream_synthesis(messages, kwargs):
+                            yield to_stream_chunk(chunk)
                         break
 
                     yield StreamChunk(
@@ -532,39 +926,37 @@ Guidelines:
                         delta=response.content,
                         finish_reason=response.finish_reason,
                         usage=response.usage,
+                        cache_hit=response.cache_hit,
                     )
 
-                    if self._cost_tracker:
-                        from agentchord.tracking.models import TokenUsage
-                        self._cost_tracker.track_usage(
-                            model=self.model,
-                            usage=TokenUsage(
-                                prompt_tokens=response.usage.prompt_tokens,
-                                completion_tokens=response.usage.completion_tokens,
-                            ),
-                            agent_name=self.name,
+                    if self._cost_tracker and not ledger.billed(response):
+                        from agentchord.tracking.models import CostEntry, TokenUsage
+                        usage = TokenUsage(
+                            prompt_tokens=response.usage.prompt_tokens,
+                            completion_tokens=response.usage.completion_tokens,
                         )
-                    break
-                else:
-                    # No tools - pure streaming
-                    await self._emit_callback("llm_start", model=self.model)
-                    async for chunk in self._provider.stream(
-                        messages=messages,
-                        temperature=self.config.temperature,
-                        max_tokens=self.config.max_tokens,
-                        **kwargs,
-                    ):
-                        yield chunk
-                        if chunk.usage and self._cost_tracker:
-                            from agentchord.tracking.models import TokenUsage
+                        if response.cost is not None and not response.cache_hit:
+                            # Priced by the provider, e.g. at the routed model's rates
+                            self._cost_tracker.track(CostEntry(
+                                model=response.model,
+                                usage=usage,
+                                cost_usd=response.cost,
+                                agent_name=self.name,
+                            ))
+                        else:
                             self._cost_tracker.track_usage(
                                 model=self.model,
-                                usage=TokenUsage(
-                                    prompt_tokens=chunk.usage.prompt_tokens,
-                                    completion_tokens=chunk.usage.completion_tokens,
-                                ),
+                                usage=usage,
                                 agent_name=self.name,
+                                cache_hit=response.cache_hit,
                             )
+                    break
+                else:
+                    # No tools - pure streaming
+                    await self._emit_callback("llm_start", model=self.model)
+                    async for chunk in self._stream_llm(messages, **kwargs):
+                        yield to_stream_chunk(chunk)
+                        self._track_stream_usage(chunk)
                     await self._emit_callback("llm_end", model=self.model)
                     break
 
@@ -577,6 +969,68 @@ Guidelines:
 
         await self._emit_callback("agent_end")
 
+    async def _stream_synthesis(
+        self, messages: list[Message], kwargs: dict[str, Any]
+    ) -> AsyncIterator[AnyStreamChunk]:
+        """Stream a final answer without tools after tool rounds ended silently."""
+        synth_kwargs = {k: v for k, v in kwargs.items() if k != "tools"}
+        await self._emit_callback("llm_start", model=self.model)
+        async for chunk in self._stream_llm(messages, **synth_kwargs):
+            yield chunk
+            self._track_stream_usage(chunk)
+        await self._emit_callback("llm_end", model=self.model)
+
+    def run_many(
+        self,
+        inputs: "Iterable[str] | AsyncIterable[str]",
+        *,
+        concurrency: int = 8,
+        ordered: bool = False,
+        on_progress: "ProgressCallback | None" = None,
+        max_rate_limit_retries: int = 3,
+        **kwargs: Any,
+    ) -> "AsyncIterator[BatchResult[AgentResult]]":
+        """Run the agent over many inputs with bounded concurrency.
+
+        Results are yielded as they finish, so memory use is bounded by
+        ``concurrency`` rather than the number of inputs. Failures are
+        captured per item. Rate limit errors pause the batch and retry the
+        item; once the agent's cost tracker is over budget no new items
+        are started.
+
+        Note:
+            Runs share this agent's memory, tools and cost tracker.
+
+        Example:
+            >>> async for item in agent.run_many(questions, concurrency=16):
+            ...     print(item.index, item.result.output if item.ok else item.error)
+
+        Args:
+            inputs: Inputs to process (iterable or async iterable).
+            concurrency: Maximum runs at the same time.
+            ordered: Yield results in input order instead of completion order.
+            on_progress: Sync or async callback receiving ``BatchProgress``.
+            max_rate_limit_retries: Retries per item after rate limit errors.
+            **kwargs: Parameters passed to each ``run()`` call.
+
+        Returns:
+            Async iterator of ``BatchResult`` objects.
+        """
+        from agentchord.core.batch import run_batch
+
+        async def _run(text: str) -> AgentResult:
+            return await self.run(text, **kwargs)
+
+        return run_batch(
+            _run,
+            inputs,
+            concurrency=concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+            cost_trackers=[self._cost_tracker] if self._cost_tracker else [],
+            max_rate_limit_retries=max_rate_limit_retries,
+        )
+
     def run_sync(self, input: str, **kwargs: Any) -> AgentResult:
         """Synchronous version of run().
 
@@ -593,12 +1047,23 @@ Guidelines:
 
     async def __aenter__(self) -> Agent:
         """Enter async context - load persisted state."""
-        self._closed = False
+        self._acquire_http()
         # Load from memory store if available
         if self._memory is not None and hasattr(self._memory, 'load_from_store'):
             await self._memory.load_from_store()
         return self
 
+    def _acquire_http(self) -> None:
+        """Keep shared HTTP connections alive while the agent is in use.
+
+        Runs on context entry and on every run, so ``close()`` releases the
+        connections even when the agent was never used as a context manager.
+        """
+        self._closed = False
+        if not self._http_acquired:
+            get_http_client_manager().acquire()
+            self._http_acquired = True
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit async context - flush state and cleanup resources."""
         if self._closed:
@@ -619,6 +1084,11 @@ Guidelines:
             except Exception:
                 pass  # Don't mask the original exception
 
+        # Close shared HTTP clients once no agent is using them
+        if self._http_acquired:
+            self._http_acquired = False
+            await get_http_client_manager().release()
+
     @asynccontextmanager
     async def temporary_tools(self, tools: "list[Tool]"):
         """Temporarily add tools to this agent, restoring original state on exit.
@@ -0,0 +1,240 @@
+"""Batch execution with bounded concurrency.
+
+Backs ``Agent.run_many()`` and ``Workflow.run_many()``. Inputs are consumed
+lazily and results are yielded as they become available, so memory stays
+bounded by the concurrency level rather than the number of inputs.
+
+Backpressure:
+    - At most ``concurrency`` items run at once. Nothing new starts while
+      the consumer is busy with a yielded result.
+    - A ``RateLimitError`` pauses every item of the batch for the provider's
+      ``retry_after`` (1 second if unknown) and retries the failed item.
+    - Once a ``CostTracker`` is over budget no new items are started;
+      running items finish and the iterator ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+from agentchord.errors.exceptions import CostLimitExceededError, RateLimitError, find_error
+
+if TYPE_CHECKING:
+    from agentchord.tracking.cost import CostTracker
+
+R = TypeVar("R")
+
+# In input order, results may run ahead of the oldest pending item by this
+# many multiples of ``concurrency`` before new items stop being started.
+_ORDERED_WINDOW_FACTOR = 2
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+@dataclass
+class BatchResult(Generic[R]):
+    """Outcome of one batch item."""
+
+    index: int
+    input: Any
+    result: R | None = None
+    error: BaseException | None = None
+    attempts: int = 1
+    duration_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BatchProgress:
+    """Running totals passed to ``on_progress`` after each item."""
+
+    total: int | None
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    rate_limited: int = 0
+    budget_exceeded: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        """Completed fraction, if the number of inputs is known."""
+        if not self.total:
+            return None
+        return self.completed / self.total
+
+
+ProgressCallback = Callable[[BatchProgress], "Awaitable[None] | None"]
+
+
+async def _aiter_inputs(inputs: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    """Iterate sync or async inputs uniformly."""
+    if isinstance(inputs, AsyncIterable):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
+
+
+class _RateLimitGate:
+    """Shared pause applied to every item after a rate limit error."""
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    def pause(self, seconds: float) -> None:
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    async def wait(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._resume_at - time.monotonic()
+
+
+async def run_batch(
+    func: Callable[[Any], Awaitable[R]],
+    inputs: Iterable[Any] | AsyncIterable[Any],
+    *,
+    concurrency: int = 8,
+    ordered: bool = False,
+    on_progress: ProgressCallback | None = None,
+    cost_trackers: "Iterable[CostTracker]" = (),
+    max_rate_limit_retries: int = 3,
+) -> AsyncIterator[BatchResult[R]]:
+    """Run ``func`` over ``inputs`` with bounded concurrency.
+
+    Args:
+        func: Coroutine function called with each input.
+        inputs: Inputs (any iterable or async iterable, consumed lazily).
+        concurrency: Maximum items running at once.
+        ordered: Yield results in input order instead of completion order.
+        on_progress: Sync or async callback invoked after each item.
+        cost_trackers: Trackers whose budgets stop new items when exceeded.
+        max_rate_limit_retries: Retries per item after rate limit errors.
+
+    Yields:
+        BatchResult for each item. Errors are captured, never raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if max_rate_limit_retries < 0:
+        raise ValueError("max_rate_limit_retries must be non-negative")
+
+    trackers = list(cost_trackers)
+    total = len(inputs) if hasattr(inputs, "__len__") else None  # type: ignore[arg-type]
+    progress = BatchProgress(total=total)
+    gate = _RateLimitGate()
+    window = concurrency * _ORDERED_WINDOW_FACTOR
+
+    async def _run_item(index: int, item: Any) -> BatchResult[R]:
+        start = time.perf_counter()
+        attempts = 0
+        while True:
+            await gate.wait()
+            attempts += 1
+            try:
+                result = await func(item)
+            except Exception as e:
+                rate_limit = find_error(e, RateLimitError)
+                if rate_limit is not None and attempts <= max_rate_limit_retries:
+                    progress.rate_limited += 1
+                    gate.pause(getattr(rate_limit, "retry_after", None) or _DEFAULT_RETRY_AFTER)
+                    continue
+                error: BaseException | None = e
+                result = None
+            else:
+                error = None
+            return BatchResult(
+                index=index,
+                input=item,
+                result=result,
+                error=error,
+                attempts=attempts,
+                duration_ms=int((time.perf_counter() - start) * 1000),
+            )
+
+    source = _aiter_inputs(inputs)
+    pending: dict[asyncio.Task[BatchResult[R]], int] = {}
+    buffered: dict[int, BatchResult[R]] = {}
+    next_index = 0
+    next_yield = 0
+    exhausted = False
+
+    try:
+        while True:
+            # Start new items while there is capacity
+            while (
+                not exhausted
+                and not progress.budget_exceeded
+                and len(pending) < concurrency
+                and (not ordered or next_index - next_yield < window)
+            ):
+                if any(t.is_over_budget for t in trackers):
+                    progress.budget_exceeded = True
+                    break
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                task = asyncio.create_task(_run_item(next_index, item))
+                pending[task] = next_index
+                next_index += 1
+
+            if not pending:
+                break
+
+            progress.in_flight = len(pending)
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in sorted(done, key=pending.__getitem__):
+                del pending[task]
+                outcome = task.result()
+
+                progress.completed += 1
+                progress.in_flight = len(pending)
+                if outcome.ok:
+                    progress.succeeded += 1
+                else:
+                    progress.failed += 1
+                    if find_error(outcome.error, CostLimitExceededError) is not None:
+                        progress.budget_exceeded = True
+
+                if on_progress is not None:
+                    ret = on_progress(progress)
+                    if inspect.isawaitable(ret):
+                        await ret
+
+                if ordered:
+                    buffered[outcome.index] = outcome
+                else:
+                    yield outcome
+
+            while next_yield in buffered:
+                yield buffered.pop(next_yield)
+                next_yield += 1
+    finally:
+        # Consumer stopped early (break/aclose) or an error escaped
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
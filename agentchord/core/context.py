@@ -0,0 +1,249 @@
+"""Token-budget-aware context assembly.
+
+``ContextBuilder`` builds the messages an agent sends: the system prompt,
+as much recent memory as fits the token budget (newest first), and the
+user input. It reports how many tokens each section used.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from agentchord.core.conversation import Conversation
+from agentchord.core.types import Message, MessageRole
+from agentchord.utils.tokens import (
+    MESSAGE_OVERHEAD_TOKENS,
+    estimate_json_tokens,
+    estimate_tokens,
+    get_context_window,
+    truncate_to_tokens,
+)
+
+if TYPE_CHECKING:
+    from agentchord.memory.base import BaseMemory, MemoryEntry
+
+OversizedPolicy = Literal["truncate", "elide"]
+
+ELIDED_MARKER = "[... {tokens} tokens elided ...]"
+
+
+@dataclass
+class ContextReport:
+    """Estimated tokens per prompt section and what happened to memory."""
+
+    budget: int | None
+    system: int = 0
+    memory: int = 0
+    input: int = 0
+    tools: int = 0
+    memory_entries: int = 0
+    truncated: int = 0
+    elided: int = 0
+    dropped: int = 0
+
+    @property
+    def total(self) -> int:
+        """Estimated prompt tokens across all sections."""
+        return self.system + self.memory + self.input + self.tools
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "budget": self.budget,
+            "tokens": {
+                "system": self.system,
+                "memory": self.memory,
+                "input": self.input,
+                "tools": self.tools,
+                "total": self.total,
+            },
+            "memory_entries": self.memory_entries,
+            "truncated": self.truncated,
+            "elided": self.elided,
+            "dropped": self.dropped,
+        }
+
+
+@dataclass
+class ContextWindow:
+    """Messages built by ``ContextBuilder`` and their token report."""
+
+    messages: Conversation
+    report: ContextReport
+
+
+class ContextBuilder:
+    """Assemble prompt messages within a token budget.
+
+    The system prompt, tool definitions and user input are always sent.
+    Memory fills the rest of the budget, newest entry first; once an entry
+    no longer fits, it and everything older is dropped. An entry larger
+    than ``max_entry_tokens`` is truncated (start and end kept) or elided
+    (replaced by a placeholder), depending on ``oversized``.
+
+    Without ``max_tokens`` the budget is the model's context window minus
+    the tokens reserved for the response. Models whose window is unknown
+    (not in ``agentchord.utils.tokens.CONTEXT_WINDOWS``) get no budget, so
+    memory is only limited by ``memory_limit``; pass ``max_tokens`` or add
+    the model to ``CONTEXT_WINDOWS`` to budget them.
+
+    Token counts are fast local estimates (see ``agentchord.utils.tokens``),
+    not exact tokenizer counts.
+
+    Example:
+        >>> builder = ContextBuilder(max_tokens=8_000, max_entry_tokens=1_000)
+        >>> agent = Agent(name="a", role="r", memory=memory, context=builder)
+        >>> result = await agent.run("요약해줘")
+        >>> result.metadata["context"]["tokens"]
+        {'system': 52, 'memory': 4210, 'input': 5, 'tools': 0, 'total': 4267}
+    """
+
+    def __init__(
+        self,
+        max_tokens: int | None = None,
+        *,
+        memory_limit: int = 10,
+        max_entry_tokens: int | None = None,
+        oversized: OversizedPolicy = "truncate",
+        min_entry_tokens: int = 32,
+    ) -> None:
+        """Initialize context builder.
+
+        Args:
+            max_tokens: Prompt token budget. None uses the model's context
+                window minus the response tokens, or no budget if the
+                window is unknown.
+            memory_limit: Most recent memory entries considered.
+            max_entry_tokens: Largest memory entry sent as-is.
+            oversized: ``"truncate"`` or ``"elide"`` entries over
+                ``max_entry_tokens``.
+            min_entry_tokens: Smallest truncated entry worth sending when
+                the budget runs out part-way through an entry.
+        """
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if memory_limit < 0:
+            raise ValueError("memory_limit must be >= 0")
+        if max_entry_tokens is not None and max_entry_tokens < 1:
+            raise ValueError("max_entry_tokens must be at least 1")
+        if oversized not in ("truncate", "elide"):
+            raise ValueError("oversized must be 'truncate' or 'elide'")
+
+        self.max_tokens = max_tokens
+        self.memory_limit = memory_limit
+        self.max_entry_tokens = max_entry_tokens
+        self.oversized = oversized
+        self.min_entry_tokens = min_entry_tokens
+
+    def budget_for(self, model: str | None, max_output_tokens: int = 0) -> int | None:
+        """Prompt token budget for ``model`` (None if its window is unknown)."""
+        if self.max_tokens is not None:
+            return self.max_tokens
+        window = get_context_window(model)
+        if window is None:
+            return None
+        return max(1, window - max_output_tokens)
+
+    def build(
+        self,
+        *,
+        system_prompt: str,
+        input: str,
+        memory: BaseMemory | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_output_tokens: int = 0,
+    ) -> ContextWindow:
+        """Build the messages for one run.
+
+        Args:
+            system_prompt: System prompt.
+            input: User input.
+            memory: Memory to take recent entries from.
+            tools: Tool definitions sent with the request.
+            model: Model name, for token estimation and the default budget.
+            max_output_tokens: Tokens reserved for the response.
+
+        Returns:
+            ContextWindow with the messages and the token report.
+        """
+        budget = self.budget_for(model, max_output_tokens)
+        report = ContextReport(budget=budget)
+        report.system = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(system_prompt, model)
+        report.input = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(input, model)
+        report.tools = estimate_json_tokens(tools, model)
+
+        history: list[Message] = []
+        if memory is not None and self.memory_limit:
+            entries = memory.get_recent(limit=self.memory_limit)
+            remaining = (
+                math.inf
+                if budget is None
+                else budget - report.system - report.input - report.tools
+            )
+            history = self._fill(entries, remaining, model, report)
+
+        messages = Conversation([Message(role=MessageRole.SYSTEM, content=system_prompt)])
+        messages.extend(history)
+        messages.append(Message(role=MessageRole.USER, content=input))
+        return ContextWindow(messages=messages, report=report)
+
+    def _fill(
+        self,
+        entries: list[MemoryEntry],
+        remaining: float,
+        model: str | None,
+        report: ContextReport,
+    ) -> list[Message]:
+        """Take entries newest first until ``remaining`` tokens are used."""
+        # Memories disagree on get_recent() order; sort to be sure
+        entries = sorted(entries, key=lambda e: e.timestamp)
+        selected: list[Message] = []
+
+        for position, entry in enumerate(reversed(entries)):
+            content = entry.content
+            tokens = estimate_tokens(content, model)
+            truncated = elided = False
+
+            if self.max_entry_tokens is not None and tokens > self.max_entry_tokens:
+                if self.oversized == "truncate":
+                    content = truncate_to_tokens(content, self.max_entry_tokens, model)
+                    truncated = True
+                else:
+                    content = ELIDED_MARKER.format(tokens=tokens)
+                    elided = True
+                tokens = estimate_tokens(content, model)
+
+            cost = MESSAGE_OVERHEAD_TOKENS + tokens
+            if cost > remaining:
+                room = remaining - MESSAGE_OVERHEAD_TOKENS
+                if self.oversized == "truncate" and room >= self.min_entry_tokens:
+                    content = truncate_to_tokens(content, room, model)
+                    cost = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(content, model)
+                    truncated = True
+                else:
+                    report.dropped += len(entries) - position
+                    break
+
+            report.truncated += truncated
+            report.elided += elided
+            role = MessageRole.USER if entry.role == "user" else MessageRole.ASSISTANT
+            selected.append(Message(role=role, content=content))
+            report.memory += cost
+            remaining -= cost
+            if remaining <= MESSAGE_OVERHEAD_TOKENS:
+                report.dropped += len(entries) - position - 1
+                break
+
+        report.memory_entries = len(selected)
+        selected.reverse()
+        return selected
+
+    def __repr__(self) -> str:
+        return (
+            f"ContextBuilder(max_tokens={self.max_tokens}, "
+            f"memory_limit={self.memory_limit}, "
+            f"max_entry_tokens={self.max_entry_tokens}, oversized={self.oversized!r})"
+        )
@@ -0,0 +1,121 @@
+"""Conversation message list with cached provider payloads.
+
+Every tool round sends the whole conversation again. ``Conversation``
+remembers the wire format each provider produced for each message, so a
+new round only converts the messages appended since the last one.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, TypeVar
+
+from agentchord.core.types import Message
+
+T = TypeVar("T")
+
+
+_Entry = tuple[Message, Any, Any, Any, Any, Any, Any]
+
+
+def _entry(message: Message, payload: Any) -> _Entry:
+    """Cache entry: the message, the field values it was built from, payload."""
+    return (
+        message,
+        message.content,
+        message.tool_calls,
+        message.tool_call_id,
+        message.role,
+        message.name,
+        payload,
+    )
+
+
+def _is_current(entry: _Entry, message: Message) -> bool:
+    # Identity, not equality: comparing large contents would cost as much
+    # as converting them again, and reassigning a field always rebinds it.
+    return (
+        entry[0] is message
+        and entry[1] is message.content
+        and entry[2] is message.tool_calls
+        and entry[3] is message.tool_call_id
+        and entry[4] is message.role
+        and entry[5] is message.name
+    )
+
+
+class Conversation(list[Message]):
+    """List of messages that caches each message's provider payload.
+
+    It is a plain ``list`` for every other purpose, so it can be passed
+    anywhere a ``list[Message]`` is expected. Providers call
+    ``convert_messages()``, which uses the cache when given a
+    ``Conversation`` and converts every message otherwise.
+
+    A cached payload is reused while its message is the same object and
+    none of its fields has been reassigned; replacing a message or setting
+    one of its fields converts it again. Payloads are shared between calls
+    and must not be mutated.
+
+    Example:
+        >>> conversation = Conversation([Message.system("..."), Message.user("hi")])
+        >>> conversation.converted("openai", to_openai)   # converts 2 messages
+        >>> conversation.append(Message.assistant("hello"))
+        >>> conversation.converted("openai", to_openai)   # converts 1 message
+    """
+
+    def __init__(self, messages: Iterable[Message] = ()) -> None:
+        super().__init__(messages)
+        self._payloads: dict[str, dict[int, _Entry]] = {}
+
+    def converted(self, key: str, convert: Callable[[Message], T]) -> list[T]:
+        """Convert every message, reusing payloads cached under ``key``.
+
+        Args:
+            key: Wire format name, usually the provider name.
+            convert: Converts one message to its payload.
+
+        Returns:
+            One payload per message, in order.
+        """
+        previous = self._payloads.get(key, {})
+        current: dict[int, _Entry] = {}
+        result: list[T] = []
+        for message in self:
+            entry = previous.get(id(message))
+            if entry is None or not _is_current(entry, message):
+                entry = _entry(message, convert(message))
+            current[id(message)] = entry
+            result.append(entry[6])
+        # Rebuilt every call so removed messages don't stay cached
+        self._payloads[key] = current
+        return result
+
+    def clear_payloads(self) -> None:
+        """Drop every cached payload."""
+        self._payloads.clear()
+
+    def copy(self) -> Conversation:  # type: ignore[override]
+        """Shallow copy that keeps the cached payloads."""
+        clone = Conversation(self)
+        clone._payloads = {key: dict(cache) for key, cache in self._payloads.items()}
+        return clone
+
+
+def convert_messages(
+    messages: list[Message], key: str, convert: Callable[[Message], T]
+) -> list[T]:
+    """Convert messages to a provider's wire format.
+
+    Uses the per-message cache when ``messages`` is a ``Conversation``.
+
+    Args:
+        messages: Messages to convert.
+        key: Wire format name, usually the provider name.
+        convert: Converts one message to its payload.
+
+    Returns:
+        One payload per message, in order.
+    """
+    if isinstance(messages, Conversation):
+        return messages.converted(key, convert)
+    return [convert(message) for message in messages]
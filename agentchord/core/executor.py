@@ -4,20 +4,28 @@ This module provides different execution strategies for running agents:
 - SequentialExecutor: Runs agents one after another
 - ParallelExecutor: Runs agents concurrently
 - CompositeExecutor: Combines multiple execution steps
+- DAGExecutor: Runs agents as a dependency graph
 """
 
 from __future__ import annotations
 
 import asyncio
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Mapping, Sequence
 
 from agentchord.core.state import WorkflowState, WorkflowStatus
-from agentchord.errors.exceptions import WorkflowExecutionError
+from agentchord.errors.exceptions import (
+    AgentNotFoundInFlowError,
+    InvalidFlowError,
+    WorkflowExecutionError,
+)
 
 if TYPE_CHECKING:
     from agentchord.core.agent import Agent
+    from agentchord.core.types import AgentResult
 
 
 class MergeStrategy(str, Enum):
@@ -29,6 +37,21 @@ class MergeStrategy(str, Enum):
     LAST = "last"
 
 
+_SEPARATORS = {
+    MergeStrategy.CONCAT: "",
+    MergeStrategy.CONCAT_NEWLINE: "\n\n",
+}
+
+
+def merge_outputs(outputs: Sequence[str], strategy: MergeStrategy) -> str:
+    """Merge agent outputs according to ``strategy``."""
+    if strategy == MergeStrategy.FIRST:
+        return outputs[0] if outputs else ""
+    if strategy == MergeStrategy.LAST:
+        return outputs[-1] if outputs else ""
+    return _SEPARATORS.get(strategy, "\n\n").join(outputs)
+
+
 class BaseExecutor(ABC):
     """Abstract base class for workflow executors.
 
@@ -81,11 +104,11 @@ class SequentialExecutor(BaseExecutor):
 
         for idx, agent_name in enumerate(self.agent_names):
             agent = agents[agent_name]
-            state = state.model_copy(update={"current_agent": agent_name})
+            state = state.with_current_agent(agent_name)
 
             try:
                 result = await agent.run(state.effective_input)
-                state = state.with_result(result)
+                state = await state.add_result(result)
             except Exception as e:
                 raise WorkflowExecutionError(
                     f"Agent '{agent_name}' failed: {e}",
@@ -109,10 +132,7 @@ class ParallelExecutor(BaseExecutor):
         >>> state = await executor.execute(agents, state)
     """
 
-    SEPARATOR_MAP = {
-        MergeStrategy.CONCAT: "",
-        MergeStrategy.CONCAT_NEWLINE: "\n\n",
-    }
+    SEPARATOR_MAP = _SEPARATORS
 
     def __init__(
         self,
@@ -155,7 +175,7 @@ class ParallelExecutor(BaseExecutor):
                     failed_agent=self.agent_names[idx],
                 ) from result
             successful_results.append(result)
-            state = state.with_result(result)
+            state = await state.add_result(result)
 
         merged_output = self._merge_outputs(successful_results)
         state = state.with_output(merged_output)
@@ -164,14 +184,7 @@ class ParallelExecutor(BaseExecutor):
 
     def _merge_outputs(self, results: list) -> str:
         """Merge outputs based on strategy."""
-        if self.merge_strategy == MergeStrategy.FIRST:
-            return results[0].output if results else ""
-
-        if self.merge_strategy == MergeStrategy.LAST:
-            return results[-1].output if results else ""
-
-        separator = self.SEPARATOR_MAP.get(self.merge_strategy, "\n\n")
-        return separator.join(r.output for r in results)
+        return merge_outputs([r.output for r in results], self.merge_strategy)
 
 
 class CompositeExecutor(BaseExecutor):
@@ -232,7 +245,7 @@ class SingleAgentExecutor(BaseExecutor):
 
         try:
             result = await agent.run(state.effective_input)
-            state = state.with_result(result)
+            state = await state.add_result(result)
         except Exception as e:
             raise WorkflowExecutionError(
                 f"Agent '{self.agent_name}' failed: {e}",
@@ -240,3 +253,212 @@ class SingleAgentExecutor(BaseExecutor):
             ) from e
 
         return state
+
+
+class DAGExecutor(BaseExecutor):
+    """Executes agents as a dependency graph.
+
+    Each agent starts as soon as all of its dependencies have finished,
+    rather than when a whole stage is done. A root agent (no dependencies)
+    receives the workflow input; an agent with one dependency receives
+    that agent's output; a join (several dependencies) receives their
+    outputs merged with its merge strategy, in the order the dependencies
+    were declared. The workflow output is the merged output of the agents
+    nothing depends on.
+
+    ``max_concurrency`` and ``agent_concurrency`` limit how many agents (or
+    runs of one agent) execute at the same time. The limits belong to the
+    executor, so they also hold across concurrent workflow runs.
+
+    Example:
+        >>> executor = DAGExecutor(
+        ...     {"b": ["a"], "c": ["a"], "d": ["b"], "e": ["c"], "f": ["d", "e"]},
+        ...     merge_strategies={"f": MergeStrategy.CONCAT_NEWLINE},
+        ...     max_concurrency=2,
+        ... )
+        >>> state = await executor.execute(agents, state)
+    """
+
+    def __init__(
+        self,
+        dependencies: Mapping[str, Sequence[str]],
+        *,
+        merge_strategy: MergeStrategy = MergeStrategy.CONCAT_NEWLINE,
+        merge_strategies: Mapping[str, MergeStrategy] | None = None,
+        max_concurrency: int | None = None,
+        agent_concurrency: Mapping[str, int] | None = None,
+    ) -> None:
+        """Initialize with each agent's dependencies.
+
+        Args:
+            dependencies: Agent name to the names of the agents it waits
+                for. Agents that only appear as dependencies are roots.
+            merge_strategy: Merge strategy for joins without their own, and
+                for combining the outputs of the final agents.
+            merge_strategies: Merge strategy per join agent.
+            max_concurrency: Most agents running at the same time.
+            agent_concurrency: Most concurrent runs per agent name.
+
+        Raises:
+            InvalidFlowError: If the graph has a cycle or an agent depends
+                on itself.
+            ValueError: If a concurrency limit is below 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Keep first-mention order so ties run in declaration order
+        self.dependencies: dict[str, list[str]] = {}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                self.dependencies.setdefault(dep, [])
+            self.dependencies.setdefault(name, [])
+            self.dependencies[name].extend(d for d in deps if d not in self.dependencies[name])
+
+        self.merge_strategy = merge_strategy
+        self.merge_strategies = dict(merge_strategies or {})
+        self.max_concurrency = max_concurrency
+        self.agent_concurrency = dict(agent_concurrency or {})
+
+        self._dependents: dict[str, list[str]] = {name: [] for name in self.dependencies}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                self._dependents[dep].append(name)
+        self._order = {name: i for i, name in enumerate(self.dependencies)}
+        self._check_acyclic()
+
+        for name, limit in self.agent_concurrency.items():
+            if limit < 1:
+                raise ValueError(f"agent_concurrency for '{name}' must be at least 1")
+        # Semaphores bind to the loop that first waits on them, so each
+        # running loop gets its own (global slots, per-agent slots) pair.
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[asyncio.Semaphore | None, dict[str, asyncio.Semaphore]],
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def agent_names(self) -> list[str]:
+        """Agents in the graph, in declaration order."""
+        return list(self.dependencies)
+
+    @property
+    def sinks(self) -> list[str]:
+        """Agents nothing depends on; their outputs form the result."""
+        return [name for name, dependents in self._dependents.items() if not dependents]
+
+    def _check_acyclic(self) -> None:
+        # Kahn's algorithm: anything left unvisited is on a cycle
+        waiting = {name: len(deps) for name, deps in self.dependencies.items()}
+        ready = [name for name, count in waiting.items() if count == 0]
+        visited = 0
+        while ready:
+            name = ready.pop()
+            visited += 1
+            for child in self._dependents[name]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    ready.append(child)
+        if visited < len(waiting):
+            cycle = ", ".join(name for name, count in waiting.items() if count > 0)
+            raise InvalidFlowError(self._describe(), f"Cycle between agents: {cycle}")
+
+    def _describe(self) -> str:
+        return ", ".join(
+            f"{'+'.join(deps)} -> {name}" if deps else name
+            for name, deps in self.dependencies.items()
+        )
+
+    async def execute(
+        self,
+        agents: dict[str, "Agent"],
+        state: WorkflowState,
+    ) -> WorkflowState:
+        """Execute agents in dependency order, each as soon as it is ready."""
+        for name in self.dependencies:
+            if name not in agents:
+                raise AgentNotFoundInFlowError(name, list(agents))
+
+        state = state.with_status(WorkflowStatus.RUNNING)
+        root_input = state.effective_input
+        outputs: dict[str, str] = {}
+        waiting = {name: len(deps) for name, deps in self.dependencies.items()}
+        running: dict[asyncio.Task[AgentResult], str] = {}
+
+        def start(name: str) -> None:
+            deps = self.dependencies[name]
+            if not deps:
+                input_text = root_input
+            elif len(deps) == 1:
+                input_text = outputs[deps[0]]
+            else:
+                input_text = merge_outputs(
+                    [outputs[d] for d in deps],
+                    self.merge_strategies.get(name, self.merge_strategy),
+                )
+            task = asyncio.create_task(self._run_agent(agents[name], name, input_text))
+            running[task] = name
+
+        for name, count in waiting.items():
+            if count == 0:
+                start(name)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # Record simultaneous completions in declaration order
+                for task in sorted(done, key=lambda t: self._order[running[t]]):
+                    name = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        raise WorkflowExecutionError(
+                            f"Agent '{name}' failed: {e}",
+                            failed_agent=name,
+                            step_index=self._order[name],
+                        ) from e
+                    outputs[name] = result.output
+                    state = await state.add_result(result)
+                    for child in self._dependents[name]:
+                        waiting[child] -= 1
+                        if waiting[child] == 0:
+                            start(child)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        output = merge_outputs([outputs[name] for name in self.sinks], self.merge_strategy)
+        return state.with_output(output)
+
+    async def _run_agent(self, agent: "Agent", name: str, input_text: str) -> AgentResult:
+        # Take the agent's own slot first so a waiting agent holds no global slot
+        async with AsyncExitStack() as stack:
+            global_slots, agent_slots = self._loop_slots()
+            own_slots = agent_slots.get(name)
+            if own_slots is not None:
+                await stack.enter_async_context(own_slots)
+            if global_slots is not None:
+                await stack.enter_async_context(global_slots)
+            return await agent.run(input_text)
+
+    def _loop_slots(
+        self,
+    ) -> tuple[asyncio.Semaphore | None, dict[str, asyncio.Semaphore]]:
+        """Get the concurrency semaphores for the running loop."""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            global_slots = (
+                asyncio.Semaphore(self.max_concurrency)
+                if self.max_concurrency is not None
+                else None
+            )
+            agent_slots = {
+                name: asyncio.Semaphore(limit)
+                for name, limit in self.agent_concurrency.items()
+            }
+            slots = (global_slots, agent_slots)
+            self._slots[loop] = slots
+        return slots
@@ -6,13 +6,21 @@ States are designed to be passed between agents without mutation.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from enum import Enum
-from typing import Any
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, get_args, overload
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, PrivateAttr
+from pydantic_core import core_schema
 
 from agentchord.core.types import AgentResult, Usage
 
+if TYPE_CHECKING:
+    from agentchord.core.transcript import TranscriptPolicy
+
+T = TypeVar("T")
+
 
 class WorkflowStatus(str, Enum):
     """Status of a workflow execution."""
@@ -24,6 +32,99 @@ class WorkflowStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class History(Sequence[T], Generic[T]):
+    """Persistent, append-only sequence.
+
+    ``appended()`` returns a new history and leaves this one unchanged, in
+    O(1) amortized time: histories built from one another share a backing
+    list, and each only sees its own prefix of it. Appending to a history
+    that isn't the newest one of its line copies its prefix first, so
+    branches never see each other's items.
+
+    Reads are list-like (indexing, ``len``, iteration) and a history
+    compares equal to a list or tuple with the same items.
+
+    Example:
+        >>> first = History([1, 2])
+        >>> second = first.appended(3)
+        >>> list(first), list(second)
+        ([1, 2], [1, 2, 3])
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items: Sequence[T] = ()) -> None:
+        self._items: list[T] = list(items)
+        self._length = len(self._items)
+
+    @classmethod
+    def _view(cls, items: list[T], length: int) -> History[T]:
+        history = cls.__new__(cls)
+        history._items = items
+        history._length = length
+        return history
+
+    def appended(self, item: T) -> History[T]:
+        """New history with ``item`` added at the end."""
+        items = self._items
+        if len(items) == self._length:
+            items.append(item)
+            # Another thread may have appended to the same list first
+            if items[self._length] is item:
+                return self._view(items, self._length + 1)
+        return self._view([*islice(items, self._length), item], self._length + 1)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return self._items[: self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("history index out of range")
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._items, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, History):
+            if other._items is self._items:
+                return other._length == self._length
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return len(other) == self._length and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"History({list(self)!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = get_args(source)
+        items_schema = handler.generate_schema(list[args[0] if args else Any])  # type: ignore[misc]
+        return core_schema.union_schema(
+            [
+                core_schema.is_instance_schema(cls),
+                core_schema.no_info_after_validator_function(cls, items_schema),
+            ],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=items_schema
+            ),
+        )
+
+
 class WorkflowState(BaseModel):
     """Immutable state passed between workflow steps.
 
@@ -39,9 +140,9 @@ class WorkflowState(BaseModel):
 
     input: str = Field(..., description="Original input to the workflow")
     output: str | None = Field(None, description="Current output (updated by agents)")
-    history: list[AgentResult] = Field(
-        default_factory=list,
-        description="History of all agent executions",
+    history: History[AgentResult] = Field(
+        default_factory=History,
+        description="History of all agent executions (append-only, shared between states)",
     )
     context: dict[str, Any] = Field(
         default_factory=dict,
@@ -57,6 +158,9 @@ class WorkflowState(BaseModel):
     )
     error: str | None = Field(None, description="Error message if failed")
 
+    # Applied by add_result(); carried over to derived states
+    _transcript: TranscriptPolicy | None = PrivateAttr(default=None)
+
     def with_output(self, output: str) -> WorkflowState:
         """Create new state with updated output."""
         return self.model_copy(update={"output": output})
@@ -65,18 +169,34 @@ class WorkflowState(BaseModel):
         """Create new state with agent result appended to history."""
         return self.model_copy(
             update={
-                "history": [*self.history, result],
+                "history": self.history.appended(result),
                 "output": result.output,
                 "current_agent": result.metadata.get("agent_name"),
             }
         )
 
+    async def add_result(self, result: AgentResult) -> WorkflowState:
+        """Like ``with_result``, applying the state's transcript policy first."""
+        if self._transcript is not None:
+            result = await self._transcript.apply(result)
+        return self.with_result(result)
+
+    def with_transcript(self, policy: TranscriptPolicy | None) -> WorkflowState:
+        """Create new state whose ``add_result`` applies ``policy``."""
+        state = self.model_copy()
+        state._transcript = policy
+        return state
+
     def with_context(self, key: str, value: Any) -> WorkflowState:
         """Create new state with updated context."""
         return self.model_copy(
             update={"context": {**self.context, key: value}}
         )
 
+    def with_current_agent(self, agent_name: str | None) -> WorkflowState:
+        """Create new state with updated current agent."""
+        return self.model_copy(update={"current_agent": agent_name})
+
     def with_status(self, status: WorkflowStatus) -> WorkflowState:
         """Create new state with updated status."""
         return self.model_copy(update={"status": status})
@@ -134,7 +254,7 @@ class WorkflowResult(BaseModel):
     @property
     def agent_results(self) -> list[AgentResult]:
         """Get all agent execution results."""
-        return self.state.history
+        return list(self.state.history)
 
     @property
     def usage(self) -> Usage:
@@ -0,0 +1,215 @@
+"""Low-overhead stream chunks and chunk coalescing.
+
+Providers yield one chunk per streamed token, so per-chunk overhead adds
+up on long answers. ``FastStreamChunk`` has the same attributes as the
+pydantic ``StreamChunk`` but skips validation. Built-in providers yield it
+from ``stream_chunks()``, which agents and wrapping providers use
+internally; the public ``stream()`` methods of providers and ``Agent``
+validate each chunk into a ``StreamChunk`` before yielding it.
+
+``coalesce_chunks`` merges a chunk stream into fewer, larger chunks for
+consumers that don't need per-token granularity.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Union
+
+from agentchord.core.types import StreamChunk, ToolCall, Usage
+
+
+class FastStreamChunk:
+    """Non-validating, slotted counterpart of ``StreamChunk``.
+
+    Attributes match ``StreamChunk``, so code that reads chunks works with
+    either. Values are trusted as given; providers build these from data
+    they have already parsed.
+    """
+
+    __slots__ = ("content", "delta", "finish_reason", "usage", "tool_calls", "cache_hit")
+
+    def __init__(
+        self,
+        content: str,
+        delta: str,
+        finish_reason: str | None = None,
+        usage: Usage | None = None,
+        tool_calls: list[ToolCall] | None = None,
+        cache_hit: bool = False,
+    ) -> None:
+        self.content = content
+        self.delta = delta
+        self.finish_reason = finish_reason
+        self.usage = usage
+        self.tool_calls = tool_calls
+        self.cache_hit = cache_hit
+
+    def to_model(self) -> StreamChunk:
+        """Validated ``StreamChunk`` with the same values."""
+        return StreamChunk(
+            content=self.content,
+            delta=self.delta,
+            finish_reason=self.finish_reason,
+            usage=self.usage,
+            tool_calls=self.tool_calls,
+            cache_hit=self.cache_hit,
+        )
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Serialize like ``StreamChunk.model_dump``."""
+        return self.to_model().model_dump(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (FastStreamChunk, StreamChunk)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"FastStreamChunk({fields})"
+
+
+# Either chunk type; what ``BaseLLMProvider.stream`` yields
+AnyStreamChunk = Union[StreamChunk, FastStreamChunk]
+
+
+def to_stream_chunk(chunk: AnyStreamChunk) -> StreamChunk:
+    """Validated ``StreamChunk`` for ``chunk``, converting only if needed."""
+    if isinstance(chunk, FastStreamChunk):
+        return chunk.to_model()
+    return chunk
+
+
+async def validate_chunks(
+    chunks: AsyncIterator[AnyStreamChunk],
+) -> AsyncIterator[StreamChunk]:
+    """Yield ``chunks`` as validated ``StreamChunk`` models.
+
+    Closes ``chunks`` when the consumer stops early, so cleanup in the
+    source stream runs right away.
+    """
+    try:
+        async for chunk in chunks:
+            yield to_stream_chunk(chunk)
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _merge(chunks: list[AnyStreamChunk]) -> AnyStreamChunk:
+    if len(chunks) == 1:
+        return chunks[0]
+    last = chunks[-1]
+    tool_calls = [tc for chunk in chunks for tc in chunk.tool_calls or ()]
+    # Merged chunks keep the stream's chunk type, so coalescing a validated
+    # stream such as ``Agent.stream`` still yields ``StreamChunk`` models
+    chunk_type = StreamChunk if isinstance(last, StreamChunk) else FastStreamChunk
+    return chunk_type(
+        content=last.content,
+        delta="".join(chunk.delta for chunk in chunks),
+        finish_reason=last.finish_reason,
+        usage=next((c.usage for c in reversed(chunks) if c.usage is not None), None),
+        tool_calls=tool_calls or None,
+        cache_hit=last.cache_hit,
+    )
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[AnyStreamChunk],
+    *,
+    interval: float | None = None,
+    max_chars: int | None = None,
+) -> AsyncIterator[AnyStreamChunk]:
+    """Merge a chunk stream into fewer, larger chunks.
+
+    Buffered chunks are emitted as one chunk once ``interval`` seconds have
+    passed since the first of them arrived, or once their deltas reach
+    ``max_chars`` characters, whichever comes first. Chunks carrying tool
+    calls, a finish reason or usage are emitted without waiting, so tools
+    can start as early as before. A merged chunk has the last chunk's
+    ``content`` and the buffered deltas joined; no text is dropped.
+
+    Args:
+        chunks: Stream to coalesce, e.g. ``agent.stream(...)``.
+        interval: Longest time in seconds to hold text back.
+        max_chars: Most buffered delta characters before emitting.
+
+    Example:
+        >>> async for chunk in coalesce_chunks(agent.stream("..."), interval=0.05):
+        ...     render(chunk.content)
+    """
+    if interval is None and max_chars is None:
+        raise ValueError("Set interval, max_chars or both")
+    if interval is not None and interval <= 0:
+        raise ValueError("interval must be positive")
+    if max_chars is not None and max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+
+    if interval is None:
+        # Size-only windows need no timer
+        buffer: list[AnyStreamChunk] = []
+        size = 0
+        async for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk.delta)
+            if (
+                size >= max_chars  # type: ignore[operator]
+                or chunk.tool_calls
+                or chunk.finish_reason is not None
+                or chunk.usage is not None
+            ):
+                yield _merge(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield _merge(buffer)
+        return
+
+    # Time windows: wait for the next chunk only until the window closes.
+    # The pending read is a task so a timeout doesn't cancel the stream.
+    iterator = chunks.__aiter__()
+    pending: asyncio.Future[AnyStreamChunk] | None = None
+    buffer = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            if buffer:
+                timeout = max(0.0, deadline - time.monotonic())
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    yield _merge(buffer)
+                    buffer, size = [], 0
+                    continue
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                if pending.done():
+                    pending = None
+
+            if not buffer:
+                deadline = time.monotonic() + interval
+            buffer.append(chunk)
+            size += len(chunk.delta)
+            if (
+                (max_chars is not None and size >= max_chars)
+                or chunk.tool_calls
+                or chunk.finish_reason is not None
+                or chunk.usage is not None
+            ):
+                yield _merge(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield _merge(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
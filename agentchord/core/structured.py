@@ -67,13 +67,7 @@ class OutputSchema(Generic[T]):
         Returns:
             String instruction to append to system prompt.
         """
-        schema_str = json.dumps(self.json_schema, indent=2)
-        return (
-            f"\n\nYou MUST respond with valid JSON that conforms to this schema:\n"
-            f"```json\n{schema_str}\n```\n"
-            f"Do not include any text outside the JSON object. "
-            f"Respond ONLY with the JSON."
-        )
+        return schema_instruction(self.json_schema)
 
     def validate(self, data: str | dict[str, Any]) -> T:
         """Parse and validate data against the schema.
@@ -150,3 +144,21 @@ class OutputSchema(Generic[T]):
                 start = idx + 1
 
         return text  # Return as-is, let json.loads handle the error
+
+
+def schema_instruction(schema: dict[str, Any]) -> str:
+    """System prompt instruction asking for JSON conforming to ``schema``.
+
+    Args:
+        schema: JSON schema the response must follow.
+
+    Returns:
+        String instruction to append to system prompt.
+    """
+    schema_str = json.dumps(schema, indent=2)
+    return (
+        f"\n\nYou MUST respond with valid JSON that conforms to this schema:\n"
+        f"```json\n{schema_str}\n```\n"
+        f"Do not include any text outside the JSON object. "
+        f"Respond ONLY with the JSON."
+    )
@@ -0,0 +1,283 @@
+"""Transcript retention for agent results.
+
+``AgentResult.messages`` holds the whole conversation of a run, tool
+outputs included, and workflows keep every result in their history. A
+``TranscriptPolicy`` bounds that: keep the full transcript, only the last
+N messages, or none. With a ``TranscriptSpool`` the full transcript is
+written out first and can be loaded again with
+``AgentResult.load_messages()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator
+
+from agentchord.core.types import AgentResult, Message
+
+# Optional dependency - gracefully handle missing aiosqlite
+try:
+    import aiosqlite
+
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    AIOSQLITE_AVAILABLE = False
+
+
+class TranscriptSpool(ABC):
+    """Storage for transcripts dropped from ``AgentResult.messages``."""
+
+    @abstractmethod
+    async def save(self, messages: list[Message]) -> str:
+        """Store a transcript.
+
+        Returns:
+            ID to load the transcript with.
+        """
+        ...
+
+    @abstractmethod
+    async def load(self, transcript_id: str) -> list[Message]:
+        """Load a stored transcript.
+
+        Raises:
+            KeyError: If no transcript has this ID.
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, transcript_id: str) -> bool:
+        """Delete a stored transcript.
+
+        Returns:
+            True if it was deleted, False if not found.
+        """
+        ...
+
+
+class FileTranscriptSpool(TranscriptSpool):
+    """Spool that writes each transcript to a JSON Lines file.
+
+    Files are named ``<transcript_id>.jsonl`` inside ``directory``, one
+    message per line.
+
+    Example:
+        >>> spool = FileTranscriptSpool("./transcripts")
+        >>> agent = Agent(..., transcript=TranscriptPolicy.none(spool=spool))
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize file spool.
+
+        Args:
+            directory: Directory for transcript files; created if missing.
+        """
+        self._directory = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the transcript files."""
+        return self._directory
+
+    def _path(self, transcript_id: str) -> Path:
+        # IDs are generated hex strings; reject anything that could escape
+        if not transcript_id or not transcript_id.isalnum():
+            raise KeyError(transcript_id)
+        return self._directory / f"{transcript_id}.jsonl"
+
+    async def save(self, messages: list[Message]) -> str:
+        transcript_id = uuid.uuid4().hex
+        lines = "".join(m.model_dump_json() + "\n" for m in messages)
+
+        def write() -> None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._path(transcript_id).write_text(lines, encoding="utf-8")
+
+        await asyncio.to_thread(write)
+        return transcript_id
+
+    async def load(self, transcript_id: str) -> list[Message]:
+        path = self._path(transcript_id)
+        try:
+            text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+        except FileNotFoundError:
+            raise KeyError(transcript_id) from None
+        return [Message.model_validate_json(line) for line in text.splitlines() if line]
+
+    async def delete(self, transcript_id: str) -> bool:
+        path = self._path(transcript_id)
+        try:
+            await asyncio.to_thread(path.unlink)
+        except FileNotFoundError:
+            return False
+        return True
+
+
+class SQLiteTranscriptSpool(TranscriptSpool):
+    """Spool that stores transcripts in a SQLite database.
+
+    Example:
+        >>> spool = SQLiteTranscriptSpool("transcripts.db")
+        >>> workflow = Workflow(agents, transcript=TranscriptPolicy.last(4, spool=spool))
+
+    Note:
+        Requires aiosqlite package: pip install aiosqlite
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:") -> None:
+        """Initialize SQLite spool.
+
+        Args:
+            db_path: Path to SQLite database file, or ":memory:" for in-memory DB.
+
+        Raises:
+            ImportError: If aiosqlite is not installed.
+        """
+        if not AIOSQLITE_AVAILABLE:
+            raise ImportError(
+                "aiosqlite is required for SQLiteTranscriptSpool. "
+                "Install it with: pip install aiosqlite"
+            )
+
+        self._db_path = str(db_path)
+        self._is_memory = self._db_path == ":memory:"
+        self._memory_conn: aiosqlite.Connection | None = None
+        self._table_created = False
+
+    @asynccontextmanager
+    async def _get_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Get database connection (persistent for :memory: databases)."""
+        if self._is_memory:
+            if self._memory_conn is None:
+                self._memory_conn = await aiosqlite.connect(self._db_path)
+            yield self._memory_conn
+        else:
+            async with aiosqlite.connect(self._db_path) as db:
+                yield db
+
+    async def _ensure_table(self, db: aiosqlite.Connection) -> None:
+        """Create the transcript table if it doesn't exist."""
+        if self._table_created and self._is_memory:
+            return
+
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS agent_transcripts (
+                id TEXT PRIMARY KEY,
+                messages TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        await db.commit()
+        self._table_created = True
+
+    async def save(self, messages: list[Message]) -> str:
+        transcript_id = uuid.uuid4().hex
+        payload = json.dumps([m.model_dump(mode="json") for m in messages])
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            await db.execute(
+                "INSERT INTO agent_transcripts (id, messages, created_at) VALUES (?, ?, ?)",
+                (transcript_id, payload, time.time()),
+            )
+            await db.commit()
+        return transcript_id
+
+    async def load(self, transcript_id: str) -> list[Message]:
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            async with db.execute(
+                "SELECT messages FROM agent_transcripts WHERE id = ?", (transcript_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+
+        if row is None:
+            raise KeyError(transcript_id)
+        return [Message.model_validate(m) for m in json.loads(row[0])]
+
+    async def delete(self, transcript_id: str) -> bool:
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            cursor = await db.execute(
+                "DELETE FROM agent_transcripts WHERE id = ?", (transcript_id,)
+            )
+            await db.commit()
+            return cursor.rowcount > 0
+
+    async def close(self) -> None:
+        """Close the persistent connection (in-memory databases only)."""
+        if self._memory_conn is not None:
+            await self._memory_conn.close()
+            self._memory_conn = None
+            self._table_created = False
+
+
+@dataclass(frozen=True)
+class TranscriptPolicy:
+    """How much of a run's transcript an ``AgentResult`` keeps.
+
+    Attributes:
+        keep: Messages kept in ``AgentResult.messages``, counted from the
+            end. None keeps all of them, 0 keeps none.
+        spool: Where the full transcript is written before trimming. Load
+            it again with ``AgentResult.load_messages()``.
+
+    Example:
+        >>> agent = Agent(..., transcript=TranscriptPolicy.last(2))
+        >>> result = await agent.run("hi")
+        >>> len(result.messages)
+        2
+    """
+
+    keep: int | None = None
+    spool: TranscriptSpool | None = None
+
+    def __post_init__(self) -> None:
+        if self.keep is not None and self.keep < 0:
+            raise ValueError("keep must be non-negative")
+
+    @classmethod
+    def full(cls, spool: TranscriptSpool | None = None) -> TranscriptPolicy:
+        """Keep every message."""
+        return cls(None, spool)
+
+    @classmethod
+    def last(cls, n: int, spool: TranscriptSpool | None = None) -> TranscriptPolicy:
+        """Keep the last ``n`` messages."""
+        return cls(n, spool)
+
+    @classmethod
+    def none(cls, spool: TranscriptSpool | None = None) -> TranscriptPolicy:
+        """Keep no messages."""
+        return cls(0, spool)
+
+    async def apply(self, result: AgentResult) -> AgentResult:
+        """Return ``result`` with its transcript spooled and trimmed.
+
+        Results that were already spooled are only trimmed further.
+        """
+        messages = result.messages
+        keep = len(messages) if self.keep is None else min(self.keep, len(messages))
+        spool = self.spool if "transcript_id" not in result.metadata else None
+        if keep == len(messages) and spool is None:
+            return result
+
+        metadata = dict(result.metadata)
+        metadata.setdefault("transcript_length", len(messages))
+        if spool is not None:
+            metadata["transcript_id"] = await spool.save(messages)
+
+        retained = result.model_copy(
+            update={"messages": messages[len(messages) - keep :], "metadata": metadata}
+        )
+        if spool is not None:
+            retained._spool = spool
+        return retained
@@ -7,9 +7,12 @@ All types use Pydantic for validation and serialization.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+if TYPE_CHECKING:
+    from agentchord.core.transcript import TranscriptSpool
 
 
 class MessageRole(str, Enum):
@@ -67,12 +70,23 @@ class Usage(BaseModel):
     completion_tokens: int = Field(
         ..., ge=0, description="Number of completion tokens used"
     )
+    cache_read_tokens: int = Field(
+        0, ge=0, description="Prompt tokens read from the provider's prompt cache"
+    )
+    cache_write_tokens: int = Field(
+        0, ge=0, description="Prompt tokens written to the provider's prompt cache"
+    )
 
     @property
     def total_tokens(self) -> int:
         """Total tokens used."""
         return self.prompt_tokens + self.completion_tokens
 
+    @property
+    def uncached_prompt_tokens(self) -> int:
+        """Prompt tokens billed at the normal input rate."""
+        return max(0, self.prompt_tokens - self.cache_read_tokens - self.cache_write_tokens)
+
 
 class LLMResponse(BaseModel):
     """Response from an LLM provider."""
@@ -87,6 +101,20 @@ class LLMResponse(BaseModel):
     raw_response: dict[str, Any] | None = Field(
         None, description="Raw response from the provider"
     )
+    cache_hit: bool = Field(
+        False, description="Whether the response was served from a response cache"
+    )
+    coalesced: bool = Field(
+        False,
+        description="Whether the response was shared from another caller's identical request",
+    )
+    cost: float | None = Field(
+        None,
+        description=(
+            "Cost in USD when the provider priced the response itself "
+            "(routing and cascade providers); None means the provider's own rates apply"
+        ),
+    )
 
 
 class AgentResult(BaseModel):
@@ -106,6 +134,25 @@ class AgentResult(BaseModel):
         default_factory=dict, description="Additional metadata"
     )
 
+    # Spool holding the full transcript, set by TranscriptPolicy
+    _spool: TranscriptSpool | None = PrivateAttr(default=None)
+
+    async def load_messages(self, spool: TranscriptSpool | None = None) -> list[Message]:
+        """Full conversation history, loaded from the spool if it was spilled.
+
+        Args:
+            spool: Spool to load from, for results restored from JSON.
+                Defaults to the spool the transcript was written to.
+
+        Returns:
+            The full transcript, or ``messages`` if it was never spooled.
+        """
+        transcript_id = self.metadata.get("transcript_id")
+        spool = spool or self._spool
+        if transcript_id is None or spool is None:
+            return list(self.messages)
+        return await spool.load(transcript_id)
+
 
 class StreamChunk(BaseModel):
     """A chunk of streamed LLM response."""
@@ -116,3 +163,9 @@ class StreamChunk(BaseModel):
         None, description="Reason for completion (last chunk only)"
     )
     usage: Usage | None = Field(None, description="Token usage (last chunk only)")
+    tool_calls: list[ToolCall] | None = Field(
+        None, description="Tool calls completed in this chunk"
+    )
+    cache_hit: bool = Field(
+        False, description="Whether the chunk was replayed from a response cache"
+    )
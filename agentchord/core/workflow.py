@@ -8,11 +8,12 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import Any, TYPE_CHECKING
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, TYPE_CHECKING
 
 from agentchord.core.executor import (
     BaseExecutor,
     CompositeExecutor,
+    DAGExecutor,
     MergeStrategy,
     ParallelExecutor,
     SequentialExecutor,
@@ -23,10 +24,15 @@ from agentchord.errors.exceptions import (
     AgentNotFoundInFlowError,
     EmptyWorkflowError,
     InvalidFlowError,
+    RateLimitError,
+    find_error,
 )
+from agentchord.utils.http import get_http_client_manager
 
 if TYPE_CHECKING:
     from agentchord.core.agent import Agent
+    from agentchord.core.batch import BatchResult, ProgressCallback
+    from agentchord.core.transcript import TranscriptPolicy
 
 
 class FlowParser:
@@ -36,6 +42,7 @@ class FlowParser:
         - Sequential: "A -> B -> C"
         - Parallel: "[A, B]"
         - Mixed: "A -> [B, C] -> D"
+        - Dependency graph: "A -> B, A -> C, B + C -> D" (see ``parse_dag``)
 
     Example:
         >>> parser = FlowParser()
@@ -44,6 +51,72 @@ class FlowParser:
 
     ARROW_PATTERN = re.compile(r"\s*->\s*")
     PARALLEL_PATTERN = re.compile(r"\[([^\]]+)\]")
+    # A comma or "+" outside brackets marks a dependency graph
+    DAG_PATTERN = re.compile(r"[,+](?![^\[]*\])")
+
+    @classmethod
+    def is_dag(cls, flow: str) -> bool:
+        """Whether ``flow`` uses the dependency graph syntax."""
+        return bool(cls.DAG_PATTERN.search(flow))
+
+    def parse_dag(
+        self,
+        flow: str,
+        available_agents: list[str],
+        merge_strategy: MergeStrategy = MergeStrategy.CONCAT_NEWLINE,
+    ) -> DAGExecutor:
+        """Parse a dependency graph into a ``DAGExecutor``.
+
+        Comma-separated clauses each declare edges: ``A -> B`` makes B wait
+        for A, ``A + B -> C`` makes C wait for both, and chains such as
+        ``A -> B -> C`` declare every edge along the way. A clause with a
+        single name adds an agent with no dependencies.
+
+        Args:
+            flow: Flow DSL string (e.g., "a -> b, a -> c, b + c -> d").
+            available_agents: List of valid agent names.
+            merge_strategy: Merge strategy for joins and the final output.
+
+        Returns:
+            DAGExecutor for the graph.
+
+        Raises:
+            InvalidFlowError: If flow syntax is invalid or has a cycle.
+            AgentNotFoundInFlowError: If agent name not in available_agents.
+        """
+        if not flow or not flow.strip():
+            raise InvalidFlowError(flow, "Flow string cannot be empty")
+
+        dependencies: dict[str, list[str]] = {}
+        for clause in flow.split(","):
+            if not clause.strip():
+                continue
+            groups = [
+                [name.strip() for name in group.split("+")]
+                for group in self.ARROW_PATTERN.split(clause.strip())
+            ]
+            for group in groups:
+                for name in group:
+                    if not name:
+                        raise InvalidFlowError(flow, f"Empty agent name in '{clause.strip()}'")
+                    if name not in available_agents:
+                        raise AgentNotFoundInFlowError(name, available_agents)
+                    dependencies.setdefault(name, [])
+            for parents, children in zip(groups, groups[1:]):
+                for child in children:
+                    if child in parents:
+                        raise InvalidFlowError(flow, f"Agent '{child}' depends on itself")
+                    dependencies[child].extend(
+                        p for p in parents if p not in dependencies[child]
+                    )
+
+        if not dependencies:
+            raise InvalidFlowError(flow, "No valid steps found")
+
+        try:
+            return DAGExecutor(dependencies, merge_strategy=merge_strategy)
+        except InvalidFlowError as e:
+            raise InvalidFlowError(flow, e.reason) from None
 
     def parse(
         self,
@@ -152,29 +225,42 @@ class Workflow:
     def __init__(
         self,
         agents: list["Agent"],
-        flow: str | None = None,
+        flow: str | BaseExecutor | None = None,
         merge_strategy: MergeStrategy = MergeStrategy.CONCAT_NEWLINE,
+        transcript: "TranscriptPolicy | None" = None,
     ) -> None:
         """Initialize workflow with agents and optional flow.
 
         Args:
             agents: List of Agent instances.
-            flow: Flow DSL string. If None, agents run sequentially in order.
+            flow: Flow DSL string, or an executor such as ``DAGExecutor``.
+                If None, agents run sequentially in order.
             merge_strategy: Strategy for merging parallel execution outputs.
+            transcript: Applied to each agent result as it enters the
+                workflow history, on top of the agents' own policies.
+                None keeps results as the agents return them.
         """
         self._agents: dict[str, "Agent"] = {a.name: a for a in agents}
         self._merge_strategy = merge_strategy
+        self._transcript = transcript
         self._executor: BaseExecutor | None = None
+        self._http_acquired = False
 
         if flow:
             self._set_flow(flow)
         elif agents:
             self._set_sequential_flow([a.name for a in agents])
 
-    def _set_flow(self, flow: str) -> None:
+    def _set_flow(self, flow: str | BaseExecutor) -> None:
         """Parse and set the execution flow."""
+        if isinstance(flow, BaseExecutor):
+            self._executor = flow
+            return
         parser = FlowParser()
         available = list(self._agents.keys())
+        if parser.is_dag(flow):
+            self._executor = parser.parse_dag(flow, available, self._merge_strategy)
+            return
         steps = parser.parse(flow, available, self._merge_strategy)
         self._executor = CompositeExecutor(steps)
 
@@ -205,18 +291,29 @@ class Workflow:
             EmptyWorkflowError: If no agents are defined.
             WorkflowExecutionError: If execution fails.
         """
+        return await self._run(input)
+
+    async def _run(self, input: str, *, raise_rate_limits: bool = False) -> WorkflowResult:
+        """Execute the workflow, optionally letting rate limit errors escape.
+
+        ``run_many()`` sets ``raise_rate_limits`` so the batch runner sees a
+        ``RateLimitError`` and can pause and retry the input instead of
+        getting a FAILED result.
+        """
         if not self._agents:
             raise EmptyWorkflowError()
 
         if self._executor is None:
             raise EmptyWorkflowError()
 
-        state = WorkflowState(input=input)
+        state = WorkflowState(input=input).with_transcript(self._transcript)
 
         try:
             state = await self._executor.execute(self._agents, state)
             state = state.with_status(WorkflowStatus.COMPLETED)
         except Exception as e:
+            if raise_rate_limits and find_error(e, RateLimitError) is not None:
+                raise
             state = state.with_error(str(e))
             return WorkflowResult(
                 output=state.output or "",
@@ -230,6 +327,51 @@ class Workflow:
             status=WorkflowStatus.COMPLETED,
         )
 
+    def run_many(
+        self,
+        inputs: "Iterable[str] | AsyncIterable[str]",
+        *,
+        concurrency: int = 4,
+        ordered: bool = False,
+        on_progress: "ProgressCallback | None" = None,
+    ) -> "AsyncIterator[BatchResult[WorkflowResult]]":
+        """Run the workflow over many inputs with bounded concurrency.
+
+        Each input gets its own ``WorkflowState``; agents are shared. Failed
+        workflows are reported through ``WorkflowResult.status``, except rate
+        limit errors: those pause the batch and retry the input, and if the
+        retries run out the error is reported on ``BatchResult.error``. New
+        inputs stop being started once any agent's cost tracker is over
+        budget.
+
+        Args:
+            inputs: Inputs to process (iterable or async iterable).
+            concurrency: Maximum workflow runs at the same time.
+            ordered: Yield results in input order instead of completion order.
+            on_progress: Sync or async callback receiving ``BatchProgress``.
+
+        Returns:
+            Async iterator of ``BatchResult`` objects.
+        """
+        from agentchord.core.batch import run_batch
+
+        async def _run_item(input: str) -> WorkflowResult:
+            return await self._run(input, raise_rate_limits=True)
+
+        trackers = {
+            id(agent.cost_tracker): agent.cost_tracker
+            for agent in self._agents.values()
+            if agent.cost_tracker is not None
+        }
+        return run_batch(
+            _run_item,
+            inputs,
+            concurrency=concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+            cost_trackers=list(trackers.values()),
+        )
+
     def run_sync(self, input: str) -> WorkflowResult:
         """Execute the workflow synchronously.
 
@@ -255,11 +397,11 @@ class Workflow:
         self._agents[agent.name] = agent
         return self
 
-    def set_flow(self, flow: str) -> "Workflow":
+    def set_flow(self, flow: str | BaseExecutor) -> "Workflow":
         """Set or update the execution flow.
 
         Args:
-            flow: Flow DSL string.
+            flow: Flow DSL string, or an executor.
 
         Returns:
             Self for method chaining.
@@ -269,6 +411,11 @@ class Workflow:
 
     async def __aenter__(self) -> Workflow:
         """Enter async context - prepare all agents."""
+        # Keep shared HTTP connections alive for the whole workflow, not
+        # just while some agent happens to hold them
+        if not self._http_acquired:
+            get_http_client_manager().acquire()
+            self._http_acquired = True
         for agent in self._agents.values():
             await agent.__aenter__()
         return self
@@ -281,6 +428,10 @@ class Workflow:
             except Exception:
                 pass  # Don't mask original exception, cleanup all agents
 
+        if self._http_acquired:
+            self._http_acquired = False
+            await get_http_client_manager().release()
+
     async def close(self) -> None:
         """Explicitly cleanup all workflow agents."""
         await self.__aexit__(None, None, None)
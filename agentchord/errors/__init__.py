@@ -20,6 +20,7 @@ from agentchord.errors.exceptions import (
     AgentNotFoundInFlowError,
     WorkflowExecutionError,
     EmptyWorkflowError,
+    find_error,
 )
 
 __all__ = [
@@ -42,4 +43,5 @@ __all__ = [
     "AgentNotFoundInFlowError",
     "WorkflowExecutionError",
     "EmptyWorkflowError",
+    "find_error",
 ]
@@ -6,6 +6,10 @@ Each exception includes a `retryable` flag to indicate if the operation can be r
 
 from __future__ import annotations
 
+from typing import TypeVar
+
+E = TypeVar("E", bound=BaseException)
+
 
 class AgentChordError(Exception):
     """Base exception for all AgentChord errors."""
@@ -232,3 +236,27 @@ class EmptyWorkflowError(WorkflowError):
             "Workflow has no agents. Add agents before running.",
             retryable=False,
         )
+
+
+def find_error(error: BaseException | None, kind: type[E]) -> E | None:
+    """Find an exception of type ``kind`` in ``error``'s cause chain.
+
+    Agents and workflows wrap provider errors (e.g. ``RateLimitError``
+    inside ``AgentExecutionError``), so ``isinstance`` on the raised error
+    alone misses them.
+
+    Args:
+        error: Exception to inspect (None finds nothing).
+        kind: Exception type to look for.
+
+    Returns:
+        The first matching exception, or None.
+    """
+    seen: set[int] = set()
+    current = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, kind):
+            return current
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return None
@@ -24,4 +24,28 @@ def __getattr__(name: str):
     elif name == "GeminiProvider":
         from agentchord.llm.gemini import GeminiProvider
         return GeminiProvider
+    elif name == "CachedProvider":
+        from agentchord.llm.cache import CachedProvider
+        return CachedProvider
+    elif name == "ResponseCache":
+        from agentchord.llm.cache import ResponseCache
+        return ResponseCache
+    elif name == "SQLiteResponseStore":
+        from agentchord.llm.cache import SQLiteResponseStore
+        return SQLiteResponseStore
+    elif name == "RateLimiter":
+        from agentchord.llm.rate_limit import RateLimiter
+        return RateLimiter
+    elif name == "RateLimitedProvider":
+        from agentchord.llm.rate_limit import RateLimitedProvider
+        return RateLimitedProvider
+    elif name == "CoalescingProvider":
+        from agentchord.llm.coalesce import CoalescingProvider
+        return CoalescingProvider
+    elif name == "RoutedProvider":
+        from agentchord.llm.router import RoutedProvider
+        return RoutedProvider
+    elif name == "CascadeProvider":
+        from agentchord.llm.cascade import CascadeProvider
+        return CascadeProvider
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,16 @@ from __future__ import annotations
 import os
 from typing import Any, AsyncIterator
 
-from agentchord.core.types import LLMResponse, Message, MessageRole, StreamChunk, ToolCall, Usage
+from agentchord.core.conversation import convert_messages
+from agentchord.core.streaming import AnyStreamChunk, FastStreamChunk, validate_chunks
+from agentchord.core.types import (
+    LLMResponse,
+    Message,
+    MessageRole,
+    StreamChunk,
+    ToolCall,
+    Usage,
+)
 from agentchord.errors.exceptions import (
     APIError,
     AuthenticationError,
@@ -14,6 +23,8 @@ from agentchord.errors.exceptions import (
     TimeoutError,
 )
 from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.rate_limit import parse_retry_after
+from agentchord.llm.tool_stream import ToolCallAccumulator
 
 # Pricing as of 2025 (USD per 1K tokens)
 MODEL_COSTS: dict[str, dict[str, float]] = {
@@ -33,22 +44,35 @@ MODEL_COSTS: dict[str, dict[str, float]] = {
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 DEFAULT_COST = {"input": 0.003, "output": 0.015}
 
+# Anthropic allows at most four cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude API provider.
 
+    With ``prompt_caching`` enabled (the default), cache breakpoints are
+    placed on the stable prefix of every request: the tool definitions,
+    the system prompt and the conversation history before the newest
+    turn. Repeated runs and tool-calling rounds then read that prefix
+    from Anthropic's prompt cache instead of processing it again.
+
     Example:
         >>> provider = AnthropicProvider(model="claude-3-5-sonnet-latest")
         >>> response = await provider.complete([Message.user("Hello!")])
         >>> print(response.content)
     """
 
+    supports_streaming_tool_calls = True
+
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
         api_key: str | None = None,
         base_url: str | None = None,
         timeout: float = 60.0,
+        prompt_caching: bool = True,
     ) -> None:
         """Initialize Anthropic provider.
 
@@ -57,11 +81,13 @@ class AnthropicProvider(BaseLLMProvider):
             api_key: Anthropic API key. Defaults to ANTHROPIC_API_KEY env var.
             base_url: Custom API base URL for proxies.
             timeout: Request timeout in seconds.
+            prompt_caching: Place cache breakpoints on stable prompt prefixes.
         """
         self._model = model
         self._api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self._base_url = base_url
         self._timeout = timeout
+        self._prompt_caching = prompt_caching
         self._client: Any = None
 
     def _get_client(self) -> Any:
@@ -130,26 +156,17 @@ class AnthropicProvider(BaseLLMProvider):
             LLMResponse with generated content and usage.
         """
         client = self._get_client()
-        system_prompt, anthropic_messages = self._extract_system_and_messages(messages)
+        create_kwargs = self._build_request(messages, temperature, max_tokens, kwargs)
 
         try:
-            create_kwargs: dict[str, Any] = {
-                "model": self._model,
-                "messages": anthropic_messages,
-                "max_tokens": max_tokens,
-                "temperature": min(temperature, 1.0),  # Claude max is 1.0
-                **kwargs,
-            }
-            if system_prompt:
-                create_kwargs["system"] = system_prompt
-
-            response = await client.messages.create(**create_kwargs)
+            raw = await client.messages.with_raw_response.create(**create_kwargs)
         except Exception as e:
             self._handle_error(e)
 
-        return self._convert_response(response)
+        self._report_response_headers(raw.headers)
+        return self._convert_response(raw.parse())
 
-    async def stream(
+    def stream(
         self,
         messages: list[Message],
         *,
@@ -157,44 +174,139 @@ class AnthropicProvider(BaseLLMProvider):
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
         """Stream a completion using Anthropic API."""
         client = self._get_client()
-        system_prompt, anthropic_messages = self._extract_system_and_messages(messages)
-
-        create_kwargs: dict[str, Any] = {
-            "model": self._model,
-            "messages": anthropic_messages,
-            "max_tokens": max_tokens,
-            "temperature": min(temperature, 1.0),
-            **kwargs,
-        }
-        if system_prompt:
-            create_kwargs["system"] = system_prompt
+        create_kwargs = self._build_request(messages, temperature, max_tokens, kwargs)
 
         try:
             async with client.messages.stream(**create_kwargs) as stream:
+                self._report_response_headers(
+                    getattr(getattr(stream, "response", None), "headers", None)
+                )
                 content = ""
-                async for text in stream.text_stream:
-                    content += text
-                    yield StreamChunk(
-                        content=content,
-                        delta=text,
-                    )
+                tool_calls = ToolCallAccumulator()
+                async for event in stream:
+                    if event.type == "content_block_start":
+                        block = event.content_block
+                        if block.type == "tool_use":
+                            tool_calls.start(event.index, id=block.id, name=block.name)
+                    elif event.type == "content_block_delta":
+                        if event.delta.type == "text_delta":
+                            content += event.delta.text
+                            yield FastStreamChunk(content=content, delta=event.delta.text)
+                        elif event.delta.type == "input_json_delta":
+                            tool_calls.append(event.index, event.delta.partial_json)
+                    elif event.type == "content_block_stop":
+                        # A tool call is complete when its block closes
+                        tool_call = tool_calls.finish(event.index)
+                        if tool_call is not None:
+                            yield FastStreamChunk(
+                                content=content, delta="", tool_calls=[tool_call]
+                            )
 
                 # Get final message for usage stats
                 final_message = await stream.get_final_message()
-                yield StreamChunk(
+                yield FastStreamChunk(
                     content=content,
                     delta="",
                     finish_reason=final_message.stop_reason,
-                    usage=Usage(
-                        prompt_tokens=final_message.usage.input_tokens,
-                        completion_tokens=final_message.usage.output_tokens,
-                    ),
+                    usage=self._convert_usage(final_message.usage),
                 )
         except Exception as e:
             self._handle_error(e)
 
+    def _build_request(
+        self,
+        messages: list[Message],
+        temperature: float,
+        max_tokens: int,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build keyword arguments for ``messages.create``/``messages.stream``."""
+        system_prompt, anthropic_messages = self._extract_system_and_messages(messages)
+
+        create_kwargs: dict[str, Any] = {
+            "model": self._model,
+            "messages": anthropic_messages,
+            "max_tokens": max_tokens,
+            "temperature": min(temperature, 1.0),  # Claude max is 1.0
+            **kwargs,
+        }
+        if system_prompt:
+            create_kwargs["system"] = system_prompt
+        if self._prompt_caching:
+            self._add_cache_breakpoints(create_kwargs)
+        return create_kwargs
+
+    @staticmethod
+    def _add_cache_breakpoints(create_kwargs: dict[str, Any]) -> None:
+        """Mark the stable prefix of a request as cacheable.
+
+        The cache prefix runs tools -> system -> messages, so breakpoints go
+        on the last tool, the system prompt and the last message before the
+        newest turn. Requests that already carry ``cache_control`` are left
+        alone.
+        """
+        if _count_breakpoints(create_kwargs) > 0:
+            return
+        budget = MAX_CACHE_BREAKPOINTS
+
+        tools = create_kwargs.get("tools")
+        if tools:
+            create_kwargs["tools"] = [
+                *tools[:-1],
+                {**tools[-1], "cache_control": CACHE_CONTROL},
+            ]
+            budget -= 1
+
+        system = create_kwargs.get("system")
+        if isinstance(system, str) and system:
+            create_kwargs["system"] = [
+                {"type": "text", "text": system, "cache_control": CACHE_CONTROL},
+            ]
+            budget -= 1
+
+        # History before the newest turn is identical on the next round
+        # or run. A single message has no history worth caching.
+        messages = create_kwargs["messages"]
+        if budget > 0 and len(messages) > 1:
+            index = len(messages) - 2
+            marked = _with_cache_control(messages[index])
+            if marked is not None:
+                create_kwargs["messages"] = [
+                    *messages[:index], marked, *messages[index + 1:],
+                ]
+
+    @staticmethod
+    def _convert_usage(usage: Any) -> Usage:
+        """Convert Anthropic usage, folding cached tokens into prompt tokens.
+
+        Anthropic reports ``input_tokens`` without the tokens read from or
+        written to the cache; ``Usage.prompt_tokens`` counts all of them.
+        """
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        cache_write = getattr(usage, "cache_creation_input_tokens", None)
+        cache_read = cache_read if isinstance(cache_read, int) else 0
+        cache_write = cache_write if isinstance(cache_write, int) else 0
+        return Usage(
+            prompt_tokens=usage.input_tokens + cache_read + cache_write,
+            completion_tokens=usage.output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
+
     def _extract_system_and_messages(
         self, messages: list[Message]
     ) -> tuple[str | None, list[dict[str, Any]]]:
@@ -203,44 +315,49 @@ class AnthropicProvider(BaseLLMProvider):
         Anthropic handles system messages separately from other messages.
         """
         system_prompt: str | None = None
-        anthropic_messages: list[dict[str, Any]] = []
-
         for msg in messages:
             if msg.role == MessageRole.SYSTEM:
                 system_prompt = msg.content
-            elif msg.role == MessageRole.TOOL:
-                anthropic_messages.append({
-                    "role": "user",
-                    "content": [{
-                        "type": "tool_result",
-                        "tool_use_id": msg.tool_call_id or "",
-                        "content": msg.content,
-                    }],
-                })
-            elif msg.role == MessageRole.ASSISTANT and msg.tool_calls:
-                content_blocks: list[dict[str, Any]] = []
-                if msg.content:
-                    content_blocks.append({"type": "text", "text": msg.content})
-                for tc in msg.tool_calls:
-                    content_blocks.append({
-                        "type": "tool_use",
-                        "id": tc.id,
-                        "name": tc.name,
-                        "input": tc.arguments,
-                    })
-                anthropic_messages.append({
-                    "role": "assistant",
-                    "content": content_blocks,
-                })
-            else:
-                role = "user" if msg.role == MessageRole.USER else "assistant"
-                anthropic_messages.append({
-                    "role": role,
-                    "content": msg.content,
-                })
 
+        converted = convert_messages(messages, "anthropic", self._convert_message)
+        anthropic_messages = [m for m in converted if m is not None]
         return system_prompt, anthropic_messages
 
+    @staticmethod
+    def _convert_message(msg: Message) -> dict[str, Any] | None:
+        """Convert one message to Anthropic format (``None`` for system)."""
+        if msg.role == MessageRole.SYSTEM:
+            return None
+        if msg.role == MessageRole.TOOL:
+            return {
+                "role": "user",
+                "content": [{
+                    "type": "tool_result",
+                    "tool_use_id": msg.tool_call_id or "",
+                    "content": msg.content,
+                }],
+            }
+        if msg.role == MessageRole.ASSISTANT and msg.tool_calls:
+            content_blocks: list[dict[str, Any]] = []
+            if msg.content:
+                content_blocks.append({"type": "text", "text": msg.content})
+            for tc in msg.tool_calls:
+                content_blocks.append({
+                    "type": "tool_use",
+                    "id": tc.id,
+                    "name": tc.name,
+                    "input": tc.arguments,
+                })
+            return {
+                "role": "assistant",
+                "content": content_blocks,
+            }
+        role = "user" if msg.role == MessageRole.USER else "assistant"
+        return {
+            "role": role,
+            "content": msg.content,
+        }
+
     def _convert_response(self, response: Any) -> LLMResponse:
         """Convert Anthropic response to AgentChord format."""
         content = ""
@@ -259,10 +376,7 @@ class AnthropicProvider(BaseLLMProvider):
         return LLMResponse(
             content=content,
             model=response.model,
-            usage=Usage(
-                prompt_tokens=response.usage.input_tokens,
-                completion_tokens=response.usage.output_tokens,
-            ),
+            usage=self._convert_usage(response.usage),
             finish_reason=response.stop_reason or "end_turn",
             tool_calls=tool_calls if tool_calls else None,
             raw_response={
@@ -282,10 +396,13 @@ class AnthropicProvider(BaseLLMProvider):
             raise error
 
         if isinstance(error, anthropic.RateLimitError):
+            headers = getattr(getattr(error, "response", None), "headers", None)
+            self._report_response_headers(headers)
             raise RateLimitError(
                 str(error),
                 provider="anthropic",
                 model=self._model,
+                retry_after=parse_retry_after(headers),
             ) from error
         elif isinstance(error, anthropic.AuthenticationError):
             raise AuthenticationError(
@@ -306,3 +423,33 @@ class AnthropicProvider(BaseLLMProvider):
                 model=self._model,
             ) from error
         raise error
+
+
+def _count_breakpoints(create_kwargs: dict[str, Any]) -> int:
+    """Count ``cache_control`` markers the caller already set."""
+    count = sum(1 for tool in create_kwargs.get("tools") or () if "cache_control" in tool)
+    system = create_kwargs.get("system")
+    if isinstance(system, list):
+        count += sum(1 for block in system if "cache_control" in block)
+    for message in create_kwargs.get("messages", ()):
+        content = message.get("content")
+        if isinstance(content, list):
+            count += sum(
+                1 for block in content if isinstance(block, dict) and "cache_control" in block
+            )
+    return count
+
+
+def _with_cache_control(message: dict[str, Any]) -> dict[str, Any] | None:
+    """Copy of ``message`` with a breakpoint on its last content block."""
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return None
+        blocks: list[dict[str, Any]] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content:
+        blocks = list(content)
+    else:
+        return None
+    blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+    return {**message, "content": blocks}
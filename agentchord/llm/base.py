@@ -6,9 +6,11 @@ All LLM providers must implement this abstract base class.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable, Mapping
 
+from agentchord.core.streaming import AnyStreamChunk
 from agentchord.core.types import LLMResponse, Message, StreamChunk
+from agentchord.tracking.pricing import get_cache_pricing
 
 
 class BaseLLMProvider(ABC):
@@ -24,6 +26,15 @@ class BaseLLMProvider(ABC):
         ...         pass
     """
 
+    # Called with HTTP response headers when a provider can see them
+    # (used by RateLimiter to learn limits). Set per instance.
+    response_headers_hook: Callable[[Mapping[str, str]], None] | None = None
+
+    # Whether stream() accepts ``tools`` and yields completed tool calls
+    # in ``StreamChunk.tool_calls``. Agent.stream falls back to complete()
+    # for tool-calling rounds when this is False.
+    supports_streaming_tool_calls: bool = False
+
     @property
     @abstractmethod
     def model(self) -> str:
@@ -36,6 +47,19 @@ class BaseLLMProvider(ABC):
         """Return the provider name (e.g., 'openai', 'anthropic')."""
         ...
 
+    @property
+    def cache_read_cost_multiplier(self) -> float:
+        """Price of a prompt cache read relative to an input token.
+
+        Looked up from ``tracking.pricing.CACHE_PRICING`` by model.
+        """
+        return get_cache_pricing(self.model)[0]
+
+    @property
+    def cache_write_cost_multiplier(self) -> float:
+        """Price of a prompt cache write relative to an input token."""
+        return get_cache_pricing(self.model)[1]
+
     @abstractmethod
     async def complete(
         self,
@@ -86,6 +110,41 @@ class BaseLLMProvider(ABC):
         """
         ...
 
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
+        """Stream a completion without validating each chunk.
+
+        Agents and wrapping providers read streams through this method.
+        Built-in providers yield the non-validating ``FastStreamChunk``
+        here, which has the same attributes as ``StreamChunk``, and
+        validate in ``stream()``. The default passes ``stream()`` through.
+
+        Args:
+            messages: List of conversation messages.
+            temperature: Sampling temperature (0.0-2.0).
+            max_tokens: Maximum tokens to generate.
+            **kwargs: Additional provider-specific parameters.
+
+        Yields:
+            StreamChunk or FastStreamChunk containing incremental content.
+        """
+        stream = self.stream(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     @property
     @abstractmethod
     def cost_per_1k_input_tokens(self) -> float:
@@ -98,19 +157,64 @@ class BaseLLMProvider(ABC):
         """Cost per 1,000 output tokens in USD."""
         ...
 
-    def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    def calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        *,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float:
         """Calculate the cost for given token usage.
 
         Args:
-            input_tokens: Number of input tokens.
+            input_tokens: Number of input tokens, including cached ones.
             output_tokens: Number of output tokens.
+            cache_read_tokens: Input tokens read from the prompt cache.
+            cache_write_tokens: Input tokens written to the prompt cache.
 
         Returns:
             Estimated cost in USD.
         """
+        uncached = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+        input_tokens = (
+            uncached
+            + cache_read_tokens * self.cache_read_cost_multiplier
+            + cache_write_tokens * self.cache_write_cost_multiplier
+        )
         input_cost = (input_tokens / 1000) * self.cost_per_1k_input_tokens
         output_cost = (output_tokens / 1000) * self.cost_per_1k_output_tokens
         return input_cost + output_cost
 
+    def response_cost(self, response: LLMResponse) -> float:
+        """Cost of one response: ``response.cost`` if set, else priced here.
+
+        Responses served from a response cache cost nothing.
+        """
+        if response.cache_hit:
+            return 0.0
+        if response.cost is not None:
+            return response.cost
+        usage = response.usage
+        return self.calculate_cost(
+            usage.prompt_tokens,
+            usage.completion_tokens,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
+
+    def _report_response_headers(self, headers: Mapping[str, str] | None) -> None:
+        """Pass response headers to ``response_headers_hook``, if set.
+
+        Hook failures are ignored; they must never fail the request.
+        """
+        hook = self.response_headers_hook
+        if hook is None or not headers:
+            return
+        try:
+            hook(headers)
+        except Exception:
+            pass
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model!r})"
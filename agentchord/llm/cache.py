@@ -0,0 +1,551 @@
+"""Exact-match response cache for LLM providers.
+
+Test, replay and evaluation runs often send byte-identical requests (same
+messages, model, tools and ``temperature=0``). ``CachedProvider`` wraps any
+``BaseLLMProvider`` and answers those requests from a ``ResponseCache``
+instead of calling the API again.
+
+Cache keys are SHA-256 hashes of a canonical JSON encoding of the provider,
+model, messages and every request parameter. Cached responses come back with
+``cache_hit=True`` so usage and cost reporting can tell them apart.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from agentchord.core.streaming import AnyStreamChunk, FastStreamChunk, validate_chunks
+from agentchord.core.types import LLMResponse, Message, StreamChunk, ToolCall, Usage
+from agentchord.llm.base import BaseLLMProvider
+
+# Optional dependency - gracefully handle missing aiosqlite
+try:
+    import aiosqlite
+
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    AIOSQLITE_AVAILABLE = False
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    messages: list[Message],
+    **params: Any,
+) -> str:
+    """Build a canonical cache key for a completion request.
+
+    Args:
+        provider: Provider name.
+        model: Model identifier.
+        messages: Conversation messages.
+        **params: Request parameters (temperature, max_tokens, tools, ...).
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    payload = {
+        "provider": provider,
+        "model": model,
+        "messages": [m.model_dump(mode="json", exclude_none=True) for m in messages],
+        "params": params,
+    }
+    blob = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss statistics for a ``ResponseCache``."""
+
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    store_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    saved_tokens: int = 0
+    saved_cost_usd: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        """Total lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        return self.hits / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, including derived values."""
+        data = asdict(self)
+        data["requests"] = self.requests
+        data["hit_rate"] = self.hit_rate
+        return data
+
+
+class SQLiteResponseStore:
+    """SQLite-backed second tier for ``ResponseCache``.
+
+    Survives process restarts, so replay and evaluation runs can reuse
+    responses recorded by earlier runs.
+
+    Example:
+        >>> store = SQLiteResponseStore("llm_cache.db")
+        >>> cache = ResponseCache(max_size=512, ttl=None, store=store)
+
+    Note:
+        Requires aiosqlite package: pip install aiosqlite
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:") -> None:
+        """Initialize SQLite response store.
+
+        Args:
+            db_path: Path to SQLite database file, or ":memory:" for in-memory DB.
+
+        Raises:
+            ImportError: If aiosqlite is not installed.
+        """
+        if not AIOSQLITE_AVAILABLE:
+            raise ImportError(
+                "aiosqlite is required for SQLiteResponseStore. "
+                "Install it with: pip install aiosqlite"
+            )
+
+        self._db_path = str(db_path)
+        self._is_memory = self._db_path == ":memory:"
+        self._memory_conn: aiosqlite.Connection | None = None
+        self._table_created = False
+
+    @asynccontextmanager
+    async def _get_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Get database connection (persistent for :memory: databases)."""
+        if self._is_memory:
+            if self._memory_conn is None:
+                self._memory_conn = await aiosqlite.connect(self._db_path)
+            yield self._memory_conn
+        else:
+            async with aiosqlite.connect(self._db_path) as db:
+                yield db
+
+    async def _ensure_table(self, db: aiosqlite.Connection) -> None:
+        """Create the cache table if it doesn't exist."""
+        if self._table_created and self._is_memory:
+            return
+
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        await db.commit()
+        self._table_created = True
+
+    async def get(self, key: str) -> tuple[LLMResponse, float | None] | None:
+        """Load a response and its expiry time, or None if absent."""
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            async with db.execute(
+                "SELECT response, expires_at FROM llm_response_cache WHERE key = ?",
+                (key,),
+            ) as cursor:
+                row = await cursor.fetchone()
+
+        if row is None:
+            return None
+        response_json, expires_at = row
+        return LLMResponse.model_validate_json(response_json), expires_at
+
+    async def set(
+        self, key: str, response: LLMResponse, expires_at: float | None
+    ) -> None:
+        """Insert or replace a response."""
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO llm_response_cache
+                    (key, response, created_at, expires_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, response.model_dump_json(), time.time(), expires_at),
+            )
+            await db.commit()
+
+    async def delete(self, key: str) -> None:
+        """Remove a response."""
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            await db.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+            await db.commit()
+
+    async def clear(self) -> None:
+        """Remove every response."""
+        async with self._get_connection() as db:
+            await self._ensure_table(db)
+            await db.execute("DELETE FROM llm_response_cache")
+            await db.commit()
+
+    async def close(self) -> None:
+        """Close the persistent connection (in-memory databases only)."""
+        if self._memory_conn is not None:
+            await self._memory_conn.close()
+            self._memory_conn = None
+            self._table_created = False
+
+
+class ResponseCache:
+    """In-memory LRU cache of LLM responses with TTL and optional disk tier.
+
+    Lookups check the memory tier first, then the store (if configured).
+    Store hits are promoted into memory. Writes go to both tiers.
+
+    Example:
+        >>> cache = ResponseCache(max_size=1024, ttl=3600)
+        >>> provider = CachedProvider(OpenAIProvider(model="gpt-4o-mini"), cache)
+        >>> print(cache.stats.hit_rate)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = 3600.0,
+        store: SQLiteResponseStore | None = None,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            max_size: Maximum entries kept in memory (least recently used
+                entries are evicted first).
+            ttl: Seconds before an entry expires (None = never).
+            store: Optional persistent second tier.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._store = store
+        self._entries: OrderedDict[str, tuple[LLMResponse, float | None]] = OrderedDict()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss statistics."""
+        return self._stats
+
+    @property
+    def store(self) -> SQLiteResponseStore | None:
+        """Persistent second tier, if any."""
+        return self._store
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """Look up a response, updating statistics.
+
+        Args:
+            key: Cache key from ``make_cache_key``.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        now = time.time()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            response, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[key]
+                self._stats.expirations += 1
+            else:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                self._stats.memory_hits += 1
+                return response
+
+        if self._store is not None:
+            stored = await self._store.get(key)
+            if stored is not None:
+                response, expires_at = stored
+                if expires_at is not None and expires_at <= now:
+                    await self._store.delete(key)
+                    self._stats.expirations += 1
+                else:
+                    self._put_memory(key, response, expires_at)
+                    self._stats.hits += 1
+                    self._stats.store_hits += 1
+                    return response
+
+        self._stats.misses += 1
+        return None
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response in every tier.
+
+        Args:
+            key: Cache key from ``make_cache_key``.
+            response: Response to cache.
+        """
+        expires_at = time.time() + self._ttl if self._ttl is not None else None
+        self._put_memory(key, response, expires_at)
+        if self._store is not None:
+            await self._store.set(key, response, expires_at)
+
+    def _put_memory(
+        self, key: str, response: LLMResponse, expires_at: float | None
+    ) -> None:
+        """Insert into the memory tier, evicting LRU entries if full."""
+        self._entries[key] = (response, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    async def clear(self) -> None:
+        """Remove every entry from all tiers. Statistics are kept."""
+        self._entries.clear()
+        if self._store is not None:
+            await self._store.clear()
+
+    def reset_stats(self) -> CacheStats:
+        """Reset statistics and return the previous values."""
+        previous, self._stats = self._stats, CacheStats()
+        return previous
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseCache(size={len(self._entries)}, max_size={self._max_size}, "
+            f"hit_rate={self._stats.hit_rate:.2f})"
+        )
+
+
+_REPLAY_PIECES = re.compile(r"\S+\s*|\s+")
+
+
+class CachedProvider(BaseLLMProvider):
+    """Provider wrapper that serves repeated requests from a ``ResponseCache``.
+
+    By default only deterministic requests (``temperature == 0``) are cached,
+    since sampling at higher temperatures is expected to vary. Set
+    ``only_deterministic=False`` to cache every request, e.g. for replaying
+    recorded runs.
+
+    ``stream()`` replays cached responses as word-sized chunks, and caches
+    completed streams for later ``complete()`` or ``stream()`` calls.
+
+    Example:
+        >>> provider = CachedProvider(
+        ...     OpenAIProvider(model="gpt-4o-mini"),
+        ...     ResponseCache(store=SQLiteResponseStore("llm_cache.db")),
+        ... )
+        >>> agent = Agent(name="eval", role="grader", llm_provider=provider, temperature=0)
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        cache: ResponseCache | None = None,
+        *,
+        only_deterministic: bool = True,
+    ) -> None:
+        """Initialize cached provider.
+
+        Args:
+            provider: Provider that handles cache misses.
+            cache: Response cache (a private in-memory cache if None).
+                Share one cache between providers to pool entries.
+            only_deterministic: Only cache requests with ``temperature == 0``.
+        """
+        self._provider = provider
+        self._cache = cache if cache is not None else ResponseCache()
+        self._only_deterministic = only_deterministic
+
+    @property
+    def provider(self) -> BaseLLMProvider:
+        """Wrapped provider."""
+        return self._provider
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Response cache."""
+        return self._cache
+
+    @property
+    def model(self) -> str:
+        return self._provider.model
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.provider_name
+
+    @property
+    def cost_per_1k_input_tokens(self) -> float:
+        return self._provider.cost_per_1k_input_tokens
+
+    @property
+    def cost_per_1k_output_tokens(self) -> float:
+        return self._provider.cost_per_1k_output_tokens
+
+    @property
+    def supports_streaming_tool_calls(self) -> bool:  # type: ignore[override]
+        return self._provider.supports_streaming_tool_calls
+
+    def calculate_cost(
+        self, input_tokens: int, output_tokens: int, **cache_tokens: int
+    ) -> float:
+        return self._provider.calculate_cost(input_tokens, output_tokens, **cache_tokens)
+
+    def _key(
+        self,
+        messages: list[Message],
+        temperature: float,
+        max_tokens: int,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Cache key for a request, or None if it shouldn't be cached."""
+        if self._only_deterministic and temperature != 0:
+            return None
+        return make_cache_key(
+            self.provider_name,
+            self.model,
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+
+    def _record_hit(self, response: LLMResponse) -> LLMResponse:
+        """Update savings statistics and mark the response as cached."""
+        usage = response.usage
+        self._cache.stats.saved_tokens += usage.total_tokens
+        self._cache.stats.saved_cost_usd += self.calculate_cost(
+            usage.prompt_tokens, usage.completion_tokens
+        )
+        return response.model_copy(update={"cache_hit": True})
+
+    async def complete(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        key = self._key(messages, temperature, max_tokens, kwargs)
+        if key is not None:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return self._record_hit(cached)
+
+        response = await self._provider.complete(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        if key is not None:
+            await self._cache.set(key, response)
+        return response
+
+    def stream(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
+        key = self._key(messages, temperature, max_tokens, kwargs)
+        if key is not None:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                response = self._record_hit(cached)
+                async for chunk in self._replay(response):
+                    yield chunk
+                return
+
+        content = ""
+        finish_reason: str | None = None
+        usage: Usage | None = None
+        tool_calls: list[ToolCall] = []
+        async for chunk in self._provider.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ):
+            content = chunk.content
+            if chunk.finish_reason is not None:
+                finish_reason = chunk.finish_reason
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if chunk.tool_calls:
+                tool_calls.extend(chunk.tool_calls)
+            yield chunk
+
+        # Only cache streams that ran to completion
+        if key is not None and finish_reason is not None:
+            await self._cache.set(
+                key,
+                LLMResponse(
+                    content=content,
+                    model=self.model,
+                    usage=usage or Usage(prompt_tokens=0, completion_tokens=0),
+                    finish_reason=finish_reason,
+                    tool_calls=tool_calls or None,
+                ),
+            )
+
+    @staticmethod
+    async def _replay(response: LLMResponse) -> AsyncIterator[AnyStreamChunk]:
+        """Yield a cached response as incremental stream chunks."""
+        pieces = _REPLAY_PIECES.findall(response.content) or [""]
+        content = ""
+        last = len(pieces) - 1
+        for i, piece in enumerate(pieces):
+            content += piece
+            if i < last:
+                yield FastStreamChunk(content=content, delta=piece, cache_hit=True)
+            else:
+                yield FastStreamChunk(
+                    content=content,
+                    delta=piece,
+                    finish_reason=response.finish_reason,
+                    usage=response.usage,
+                    tool_calls=response.tool_calls,
+                    cache_hit=True,
+                )
+
+    def __repr__(self) -> str:
+        return f"CachedProvider({self._provider!r}, cache={self._cache!r})"
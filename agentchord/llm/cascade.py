@@ -0,0 +1,334 @@
+"""Model cascades: try a cheap model first, escalate when it isn't good enough.
+
+``CascadeProvider`` sends each request to its tiers in order, cheapest
+first. A verifier checks every answer; the first answer that passes is
+returned, and the last tier's answer is returned regardless.
+"""
+
+from __future__ import annotations
+
+import inspect
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Sequence, Union
+
+from agentchord.core.types import LLMResponse, Message, StreamChunk, Usage
+from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.tool_format import request_for_provider
+
+if TYPE_CHECKING:
+    from agentchord.core.structured import OutputSchema
+
+# Called with the tier's response and the request messages; True accepts
+Verifier = Callable[[LLMResponse, list[Message]], Union[bool, Awaitable[bool]]]
+
+_CONFIDENCE_PATTERN = re.compile(
+    r"[\"']?confidence[\"']?\s*[:=]\s*[\"']?(\d+(?:\.\d+)?)\s*(%)?", re.IGNORECASE
+)
+
+
+def schema_verifier(schema: OutputSchema[Any]) -> Verifier:
+    """Accept answers that validate against ``schema``."""
+
+    def verify(response: LLMResponse, messages: list[Message]) -> bool:
+        return schema.validate_safe(response.content) is not None
+
+    return verify
+
+
+def parse_confidence(text: str) -> float | None:
+    """Find a self-reported confidence in ``text``.
+
+    Matches ``confidence: 0.8``, ``Confidence = 80%`` or a JSON
+    ``"confidence": 0.8`` field. Values above 1 are read as percentages.
+
+    Returns:
+        Confidence between 0 and 1, or None if none was reported.
+    """
+    matches = _CONFIDENCE_PATTERN.findall(text)
+    if not matches:
+        return None
+    # The model usually states its confidence last
+    value, percent = matches[-1]
+    confidence = float(value)
+    if percent or confidence > 1:
+        confidence /= 100
+    return min(confidence, 1.0)
+
+
+def confidence_verifier(threshold: float = 0.7) -> Verifier:
+    """Accept answers whose self-reported confidence is at least ``threshold``.
+
+    The prompt must ask the model to report its confidence (see
+    ``parse_confidence`` for the accepted formats). Answers without one
+    are escalated.
+    """
+    if not 0 <= threshold <= 1:
+        raise ValueError("threshold must be between 0 and 1")
+
+    def verify(response: LLMResponse, messages: list[Message]) -> bool:
+        confidence = parse_confidence(response.content)
+        return confidence is not None and confidence >= threshold
+
+    return verify
+
+
+@dataclass
+class TierStats:
+    """Counters for one ``CascadeProvider`` tier."""
+
+    model: str
+    calls: int = 0
+    accepted: int = 0
+    escalated: int = 0
+    errors: int = 0
+    cost: float = 0.0
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of this tier's calls passed on to the next tier."""
+        return self.escalated / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "model": self.model,
+            "calls": self.calls,
+            "accepted": self.accepted,
+            "escalated": self.escalated,
+            "errors": self.errors,
+            "cost": self.cost,
+            "escalation_rate": self.escalation_rate,
+        }
+
+
+@dataclass
+class CascadeStats:
+    """Counters for a ``CascadeProvider``."""
+
+    requests: int = 0
+    escalated_requests: int = 0
+    tiers: list[TierStats] = field(default_factory=list)
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of requests answered by a tier other than the first."""
+        return self.escalated_requests / self.requests if self.requests else 0.0
+
+    @property
+    def cost(self) -> float:
+        """Total spend across tiers, including discarded answers."""
+        return sum(t.cost for t in self.tiers)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "escalated_requests": self.escalated_requests,
+            "escalation_rate": self.escalation_rate,
+            "cost": self.cost,
+            "tiers": [t.to_dict() for t in self.tiers],
+        }
+
+
+class CascadeProvider(BaseLLMProvider):
+    """Provider that escalates from cheap to strong models.
+
+    Each request goes to the first tier. If the verifier rejects the
+    answer (or the tier fails, with ``escalate_on_error``), the request is
+    sent to the next tier. The last tier's answer is returned without
+    verification. Responses with tool calls are accepted as-is, since they
+    aren't final answers.
+
+    The verifier is an ``OutputSchema`` (answers must validate), or a
+    callable ``(response, messages) -> bool`` that may be async; see
+    ``schema_verifier`` and ``confidence_verifier``.
+
+    ``stream()`` has to verify an answer before sending it, so the answer
+    arrives as one chunk.
+
+    Tool definitions are converted to each tier's format, so tiers from
+    different providers can be mixed. The returned response's ``usage``
+    and ``cost`` cover every tier the request went through, including
+    discarded answers; ``model`` names the tier that answered. The
+    provider's own ``model``, ``provider_name`` and pricing report the
+    first tier.
+
+    Example:
+        >>> provider = CascadeProvider(
+        ...     ["gpt-4o-mini", "gpt-4o"],
+        ...     verifier=OutputSchema(Answer),
+        ... )
+        >>> agent = Agent(name="a", role="r", llm_provider=provider)
+        >>> provider.stats.escalation_rate
+        0.12
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[BaseLLMProvider | str],
+        verifier: Verifier | OutputSchema[Any],
+        *,
+        escalate_on_error: bool = True,
+    ) -> None:
+        """Initialize cascade provider.
+
+        Args:
+            tiers: Providers, or model names created through the provider
+                registry, cheapest first.
+            verifier: Decides whether an answer is good enough.
+            escalate_on_error: Escalate when a tier raises, instead of
+                raising the error.
+        """
+        if len(tiers) < 2:
+            raise ValueError("A cascade needs at least two tiers")
+
+        from agentchord.core.structured import OutputSchema
+        from agentchord.llm.registry import get_registry
+
+        self._tiers = [
+            get_registry().create_provider(t) if isinstance(t, str) else t
+            for t in tiers
+        ]
+        self._verifier: Verifier = (
+            schema_verifier(verifier) if isinstance(verifier, OutputSchema) else verifier
+        )
+        self._escalate_on_error = escalate_on_error
+        self._current = self._tiers[0]
+        self._stats = CascadeStats(tiers=[TierStats(model=t.model) for t in self._tiers])
+
+    @property
+    def tiers(self) -> list[BaseLLMProvider]:
+        """Tiers, cheapest first."""
+        return list(self._tiers)
+
+    @property
+    def stats(self) -> CascadeStats:
+        """Escalation counters per tier."""
+        return self._stats
+
+    @property
+    def current(self) -> BaseLLMProvider:
+        """Tier that answered the most recent request."""
+        return self._current
+
+    @property
+    def model(self) -> str:
+        return self._tiers[0].model
+
+    @property
+    def provider_name(self) -> str:
+        return self._tiers[0].provider_name
+
+    @property
+    def cost_per_1k_input_tokens(self) -> float:
+        return self._tiers[0].cost_per_1k_input_tokens
+
+    @property
+    def cost_per_1k_output_tokens(self) -> float:
+        return self._tiers[0].cost_per_1k_output_tokens
+
+    def calculate_cost(
+        self, input_tokens: int, output_tokens: int, **cache_tokens: int
+    ) -> float:
+        return self._tiers[0].calculate_cost(input_tokens, output_tokens, **cache_tokens)
+
+    async def complete(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        self._stats.requests += 1
+        last = len(self._tiers) - 1
+        answers: list[LLMResponse] = []
+        cost = 0.0
+
+        for index, tier in enumerate(self._tiers):
+            stats = self._stats.tiers[index]
+            stats.calls += 1
+            tier_messages, tier_kwargs = request_for_provider(tier, messages, kwargs)
+            try:
+                response = await tier.complete(
+                    tier_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **tier_kwargs,
+                )
+            except Exception:
+                stats.errors += 1
+                if index == last or not self._escalate_on_error:
+                    raise
+                stats.escalated += 1
+                continue
+
+            answers.append(response)
+            tier_cost = tier.response_cost(response)
+            stats.cost += tier_cost
+            cost += tier_cost
+
+            if index < last and not response.tool_calls:
+                if not await self._verify(response, messages):
+                    stats.escalated += 1
+                    continue
+
+            stats.accepted += 1
+            if index > 0:
+                self._stats.escalated_requests += 1
+            self._current = tier
+            break
+
+        return self._combine(response, answers, cost)
+
+    @staticmethod
+    def _combine(
+        response: LLMResponse, answers: list[LLMResponse], cost: float
+    ) -> LLMResponse:
+        """Bill the returned answer for every tier the request went through."""
+        if len(answers) == 1:
+            return response.model_copy(update={"cost": cost})
+        usage = Usage(
+            prompt_tokens=sum(a.usage.prompt_tokens for a in answers),
+            completion_tokens=sum(a.usage.completion_tokens for a in answers),
+            cache_read_tokens=sum(a.usage.cache_read_tokens for a in answers),
+            cache_write_tokens=sum(a.usage.cache_write_tokens for a in answers),
+        )
+        return response.model_copy(
+            update={
+                "usage": usage,
+                "cost": cost,
+                "cache_hit": all(a.cache_hit for a in answers),
+            }
+        )
+
+    async def stream(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        response = await self.complete(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        yield StreamChunk(
+            content=response.content,
+            delta=response.content,
+            finish_reason=response.finish_reason,
+            usage=response.usage,
+            tool_calls=response.tool_calls,
+            cache_hit=response.cache_hit,
+        )
+
+    async def _verify(self, response: LLMResponse, messages: list[Message]) -> bool:
+        result = self._verifier(response, messages)
+        if inspect.isawaitable(result):
+            result = await result
+        return bool(result)
+
+    def __repr__(self) -> str:
+        models = ", ".join(repr(t.model) for t in self._tiers)
+        return f"CascadeProvider([{models}])"
@@ -0,0 +1,152 @@
+"""Request coalescing for LLM providers.
+
+``CoalescingProvider`` wraps any ``BaseLLMProvider`` so that concurrent,
+identical ``complete()`` calls share one upstream request. It complements
+``CachedProvider``: the cache answers repeats of finished requests, the
+coalescer answers repeats that arrive while the first is still running.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+from agentchord.core.streaming import AnyStreamChunk, validate_chunks
+from agentchord.core.types import LLMResponse, Message, StreamChunk
+from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.cache import make_cache_key
+from agentchord.utils.singleflight import SingleFlight, SingleFlightStats
+
+
+class CoalescingProvider(BaseLLMProvider):
+    """Provider wrapper that merges identical in-flight ``complete()`` calls.
+
+    Callers with the same request key (provider, model, messages and
+    parameters) await one shared upstream call. Cancelling one caller does
+    not cancel the call for the others. The caller that started the call
+    gets the upstream response; the others get a copy marked
+    ``coalesced=True`` with ``cost=0.0``, so the one upstream call is billed
+    once.
+
+    By default only deterministic requests (``temperature == 0``) are
+    coalesced, since callers sampling at higher temperatures usually expect
+    independent samples. ``stream()`` is passed through unchanged.
+
+    Example:
+        >>> provider = CoalescingProvider(OpenAIProvider(model="gpt-4o-mini"))
+        >>> await asyncio.gather(*(provider.complete(msgs, temperature=0) for _ in range(5)))
+        >>> provider.stats.coalesced
+        4
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        *,
+        only_deterministic: bool = True,
+    ) -> None:
+        """Initialize coalescing provider.
+
+        Args:
+            provider: Provider making the upstream calls.
+            only_deterministic: Only coalesce requests with ``temperature == 0``.
+        """
+        self._provider = provider
+        self._only_deterministic = only_deterministic
+        self._flights: SingleFlight[LLMResponse] = SingleFlight()
+
+    @property
+    def provider(self) -> BaseLLMProvider:
+        """Wrapped provider."""
+        return self._provider
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Coalescing statistics."""
+        return self._flights.stats
+
+    @property
+    def model(self) -> str:
+        return self._provider.model
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.provider_name
+
+    @property
+    def cost_per_1k_input_tokens(self) -> float:
+        return self._provider.cost_per_1k_input_tokens
+
+    @property
+    def cost_per_1k_output_tokens(self) -> float:
+        return self._provider.cost_per_1k_output_tokens
+
+    @property
+    def supports_streaming_tool_calls(self) -> bool:  # type: ignore[override]
+        return self._provider.supports_streaming_tool_calls
+
+    def calculate_cost(
+        self, input_tokens: int, output_tokens: int, **cache_tokens: int
+    ) -> float:
+        return self._provider.calculate_cost(input_tokens, output_tokens, **cache_tokens)
+
+    async def complete(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        led = False
+
+        async def _call() -> LLMResponse:
+            nonlocal led
+            led = True
+            return await self._provider.complete(
+                messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+
+        if self._only_deterministic and temperature != 0:
+            return await _call()
+
+        key = make_cache_key(
+            self.provider_name,
+            self.model,
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        response = await self._flights.do(key, _call)
+        if led:
+            return response
+        # Followers share the leader's upstream call, which is billed once
+        return response.model_copy(update={"coalesced": True, "cost": 0.0})
+
+    def stream(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
+        async for chunk in self._provider.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ):
+            yield chunk
+
+    def __repr__(self) -> str:
+        return f"CoalescingProvider({self._provider!r})"
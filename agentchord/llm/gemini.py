@@ -12,6 +12,8 @@ from typing import Any, AsyncIterator
 
 import httpx
 
+from agentchord.core.conversation import convert_messages
+from agentchord.core.streaming import AnyStreamChunk, FastStreamChunk, validate_chunks
 from agentchord.core.types import (
     LLMResponse,
     Message,
@@ -24,9 +26,13 @@ from agentchord.errors.exceptions import (
     APIError,
     AuthenticationError,
     MissingAPIKeyError,
+    RateLimitError,
     TimeoutError,
 )
 from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.rate_limit import parse_retry_after
+from agentchord.llm.tool_stream import ToolCallAccumulator
+from agentchord.utils.http import get_http_client
 
 # Model pricing information (as of 2025)
 MODEL_COSTS = {
@@ -51,6 +57,8 @@ class GeminiProvider(BaseLLMProvider):
         >>> response = await provider.complete([Message.user("Hello")])
     """
 
+    supports_streaming_tool_calls = True
+
     def __init__(
         self,
         model: str = "gemini-2.0-flash",
@@ -145,10 +153,12 @@ class GeminiProvider(BaseLLMProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(url)
+            response = await client.post(
+                url, json=payload, headers=headers, timeout=self._timeout
+            )
+            response.raise_for_status()
+            data = response.json()
 
         except httpx.ConnectError as e:
             raise APIError(
@@ -183,6 +193,9 @@ class GeminiProvider(BaseLLMProvider):
         usage = Usage(
             prompt_tokens=usage_data.get("prompt_tokens", 0),
             completion_tokens=usage_data.get("completion_tokens", 0),
+            cache_read_tokens=(usage_data.get("prompt_tokens_details") or {}).get(
+                "cached_tokens"
+            ) or 0,
         )
 
         return LLMResponse(
@@ -194,7 +207,7 @@ class GeminiProvider(BaseLLMProvider):
             raw_response=data,
         )
 
-    async def stream(
+    def stream(
         self,
         messages: list[Message],
         *,
@@ -202,6 +215,18 @@ class GeminiProvider(BaseLLMProvider):
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
         """Stream a completion using Gemini.
 
         Args:
@@ -240,57 +265,69 @@ class GeminiProvider(BaseLLMProvider):
         }
 
         accumulated_content = ""
+        tool_calls = ToolCallAccumulator()
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                async with client.stream("POST", url, json=payload, headers=headers) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        # Skip empty lines
-                        if not line.strip():
-                            continue
-
-                        # Skip "data: " prefix
-                        if not line.startswith("data: "):
-                            continue
-
-                        data_str = line[6:]  # Remove "data: " prefix
-
-                        # Check for [DONE] marker
-                        if data_str.strip() == "[DONE]":
-                            break
-
-                        try:
-                            chunk_data = json.loads(data_str)
-                        except json.JSONDecodeError:
-                            continue
-
-                        # Parse chunk
-                        choice = chunk_data.get("choices", [{}])[0]
-                        delta = choice.get("delta", {})
-
-                        content_delta = delta.get("content", "")
-                        accumulated_content += content_delta
-
-                        finish_reason = choice.get("finish_reason")
-
-                        # Parse usage from final chunk
-                        usage = None
-                        if finish_reason and "usage" in chunk_data:
-                            usage_data = chunk_data["usage"]
-                            usage = Usage(
-                                prompt_tokens=usage_data.get("prompt_tokens", 0),
-                                completion_tokens=usage_data.get("completion_tokens", 0),
-                            )
-
-                        yield StreamChunk(
-                            content=accumulated_content,
-                            delta=content_delta,
-                            finish_reason=finish_reason,
-                            usage=usage,
+            client = get_http_client(url)
+            async with client.stream(
+                "POST", url, json=payload, headers=headers, timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    # Skip empty lines
+                    if not line.strip():
+                        continue
+
+                    # Skip "data: " prefix
+                    if not line.startswith("data: "):
+                        continue
+
+                    data_str = line[6:]  # Remove "data: " prefix
+
+                    # Check for [DONE] marker
+                    if data_str.strip() == "[DONE]":
+                        break
+
+                    try:
+                        chunk_data = json.loads(data_str)
+                    except json.JSONDecodeError:
+                        continue
+
+                    # Parse chunk
+                    choice = (chunk_data.get("choices") or [{}])[0]
+                    delta = choice.get("delta", {})
+
+                    content_delta = delta.get("content") or ""
+                    accumulated_content += content_delta
+
+                    finish_reason = choice.get("finish_reason")
+
+                    # Assemble streamed tool calls; emit each once complete
+                    completed = tool_calls.feed_openai(delta.get("tool_calls"))
+                    if finish_reason:
+                        completed += tool_calls.finish_all()
+
+                    # Parse usage from final chunk
+                    usage = None
+                    if finish_reason and "usage" in chunk_data:
+                        usage_data = chunk_data["usage"]
+                        usage = Usage(
+                            prompt_tokens=usage_data.get("prompt_tokens", 0),
+                            completion_tokens=usage_data.get("completion_tokens", 0),
+                            cache_read_tokens=(usage_data.get("prompt_tokens_details") or {}).get(
+                                "cached_tokens"
+                            ) or 0,
                         )
 
+                    yield FastStreamChunk(
+                        content=accumulated_content,
+                        delta=content_delta,
+                        finish_reason=finish_reason,
+                        usage=usage,
+                        tool_calls=completed or None,
+                    )
+
         except httpx.ConnectError as e:
             raise APIError(
                 f"Failed to connect to Gemini API at {self._base_url}: {str(e)}",
@@ -316,35 +353,36 @@ class GeminiProvider(BaseLLMProvider):
         Returns:
             List of message dictionaries in OpenAI format.
         """
-        result = []
-        for msg in messages:
-            msg_dict: dict[str, Any] = {
-                "role": msg.role.value,
-                "content": msg.content,
-            }
-
-            if msg.name:
-                msg_dict["name"] = msg.name
-
-            if msg.tool_calls:
-                msg_dict["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-
-            if msg.tool_call_id:
-                msg_dict["tool_call_id"] = msg.tool_call_id
-
-            result.append(msg_dict)
-
-        return result
+        return convert_messages(messages, "gemini", self._convert_message)
+
+    @staticmethod
+    def _convert_message(msg: Message) -> dict[str, Any]:
+        """Convert one Message to OpenAI format."""
+        msg_dict: dict[str, Any] = {
+            "role": msg.role.value,
+            "content": msg.content,
+        }
+
+        if msg.name:
+            msg_dict["name"] = msg.name
+
+        if msg.tool_calls:
+            msg_dict["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": json.dumps(tc.arguments),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+
+        if msg.tool_call_id:
+            msg_dict["tool_call_id"] = msg.tool_call_id
+
+        return msg_dict
 
     def _parse_tool_calls(self, raw_tool_calls: list[dict[str, Any]]) -> list[ToolCall]:
         """Parse tool calls from Gemini API response.
@@ -383,10 +421,10 @@ class GeminiProvider(BaseLLMProvider):
 
         Raises:
             AuthenticationError: For 401/403 errors.
+            RateLimitError: For 429 errors.
             APIError: For all other HTTP errors.
         """
         status_code = error.response.status_code
-        error_text = error.response.text
 
         if status_code in (401, 403):
             raise AuthenticationError(
@@ -394,6 +432,17 @@ class GeminiProvider(BaseLLMProvider):
                 provider="gemini",
             )
 
+        if status_code == 429:
+            self._report_response_headers(error.response.headers)
+            raise RateLimitError(
+                "Gemini API rate limit exceeded",
+                provider="gemini",
+                model=self._model,
+                retry_after=parse_retry_after(error.response.headers),
+            )
+
+        error_text = error.response.text
+
         raise APIError(
             f"Gemini API error: {status_code} - {error_text}",
             provider="gemini",
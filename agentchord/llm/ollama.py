@@ -11,6 +11,8 @@ from typing import Any, AsyncIterator
 
 import httpx
 
+from agentchord.core.conversation import convert_messages
+from agentchord.core.streaming import AnyStreamChunk, FastStreamChunk, validate_chunks
 from agentchord.core.types import (
     LLMResponse,
     Message,
@@ -21,6 +23,8 @@ from agentchord.core.types import (
 )
 from agentchord.errors.exceptions import APIError, TimeoutError
 from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.tool_stream import ToolCallAccumulator
+from agentchord.utils.http import get_http_client
 
 
 class OllamaProvider(BaseLLMProvider):
@@ -35,6 +39,8 @@ class OllamaProvider(BaseLLMProvider):
         >>> response = await provider.complete([Message.user("Hello")])
     """
 
+    supports_streaming_tool_calls = True
+
     def __init__(
         self,
         model: str,
@@ -111,10 +117,10 @@ class OllamaProvider(BaseLLMProvider):
             payload["tools"] = kwargs["tools"]
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(url)
+            response = await client.post(url, json=payload, timeout=self._timeout)
+            response.raise_for_status()
+            data = response.json()
 
         except httpx.ConnectError:
             raise APIError(
@@ -166,7 +172,7 @@ class OllamaProvider(BaseLLMProvider):
             raw_response=data,
         )
 
-    async def stream(
+    def stream(
         self,
         messages: list[Message],
         *,
@@ -174,6 +180,18 @@ class OllamaProvider(BaseLLMProvider):
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
         """Stream a completion using Ollama.
 
         Args:
@@ -204,57 +222,66 @@ class OllamaProvider(BaseLLMProvider):
             payload["tools"] = kwargs["tools"]
 
         accumulated_content = ""
+        tool_calls = ToolCallAccumulator()
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                async with client.stream("POST", url, json=payload) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        # Skip empty lines
-                        if not line.strip():
-                            continue
-
-                        # Skip "data: " prefix
-                        if not line.startswith("data: "):
-                            continue
-
-                        data_str = line[6:]  # Remove "data: " prefix
-
-                        # Check for [DONE] marker
-                        if data_str.strip() == "[DONE]":
-                            break
-
-                        try:
-                            chunk_data = json.loads(data_str)
-                        except json.JSONDecodeError:
-                            continue
-
-                        # Parse chunk
-                        choice = chunk_data.get("choices", [{}])[0]
-                        delta = choice.get("delta", {})
-
-                        content_delta = delta.get("content", "")
-                        accumulated_content += content_delta
-
-                        finish_reason = choice.get("finish_reason")
-
-                        # Parse usage from final chunk
-                        usage = None
-                        if finish_reason and "usage" in chunk_data:
-                            usage_data = chunk_data["usage"]
-                            usage = Usage(
-                                prompt_tokens=usage_data.get("prompt_tokens", 0),
-                                completion_tokens=usage_data.get("completion_tokens", 0),
-                            )
-
-                        yield StreamChunk(
-                            content=accumulated_content,
-                            delta=content_delta,
-                            finish_reason=finish_reason,
-                            usage=usage,
+            client = get_http_client(url)
+            async with client.stream(
+                "POST", url, json=payload, timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    # Skip empty lines
+                    if not line.strip():
+                        continue
+
+                    # Skip "data: " prefix
+                    if not line.startswith("data: "):
+                        continue
+
+                    data_str = line[6:]  # Remove "data: " prefix
+
+                    # Check for [DONE] marker
+                    if data_str.strip() == "[DONE]":
+                        break
+
+                    try:
+                        chunk_data = json.loads(data_str)
+                    except json.JSONDecodeError:
+                        continue
+
+                    # Parse chunk
+                    choice = (chunk_data.get("choices") or [{}])[0]
+                    delta = choice.get("delta", {})
+
+                    content_delta = delta.get("content") or ""
+                    accumulated_content += content_delta
+
+                    finish_reason = choice.get("finish_reason")
+
+                    # Assemble streamed tool calls; emit each once complete
+                    completed = tool_calls.feed_openai(delta.get("tool_calls"))
+                    if finish_reason:
+                        completed += tool_calls.finish_all()
+
+                    # Parse usage from final chunk
+                    usage = None
+                    if finish_reason and "usage" in chunk_data:
+                        usage_data = chunk_data["usage"]
+                        usage = Usage(
+                            prompt_tokens=usage_data.get("prompt_tokens", 0),
+                            completion_tokens=usage_data.get("completion_tokens", 0),
                         )
 
+                    yield FastStreamChunk(
+                        content=accumulated_content,
+                        delta=content_delta,
+                        finish_reason=finish_reason,
+                        usage=usage,
+                        tool_calls=completed or None,
+                    )
+
         except httpx.ConnectError:
             raise APIError(
                 f"Ollama server not running at {self._base_url}. "
@@ -286,35 +313,36 @@ class OllamaProvider(BaseLLMProvider):
         Returns:
             List of message dictionaries in OpenAI format.
         """
-        result = []
-        for msg in messages:
-            msg_dict: dict[str, Any] = {
-                "role": msg.role.value,
-                "content": msg.content,
-            }
-
-            if msg.name:
-                msg_dict["name"] = msg.name
-
-            if msg.tool_calls:
-                msg_dict["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-
-            if msg.tool_call_id:
-                msg_dict["tool_call_id"] = msg.tool_call_id
-
-            result.append(msg_dict)
-
-        return result
+        return convert_messages(messages, "ollama", self._convert_message)
+
+    @staticmethod
+    def _convert_message(msg: Message) -> dict[str, Any]:
+        """Convert one Message to OpenAI format."""
+        msg_dict: dict[str, Any] = {
+            "role": msg.role.value,
+            "content": msg.content,
+        }
+
+        if msg.name:
+            msg_dict["name"] = msg.name
+
+        if msg.tool_calls:
+            msg_dict["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": json.dumps(tc.arguments),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+
+        if msg.tool_call_id:
+            msg_dict["tool_call_id"] = msg.tool_call_id
+
+        return msg_dict
 
     def _parse_tool_calls(self, raw_tool_calls: list[dict[str, Any]]) -> list[ToolCall]:
         """Parse tool calls from Ollama API response.
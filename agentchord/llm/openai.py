@@ -6,7 +6,9 @@ import json
 import os
 from typing import Any, AsyncIterator
 
-from agentchord.core.types import LLMResponse, Message, MessageRole, StreamChunk, Usage, ToolCall
+from agentchord.core.conversation import convert_messages
+from agentchord.core.streaming import AnyStreamChunk, FastStreamChunk, validate_chunks
+from agentchord.core.types import LLMResponse, Message, StreamChunk, Usage, ToolCall
 from agentchord.errors.exceptions import (
     APIError,
     AuthenticationError,
@@ -15,6 +17,8 @@ from agentchord.errors.exceptions import (
     TimeoutError,
 )
 from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.rate_limit import parse_retry_after
+from agentchord.llm.tool_stream import ToolCallAccumulator
 
 # Pricing as of 2025 (USD per 1K tokens)
 MODEL_COSTS: dict[str, dict[str, float]] = {
@@ -34,18 +38,27 @@ DEFAULT_COST = {"input": 0.01, "output": 0.03}
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider.
 
+    OpenAI caches long prompt prefixes automatically. With
+    ``prompt_caching`` enabled (the default), requests are laid out so the
+    stable parts come first and are byte-identical between calls: system
+    messages lead the conversation and tool definitions are sent in name
+    order.
+
     Example:
         >>> provider = OpenAIProvider(model="gpt-4o-mini")
         >>> response = await provider.complete([Message.user("Hello!")])
         >>> print(response.content)
     """
 
+    supports_streaming_tool_calls = True
+
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
         api_key: str | None = None,
         base_url: str | None = None,
         timeout: float = 60.0,
+        prompt_caching: bool = True,
     ) -> None:
         """Initialize OpenAI provider.
 
@@ -54,11 +67,13 @@ class OpenAIProvider(BaseLLMProvider):
             api_key: OpenAI API key. Defaults to OPENAI_API_KEY env var.
             base_url: Custom API base URL for proxies.
             timeout: Request timeout in seconds.
+            prompt_caching: Order requests so stable content forms the prefix.
         """
         self._model = model
         self._api_key = api_key or os.getenv("OPENAI_API_KEY")
         self._base_url = base_url
         self._timeout = timeout
+        self._prompt_caching = prompt_caching
         self._client: Any = None
 
     def _get_client(self) -> Any:
@@ -125,9 +140,11 @@ class OpenAIProvider(BaseLLMProvider):
         """
         client = self._get_client()
         openai_messages = self._convert_messages(messages)
+        if self._prompt_caching:
+            self._order_tools(kwargs)
 
         try:
-            response = await client.chat.completions.create(
+            raw = await client.chat.completions.with_raw_response.create(
                 model=self._model,
                 messages=openai_messages,
                 temperature=temperature,
@@ -137,9 +154,10 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             self._handle_error(e)
 
-        return self._convert_response(response)
+        self._report_response_headers(raw.headers)
+        return self._convert_response(raw.parse())
 
-    async def stream(
+    def stream(
         self,
         messages: list[Message],
         *,
@@ -147,12 +165,31 @@ class OpenAIProvider(BaseLLMProvider):
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
-        """Stream a completion using OpenAI API."""
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
+        """Stream a completion using OpenAI API.
+
+        Tool calls are assembled from streamed deltas; each is yielded in
+        ``StreamChunk.tool_calls`` as soon as it is complete.
+        """
         client = self._get_client()
         openai_messages = self._convert_messages(messages)
+        if self._prompt_caching:
+            self._order_tools(kwargs)
+        kwargs.setdefault("stream_options", {"include_usage": True})
 
         try:
-            response = await client.chat.completions.create(
+            raw = await client.chat.completions.with_raw_response.create(
                 model=self._model,
                 messages=openai_messages,
                 temperature=temperature,
@@ -163,44 +200,94 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             self._handle_error(e)
 
+        self._report_response_headers(raw.headers)
+        response = raw.parse()
+
         content = ""
+        tool_calls = ToolCallAccumulator()
         async for chunk in response:
             if not chunk.choices:
+                # Final usage-only chunk (stream_options.include_usage)
+                if getattr(chunk, "usage", None):
+                    yield FastStreamChunk(
+                        content=content,
+                        delta="",
+                        usage=self._convert_usage(chunk.usage),
+                    )
                 continue
 
             choice = chunk.choices[0]
             delta = choice.delta.content or ""
             content += delta
 
-            yield StreamChunk(
+            completed = tool_calls.feed_openai(choice.delta.tool_calls)
+            if choice.finish_reason is not None:
+                completed += tool_calls.finish_all()
+
+            yield FastStreamChunk(
                 content=content,
                 delta=delta,
                 finish_reason=choice.finish_reason,
+                tool_calls=completed or None,
             )
 
     def _convert_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
-        """Convert AgentChord messages to OpenAI format."""
-        result = []
-        for msg in messages:
-            converted: dict[str, Any] = {
-                "role": msg.role.value,
-                "content": msg.content,
-            }
-            if msg.name:
-                converted["name"] = msg.name
-            if msg.tool_calls:
-                converted["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {"name": tc.name, "arguments": json.dumps(tc.arguments) if isinstance(tc.arguments, dict) else str(tc.arguments)},
-                    }
-                    for tc in msg.tool_calls
-                ]
-            if msg.tool_call_id:
-                converted["tool_call_id"] = msg.tool_call_id
-            result.append(converted)
-        return result
+        """Convert AgentChord messages to OpenAI format.
+
+        Message order is kept as given: a system message in the middle of
+        a conversation applies from that point on, so moving it would
+        change the prompt's meaning, not just its caching.
+        """
+        return convert_messages(messages, "openai", self._convert_message)
+
+    @staticmethod
+    def _convert_message(msg: Message) -> dict[str, Any]:
+        """Convert one AgentChord message to OpenAI format."""
+        converted: dict[str, Any] = {
+            "role": msg.role.value,
+            "content": msg.content,
+        }
+        if msg.name:
+            converted["name"] = msg.name
+        if msg.tool_calls:
+            converted["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": (
+                            json.dumps(tc.arguments)
+                            if isinstance(tc.arguments, dict)
+                            else str(tc.arguments)
+                        ),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+        if msg.tool_call_id:
+            converted["tool_call_id"] = msg.tool_call_id
+        return converted
+
+    @staticmethod
+    def _order_tools(kwargs: dict[str, Any]) -> None:
+        """Send tool definitions in name order so the prefix doesn't shift."""
+        tools = kwargs.get("tools")
+        if tools:
+            kwargs["tools"] = sorted(
+                tools, key=lambda t: (t.get("function") or {}).get("name", "")
+            )
+
+    @staticmethod
+    def _convert_usage(usage: Any) -> Usage:
+        """Convert OpenAI usage, including prompt tokens served from cache."""
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None)
+        return Usage(
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            cache_read_tokens=cached if isinstance(cached, int) else 0,
+        )
 
     def _convert_response(self, response: Any) -> LLMResponse:
         """Convert OpenAI response to AgentChord format."""
@@ -221,10 +308,7 @@ class OpenAIProvider(BaseLLMProvider):
         return LLMResponse(
             content=choice.message.content or "",
             model=response.model,
-            usage=Usage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-            ),
+            usage=self._convert_usage(response.usage),
             finish_reason=choice.finish_reason or "stop",
             tool_calls=tool_calls,
             raw_response=response.model_dump(),
@@ -247,10 +331,13 @@ class OpenAIProvider(BaseLLMProvider):
             raise error
 
         if isinstance(error, openai.RateLimitError):
+            headers = getattr(getattr(error, "response", None), "headers", None)
+            self._report_response_headers(headers)
             raise RateLimitError(
                 str(error),
                 provider="openai",
                 model=self._model,
+                retry_after=parse_retry_after(headers),
             ) from error
         elif isinstance(error, openai.AuthenticationError):
             raise AuthenticationError(
@@ -0,0 +1,547 @@
+"""Client-side request and token rate limiting for LLM providers.
+
+Hitting a provider's rate limit and then retrying blindly makes every
+coroutine back off and retry at once. ``RateLimiter`` throttles calls
+*before* they are sent, using two token buckets: requests per minute (RPM)
+and estimated tokens per minute (TPM). Limits can be configured up front
+and are learned from the ``x-ratelimit-*`` (OpenAI) and
+``anthropic-ratelimit-*`` (Anthropic) response headers.
+
+Limiters are shared per provider, model and API key through
+``ProviderRegistry.set_rate_limit()``, so every agent using the same
+model and key draws from the same budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Mapping
+
+from agentchord.core.streaming import AnyStreamChunk, validate_chunks
+from agentchord.core.types import LLMResponse, Message, StreamChunk
+from agentchord.errors.exceptions import RateLimitError
+from agentchord.llm.base import BaseLLMProvider
+from agentchord.utils.tokens import estimate_message_tokens
+
+_DEFAULT_PERIOD = 60.0
+_DEFAULT_RETRY_AFTER = 1.0
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse reset durations like ``"1s"``, ``"6m0s"`` or ``"20ms"``."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(n) * scale[unit] for n, unit in parts)
+
+
+def _parse_reset(value: str) -> float | None:
+    """Parse a reset header: a duration or an RFC 3339 timestamp."""
+    seconds = _parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        reset_at = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Read the server-requested wait from ``retry-after-ms`` / ``retry-after``.
+
+    Args:
+        headers: HTTP response headers (case-insensitive mapping or dict).
+
+    Returns:
+        Seconds to wait, or None if the headers don't say.
+    """
+    if not headers:
+        return None
+    lowered = {k.lower(): v for k, v in headers.items()}
+    if "retry-after-ms" in lowered:
+        try:
+            return float(lowered["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if "retry-after" in lowered:
+        try:
+            return float(lowered["retry-after"])
+        except ValueError:
+            return None  # HTTP-date form is not used by LLM APIs
+    return None
+
+
+class TokenBucket:
+    """Continuously refilling bucket with reservation semantics.
+
+    ``reserve()`` takes tokens immediately, letting the balance go negative,
+    and returns how long the caller must wait for the debt to refill. Callers
+    therefore wait in arrival order without a lock or polling.
+    """
+
+    def __init__(self, capacity: float, period: float = _DEFAULT_PERIOD) -> None:
+        """Initialize token bucket.
+
+        Args:
+            capacity: Tokens available per period.
+            period: Refill period in seconds.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if period <= 0:
+            raise ValueError("period must be positive")
+
+        self._capacity = float(capacity)
+        self._period = period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        """Tokens per period."""
+        return self._capacity
+
+    @property
+    def available(self) -> float:
+        """Current balance (negative while callers are waiting)."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def _rate(self) -> float:
+        return self._capacity / self._period
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def reserve(self, amount: float) -> tuple[float, float]:
+        """Take tokens now.
+
+        Args:
+            amount: Tokens needed (capped at capacity so large requests
+                can always proceed eventually).
+
+        Returns:
+            Tuple of (seconds to wait, tokens actually reserved).
+        """
+        self._refill()
+        amount = min(float(amount), self._capacity)
+        self._tokens -= amount
+        wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        return wait, amount
+
+    def give_back(self, amount: float) -> None:
+        """Return unused tokens."""
+        self._refill()
+        self._tokens = min(self._capacity, self._tokens + amount)
+
+    def take(self, amount: float) -> None:
+        """Charge extra tokens without waiting (e.g. usage above the estimate)."""
+        self._refill()
+        self._tokens -= amount
+
+    def set_capacity(self, capacity: float) -> None:
+        """Change the per-period capacity."""
+        if capacity <= 0:
+            return
+        self._refill()
+        self._capacity = float(capacity)
+        self._tokens = min(self._tokens, self._capacity)
+
+    def limit_to(self, remaining: float) -> None:
+        """Lower the balance to what the server reports as remaining."""
+        self._refill()
+        self._tokens = min(self._tokens, float(remaining))
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a ``RateLimiter``."""
+
+    requests: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    rate_limit_errors: int = 0
+    header_updates: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter.
+
+    Example:
+        >>> limiter = RateLimiter(rpm=500, tpm=200_000)
+        >>> reserved = await limiter.acquire(tokens=1200)   # waits if over budget
+        >>> ...                                             # make the call
+        >>> limiter.record(reserved, actual=950)
+    """
+
+    def __init__(
+        self,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        *,
+        name: str | None = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rpm: Requests per minute (None = unlimited until learned).
+            tpm: Tokens per minute (None = unlimited until learned).
+            name: Label used in ``repr`` (e.g. "openai/gpt-4o").
+        """
+        if rpm is not None and rpm < 1:
+            raise ValueError("rpm must be at least 1")
+        if tpm is not None and tpm < 1:
+            raise ValueError("tpm must be at least 1")
+
+        self._name = name
+        self._configured_rpm = rpm
+        self._configured_tpm = tpm
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+        self._blocked_until = 0.0
+        self._stats = RateLimiterStats()
+
+    @property
+    def rpm(self) -> int | None:
+        """Effective requests-per-minute limit."""
+        return int(self._requests.capacity) if self._requests else None
+
+    @property
+    def tpm(self) -> int | None:
+        """Effective tokens-per-minute limit."""
+        return int(self._tokens.capacity) if self._tokens else None
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Limiter counters."""
+        return self._stats
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait until a request with ``tokens`` estimated tokens may be sent.
+
+        Time spent waiting is added to ``stats.wait_seconds``.
+
+        Args:
+            tokens: Estimated tokens for the request (prompt + max output).
+
+        Returns:
+            Tokens taken from the TPM budget: the estimate capped at the
+            bucket's capacity, or 0 when no TPM limit is known yet. Pass
+            it to ``record()`` or ``refund()``.
+        """
+        waited = 0.0
+        delay = self._blocked_until - time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+            delay = self._blocked_until - time.monotonic()
+
+        reservations: list[tuple[TokenBucket, float]] = []
+        wait = 0.0
+        reserved = 0.0
+        if self._requests is not None:
+            w, amount = self._requests.reserve(1)
+            reservations.append((self._requests, amount))
+            wait = max(wait, w)
+        if self._tokens is not None and tokens > 0:
+            w, reserved = self._tokens.reserve(tokens)
+            reservations.append((self._tokens, reserved))
+            wait = max(wait, w)
+
+        if wait > 0:
+            self._stats.throttled += 1
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                for bucket, amount in reservations:
+                    bucket.give_back(amount)
+                raise
+            waited += wait
+
+        self._stats.requests += 1
+        self._stats.wait_seconds += waited
+        return reserved
+
+    def record(self, reserved: float, actual: int) -> None:
+        """Reconcile a reservation with the usage the provider reported.
+
+        Args:
+            reserved: Tokens returned by ``acquire()``.
+            actual: Tokens the provider reported using.
+        """
+        if self._tokens is None:
+            return
+        diff = actual - reserved
+        if diff < 0:
+            self._tokens.give_back(-diff)
+        elif diff > 0:
+            self._tokens.take(diff)
+
+    def refund(self, reserved: float) -> None:
+        """Return the reservation of a request that reported no usage."""
+        self.record(reserved, 0)
+
+    def block(self, seconds: float) -> None:
+        """Hold every new request for ``seconds`` (after a 429)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def on_rate_limit_error(self, error: RateLimitError) -> None:
+        """Pause the limiter after the provider rejected a request."""
+        self._stats.rate_limit_errors += 1
+        self.block(error.retry_after or _DEFAULT_RETRY_AFTER)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Learn limits and remaining budget from provider response headers.
+
+        Understands OpenAI ``x-ratelimit-{limit,remaining}-{requests,tokens}``
+        and Anthropic ``anthropic-ratelimit-{requests,tokens}-{limit,remaining}``.
+        Configured limits act as a ceiling; learned limits can only lower them.
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+
+        def _number(*names: str) -> float | None:
+            for header in names:
+                if header in lowered:
+                    try:
+                        return float(lowered[header])
+                    except ValueError:
+                        continue
+            return None
+
+        request_limit = _number(
+            "x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit"
+        )
+        request_remaining = _number(
+            "x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"
+        )
+        token_limit = _number(
+            "x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit"
+        )
+        token_remaining = _number(
+            "x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining"
+        )
+
+        if request_limit is None and token_limit is None:
+            return
+        self._stats.header_updates += 1
+
+        if request_limit is not None:
+            self._requests = self._learn(self._requests, request_limit, self._configured_rpm)
+        if token_limit is not None:
+            self._tokens = self._learn(self._tokens, token_limit, self._configured_tpm)
+        if request_remaining is not None and self._requests is not None:
+            self._requests.limit_to(request_remaining)
+        if token_remaining is not None and self._tokens is not None:
+            self._tokens.limit_to(token_remaining)
+
+        # Out of requests: wait for the server-side window to reset
+        if request_remaining == 0:
+            reset = lowered.get("x-ratelimit-reset-requests") or lowered.get(
+                "anthropic-ratelimit-requests-reset"
+            )
+            seconds = _parse_reset(reset) if reset else None
+            if seconds:
+                self.block(seconds)
+
+    @staticmethod
+    def _learn(
+        bucket: TokenBucket | None, limit: float, configured: int | None
+    ) -> TokenBucket | None:
+        """Create or resize a bucket for a learned limit."""
+        if limit <= 0:
+            return bucket
+        capacity = min(limit, configured) if configured else limit
+        if bucket is None:
+            return TokenBucket(capacity)
+        bucket.set_capacity(capacity)
+        return bucket
+
+    def __repr__(self) -> str:
+        label = f"{self._name!r}, " if self._name else ""
+        return f"RateLimiter({label}rpm={self.rpm}, tpm={self.tpm})"
+
+
+def _chain_hooks(
+    existing: Callable[[Mapping[str, str]], None] | None,
+    hook: Callable[[Mapping[str, str]], None],
+) -> Callable[[Mapping[str, str]], None]:
+    """Combine a new response headers hook with one already installed."""
+    if existing is None or existing == hook:
+        return hook
+
+    def chained(headers: Mapping[str, str]) -> None:
+        try:
+            existing(headers)
+        finally:
+            hook(headers)
+
+    return chained
+
+
+class RateLimitedProvider(BaseLLMProvider):
+    """Provider wrapper that throttles calls through a shared ``RateLimiter``.
+
+    Usually created by ``ProviderRegistry.create_provider()`` after
+    ``set_rate_limit()``; can also wrap a provider directly.
+
+    Example:
+        >>> limiter = RateLimiter(rpm=60, tpm=90_000)
+        >>> provider = RateLimitedProvider(OpenAIProvider(model="gpt-4o"), limiter)
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        limiter: RateLimiter,
+        *,
+        learn_from_headers: bool = True,
+    ) -> None:
+        """Initialize rate-limited provider.
+
+        Args:
+            provider: Provider making the calls.
+            limiter: Limiter shared by every provider for the same model/key.
+            learn_from_headers: Feed provider response headers to the limiter.
+        """
+        self._provider = provider
+        self._limiter = limiter
+        if learn_from_headers:
+            provider.response_headers_hook = _chain_hooks(
+                provider.response_headers_hook, limiter.update_from_headers
+            )
+
+    @property
+    def provider(self) -> BaseLLMProvider:
+        """Wrapped provider."""
+        return self._provider
+
+    @property
+    def limiter(self) -> RateLimiter:
+        """Shared rate limiter."""
+        return self._limiter
+
+    @property
+    def model(self) -> str:
+        return self._provider.model
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.provider_name
+
+    @property
+    def cost_per_1k_input_tokens(self) -> float:
+        return self._provider.cost_per_1k_input_tokens
+
+    @property
+    def cost_per_1k_output_tokens(self) -> float:
+        return self._provider.cost_per_1k_output_tokens
+
+    @property
+    def supports_streaming_tool_calls(self) -> bool:  # type: ignore[override]
+        return self._provider.supports_streaming_tool_calls
+
+    def calculate_cost(
+        self, input_tokens: int, output_tokens: int, **cache_tokens: int
+    ) -> float:
+        return self._provider.calculate_cost(input_tokens, output_tokens, **cache_tokens)
+
+    async def complete(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        reserved = await self._limiter.acquire(self._estimate(messages, max_tokens))
+        actual: int | None = None
+        try:
+            response = await self._provider.complete(
+                messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+            actual = response.usage.total_tokens
+        except RateLimitError as e:
+            self._limiter.on_rate_limit_error(e)
+            raise
+        finally:
+            self._settle(reserved, actual)
+        return response
+
+    def stream(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
+        reserved = await self._limiter.acquire(self._estimate(messages, max_tokens))
+        actual: int | None = None
+        try:
+            async for chunk in self._provider.stream_chunks(
+                messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            ):
+                if chunk.usage is not None:
+                    actual = chunk.usage.total_tokens
+                yield chunk
+        except RateLimitError as e:
+            self._limiter.on_rate_limit_error(e)
+            raise
+        finally:
+            # Also runs when the consumer stops early and closes the stream
+            self._settle(reserved, actual)
+
+    def _estimate(self, messages: list[Message], max_tokens: int) -> int:
+        """Estimate a request's TPM cost."""
+        # Providers count the requested output budget against TPM up front
+        model = self._provider.model
+        return sum(estimate_message_tokens(m, model) for m in messages) + max_tokens
+
+    def _settle(self, reserved: float, actual: int | None) -> None:
+        """Settle a reservation: charge reported usage or refund it.
+
+        Runs for every call, including failures, cancellation and streams
+        that end without a usage chunk, so no reservation stays charged.
+        """
+        if actual is None:
+            self._limiter.refund(reserved)
+        else:
+            self._limiter.record(reserved, actual)
+
+    def __repr__(self) -> str:
+        return f"RateLimitedProvider({self._provider!r}, {self._limiter!r})"
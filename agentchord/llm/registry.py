@@ -6,11 +6,13 @@ Replaces the hardcoded _detect_provider/_create_provider pattern.
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from agentchord.errors.exceptions import ModelNotFoundError
 from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.rate_limit import RateLimitedProvider, RateLimiter
 
 
 @dataclass
@@ -24,6 +26,15 @@ class ProviderInfo:
     default_cost_output: float = 0.0
 
 
+@dataclass
+class RateLimitConfig:
+    """Client-side rate limits for a provider."""
+
+    rpm: int | None = None
+    tpm: int | None = None
+    learn_from_headers: bool = True
+
+
 class ProviderRegistry:
     """Registry for managing LLM provider registration and auto-detection.
 
@@ -31,11 +42,18 @@ class ProviderRegistry:
         >>> registry = ProviderRegistry()
         >>> registry.register("openai", factory_fn, ["gpt-", "o1"])
         >>> provider = registry.create_provider("gpt-4o")
+
+    Rate limiting:
+        >>> registry.set_rate_limit("openai", rpm=500, tpm=200_000)
+        >>> # Providers created from now on share one limiter per model/key
+        >>> provider = registry.create_provider("gpt-4o")
     """
 
     def __init__(self) -> None:
         self._providers: dict[str, ProviderInfo] = {}
         self._prefix_map: list[tuple[str, str]] = []  # (prefix, provider_name), sorted by length desc
+        self._rate_limits: dict[str, RateLimitConfig] = {}
+        self._limiters: dict[tuple[str, str, str], RateLimiter] = {}
 
     def register(
         self,
@@ -80,10 +98,80 @@ class ProviderRegistry:
         raise ModelNotFoundError(model)
 
     def create_provider(self, model: str, **kwargs: Any) -> BaseLLMProvider:
-        """Create a provider instance for the given model."""
+        """Create a provider instance for the given model.
+
+        If a rate limit is set for the provider, the instance is wrapped in a
+        ``RateLimitedProvider`` sharing one limiter per model and API key.
+        """
         provider_name = self.detect_provider(model)
         info = self._providers[provider_name]
-        return info.factory(model=model, **kwargs)
+        provider = info.factory(model=model, **kwargs)
+
+        config = self._rate_limits.get(provider_name)
+        if config is None:
+            return provider
+        limiter = self.get_rate_limiter(
+            provider_name, model, getattr(provider, "_api_key", None)
+        )
+        return RateLimitedProvider(
+            provider, limiter, learn_from_headers=config.learn_from_headers
+        )
+
+    def set_rate_limit(
+        self,
+        name: str,
+        *,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        learn_from_headers: bool = True,
+    ) -> None:
+        """Enable client-side rate limiting for a provider.
+
+        Applies to providers created afterwards by ``create_provider()``.
+        With no ``rpm``/``tpm``, limits are learned from response headers.
+
+        Args:
+            name: Registered provider name (e.g. "openai").
+            rpm: Requests per minute per model and API key.
+            tpm: Tokens per minute per model and API key.
+            learn_from_headers: Learn limits from provider response headers.
+        """
+        if name not in self._providers:
+            raise KeyError(f"Provider {name!r} is not registered")
+        self._rate_limits[name] = RateLimitConfig(
+            rpm=rpm, tpm=tpm, learn_from_headers=learn_from_headers
+        )
+        # Drop limiters built from the previous configuration
+        self._limiters = {k: v for k, v in self._limiters.items() if k[0] != name}
+
+    def clear_rate_limit(self, name: str) -> bool:
+        """Disable rate limiting for a provider. Returns True if it was set."""
+        self._limiters = {k: v for k, v in self._limiters.items() if k[0] != name}
+        return self._rate_limits.pop(name, None) is not None
+
+    def get_rate_limiter(
+        self, name: str, model: str, api_key: str | None = None
+    ) -> RateLimiter:
+        """Get the limiter shared by every provider for ``name``/``model``/key.
+
+        Args:
+            name: Registered provider name.
+            model: Model identifier.
+            api_key: API key (only a hash of it is kept).
+        """
+        fingerprint = (
+            hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+            if api_key else ""
+        )
+        key = (name, model, fingerprint)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            config = self._rate_limits.get(name, RateLimitConfig())
+            limiter = RateLimiter(
+                rpm=config.rpm, tpm=config.tpm, name=f"{name}/{model}"
+            )
+            self._limiters[key] = limiter
+        return limiter
 
     def list_providers(self) -> list[str]:
         """List all registered provider names."""
@@ -0,0 +1,383 @@
+"""Latency-aware routing across LLM providers.
+
+``RoutedProvider`` wraps several candidate providers (each bound to one
+model) and sends every call to the candidate that currently answers
+fastest, within an optional per-call cost ceiling. Each candidate has its
+own ``CircuitBreaker``; calls fail over to the next candidate on errors,
+and a candidate whose circuit is open takes no traffic until it recovers.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Sequence
+
+from agentchord.core.streaming import AnyStreamChunk, validate_chunks
+from agentchord.core.types import LLMResponse, Message, StreamChunk
+from agentchord.errors.exceptions import CostLimitExceededError
+from agentchord.llm.base import BaseLLMProvider
+from agentchord.llm.tool_format import request_for_provider
+from agentchord.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from agentchord.utils.tokens import estimate_message_tokens
+
+# Floor for the success rate when scoring, so a failing candidate's score
+# stays finite and it can still be ranked
+_MIN_SUCCESS_RATE = 0.05
+
+
+@dataclass
+class RouteStats:
+    """Live statistics for one ``RoutedProvider`` candidate."""
+
+    model: str
+    provider: str
+    state: CircuitState
+    latency: float | None
+    ttft: float | None
+    error_rate: float
+    requests: int
+    failures: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "model": self.model,
+            "provider": self.provider,
+            "state": self.state.value,
+            "latency": self.latency,
+            "ttft": self.ttft,
+            "error_rate": self.error_rate,
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+class Route:
+    """One candidate of a ``RoutedProvider``.
+
+    Keeps EWMAs of call latency, time to first streamed chunk (TTFT) and
+    error rate, plus the candidate's circuit breaker.
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        breaker: CircuitBreaker,
+        smoothing: float,
+    ) -> None:
+        self.provider = provider
+        self.breaker = breaker
+        self._smoothing = smoothing
+        self.latency: float | None = None
+        self.ttft: float | None = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether the circuit lets calls through."""
+        return self.breaker.is_closed
+
+    def score(self, streaming: bool = False) -> float:
+        """Expected seconds to a successful answer (lower is better).
+
+        Untried candidates, and candidates whose circuit is half-open,
+        score 0 so they get a trial call.
+        """
+        if self.breaker.state == CircuitState.HALF_OPEN:
+            return 0.0
+        latency = self.ttft if streaming and self.ttft is not None else self.latency
+        if latency is None:
+            # Untried, or nothing but failures so far
+            return 0.0 if self.requests == 0 else float("inf")
+        # Expected attempts until success, if failures were retried here
+        return latency / max(_MIN_SUCCESS_RATE, 1.0 - self.error_rate)
+
+    def record_success(self, latency: float, ttft: float | None = None) -> None:
+        """Record a successful call."""
+        self.requests += 1
+        self.latency = self._ewma(self.latency, latency)
+        if ttft is not None:
+            self.ttft = self._ewma(self.ttft, ttft)
+        self.error_rate = self._ewma(self.error_rate, 0.0)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self.requests += 1
+        self.failures += 1
+        self.error_rate = self._ewma(self.error_rate, 1.0)
+
+    def _ewma(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self._smoothing * (sample - current)
+
+    @property
+    def stats(self) -> RouteStats:
+        """Snapshot of the candidate's statistics."""
+        return RouteStats(
+            model=self.provider.model,
+            provider=self.provider.provider_name,
+            state=self.breaker.state,
+            latency=self.latency,
+            ttft=self.ttft,
+            error_rate=self.error_rate,
+            requests=self.requests,
+            failures=self.failures,
+        )
+
+    def __repr__(self) -> str:
+        return f"Route({self.provider!r}, score={self.score():.3f})"
+
+
+class RoutedProvider(BaseLLMProvider):
+    """Provider that routes each call to the best of several candidates.
+
+    Candidates are ranked by expected time to a successful answer: the
+    EWMA latency (TTFT for ``stream()``) divided by the EWMA success rate.
+    Untried and recovering (half-open) candidates are tried first, in the
+    order given. Candidates
+    whose estimated cost for the call exceeds ``max_cost`` are skipped.
+
+    On an error the call fails over to the next candidate. Each candidate
+    has its own ``CircuitBreaker``: after ``failure_threshold`` consecutive
+    failures it takes no traffic for ``recovery_timeout`` seconds. A stream
+    only fails over before its first chunk.
+
+    Tool definitions are converted to each candidate's format, so
+    candidates from different providers can be mixed. ``model``,
+    ``provider_name`` and pricing report the first candidate; each
+    response names the model that produced it (``LLMResponse.model``) and
+    carries its cost at that candidate's rates (``LLMResponse.cost``).
+
+    Example:
+        >>> provider = RoutedProvider(
+        ...     ["gpt-4o-mini", "claude-3-5-haiku-20241022", "gemini-2.0-flash"],
+        ...     max_cost=0.01,
+        ... )
+        >>> agent = Agent(name="a", role="r", llm_provider=provider)
+        >>> [s.to_dict() for s in provider.stats]
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[BaseLLMProvider | str],
+        *,
+        max_cost: float | None = None,
+        smoothing: float = 0.2,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        """Initialize routed provider.
+
+        Args:
+            candidates: Providers, or model names created through the
+                provider registry.
+            max_cost: Most a single call may cost in USD, estimated from the
+                prompt and ``max_tokens``. None means no ceiling.
+            smoothing: EWMA weight of each new latency/error sample.
+            failure_threshold: Consecutive failures that open a
+                candidate's circuit.
+            recovery_timeout: Seconds an open circuit waits before
+                letting a trial call through.
+        """
+        if not candidates:
+            raise ValueError("At least one candidate is required")
+        if max_cost is not None and max_cost <= 0:
+            raise ValueError("max_cost must be positive")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+
+        from agentchord.llm.registry import get_registry
+
+        self._routes = [
+            Route(
+                get_registry().create_provider(c) if isinstance(c, str) else c,
+                CircuitBreaker(
+                    failure_threshold=failure_threshold, timeout=recovery_timeout
+                ),
+                smoothing,
+            )
+            for c in candidates
+        ]
+        self._max_cost = max_cost
+        self._current = self._routes[0].provider
+
+    @property
+    def routes(self) -> list[Route]:
+        """Candidates in the order given."""
+        return list(self._routes)
+
+    @property
+    def stats(self) -> list[RouteStats]:
+        """Live statistics per candidate."""
+        return [route.stats for route in self._routes]
+
+    @property
+    def current(self) -> BaseLLMProvider:
+        """Candidate that served the most recent call."""
+        return self._current
+
+    @property
+    def model(self) -> str:
+        return self._routes[0].provider.model
+
+    @property
+    def provider_name(self) -> str:
+        return self._routes[0].provider.provider_name
+
+    @property
+    def cost_per_1k_input_tokens(self) -> float:
+        return self._routes[0].provider.cost_per_1k_input_tokens
+
+    @property
+    def cost_per_1k_output_tokens(self) -> float:
+        return self._routes[0].provider.cost_per_1k_output_tokens
+
+    @property
+    def supports_streaming_tool_calls(self) -> bool:  # type: ignore[override]
+        return all(r.provider.supports_streaming_tool_calls for r in self._routes)
+
+    def calculate_cost(
+        self, input_tokens: int, output_tokens: int, **cache_tokens: int
+    ) -> float:
+        return self._routes[0].provider.calculate_cost(
+            input_tokens, output_tokens, **cache_tokens
+        )
+
+    def rank(
+        self,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        *,
+        streaming: bool = False,
+    ) -> list[Route]:
+        """Candidates eligible for a call, best first.
+
+        Raises:
+            CostLimitExceededError: If no candidate fits ``max_cost``.
+            CircuitOpenError: If every affordable candidate's circuit is open.
+        """
+        routes = self._routes
+        if self._max_cost is not None:
+            costs = [self._estimate_cost(r, messages, max_tokens) for r in routes]
+            routes = [r for r, cost in zip(routes, costs) if cost <= self._max_cost]
+            if not routes:
+                raise CostLimitExceededError(min(costs), self._max_cost)
+
+        available = [r for r in routes if r.available]
+        if not available:
+            retry_after = min(r.breaker.retry_after for r in routes)
+            raise CircuitOpenError(
+                f"All candidate circuits are open. Retry after {retry_after:.1f}s",
+                retry_after=retry_after,
+            )
+        # sorted() is stable, so ties keep the given order
+        return sorted(available, key=lambda r: r.score(streaming))
+
+    async def complete(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        last_error: Exception | None = None
+        for route in self.rank(messages, max_tokens):
+            route_messages, route_kwargs = request_for_provider(route.provider, messages, kwargs)
+            started = time.monotonic()
+            try:
+                response = await route.breaker.execute(
+                    route.provider.complete,
+                    route_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **route_kwargs,
+                )
+            except CircuitOpenError as e:
+                # Opened by a concurrent call since ranking
+                last_error = e
+                continue
+            except Exception as e:
+                route.record_failure()
+                last_error = e
+                continue
+            route.record_success(time.monotonic() - started)
+            self._current = route.provider
+            if response.cost is None and not response.cache_hit:
+                response = response.model_copy(
+                    update={"cost": route.provider.response_cost(response)}
+                )
+            return response
+
+        assert last_error is not None
+        raise last_error
+
+    def stream(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[AnyStreamChunk]:
+        last_error: Exception | None = None
+        for route in self.rank(messages, max_tokens, streaming=True):
+            if not route.available:
+                continue
+            route_messages, route_kwargs = request_for_provider(route.provider, messages, kwargs)
+            started = time.monotonic()
+            ttft: float | None = None
+            try:
+                async for chunk in route.provider.stream_chunks(
+                    route_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **route_kwargs,
+                ):
+                    if ttft is None:
+                        ttft = time.monotonic() - started
+                        self._current = route.provider
+                    yield chunk
+            except Exception as e:
+                route.record_failure()
+                route.breaker.record_failure(e)
+                if ttft is not None:
+                    # Chunks were already yielded; can't switch candidates
+                    raise
+                last_error = e
+                continue
+            route.record_success(time.monotonic() - started, ttft)
+            route.breaker.record_success()
+            return
+
+        if last_error is None:
+            # Every circuit opened while earlier candidates were failing
+            raise CircuitOpenError("All candidate circuits are open")
+        raise last_error
+
+    def _estimate_cost(
+        self, route: Route, messages: list[Message], max_tokens: int
+    ) -> float:
+        model = route.provider.model
+        prompt_tokens = sum(estimate_message_tokens(m, model) for m in messages)
+        return route.provider.calculate_cost(prompt_tokens, max_tokens)
+
+    def __repr__(self) -> str:
+        models = ", ".join(repr(r.provider.model) for r in self._routes)
+        return f"RoutedProvider([{models}])"
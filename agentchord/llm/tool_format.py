@@ -0,0 +1,102 @@
+"""Convert tool definitions between provider wire formats.
+
+Anthropic takes ``{"name", "description", "input_schema"}``; OpenAI,
+Gemini, Ollama and other OpenAI-compatible providers take
+``{"type": "function", "function": {"name", "description", "parameters"}}``.
+Providers that forward a call to one of several inner providers use
+``request_for_provider`` so each one receives its own format.
+
+Call kwargs only OpenAI understands are adapted the same way: an OpenAI
+``response_format`` JSON schema becomes a system prompt instruction (as
+``Agent`` does for non-OpenAI providers), and other OpenAI-only options
+are dropped.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from agentchord.core.structured import schema_instruction
+from agentchord.core.types import Message, MessageRole
+from agentchord.llm.base import BaseLLMProvider
+
+# OpenAI request options other providers reject or ignore
+_OPENAI_ONLY_KWARGS = ("response_format", "parallel_tool_calls", "stream_options", "seed")
+
+
+def tools_for_provider(
+    tools: list[dict[str, Any]], provider_name: str
+) -> list[dict[str, Any]]:
+    """Convert tool definitions to the format ``provider_name`` expects.
+
+    Definitions already in the right format are returned unchanged.
+    """
+    if provider_name == "anthropic":
+        return [_to_anthropic(tool) for tool in tools]
+    return [_to_openai(tool) for tool in tools]
+
+
+def request_for_provider(
+    provider: BaseLLMProvider,
+    messages: list[Message],
+    kwargs: dict[str, Any],
+) -> tuple[list[Message], dict[str, Any]]:
+    """Adapt a call's messages and kwargs to what ``provider`` accepts.
+
+    ``tools`` are converted to the provider's format. For providers other
+    than OpenAI, OpenAI-only kwargs are dropped and a ``response_format``
+    JSON schema is moved into the system prompt.
+
+    Returns:
+        The messages and kwargs to call ``provider`` with.
+    """
+    tools = kwargs.get("tools")
+    if tools:
+        kwargs = {**kwargs, "tools": tools_for_provider(tools, provider.provider_name)}
+    if provider.provider_name == "openai" or not any(k in kwargs for k in _OPENAI_ONLY_KWARGS):
+        return messages, kwargs
+
+    schema = _response_schema(kwargs.get("response_format"))
+    kwargs = {k: v for k, v in kwargs.items() if k not in _OPENAI_ONLY_KWARGS}
+    if schema is None:
+        return messages, kwargs
+    return _with_system_instruction(messages, schema_instruction(schema)), kwargs
+
+
+def _response_schema(response_format: Any) -> dict[str, Any] | None:
+    """JSON schema of an OpenAI ``json_schema`` response format, if any."""
+    if not isinstance(response_format, dict) or response_format.get("type") != "json_schema":
+        return None
+    return response_format.get("json_schema", {}).get("schema")
+
+
+def _with_system_instruction(messages: list[Message], instruction: str) -> list[Message]:
+    """Append ``instruction`` to the leading system message, adding one if needed."""
+    if messages and messages[0].role == MessageRole.SYSTEM:
+        first = messages[0]
+        return [first.model_copy(update={"content": first.content + instruction}), *messages[1:]]
+    return [Message.system(instruction.lstrip()), *messages]
+
+
+def _to_anthropic(tool: dict[str, Any]) -> dict[str, Any]:
+    function = tool.get("function")
+    if function is None:
+        return tool
+    return {
+        "name": function["name"],
+        "description": function.get("description", ""),
+        "input_schema": function.get("parameters", {"type": "object", "properties": {}}),
+    }
+
+
+def _to_openai(tool: dict[str, Any]) -> dict[str, Any]:
+    if "input_schema" not in tool:
+        return tool
+    return {
+        "type": "function",
+        "function": {
+            "name": tool["name"],
+            "description": tool.get("description", ""),
+            "parameters": tool["input_schema"],
+        },
+    }
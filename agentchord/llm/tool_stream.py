@@ -0,0 +1,178 @@
+"""Incremental assembly of streamed tool calls.
+
+Providers stream tool calls as fragments: an id and name first, then the
+JSON arguments in pieces. ``ToolCallAccumulator`` collects the fragments per
+call and hands back a complete ``ToolCall`` as soon as each one is done, so
+the agent can start running it while the rest of the response streams.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from agentchord.core.types import ToolCall
+
+
+def _get(obj: Any, name: str) -> Any:
+    """Read a field from a dict (raw JSON) or an SDK object."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+class _PartialCall:
+    __slots__ = ("id", "name", "arguments")
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.name = ""
+        self.arguments: list[str] = []
+
+
+class ToolCallAccumulator:
+    """Assemble streamed tool-call fragments into ``ToolCall`` objects.
+
+    Example:
+        >>> acc = ToolCallAccumulator()
+        >>> acc.start(0, id="call_1", name="search")
+        >>> acc.append(0, '{"query": ')
+        >>> acc.append(0, '"python"}')
+        >>> acc.finish(0)
+        ToolCall(id='call_1', name='search', arguments={'query': 'python'})
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[int, _PartialCall] = {}
+        self._finished: set[int] = set()
+        # feed_openai(): wire index (or list position) -> call key
+        self._slots: dict[int, int] = {}
+
+    @property
+    def pending(self) -> int:
+        """Calls started but not yet finished."""
+        return len(self._open)
+
+    def start(self, index: int, *, id: str | None = None, name: str | None = None) -> None:
+        """Begin (or update) the call at ``index``."""
+        call = self._open.get(index)
+        if call is None:
+            if index in self._finished:
+                return
+            call = self._open[index] = _PartialCall()
+        if id:
+            call.id = id
+        if name:
+            call.name = name
+
+    def append(self, index: int, fragment: str) -> None:
+        """Add a fragment of JSON arguments to the call at ``index``."""
+        if not fragment:
+            return
+        if index not in self._open:
+            self.start(index)
+        if index in self._open:
+            self._open[index].arguments.append(fragment)
+
+    def finish(self, index: int) -> ToolCall | None:
+        """Complete the call at ``index`` and return it.
+
+        Raises:
+            ValueError: If the call's arguments are not a JSON object.
+        """
+        call = self._open.pop(index, None)
+        if call is None:
+            return None
+        self._finished.add(index)
+        return ToolCall(
+            id=call.id or f"call_{index}",
+            name=call.name,
+            arguments=self._parse_arguments(call),
+        )
+
+    def finish_all(self) -> list[ToolCall]:
+        """Complete every open call, in index order."""
+        done = [self.finish(index) for index in sorted(self._open)]
+        return [tc for tc in done if tc is not None]
+
+    def feed_openai(self, deltas: list[Any] | None) -> list[ToolCall]:
+        """Consume OpenAI-style ``delta.tool_calls`` entries.
+
+        Works with SDK objects and raw JSON dicts (Gemini, Ollama). OpenAI
+        streams calls one after another, so a delta for a new index means
+        every lower-indexed call is complete. Some OpenAI-compatible servers
+        send each call whole, without an index; a delta then starts a new
+        call when its id differs from the open call's, or when it names a
+        call while the open call's arguments are already complete JSON.
+
+        Returns:
+            Calls completed by this delta.
+
+        Raises:
+            ValueError: If a completed call's arguments are not a JSON object.
+        """
+        completed: list[ToolCall] = []
+        for position, delta in enumerate(deltas or ()):
+            slot = _get(delta, "index")
+            if slot is None:
+                slot = position
+            function = _get(delta, "function")
+            call_id = _get(delta, "id")
+            name = _get(function, "name") if function is not None else None
+
+            key = self._slots.get(slot)
+            call = self._open.get(key) if key is not None else None
+            if call is not None and self._starts_new_call(call, call_id, name):
+                completed.append(self.finish(key))  # type: ignore[arg-type]
+                call = None
+            if call is None and (key is None or call_id or name):
+                for earlier in sorted(
+                    s for s, k in self._slots.items() if s < slot and k in self._open
+                ):
+                    tc = self.finish(self._slots[earlier])
+                    if tc is not None:
+                        completed.append(tc)
+                key = self._slots[slot] = self._next_key()
+
+            self.start(key, id=call_id, name=name)  # type: ignore[arg-type]
+            if function is not None:
+                arguments = _get(function, "arguments")
+                if isinstance(arguments, dict):
+                    # Some OpenAI-compatible servers send parsed arguments
+                    arguments = json.dumps(arguments)
+                self.append(key, arguments or "")  # type: ignore[arg-type]
+        return [tc for tc in completed if tc is not None]
+
+    def _next_key(self) -> int:
+        return max(self._open.keys() | self._finished, default=-1) + 1
+
+    @staticmethod
+    def _starts_new_call(call: _PartialCall, call_id: str | None, name: str | None) -> bool:
+        """Whether a delta carrying ``call_id``/``name`` begins another call."""
+        if call_id and call.id and call_id != call.id:
+            return True
+        if not (call_id or name) or not call.arguments:
+            return False
+        try:
+            json.loads("".join(call.arguments))
+        except json.JSONDecodeError:
+            return False
+        return True
+
+    @staticmethod
+    def _parse_arguments(call: _PartialCall) -> dict[str, Any]:
+        arguments = "".join(call.arguments)
+        if not arguments.strip():
+            return {}
+        try:
+            parsed = json.loads(arguments)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"Tool call {call.name!r} has invalid JSON arguments: {arguments[:200]!r}"
+            ) from e
+        if not isinstance(parsed, dict):
+            raise ValueError(
+                f"Tool call {call.name!r} arguments must be a JSON object, "
+                f"got {type(parsed).__name__}"
+            )
+        return parsed
@@ -1,6 +1,7 @@
 """Embedding providers for RAG."""
 
 from agentchord.rag.embeddings.base import EmbeddingProvider
+from agentchord.rag.embeddings.coalesce import CoalescingEmbeddings
 from agentchord.rag.embeddings.gemini import GeminiEmbeddings
 
-__all__ = ["EmbeddingProvider", "GeminiEmbeddings"]
+__all__ = ["EmbeddingProvider", "CoalescingEmbeddings", "GeminiEmbeddings"]
@@ -0,0 +1,83 @@
+"""Request coalescing for embedding providers."""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from agentchord.rag.embeddings.base import EmbeddingProvider
+from agentchord.utils.singleflight import SingleFlight, SingleFlightStats
+
+
+def _key(model: str, payload: str | list[str]) -> str:
+    blob = json.dumps([model, payload], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class CoalescingEmbeddings(EmbeddingProvider):
+    """Embedding provider wrapper that merges identical in-flight requests.
+
+    Concurrent ``embed()`` calls for the same text, and concurrent
+    ``embed_batch()`` calls for the same list of texts, share one upstream
+    call. Duplicate texts within a batch are embedded once. Cancelling one
+    caller does not cancel the call for the others.
+
+    Example:
+        >>> embeddings = CoalescingEmbeddings(OpenAIEmbeddings())
+        >>> await asyncio.gather(*(embeddings.embed("query") for _ in range(10)))
+        >>> embeddings.stats.calls
+        1
+    """
+
+    def __init__(self, provider: EmbeddingProvider) -> None:
+        """Initialize coalescing embeddings.
+
+        Args:
+            provider: Provider making the upstream calls.
+        """
+        self._provider = provider
+        self._single: SingleFlight[list[float]] = SingleFlight()
+        self._batch: SingleFlight[list[list[float]]] = SingleFlight()
+
+    @property
+    def provider(self) -> EmbeddingProvider:
+        """Wrapped provider."""
+        return self._provider
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Combined coalescing statistics for single and batch calls."""
+        single, batch = self._single.stats, self._batch.stats
+        return SingleFlightStats(
+            calls=single.calls + batch.calls,
+            coalesced=single.coalesced + batch.coalesced,
+            cancelled=single.cancelled + batch.cancelled,
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self._provider.model_name
+
+    @property
+    def dimensions(self) -> int:
+        return self._provider.dimensions
+
+    async def embed(self, text: str) -> list[float]:
+        return await self._single.do(
+            _key(self.model_name, text),
+            lambda: self._provider.embed(text),
+        )
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+
+        unique = list(dict.fromkeys(texts))
+        vectors = await self._batch.do(
+            _key(self.model_name, unique),
+            lambda: self._provider.embed_batch(unique),
+        )
+        if len(unique) == len(texts):
+            return vectors
+
+        by_text = dict(zip(unique, vectors))
+        return [by_text[text] for text in texts]
@@ -1,9 +1,10 @@
 """Gemini embedding provider."""
 from __future__ import annotations
 
-import httpx
-
 from agentchord.rag.embeddings.base import EmbeddingProvider
+from agentchord.utils.http import get_http_client
+
+_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
 
 _DIMENSIONS: dict[str, int] = {
     "gemini-embedding-001": 3072,
@@ -39,19 +40,19 @@ class GeminiEmbeddings(EmbeddingProvider):
         if not self._api_key:
             raise ValueError("api_key is required for GeminiEmbeddings")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/{self._model}:embedContent",
-                params={"key": self._api_key},
-                json={
-                    "model": f"models/{self._model}",
-                    "content": {"parts": [{"text": text}]},
-                },
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["embedding"]["values"]
+        client = get_http_client(_BASE_URL)
+        response = await client.post(
+            f"{_BASE_URL}/models/{self._model}:embedContent",
+            params={"key": self._api_key},
+            json={
+                "model": f"models/{self._model}",
+                "content": {"parts": [{"text": text}]},
+            },
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["embedding"]["values"]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         if not texts:
@@ -62,26 +63,26 @@ class GeminiEmbeddings(EmbeddingProvider):
         all_embeddings: list[list[float]] = []
         batch_size = 100
 
-        async with httpx.AsyncClient() as client:
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i : i + batch_size]
-                requests = [
-                    {
-                        "model": f"models/{self._model}",
-                        "content": {"parts": [{"text": text}]},
-                    }
-                    for text in batch
-                ]
-                response = await client.post(
-                    f"https://generativelanguage.googleapis.com/v1beta/models/{self._model}:batchEmbedContents",
-                    params={"key": self._api_key},
-                    json={"requests": requests},
-                    timeout=60.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-                all_embeddings.extend(
-                    [embedding["values"] for embedding in data["embeddings"]]
-                )
+        client = get_http_client(_BASE_URL)
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i : i + batch_size]
+            requests = [
+                {
+                    "model": f"models/{self._model}",
+                    "content": {"parts": [{"text": text}]},
+                }
+                for text in batch
+            ]
+            response = await client.post(
+                f"{_BASE_URL}/models/{self._model}:batchEmbedContents",
+                params={"key": self._api_key},
+                json={"requests": requests},
+                timeout=60.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+            all_embeddings.extend(
+                [embedding["values"] for embedding in data["embeddings"]]
+            )
 
         return all_embeddings
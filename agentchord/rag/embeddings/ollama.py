@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from agentchord.rag.embeddings.base import EmbeddingProvider
+from agentchord.utils.http import get_http_client
 
 
 class OllamaEmbeddings(EmbeddingProvider):
@@ -35,15 +36,15 @@ class OllamaEmbeddings(EmbeddingProvider):
         return self._dimensions
 
     async def embed(self, text: str) -> list[float]:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self._base_url}/api/embeddings",
-                json={"model": self._model, "prompt": text},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["embedding"]
+        client = get_http_client(self._base_url)
+        response = await client.post(
+            f"{self._base_url}/api/embeddings",
+            json={"model": self._model, "prompt": text},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["embedding"]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         if not texts:
@@ -61,7 +62,7 @@ class OllamaEmbeddings(EmbeddingProvider):
                 response.raise_for_status()
                 return response.json()["embedding"]
 
-        async with httpx.AsyncClient() as client:
-            return list(await asyncio.gather(
-                *[_embed_one(client, text) for text in texts]
-            ))
+        client = get_http_client(self._base_url)
+        return list(await asyncio.gather(
+            *[_embed_one(client, text) for text in texts]
+        ))
@@ -33,34 +33,35 @@ class WebLoader(DocumentLoader):
         }
 
     async def load(self) -> list[Document]:
-        import httpx
+        from agentchord.utils.http import get_http_client
 
         documents: list[Document] = []
 
-        async with httpx.AsyncClient(
-            timeout=self._timeout,
-            headers=self._headers,
-            follow_redirects=True,
-        ) as client:
-            for url in self._urls:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                text = self._extract_text(response.text)
-                if not text.strip():
-                    continue
-
-                documents.append(
-                    Document(
-                        content=text,
-                        source=url,
-                        metadata={
-                            "url": url,
-                            "status_code": response.status_code,
-                            "content_type": response.headers.get("content-type", ""),
-                        },
-                    )
+        for url in self._urls:
+            client = get_http_client(url)
+            response = await client.get(
+                url,
+                headers=self._headers,
+                timeout=self._timeout,
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+
+            text = self._extract_text(response.text)
+            if not text.strip():
+                continue
+
+            documents.append(
+                Document(
+                    content=text,
+                    source=url,
+                    metadata={
+                        "url": url,
+                        "status_code": response.status_code,
+                        "content_type": response.headers.get("content-type", ""),
+                    },
                 )
+            )
 
         return documents
 
@@ -166,6 +166,29 @@ class RAGPipeline:
             filter=filter,
         )
 
+    async def retrieve_batch(
+        self,
+        queries: list[str],
+        limit: int | None = None,
+        *,
+        filter: dict[str, Any] | None = None,
+    ) -> list[RetrievalResult]:
+        """Retrieve context for several queries in one pass.
+
+        Args:
+            queries: Search queries.
+            limit: Override default search limit.
+            filter: Optional metadata filter.
+
+        Returns:
+            One RetrievalResult per query, in query order.
+        """
+        return await self._search.search_batch(
+            queries,
+            limit=limit or self._search_limit,
+            filter=filter,
+        )
+
     async def generate(
         self,
         query: str,
@@ -19,6 +19,7 @@ Reference:
 """
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
@@ -192,6 +193,87 @@ class HybridSearch:
             total_ms=retrieval_time_ms,
         )
 
+    async def search_batch(
+        self,
+        queries: list[str],
+        limit: int = 5,
+        *,
+        filter: dict[str, Any] | None = None,
+        use_reranker: bool = True,
+    ) -> list[RetrievalResult]:
+        """Search several queries at once.
+
+        Runs the same pipeline as ``search``, but embeds all queries with
+        one ``embed_batch`` call and scores them with one
+        ``VectorStore.search_batch`` call. Reranking runs concurrently.
+
+        Args:
+            queries: Search query texts.
+            limit: Number of final results per query.
+            filter: Optional metadata filter for vector search.
+            use_reranker: Whether to apply reranker (if available).
+
+        Returns:
+            One RetrievalResult per query, in query order. Timings cover
+            the whole batch.
+        """
+        start_time = time.perf_counter()
+
+        active = [query for query in queries if query.strip()]
+        if not active:
+            return [RetrievalResult(query=query) for query in queries]
+
+        # Steps 1-2: Embed and vector search all queries together
+        query_embeddings = await self.embedding_provider.embed_batch(active)
+        vector_batch = await self.vectorstore.search_batch(
+            query_embeddings=query_embeddings,
+            limit=self.vector_candidates,
+            filter=filter,
+        )
+
+        # Steps 3-4: BM25 search and RRF fusion per query
+        fused_batch = [
+            self._rrf_fuse(
+                result_lists=[
+                    vector_results,
+                    self.bm25.search(query=query, limit=self.bm25_candidates),
+                ],
+                weights=[self.vector_weight, self.bm25_weight],
+                k=self.rrf_k,
+            )
+            for query, vector_results in zip(active, vector_batch)
+        ]
+
+        # Step 5: Optional reranking
+        if use_reranker and self.reranker is not None:
+            reranker = self.reranker
+
+            async def rerank(query: str, results: list[SearchResult]) -> list[SearchResult]:
+                if not results:
+                    return results
+                return await reranker.rerank(query=query, results=results, top_n=limit)
+
+            fused_batch = list(
+                await asyncio.gather(
+                    *(rerank(q, fused) for q, fused in zip(active, fused_batch))
+                )
+            )
+
+        # Step 6: Return top-K per query
+        retrieval_time_ms = (time.perf_counter() - start_time) * 1000
+        by_query = iter(fused_batch)
+        return [
+            RetrievalResult(
+                query=query,
+                results=next(by_query)[:limit],
+                retrieval_ms=retrieval_time_ms,
+                total_ms=retrieval_time_ms,
+            )
+            if query.strip()
+            else RetrievalResult(query=query)
+            for query in queries
+        ]
+
     async def delete(self, chunk_ids: list[str]) -> int:
         """Delete chunks from both vector store and BM25 index.
 
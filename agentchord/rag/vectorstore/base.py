@@ -46,6 +46,30 @@ class VectorStore(ABC):
             SearchResults sorted by score descending.
         """
 
+    async def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query vectors at once.
+
+        Default implementation calls ``search`` once per query. Override
+        to score all queries in one pass.
+
+        Args:
+            query_embeddings: Query vectors.
+            limit: Maximum number of results per query.
+            filter: Optional metadata filter applied to every query.
+
+        Returns:
+            One list of SearchResults per query, in query order.
+        """
+        return [
+            await self.search(query_embedding, limit=limit, filter=filter)
+            for query_embedding in query_embeddings
+        ]
+
     @abstractmethod
     async def delete(self, chunk_ids: list[str]) -> int:
         """Delete chunks by ID.
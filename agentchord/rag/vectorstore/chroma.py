@@ -81,9 +81,20 @@ class ChromaVectorStore(VectorStore):
         limit: int = 10,
         filter: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
+        results = await self.search_batch([query_embedding], limit=limit, filter=filter)
+        return results[0]
+
+    async def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        if not query_embeddings:
+            return []
         collection = self._get_collection()
         kwargs: dict[str, Any] = {
-            "query_embeddings": [query_embedding],
+            "query_embeddings": query_embeddings,
             "n_results": limit,
         }
         if filter:
@@ -91,13 +102,19 @@ class ChromaVectorStore(VectorStore):
 
         raw = await asyncio.to_thread(collection.query, **kwargs)
 
+        # Chroma returns one row of ids/distances/documents per query
+        return [self._parse_results(raw, i) for i in range(len(query_embeddings))]
+
+    @staticmethod
+    def _parse_results(raw: dict[str, Any], i: int) -> list[SearchResult]:
+        """Convert the results of the i-th query in a Chroma response."""
         results: list[SearchResult] = []
-        if raw["ids"] and raw["ids"][0]:
-            for i, chunk_id in enumerate(raw["ids"][0]):
-                distance = raw["distances"][0][i] if raw.get("distances") else 0.0
+        if raw["ids"] and raw["ids"][i]:
+            for j, chunk_id in enumerate(raw["ids"][i]):
+                distance = raw["distances"][i][j] if raw.get("distances") else 0.0
                 score = max(0.0, 1.0 - distance)
-                content = raw["documents"][0][i] if raw.get("documents") else ""
-                metadata = raw["metadatas"][0][i] if raw.get("metadatas") else {}
+                content = raw["documents"][i][j] if raw.get("documents") else ""
+                metadata = raw["metadatas"][i][j] if raw.get("metadatas") else {}
                 results.append(
                     SearchResult(
                         chunk=Chunk(
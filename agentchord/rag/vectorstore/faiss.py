@@ -2,10 +2,25 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
 
 from agentchord.rag.types import Chunk, SearchResult
 from agentchord.rag.vectorstore.base import VectorStore
+from agentchord.rag.vectorstore.persistence import read_chunks, replace_file, write_chunks
+
+
+INDEX_TYPES = ("flat", "hnsw", "ivf", "ivfpq")
+
+# Rebuild an HNSW graph once at least this many deleted vectors linger...
+_MIN_COMPACT_ROWS = 1024
+# ...and they make up at least this share of it.
+_COMPACT_RATIO = 0.25
+
+_INDEX_FILE = "index.faiss"
+# Training buffer of an index saved before it was trained
+_BUFFER_FILE = "buffer.faiss"
 
 
 class FAISSVectorStore(VectorStore):
@@ -13,14 +28,73 @@ class FAISSVectorStore(VectorStore):
 
     Requires: pip install faiss-cpu (or faiss-gpu)
     Provides GPU-accelerated similarity search.
+
+    Index types:
+        - ``"flat"``: exact search over every vector.
+        - ``"hnsw"``: HNSW graph. No training; recall grows with ``ef_search``.
+        - ``"ivf"``: vectors bucketed into ``nlist`` k-means cells; a search
+          scans the ``nprobe`` closest cells.
+        - ``"ivfpq"``: IVF over product-quantized vectors (``pq_m`` codes of
+          ``pq_bits`` bits each), optionally rotated with OPQ first.
+
+    IVF indexes need training. Until then added vectors are kept in an
+    exact flat buffer, which searches use. Once ``train_size`` vectors
+    have arrived the index is trained on a random sample of them and the
+    buffer moves in; call ``train()`` to do that earlier.
+
+    Deleting removes vectors from the index, except for HNSW graphs,
+    which cannot drop nodes: there deleted vectors are skipped by searches
+    and dropped when the graph is rebuilt by ``compact()``. Metadata
+    filters are applied inside FAISS with an ID selector.
+
+    ``save()`` writes the index with ``faiss.write_index`` next to a chunk
+    sidecar; ``load()`` memory-maps it back, so a cold start neither
+    re-embeds nor rebuilds the index. A mapped index is read into memory
+    the first time the store is changed.
+
+    Example:
+        >>> store = FAISSVectorStore(1536, "ivf", nlist=1024, nprobe=16)
+        >>> await store.add(chunks)
+        >>> results = await store.search(query, limit=5, nprobe=64)
     """
 
-    def __init__(self, dimensions: int, index_type: str = "flat") -> None:
+    def __init__(
+        self,
+        dimensions: int,
+        index_type: str = "flat",
+        *,
+        nlist: int = 100,
+        nprobe: int = 8,
+        hnsw_m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        pq_m: int = 8,
+        pq_bits: int = 8,
+        opq: bool = False,
+        train_size: int | None = None,
+        max_train_size: int | None = None,
+    ) -> None:
         """Initialize FAISS vector store.
 
         Args:
             dimensions: Vector dimension size.
-            index_type: FAISS index type ('flat' for exact search).
+            index_type: FAISS index type: 'flat', 'hnsw', 'ivf' or 'ivfpq'.
+            nlist: Number of IVF cells.
+            nprobe: Default number of IVF cells scanned per query.
+            hnsw_m: Neighbors per HNSW node.
+            ef_construction: HNSW candidate list size while building.
+            ef_search: Default HNSW candidate list size per query.
+            pq_m: Sub-quantizers per vector for 'ivfpq'. Must divide dimensions.
+            pq_bits: Bits per sub-quantizer code for 'ivfpq'.
+            opq: Rotate vectors with OPQ before 'ivfpq' quantization.
+            train_size: Vectors to collect before training automatically.
+                Defaults to 39 per centroid, FAISS's recommended minimum.
+            max_train_size: Largest sample trained on. Defaults to 256
+                per centroid.
+
+        Raises:
+            ImportError: If faiss or numpy is not installed.
+            ValueError: If the index type or its parameters are invalid.
         """
         try:
             import faiss
@@ -31,16 +105,163 @@ class FAISSVectorStore(VectorStore):
                 "Install with: pip install faiss-cpu numpy"
             ) from e
 
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unsupported index_type: {index_type!r}. "
+                f"Expected one of: {', '.join(INDEX_TYPES)}."
+            )
+        if index_type == "ivfpq" and dimensions % pq_m != 0:
+            raise ValueError(f"pq_m ({pq_m}) must divide dimensions ({dimensions})")
+        if opq and index_type != "ivfpq":
+            raise ValueError("opq is only supported with index_type='ivfpq'")
+
         self._dimensions = dimensions
-        if index_type == "flat":
-            self._index = faiss.IndexFlatIP(dimensions)
-        else:
-            raise ValueError(f"Unsupported index_type: {index_type!r}. Currently only 'flat' is supported.")
+        self._index_type = index_type
+        self._nlist = nlist
+        self._hnsw_m = hnsw_m
+        self._ef_construction = ef_construction
+        self._pq_m = pq_m
+        self._pq_bits = pq_bits
+        self._opq = opq
+        self.nprobe = nprobe
+        self.ef_search = ef_search
+
+        # Fewest vectors k-means can train on, and the defaults per centroid
+        centroids = nlist
+        if index_type == "ivfpq":
+            # OPQ trains its own 8-bit quantizer
+            centroids = max(nlist, 2**pq_bits, 256 if opq else 0)
+        self._min_train_size = centroids
+        self._train_size = max(train_size or 39 * centroids, centroids)
+        self._max_train_size = max_train_size or 256 * centroids
+
+        # Writers hold the lock and wait for running searches to finish;
+        # searches only pass through it, so they still run concurrently
+        self._lock = asyncio.Lock()
+        self._readers = 0
+        self._no_readers = asyncio.Event()
+        self._no_readers.set()
+        self._index, self._buffer = self._build_index()
 
         self._chunks: dict[int, Chunk] = {}
         self._id_map: dict[str, int] = {}
         self._deleted_ids: set[int] = set()
         self._next_idx: int = 0
+        # Index file memory-mapped by load(); read in full before a change
+        self._mapped_from: Path | None = None
+
+    def _build_index(self) -> tuple[Any, Any]:
+        """Create an empty index, plus a flat buffer if it needs training.
+
+        Vectors are stored under their chunk index as FAISS ID: IVF indexes
+        map IDs natively, the others are wrapped in ``IndexIDMap2``.
+        """
+        import faiss
+
+        d = self._dimensions
+        metric = faiss.METRIC_INNER_PRODUCT
+        if self._index_type == "flat":
+            index = faiss.index_factory(d, "IDMap2,Flat", metric)
+        elif self._index_type == "hnsw":
+            index = faiss.index_factory(d, f"IDMap2,HNSW{self._hnsw_m},Flat", metric)
+            faiss.downcast_index(index.index).hnsw.efConstruction = self._ef_construction
+        elif self._index_type == "ivf":
+            index = faiss.index_factory(d, f"IVF{self._nlist},Flat", metric)
+        else:
+            # "np" skips polysemous training, which searches here never use
+            rotation = f"OPQ{self._pq_m}," if self._opq else ""
+            index = faiss.index_factory(
+                d, f"{rotation}IVF{self._nlist},PQ{self._pq_m}x{self._pq_bits}np", metric
+            )
+
+        buffer = None if index.is_trained else faiss.index_factory(d, "IDMap2,Flat", metric)
+        return index, buffer
+
+    @property
+    def index_type(self) -> str:
+        """FAISS index type of this store."""
+        return self._index_type
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether vectors go into the index rather than the training buffer."""
+        return self._buffer is None
+
+    async def train(self) -> None:
+        """Train the index on a sample of the vectors added so far.
+
+        Runs automatically once ``train_size`` vectors have been added. Does
+        nothing if the index is already trained.
+
+        Raises:
+            ValueError: If too few vectors have been added to train on.
+        """
+        async with self._writing():
+            if self._buffer is not None:
+                await asyncio.to_thread(self._train)
+
+    def _train(self) -> None:
+        import faiss
+        import numpy as np
+
+        buffer = self._buffer
+        if buffer.ntotal < self._min_train_size:
+            raise ValueError(
+                f"Training needs at least {self._min_train_size} vectors, "
+                f"got {buffer.ntotal}"
+            )
+        vectors = buffer.index.reconstruct_n(0, buffer.ntotal)
+        ids = faiss.vector_to_array(buffer.id_map)
+        sample = vectors
+        if len(vectors) > self._max_train_size:
+            rng = np.random.default_rng(0)
+            sample = vectors[rng.choice(len(vectors), self._max_train_size, replace=False)]
+
+        self._ensure_writable()
+        self._index.train(sample)
+        self._index.add_with_ids(vectors, ids)
+        self._buffer = None
+
+    def _ensure_writable(self) -> None:
+        """Replace a memory-mapped index with an in-memory copy.
+
+        Mapped inverted lists and codes are read-only in FAISS, so every
+        change to the index goes through here first.
+        """
+        import faiss
+
+        if self._mapped_from is not None:
+            self._index = faiss.read_index(str(self._mapped_from))
+            self._mapped_from = None
+
+    @asynccontextmanager
+    async def _reading(self) -> AsyncIterator[None]:
+        """Hold off writers while a search uses the index."""
+        async with self._lock:
+            self._readers += 1
+            self._no_readers.clear()
+        try:
+            yield
+        finally:
+            self._readers -= 1
+            if not self._readers:
+                self._no_readers.set()
+
+    @asynccontextmanager
+    async def _writing(self) -> AsyncIterator[None]:
+        """Change the index once no search is using it."""
+        async with self._lock:
+            await self._no_readers.wait()
+            yield
+
+    @property
+    def _searchable(self) -> Any:
+        return self._index if self._buffer is None else self._buffer
+
+    @property
+    def _keeps_deleted(self) -> bool:
+        # HNSW graphs cannot drop nodes; deleted vectors stay until compaction
+        return self._index_type == "hnsw"
 
     async def add(self, chunks: list[Chunk]) -> list[str]:
         import numpy as np
@@ -48,8 +269,6 @@ class FAISSVectorStore(VectorStore):
         if not chunks:
             return []
 
-        vectors = []
-        ids: list[str] = []
         for chunk in chunks:
             if chunk.embedding is None:
                 raise ValueError(f"Chunk {chunk.id} has no embedding")
@@ -58,83 +277,381 @@ class FAISSVectorStore(VectorStore):
                     f"Embedding dimension mismatch: expected {self._dimensions}, "
                     f"got {len(chunk.embedding)} for chunk {chunk.id}"
                 )
-            vectors.append(chunk.embedding)
-            self._chunks[self._next_idx] = chunk
-            self._id_map[chunk.id] = self._next_idx
-            ids.append(chunk.id)
-            self._next_idx += 1
 
-        arr = np.array(vectors, dtype=np.float32)
-        norms = np.linalg.norm(arr, axis=1, keepdims=True)
-        norms = np.where(norms == 0, 1, norms)
-        arr = arr / norms
+        async with self._writing():
+            indices: list[int] = []
+            replaced: list[int] = []
+            for chunk in chunks:
+                # Re-added IDs replace the stored vector
+                previous = self._id_map.get(chunk.id)
+                if previous is not None:
+                    replaced.append(previous)
+                    del self._chunks[previous]
+                self._chunks[self._next_idx] = chunk
+                self._id_map[chunk.id] = self._next_idx
+                indices.append(self._next_idx)
+                self._next_idx += 1
+
+            arr = np.array([chunk.embedding for chunk in chunks], dtype=np.float32)
+            norms = np.linalg.norm(arr, axis=1, keepdims=True)
+            norms = np.where(norms == 0, 1, norms)
+            arr = arr / norms
+
+            await asyncio.to_thread(self._add_vectors, arr, np.array(indices, dtype=np.int64))
+            if replaced:
+                await asyncio.to_thread(self._remove, replaced)
+            if self._buffer is not None and self._buffer.ntotal >= self._train_size:
+                await asyncio.to_thread(self._train)
+        return [chunk.id for chunk in chunks]
 
-        await asyncio.to_thread(self._index.add, arr)
-        return ids
+    def _add_vectors(self, vectors: Any, ids: Any) -> None:
+        if self._buffer is None:
+            self._ensure_writable()
+        self._searchable.add_with_ids(vectors, ids)
+
+    def _search_params(self, nprobe: int, ef_search: int, selector: Any) -> Any:
+        """FAISS search parameters for one search call, or None if not needed."""
+        import faiss
+
+        if self._buffer is not None or self._index_type == "flat":
+            if selector is None:
+                return None
+            params = faiss.SearchParameters()
+        elif self._index_type == "hnsw":
+            params = faiss.SearchParametersHNSW()
+            params.efSearch = ef_search
+        else:
+            params = faiss.SearchParametersIVF()
+            params.nprobe = nprobe
+        if selector is not None:
+            params.sel = selector
+
+        # SWIG does not keep nested parameter objects alive on its own
+        referenced = [selector]
+        if self._opq and self._buffer is None:
+            wrapper = faiss.SearchParametersPreTransform()
+            wrapper.index_params = params
+            referenced.append(params)
+            params = wrapper
+        params.referenced_objects = referenced
+        return params
+
+    def _selector(self, filter: dict[str, Any] | None) -> tuple[Any, int]:
+        """Build the ID selector for a search.
+
+        Returns:
+            (selector or None, number of vectors the selector admits).
+        """
+        import faiss
+        import numpy as np
+
+        if filter:
+            allowed = [
+                idx for idx, chunk in self._chunks.items() if self._matches_filter(chunk, filter)
+            ]
+            return faiss.IDSelectorBatch(np.array(allowed, dtype=np.int64)), len(allowed)
+        if self._deleted_ids:
+            deleted = faiss.IDSelectorBatch(np.array(list(self._deleted_ids), dtype=np.int64))
+            selector = faiss.IDSelectorNot(deleted)
+            selector.referenced_objects = [deleted]
+            return selector, len(self._chunks)
+        return None, len(self._chunks)
 
     async def search(
         self,
         query_embedding: list[float],
         limit: int = 10,
         filter: dict[str, Any] | None = None,
+        *,
+        nprobe: int | None = None,
+        ef_search: int | None = None,
     ) -> list[SearchResult]:
+        """Search for similar vectors.
+
+        Args:
+            query_embedding: Query vector.
+            limit: Maximum number of results.
+            filter: Optional metadata filter (key-value equality).
+            nprobe: IVF cells to scan for this query. Defaults to ``self.nprobe``.
+            ef_search: HNSW candidate list size for this query. Defaults
+                to ``self.ef_search``.
+
+        Returns:
+            SearchResults sorted by score descending.
+        """
+        results = await self.search_batch(
+            [query_embedding], limit=limit, filter=filter, nprobe=nprobe, ef_search=ef_search
+        )
+        return results[0]
+
+    async def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        filter: dict[str, Any] | None = None,
+        *,
+        nprobe: int | None = None,
+        ef_search: int | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query vectors at once.
+
+        Filters are applied inside FAISS through an ID selector built from
+        chunk metadata. An approximate index can still come back short when
+        the filter is selective; those queries are repeated with ``nprobe``
+        or ``ef_search`` doubled until ``limit`` matches are found or the
+        whole index has been searched.
+
+        Searches run concurrently with each other; ``add``, ``delete``,
+        ``compact``, ``train``, ``clear`` and ``save`` wait for running
+        searches and block new ones until they finish.
+        """
+        async with self._reading():
+            return await self._search_batch(query_embeddings, limit, filter, nprobe, ef_search)
+
+    async def _search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int,
+        filter: dict[str, Any] | None,
+        nprobe: int | None,
+        ef_search: int | None,
+    ) -> list[list[SearchResult]]:
         import numpy as np
 
-        if self._index.ntotal == 0:
-            return []
+        index = self._searchable
+        if not self._chunks or not query_embeddings or limit <= 0:
+            return [[] for _ in query_embeddings]
 
-        query = np.array([query_embedding], dtype=np.float32)
-        norm = np.linalg.norm(query)
-        if norm > 0:
-            query = query / norm
+        selector, admitted = self._selector(filter)
+        if not admitted:
+            return [[] for _ in query_embeddings]
+        wanted = min(limit, admitted)
 
-        search_limit = min(limit * 3, self._index.ntotal) if filter else limit
-        scores_arr, indices = await asyncio.to_thread(
-            self._index.search, query, search_limit
-        )
+        queries = np.array(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1, norms)
+
+        nprobe = nprobe or self.nprobe
+        ef_search = ef_search or self.ef_search
+        results: list[list[SearchResult]] = [[] for _ in query_embeddings]
+        pending = list(range(len(query_embeddings)))
+        while True:
+            scores_arr, indices = await asyncio.to_thread(
+                index.search,
+                queries[pending],
+                limit,
+                params=self._search_params(nprobe, ef_search, selector),
+            )
+            short: list[int] = []
+            for i, row_scores, row_indices in zip(pending, scores_arr, indices):
+                results[i] = self._collect(row_scores, row_indices)
+                if len(results[i]) < wanted:
+                    short.append(i)
+
+            if not short or self._buffer is not None or self._index_type == "flat":
+                break
+            if self._index_type == "hnsw":
+                if ef_search >= index.ntotal:
+                    break
+                ef_search *= 2
+            else:
+                if nprobe >= self._nlist:
+                    break
+                nprobe *= 2
+            pending = short
 
+        return results
+
+    def _collect(self, scores: Any, indices: Any) -> list[SearchResult]:
+        """Turn one row of FAISS output into SearchResults."""
         results: list[SearchResult] = []
-        for score, idx in zip(scores_arr[0], indices[0]):
-            if idx < 0:
-                continue
-            if int(idx) in self._deleted_ids:
-                continue
-            chunk = self._chunks.get(int(idx))
+        for score, idx in zip(scores.tolist(), indices.tolist()):
+            chunk = self._chunks.get(idx) if idx >= 0 else None
             if chunk is None:
                 continue
-            if filter and not self._matches_filter(chunk, filter):
-                continue
             results.append(
                 SearchResult(
                     chunk=chunk,
-                    score=max(0.0, float(score)),
+                    score=max(0.0, score),
                     source="vector",
                 )
             )
-            if len(results) >= limit:
-                break
-
         return results
 
     async def delete(self, chunk_ids: list[str]) -> int:
-        deleted = 0
-        for chunk_id in chunk_ids:
-            idx = self._id_map.pop(chunk_id, None)
-            if idx is not None:
-                self._chunks.pop(idx, None)
-                self._deleted_ids.add(idx)
-                deleted += 1
-        return deleted
+        async with self._writing():
+            removed: list[int] = []
+            for chunk_id in chunk_ids:
+                idx = self._id_map.pop(chunk_id, None)
+                if idx is not None:
+                    del self._chunks[idx]
+                    removed.append(idx)
+            if removed:
+                await asyncio.to_thread(self._remove, removed)
+            if (
+                len(self._deleted_ids) >= _MIN_COMPACT_ROWS
+                and len(self._deleted_ids) >= self._index.ntotal * _COMPACT_RATIO
+            ):
+                await asyncio.to_thread(self._compact)
+        return len(removed)
 
-    async def clear(self) -> None:
-        self._index.reset()
-        self._chunks.clear()
-        self._id_map.clear()
+    def _remove(self, indices: list[int]) -> None:
+        import numpy as np
+
+        if self._buffer is None and self._keeps_deleted:
+            self._deleted_ids.update(indices)
+        else:
+            if self._buffer is None:
+                self._ensure_writable()
+            self._searchable.remove_ids(np.array(indices, dtype=np.int64))
+
+    async def compact(self) -> int:
+        """Drop deleted vectors that are still in the index.
+
+        Only HNSW keeps deleted vectors: searches skip them, but the graph
+        still holds and traverses them until it is rebuilt here. Other
+        index types remove vectors on delete. Compaction also runs
+        automatically once enough vectors are deleted.
+
+        Returns:
+            Number of vectors dropped.
+        """
+        async with self._writing():
+            return await asyncio.to_thread(self._compact)
+
+    def _compact(self) -> int:
+        import faiss
+        import numpy as np
+
+        dropped = len(self._deleted_ids)
+        if not dropped:
+            return 0
+
+        old = self._index
+        vectors = old.index.reconstruct_n(0, old.ntotal)
+        ids = faiss.vector_to_array(old.id_map)
+        keep = ~np.isin(ids, np.fromiter(self._deleted_ids, dtype=np.int64))
+
+        index, _ = self._build_index()
+        index.add_with_ids(vectors[keep], ids[keep])
+        self._index = index
+        self._mapped_from = None
         self._deleted_ids.clear()
-        self._next_idx = 0
+        return dropped
+
+    async def clear(self) -> None:
+        async with self._writing():
+            # A fresh index so the next corpus is trained on its own vectors
+            self._index, self._buffer = self._build_index()
+            self._mapped_from = None
+            self._chunks.clear()
+            self._id_map.clear()
+            self._deleted_ids.clear()
+            self._next_idx = 0
 
     async def count(self) -> int:
-        return self._index.ntotal - len(self._deleted_ids)
+        return len(self._chunks)
+
+    async def save(self, path: str | Path) -> None:
+        """Write the store to a directory.
+
+        The index goes to ``index.faiss`` (plus ``buffer.faiss`` while it is
+        untrained), chunks, metadata and settings to the ``chunks.db``
+        SQLite sidecar. Files are replaced atomically, so saving over the
+        directory a store was loaded from is safe.
+
+        Args:
+            path: Directory to write; created if missing.
+        """
+        async with self._writing():
+            await asyncio.to_thread(self._save, Path(path))
+
+    def _save(self, directory: Path) -> None:
+        import faiss
+
+        directory.mkdir(parents=True, exist_ok=True)
+        replace_file(
+            directory / _INDEX_FILE, lambda tmp: faiss.write_index(self._index, str(tmp))
+        )
+        buffer_path = directory / _BUFFER_FILE
+        if self._buffer is not None:
+            replace_file(buffer_path, lambda tmp: faiss.write_index(self._buffer, str(tmp)))
+        else:
+            buffer_path.unlink(missing_ok=True)
+
+        config = {
+            "dimensions": self._dimensions,
+            "index_type": self._index_type,
+            "nlist": self._nlist,
+            "nprobe": self.nprobe,
+            "hnsw_m": self._hnsw_m,
+            "ef_construction": self._ef_construction,
+            "ef_search": self.ef_search,
+            "pq_m": self._pq_m,
+            "pq_bits": self._pq_bits,
+            "opq": self._opq,
+            "train_size": self._train_size,
+            "max_train_size": self._max_train_size,
+        }
+        write_chunks(
+            directory,
+            {
+                "config": config,
+                "next_idx": self._next_idx,
+                "deleted_ids": sorted(self._deleted_ids),
+            },
+            self._chunks.items(),
+        )
+
+    @classmethod
+    async def load(cls, path: str | Path, *, mmap: bool = True) -> FAISSVectorStore:
+        """Restore a store written by ``save()``.
+
+        With ``mmap=True`` the index is memory-mapped read-only: IVF
+        inverted lists stay on disk and are paged in by searches, as do
+        flat and HNSW vector codes where FAISS supports it. The first add,
+        delete, compaction or training reads the index into memory; the
+        saved files are never modified.
+
+        Chunks of a loaded store have ``embedding=None``; their vectors
+        live in the index only.
+
+        Args:
+            path: Directory written by ``save()``.
+            mmap: Memory-map the index instead of reading it.
+
+        Returns:
+            The restored store.
+
+        Raises:
+            FileNotFoundError: If the directory holds no saved store.
+        """
+        directory = Path(path)
+        meta, rows = await asyncio.to_thread(read_chunks, directory)
+        store = cls(**meta["config"])
+        await asyncio.to_thread(store._load, directory, mmap)
+        store._chunks = dict(rows)
+        store._id_map = {chunk.id: idx for idx, chunk in rows}
+        store._deleted_ids = set(meta["deleted_ids"])
+        store._next_idx = meta["next_idx"]
+        return store
+
+    def _load(self, directory: Path, mmap: bool) -> None:
+        import faiss
+
+        index_path = directory / _INDEX_FILE
+        flags = 0
+        if mmap:
+            if self._index_type in ("ivf", "ivfpq"):
+                flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            else:
+                # Maps flat codes in place; older FAISS builds read them instead
+                flags = getattr(faiss, "IO_FLAG_MMAP_IFC", 0) | faiss.IO_FLAG_READ_ONLY
+        self._index = faiss.read_index(str(index_path), flags)
+        self._mapped_from = index_path if mmap else None
+
+        buffer_path = directory / _BUFFER_FILE
+        self._buffer = faiss.read_index(str(buffer_path)) if buffer_path.is_file() else None
 
     async def get(self, chunk_id: str) -> Chunk | None:
         idx = self._id_map.get(chunk_id)
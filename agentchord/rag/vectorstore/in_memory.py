@@ -1,42 +1,153 @@
 """In-memory vector store for development and testing."""
 from __future__ import annotations
 
+import asyncio
+import heapq
+from array import array
+from pathlib import Path
 from typing import Any
 
 from agentchord.rag.types import Chunk, SearchResult
 from agentchord.rag.vectorstore.base import VectorStore
+from agentchord.rag.vectorstore.persistence import read_chunks, replace_file, write_chunks
 from agentchord.utils.math import cosine_similarity
 
+# Optional dependency - fall back to pure Python without numpy
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_INITIAL_CAPACITY = 64
+# Compact once at least this many rows are tombstoned...
+_MIN_COMPACT_ROWS = 1024
+# ...and they make up at least this share of the matrix.
+_COMPACT_RATIO = 0.25
+# Largest query x row score block computed at once by search_batch
+_MAX_BLOCK_SCORES = 1 << 24
+# Raw float32 rows written by save(), in chunk sidecar order
+_EMBEDDINGS_FILE = "embeddings.f32"
+
 
 class InMemoryVectorStore(VectorStore):
     """In-memory vector store using brute-force cosine similarity.
 
-    No external dependencies. Suitable for up to ~10,000 vectors.
-    Data is not persisted across restarts.
+    With numpy installed, embeddings are kept normalized in one float32
+    matrix: a search is a single matrix-vector product followed by a
+    partial sort of the top ``limit`` scores, and ``search_batch`` scores
+    many queries with one matrix-matrix product. Deleted rows are tombstoned
+    and reclaimed by ``compact()``, which also runs automatically once
+    enough of the matrix is dead. Without numpy the store falls back to
+    pure Python, which is fine for up to ~10,000 vectors.
+
+    Data lives in memory only; ``save()`` writes a snapshot to a directory
+    and ``load()`` restores it, memory-mapping the embeddings so a cold
+    start does not re-embed or even read the whole matrix up front.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        """Initialize in-memory store.
+
+        Args:
+            use_numpy: Use the numpy matrix backend. Defaults to True when
+                numpy is installed.
+
+        Raises:
+            ImportError: If use_numpy is True and numpy is not installed.
+        """
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        elif use_numpy and not NUMPY_AVAILABLE:
+            raise ImportError(
+                "numpy is required for the matrix backend of InMemoryVectorStore. "
+                "Install it with: pip install numpy"
+            )
+
+        self._use_numpy = use_numpy
         self._chunks: dict[str, Chunk] = {}
-        self._embeddings: dict[str, list[float]] = {}
         self._dimensions: int | None = None
 
+        # Pure-Python backend
+        self._embeddings: dict[str, list[float]] = {}
+
+        # numpy backend: rows [0, _size) of _matrix are in use; a row whose
+        # _row_ids entry is None is a tombstone
+        self._matrix: Any = None
+        self._alive: Any = None
+        self._size = 0
+        self._row_ids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._tombstones = 0
+
+    @property
+    def uses_numpy(self) -> bool:
+        """Whether the numpy matrix backend is in use."""
+        return self._use_numpy
+
     async def add(self, chunks: list[Chunk]) -> list[str]:
-        ids: list[str] = []
+        # Validate the whole batch first so a bad chunk adds nothing
+        dimensions = self._dimensions
         for chunk in chunks:
             if chunk.embedding is None:
                 raise ValueError(f"Chunk {chunk.id} has no embedding")
             dim = len(chunk.embedding)
-            if self._dimensions is None:
-                self._dimensions = dim
-            elif dim != self._dimensions:
+            if dimensions is None:
+                dimensions = dim
+            elif dim != dimensions:
                 raise ValueError(
-                    f"Embedding dimension mismatch: expected {self._dimensions}, got {dim} "
+                    f"Embedding dimension mismatch: expected {dimensions}, got {dim} "
                     f"for chunk {chunk.id}"
                 )
+        if not chunks:
+            return []
+
+        self._dimensions = dimensions
+        for chunk in chunks:
             self._chunks[chunk.id] = chunk
-            self._embeddings[chunk.id] = chunk.embedding
-            ids.append(chunk.id)
-        return ids
+            if not self._use_numpy:
+                self._embeddings[chunk.id] = chunk.embedding
+        if self._use_numpy:
+            self._add_rows(chunks)
+        return [chunk.id for chunk in chunks]
+
+    def _add_rows(self, chunks: list[Chunk]) -> None:
+        # Later duplicates in the batch win, as with the dict backend
+        latest = {chunk.id: chunk for chunk in chunks}
+        vectors = np.asarray([c.embedding for c in latest.values()], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1, norms)
+
+        rows = np.empty(len(latest), dtype=np.intp)
+        for i, chunk_id in enumerate(latest):
+            row = self._rows.get(chunk_id)
+            if row is None:
+                row = len(self._row_ids)
+                self._rows[chunk_id] = row
+                self._row_ids.append(chunk_id)
+            rows[i] = row
+
+        self._reserve(len(self._row_ids))
+        self._matrix[rows] = vectors
+        self._alive[rows] = True
+        self._size = len(self._row_ids)
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix to hold at least ``rows`` rows."""
+        if self._matrix is not None and rows <= len(self._matrix):
+            return
+        capacity = max(_INITIAL_CAPACITY, len(self._matrix) if self._matrix is not None else 0)
+        while capacity < rows:
+            capacity *= 2
+
+        matrix = np.zeros((capacity, self._dimensions), dtype=np.float32)
+        alive = np.zeros(capacity, dtype=bool)
+        if self._matrix is not None:
+            matrix[: self._size] = self._matrix[: self._size]
+            alive[: self._size] = self._alive[: self._size]
+        self._matrix = matrix
+        self._alive = alive
 
     async def search(
         self,
@@ -44,9 +155,41 @@ class InMemoryVectorStore(VectorStore):
         limit: int = 10,
         filter: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
-        if not self._chunks:
-            return []
+        results = await self.search_batch([query_embedding], limit=limit, filter=filter)
+        return results[0]
+
+    async def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        if not self._chunks or limit <= 0 or not query_embeddings:
+            return [[] for _ in query_embeddings]
+
+        if self._use_numpy:
+            batch = self._search_matrix(query_embeddings, limit, filter)
+        else:
+            batch = [self._search_python(q, limit, filter) for q in query_embeddings]
+
+        return [
+            [
+                SearchResult(
+                    chunk=self._chunks[chunk_id],
+                    score=max(0.0, score),
+                    source="vector",
+                )
+                for chunk_id, score in scores
+            ]
+            for scores in batch
+        ]
 
+    def _search_python(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        filter: dict[str, Any] | None,
+    ) -> list[tuple[str, float]]:
         scores: list[tuple[str, float]] = []
         for chunk_id, embedding in self._embeddings.items():
             if filter:
@@ -56,34 +199,254 @@ class InMemoryVectorStore(VectorStore):
             similarity = cosine_similarity(query_embedding, embedding)
             scores.append((chunk_id, similarity))
 
-        scores.sort(key=lambda x: x[1], reverse=True)
+        return heapq.nlargest(limit, scores, key=lambda x: x[1])
 
-        return [
-            SearchResult(
-                chunk=self._chunks[chunk_id],
-                score=max(0.0, score),
-                source="vector",
+    def _search_matrix(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int,
+        filter: dict[str, Any] | None,
+    ) -> list[list[tuple[str, float]]]:
+        for query_embedding in query_embeddings:
+            if len(query_embedding) != self._dimensions:
+                raise ValueError("Vectors must have same length")
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries /= np.where(norms == 0, 1, norms)
+
+        dead = None
+        if filter:
+            rows = np.fromiter(
+                (
+                    row
+                    for chunk_id, row in self._rows.items()
+                    if self._matches_filter(self._chunks[chunk_id], filter)
+                ),
+                dtype=np.intp,
             )
-            for chunk_id, score in scores[:limit]
-        ]
+            if not len(rows):
+                return [[] for _ in query_embeddings]
+            matrix = self._matrix[rows]
+        else:
+            rows = None
+            matrix = self._matrix[: self._size]
+            if self._tombstones:
+                dead = ~self._alive[: self._size]
+
+        candidates = len(matrix) if rows is not None else len(self._rows)
+        k = min(limit, candidates)
+        row_ids = self._row_ids
+        results: list[list[tuple[str, float]]] = []
+
+        # Score queries in blocks so the score matrix stays bounded
+        step = max(1, _MAX_BLOCK_SCORES // len(matrix))
+        for start in range(0, len(queries), step):
+            scores = queries[start : start + step] @ matrix.T
+            if dead is not None:
+                scores[:, dead] = -np.inf
+
+            if k < scores.shape[1]:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            # Equal scores keep insertion order, as in the pure-Python path
+            order = np.lexsort((top, -top_scores), axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            if rows is not None:
+                top = rows[top]
+
+            for top_rows, row_scores in zip(top.tolist(), top_scores.tolist()):
+                results.append(
+                    [(row_ids[row], score) for row, score in zip(top_rows, row_scores)]
+                )
+        return results
 
     async def delete(self, chunk_ids: list[str]) -> int:
         deleted = 0
         for chunk_id in chunk_ids:
             if chunk_id in self._chunks:
                 del self._chunks[chunk_id]
-                del self._embeddings[chunk_id]
+                if self._use_numpy:
+                    row = self._rows.pop(chunk_id)
+                    self._row_ids[row] = None
+                    self._alive[row] = False
+                    self._tombstones += 1
+                else:
+                    del self._embeddings[chunk_id]
                 deleted += 1
+
+        if (
+            self._tombstones >= _MIN_COMPACT_ROWS
+            and self._tombstones >= self._size * _COMPACT_RATIO
+        ):
+            self._compact()
         return deleted
 
+    async def compact(self) -> int:
+        """Reclaim rows left behind by deleted chunks.
+
+        Deleting only tombstones a row; its slot is still scanned by
+        every search until the matrix is compacted. Compaction also runs
+        automatically once enough rows are dead.
+
+        Returns:
+            Number of rows reclaimed.
+        """
+        return self._compact()
+
+    def _compact(self) -> int:
+        reclaimed = self._tombstones
+        if not reclaimed:
+            return 0
+
+        keep = np.flatnonzero(self._alive[: self._size])
+        self._matrix[: len(keep)] = self._matrix[keep]
+        self._alive[: len(keep)] = True
+        self._alive[len(keep) : self._size] = False
+        self._row_ids = [self._row_ids[row] for row in keep.tolist()]
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(self._row_ids)}
+        self._size = len(keep)
+        self._tombstones = 0
+        return reclaimed
+
     async def clear(self) -> None:
         self._chunks.clear()
         self._embeddings.clear()
         self._dimensions = None
+        self._matrix = None
+        self._alive = None
+        self._size = 0
+        self._row_ids = []
+        self._rows = {}
+        self._tombstones = 0
 
     async def count(self) -> int:
         return len(self._chunks)
 
+    async def save(self, path: str | Path) -> None:
+        """Write the store to a directory.
+
+        Live embeddings go to ``embeddings.f32`` as raw float32 rows (dead
+        rows are skipped), chunks and metadata to the ``chunks.db`` SQLite
+        sidecar. Files are replaced atomically, so saving over the
+        directory a store was loaded from is safe.
+
+        Args:
+            path: Directory to write; created if missing.
+        """
+        # Snapshot on the event loop so a concurrent add, delete or
+        # compact cannot change the store while the thread writes it
+        vectors, chunks = self._snapshot()
+        await asyncio.to_thread(self._save, Path(path), self._dimensions, vectors, chunks)
+
+    def _snapshot(self) -> tuple[Any, list[tuple[int, Chunk]]]:
+        """Copy the live vectors and their (row, chunk) pairs, in row order."""
+        if self._use_numpy:
+            ids = [chunk_id for chunk_id in self._row_ids if chunk_id is not None]
+            # Fancy indexing copies the rows
+            vectors = self._matrix[[self._rows[chunk_id] for chunk_id in ids]] if ids else None
+        else:
+            ids = list(self._embeddings)
+            vectors = [self._embeddings[chunk_id] for chunk_id in ids]
+        chunks = [(row, self._chunks[chunk_id]) for row, chunk_id in enumerate(ids)]
+        return vectors, chunks
+
+    @staticmethod
+    def _save(
+        directory: Path,
+        dimensions: int | None,
+        vectors: Any,
+        chunks: list[tuple[int, Chunk]],
+    ) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        def write(tmp: Path) -> None:
+            if vectors is None:
+                tmp.write_bytes(b"")
+            elif isinstance(vectors, list):
+                with tmp.open("wb") as f:
+                    for vector in vectors:
+                        array("f", vector).tofile(f)
+            else:
+                vectors.tofile(tmp)
+
+        replace_file(directory / _EMBEDDINGS_FILE, write)
+        write_chunks(directory, {"dimensions": dimensions}, chunks)
+
+    @classmethod
+    async def load(
+        cls,
+        path: str | Path,
+        *,
+        mmap: bool = True,
+        use_numpy: bool | None = None,
+    ) -> InMemoryVectorStore:
+        """Restore a store written by ``save()``.
+
+        With the numpy backend and ``mmap=True`` the embedding matrix is
+        memory-mapped copy-on-write: pages are read on first search, and
+        later adds, deletes and compaction change only the in-memory copy,
+        never the file.
+
+        Chunks of a loaded store have ``embedding=None``; their vectors
+        live in the store only.
+
+        Args:
+            path: Directory written by ``save()``.
+            mmap: Memory-map the embeddings instead of reading them.
+            use_numpy: Use the numpy matrix backend. Defaults to True when
+                numpy is installed.
+
+        Returns:
+            The restored store.
+
+        Raises:
+            FileNotFoundError: If the directory holds no saved store.
+            ValueError: If the embeddings file does not match the sidecar.
+        """
+        store = cls(use_numpy=use_numpy)
+        await asyncio.to_thread(store._load, Path(path), mmap)
+        return store
+
+    def _load(self, directory: Path, mmap: bool) -> None:
+        meta, rows = read_chunks(directory)
+        dimensions = meta["dimensions"]
+        ids = [chunk.id for _, chunk in rows]
+        embeddings_path = directory / _EMBEDDINGS_FILE
+        expected = len(ids) * (dimensions or 0) * 4
+        if embeddings_path.stat().st_size != expected:
+            raise ValueError(
+                f"{embeddings_path} holds {embeddings_path.stat().st_size} bytes, "
+                f"expected {expected} for {len(ids)} chunks"
+            )
+
+        self._chunks = {chunk.id: chunk for _, chunk in rows}
+        self._dimensions = dimensions
+        if not ids:
+            return
+
+        if self._use_numpy:
+            shape = (len(ids), dimensions)
+            if mmap:
+                matrix = np.memmap(embeddings_path, dtype=np.float32, mode="c", shape=shape)
+            else:
+                matrix = np.fromfile(embeddings_path, dtype=np.float32).reshape(shape)
+            self._matrix = matrix
+            self._alive = np.ones(len(ids), dtype=bool)
+            self._size = len(ids)
+            self._row_ids = list(ids)
+            self._rows = {chunk_id: row for row, chunk_id in enumerate(ids)}
+        else:
+            flat = array("f")
+            with embeddings_path.open("rb") as f:
+                flat.fromfile(f, len(ids) * dimensions)
+            self._embeddings = {
+                chunk_id: flat[row * dimensions : (row + 1) * dimensions].tolist()
+                for row, chunk_id in enumerate(ids)
+            }
+
     async def get(self, chunk_id: str) -> Chunk | None:
         return self._chunks.get(chunk_id)
 
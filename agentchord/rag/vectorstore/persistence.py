@@ -0,0 +1,98 @@
+"""On-disk layout shared by the persistent vector stores.
+
+A saved store is a directory. Vectors are written by each store in its
+own format; chunk content and metadata go to a SQLite sidecar,
+``chunks.db``, keyed by the store's row or FAISS ID. Embeddings are left
+out of the sidecar so that loading it stays cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterable
+
+from agentchord.rag.types import Chunk
+
+CHUNKS_FILE = "chunks.db"
+FORMAT_VERSION = 1
+
+
+def replace_file(path: Path, write: Any) -> None:
+    """Write a file through a temporary sibling and rename it into place.
+
+    Readers that memory-mapped the old file keep seeing it intact.
+
+    Args:
+        path: Final file path.
+        write: Callable taking the temporary path and writing to it.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write_chunks(
+    directory: Path,
+    meta: dict[str, Any],
+    chunks: Iterable[tuple[int, Chunk]],
+) -> None:
+    """Write the chunk sidecar.
+
+    Args:
+        directory: Store directory.
+        meta: Store settings, serialized as JSON.
+        chunks: (key, chunk) pairs; the key locates the chunk's vector.
+    """
+
+    def write(tmp: Path) -> None:
+        with closing(sqlite3.connect(tmp)) as db:
+            db.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            db.execute(
+                "CREATE TABLE chunks (key INTEGER PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            db.execute(
+                "INSERT INTO meta VALUES ('store', ?)",
+                (json.dumps({"format": FORMAT_VERSION, **meta}),),
+            )
+            db.executemany(
+                "INSERT INTO chunks VALUES (?, ?)",
+                (
+                    (key, chunk.model_dump_json(exclude={"embedding"}))
+                    for key, chunk in chunks
+                ),
+            )
+            db.commit()
+
+    replace_file(directory / CHUNKS_FILE, write)
+
+
+def read_chunks(directory: Path) -> tuple[dict[str, Any], list[tuple[int, Chunk]]]:
+    """Read the chunk sidecar written by ``write_chunks``.
+
+    Returns:
+        (store settings, (key, chunk) pairs ordered by key). Chunks have
+        no embedding.
+
+    Raises:
+        FileNotFoundError: If the directory holds no saved store.
+        ValueError: If the sidecar was written by an unknown format.
+    """
+    path = directory / CHUNKS_FILE
+    if not path.is_file():
+        raise FileNotFoundError(f"No saved vector store at {directory}")
+
+    with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as db:
+        (raw,) = db.execute("SELECT value FROM meta WHERE key = 'store'").fetchone()
+        rows = db.execute("SELECT key, data FROM chunks ORDER BY key").fetchall()
+
+    meta = json.loads(raw)
+    if meta.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported vector store format: {meta.get('format')!r}")
+    return meta, [(key, Chunk.model_validate_json(data)) for key, data in rows]
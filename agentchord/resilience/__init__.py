@@ -1,7 +1,8 @@
 """Resilience module for AgentChord.
 
-Provides retry policies, circuit breakers, and timeout management
-for robust LLM API interactions.
+Provides retry policies, circuit breakers, timeout management,
+adaptive concurrency limiting and request hedging for robust LLM API
+interactions.
 """
 
 from agentchord.resilience.retry import (
@@ -14,6 +15,11 @@ from agentchord.resilience.circuit_breaker import (
     CircuitOpenError,
 )
 from agentchord.resilience.timeout import TimeoutManager
+from agentchord.resilience.adaptive import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyStats,
+)
+from agentchord.resilience.hedge import HedgePolicy, HedgeStats
 from agentchord.resilience.config import ResilienceConfig
 
 __all__ = [
@@ -26,6 +32,12 @@ __all__ = [
     "CircuitOpenError",
     # Timeout
     "TimeoutManager",
+    # Adaptive concurrency
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyStats",
+    # Hedging
+    "HedgePolicy",
+    "HedgeStats",
     # Config
     "ResilienceConfig",
 ]
@@ -0,0 +1,286 @@
+"""Adaptive concurrency limiting (AIMD)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+from agentchord.errors.exceptions import RateLimitError, TimeoutError
+
+T = TypeVar("T")
+
+DEFAULT_OVERLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    RateLimitError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+
+@dataclass
+class ConcurrencyStats:
+    """Counters for an ``AdaptiveConcurrencyLimiter``."""
+
+    limit: int
+    in_flight: int
+    waiting: int
+    successes: int = 0
+    overloads: int = 0
+    latency_spikes: int = 0
+    increases: int = 0
+    decreases: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit that adapts like TCP congestion control.
+
+    The limit grows additively (about +1 per limit's worth of healthy
+    calls) while it is being used, and is cut multiplicatively on a
+    rate limit error, a timeout, or a latency spike. Only one cut is made
+    per "round trip": calls that started before the last cut don't cut
+    again.
+
+    A latency spike is a call slower than ``latency_tolerance`` times the
+    smoothed latency of recent successful calls.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+        >>> result = await limiter.execute(provider.complete, messages)
+        >>> limiter.limit
+        5
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1,
+        min_samples: int = 5,
+        overload_errors: tuple[type[BaseException], ...] = DEFAULT_OVERLOAD_ERRORS,
+    ) -> None:
+        """Initialize adaptive concurrency limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent calls.
+            min_limit: Lower bound for the limit.
+            max_limit: Upper bound for the limit.
+            increase: Additive increase per limit's worth of successes.
+            backoff_ratio: Multiplier applied to the limit on overload.
+            latency_tolerance: Latency above this multiple of the smoothed
+                latency counts as a spike.
+            smoothing: EWMA weight of each new latency sample.
+            min_samples: Successful calls needed before spikes are detected.
+            overload_errors: Exceptions that signal overload.
+        """
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must be >= min_limit")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._backoff_ratio = backoff_ratio
+        self._latency_tolerance = latency_tolerance
+        self._smoothing = smoothing
+        self._min_samples = min_samples
+        self._overload_errors = overload_errors
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latency: float | None = None
+        self._samples = 0
+        self._last_decrease = 0.0
+
+        self._successes = 0
+        self._overloads = 0
+        self._latency_spikes = 0
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Calls waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def latency(self) -> float | None:
+        """Smoothed latency of successful calls in seconds."""
+        return self._latency
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        """Snapshot of the limiter's state and counters."""
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            waiting=len(self._waiters),
+            successes=self._successes,
+            overloads=self._overloads,
+            latency_spikes=self._latency_spikes,
+            increases=self._increases,
+            decreases=self._decreases,
+        )
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and wake waiters that now fit under the limit."""
+        self._in_flight -= 1
+        self._wake()
+
+    def record_success(self, latency: float, started: float | None = None) -> None:
+        """Record a successful call.
+
+        Args:
+            latency: Call duration in seconds.
+            started: ``time.monotonic()`` when the call started.
+        """
+        self._successes += 1
+        if self._is_spike(latency):
+            self._latency_spikes += 1
+            self._decrease(started)
+        else:
+            # Grow only while the limit is actually the bottleneck
+            if self._in_flight >= self.limit and self._limit < self._max_limit:
+                before = self.limit
+                self._limit = min(
+                    float(self._max_limit), self._limit + self._increase / self._limit
+                )
+                if self.limit > before:
+                    self._increases += 1
+                    self._wake()
+        self._update_latency(latency)
+
+    def record_overload(self, started: float | None = None) -> None:
+        """Record a rate limit error, timeout or other overload signal.
+
+        Args:
+            started: ``time.monotonic()`` when the failed call started.
+        """
+        self._overloads += 1
+        self._decrease(started)
+
+    async def execute(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Execute function within the concurrency limit.
+
+        Args:
+            func: Async function to execute.
+            *args: Positional arguments.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            Result of function execution.
+        """
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            latency = time.monotonic() - started
+            if isinstance(e, self._overload_errors):
+                self.record_overload(started)
+            elif self._is_spike(latency):
+                # e.g. cancelled by an outer timeout after running too long
+                self._latency_spikes += 1
+                self._decrease(started)
+            raise
+        else:
+            self.record_success(time.monotonic() - started, started)
+            return result
+        finally:
+            self.release()
+
+    def reset(self, limit: int | None = None) -> None:
+        """Reset the limit and forget latency history."""
+        self._limit = float(limit if limit is not None else self._min_limit)
+        self._limit = max(float(self._min_limit), min(float(self._max_limit), self._limit))
+        self._latency = None
+        self._samples = 0
+        self._wake()
+
+    def _is_spike(self, latency: float) -> bool:
+        return (
+            self._latency is not None
+            and self._samples >= self._min_samples
+            and latency > self._latency * self._latency_tolerance
+        )
+
+    def _update_latency(self, latency: float) -> None:
+        self._samples += 1
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += self._smoothing * (latency - self._latency)
+
+    def _decrease(self, started: float | None) -> None:
+        # One cut per round trip: calls sent before the last cut saw the old limit
+        if started is not None and started < self._last_decrease:
+            return
+        self._limit = max(float(self._min_limit), self._limit * self._backoff_ratio)
+        self._last_decrease = time.monotonic()
+        self._decreases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.limit}, "
+            f"in_flight={self._in_flight}, waiting={len(self._waiters)})"
+        )
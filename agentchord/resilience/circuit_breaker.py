@@ -97,6 +97,13 @@ class CircuitBreaker:
         """Current failure count."""
         return self._failure_count
 
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial call through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return self._get_retry_after()
+
     @property
     def is_closed(self) -> bool:
         """Check if circuit allows requests."""
@@ -6,8 +6,10 @@ from typing import Any, Awaitable, Callable, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+from agentchord.resilience.adaptive import AdaptiveConcurrencyLimiter
 from agentchord.resilience.retry import RetryPolicy
 from agentchord.resilience.circuit_breaker import CircuitBreaker
+from agentchord.resilience.hedge import HedgePolicy
 from agentchord.resilience.timeout import TimeoutManager
 
 
@@ -17,8 +19,9 @@ T = TypeVar("T")
 class ResilienceConfig(BaseModel):
     """Unified resilience configuration.
 
-    Combines retry, circuit breaker, and timeout management
-    into a single configuration object.
+    Combines retry, circuit breaker, timeout management, adaptive
+    concurrency limiting and request hedging into a single configuration
+    object.
 
     Example:
         >>> config = ResilienceConfig(
@@ -45,6 +48,15 @@ class ResilienceConfig(BaseModel):
     timeout_enabled: bool = True
     timeout_manager: TimeoutManager | None = None
 
+    # Adaptive concurrency settings (share one limiter across configs
+    # that call the same endpoint)
+    concurrency_limit_enabled: bool = False
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+
+    # Hedging settings (used when the caller passes a hedge function)
+    hedging_enabled: bool = False
+    hedge_policy: HedgePolicy | None = None
+
     def get_retry_policy(self) -> RetryPolicy | None:
         """Get retry policy if enabled."""
         if not self.retry_enabled:
@@ -63,25 +75,57 @@ class ResilienceConfig(BaseModel):
             return None
         return self.timeout_manager or TimeoutManager()
 
+    def get_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        """Get adaptive concurrency limiter if enabled.
+
+        The default limiter is created once and kept, since its
+        state is what makes it adaptive.
+        """
+        if not self.concurrency_limit_enabled:
+            return None
+        if self.concurrency_limiter is None:
+            self.concurrency_limiter = AdaptiveConcurrencyLimiter()
+        return self.concurrency_limiter
+
+    def get_hedge_policy(self) -> HedgePolicy | None:
+        """Get hedge policy if enabled.
+
+        Like the concurrency limiter, the default policy is created once
+        and kept for its latency history.
+        """
+        if not self.hedging_enabled:
+            return None
+        if self.hedge_policy is None:
+            self.hedge_policy = HedgePolicy()
+        return self.hedge_policy
+
     async def execute(
         self,
         func: Callable[..., Awaitable[T]],
         *args: Any,
         model: str | None = None,
+        hedge: Callable[..., Awaitable[T]] | None = None,
         **kwargs: Any,
     ) -> T:
         """Execute function with all resilience layers.
 
         Execution order:
         1. Timeout (outermost)
-        2. Circuit breaker
-        3. Retry (innermost)
-        4. Actual function
+        2. Hedging (only with ``hedge``)
+        3. Circuit breaker
+        4. Retry
+        5. Adaptive concurrency limit (innermost, one slot per attempt)
+        6. Actual function
+
+        The hedged call runs ``hedge`` directly: it usually targets another
+        endpoint, so this config's breaker and limiter don't apply to it.
 
         Args:
             func: Async function to execute.
             *args: Positional arguments.
             model: Model name (for timeout lookup).
+            hedge: Async function for the backup request when hedging is
+                enabled. Called with the same arguments as ``func``.
             **kwargs: Keyword arguments.
 
         Returns:
@@ -91,7 +135,20 @@ class ResilienceConfig(BaseModel):
         # Use default argument to capture closure variables properly
         current_func = func
 
-        # Layer 1: Retry (innermost)
+        # Layer 0: Adaptive concurrency limit (innermost, so retry
+        # backoff doesn't hold a slot)
+        limiter = self.get_concurrency_limiter()
+        if limiter:
+            def make_limiter_wrapper(
+                lim: AdaptiveConcurrencyLimiter,
+                inner: Callable[..., Awaitable[T]],
+            ) -> Callable[..., Awaitable[T]]:
+                async def with_limiter(*a: Any, **kw: Any) -> T:
+                    return await lim.execute(inner, *a, **kw)
+                return with_limiter
+            current_func = make_limiter_wrapper(limiter, current_func)
+
+        # Layer 1: Retry
         retry_policy = self.get_retry_policy()
         if retry_policy:
             def make_retry_wrapper(
@@ -115,7 +172,20 @@ class ResilienceConfig(BaseModel):
                 return with_circuit_breaker
             current_func = make_cb_wrapper(circuit_breaker, current_func)
 
-        # Layer 3: Timeout (outermost)
+        # Layer 3: Hedging
+        hedge_policy = self.get_hedge_policy()
+        if hedge_policy and hedge is not None:
+            def make_hedge_wrapper(
+                policy: HedgePolicy,
+                inner: Callable[..., Awaitable[T]],
+                backup: Callable[..., Awaitable[T]],
+            ) -> Callable[..., Awaitable[T]]:
+                async def with_hedge(*a: Any, **kw: Any) -> T:
+                    return await policy.execute(inner, backup, *a, **kw)
+                return with_hedge
+            current_func = make_hedge_wrapper(hedge_policy, current_func, hedge)
+
+        # Layer 4: Timeout (outermost)
         timeout_manager = self.get_timeout_manager()
         if timeout_manager:
             def make_timeout_wrapper(
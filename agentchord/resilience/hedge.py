@@ -0,0 +1,220 @@
+"""Hedged requests for tail-latency reduction."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from agentchord.llm.base import BaseLLMProvider
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """Counters for a ``HedgePolicy``."""
+
+    delay: float
+    requests: int = 0
+    hedged: int = 0
+    primary_wins: int = 0
+    hedge_wins: int = 0
+    failures: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that fired a hedge."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["hedge_rate"] = self.hedge_rate
+        return data
+
+
+class HedgePolicy:
+    """Send a backup request when the primary one is slow.
+
+    If the primary call hasn't finished after ``delay`` seconds, the same
+    request is sent again (to ``provider`` if given, otherwise to the same
+    provider). The first successful answer wins and the other call is
+    cancelled. If one call fails, the other is still awaited; the primary
+    call's error is raised only when both fail. A primary call that fails
+    before the delay is not hedged (retry handles that).
+
+    Without a fixed ``delay``, the delay is the rolling ``percentile`` of
+    recent primary latencies, so roughly ``1 - percentile`` of requests
+    are hedged. Until ``min_samples`` latencies are known,
+    ``initial_delay`` is used.
+
+    Example:
+        >>> policy = HedgePolicy(provider=backup_provider, percentile=0.95)
+        >>> config = ResilienceConfig(hedging_enabled=True, hedge_policy=policy)
+        >>> agent = Agent(name="a", role="r", resilience=config)
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider | None = None,
+        *,
+        delay: float | None = None,
+        percentile: float = 0.95,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.0,
+        max_delay: float | None = None,
+        window: int = 100,
+        min_samples: int = 10,
+    ) -> None:
+        """Initialize hedge policy.
+
+        Args:
+            provider: Provider for the hedged request. None re-sends the
+                request to the primary provider.
+            delay: Fixed hedge delay in seconds. None uses the rolling
+                latency percentile.
+            percentile: Latency percentile used as the delay (0-1].
+            initial_delay: Delay used until ``min_samples`` latencies
+                have been recorded.
+            min_delay: Lower bound for the rolling delay.
+            max_delay: Upper bound for the rolling delay.
+            window: Number of recent latencies kept.
+            min_samples: Latencies needed before the percentile is used.
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay must be >= 0")
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        if initial_delay < 0 or min_delay < 0:
+            raise ValueError("initial_delay and min_delay must be >= 0")
+        if max_delay is not None and max_delay < min_delay:
+            raise ValueError("max_delay must be >= min_delay")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.provider = provider
+        self._fixed_delay = delay
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+
+        self._requests = 0
+        self._hedged = 0
+        self._primary_wins = 0
+        self._hedge_wins = 0
+        self._failures = 0
+
+    @property
+    def delay(self) -> float:
+        """Seconds to wait for the primary call before hedging."""
+        if self._fixed_delay is not None:
+            return self._fixed_delay
+        if len(self._latencies) < max(1, self._min_samples):
+            return self._initial_delay
+        ordered = sorted(self._latencies)
+        # Nearest-rank percentile
+        rank = max(1, math.ceil(self._percentile * len(ordered)))
+        delay = max(self._min_delay, ordered[rank - 1])
+        if self._max_delay is not None:
+            delay = min(self._max_delay, delay)
+        return delay
+
+    @property
+    def stats(self) -> HedgeStats:
+        """Snapshot of the policy's counters."""
+        return HedgeStats(
+            delay=self.delay,
+            requests=self._requests,
+            hedged=self._hedged,
+            primary_wins=self._primary_wins,
+            hedge_wins=self._hedge_wins,
+            failures=self._failures,
+        )
+
+    def record_latency(self, latency: float) -> None:
+        """Record how long a primary call took, in seconds."""
+        self._latencies.append(latency)
+
+    async def execute(
+        self,
+        func: Callable[..., Awaitable[T]],
+        hedge: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Execute ``func``, hedging with ``hedge`` if it is slow.
+
+        Args:
+            func: Primary async function.
+            hedge: Async function for the backup request.
+            *args: Positional arguments for both functions.
+            **kwargs: Keyword arguments for both functions.
+
+        Returns:
+            Result of whichever call succeeded first.
+        """
+        self._requests += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(func(*args, **kwargs))
+        backup: asyncio.Future[T] | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.delay)
+            if done:
+                result = self._result(primary)
+                self.record_latency(time.monotonic() - started)
+                self._primary_wins += 1
+                return result
+
+            self._hedged += 1
+            backup = asyncio.ensure_future(hedge(*args, **kwargs))
+            pending: set[asyncio.Future[T]] = {primary, backup}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer the primary call when both finish together
+                for task in (primary, backup):
+                    if task in done and not task.cancelled() and task.exception() is None:
+                        # Lower bound of the primary latency if the hedge won
+                        self.record_latency(time.monotonic() - started)
+                        if task is primary:
+                            self._primary_wins += 1
+                        else:
+                            self._hedge_wins += 1
+                        return task.result()
+
+            return self._result(primary)
+        finally:
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
+            losers = [t for t in (primary, backup) if t is not None]
+            await asyncio.gather(*losers, return_exceptions=True)
+
+    def _result(self, task: asyncio.Future[T]) -> T:
+        if task.exception() is not None:
+            self._failures += 1
+        return task.result()
+
+    def reset(self) -> None:
+        """Forget latency history and counters."""
+        self._latencies.clear()
+        self._requests = 0
+        self._hedged = 0
+        self._primary_wins = 0
+        self._hedge_wins = 0
+        self._failures = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"HedgePolicy(delay={self.delay:.3f}, "
+            f"percentile={self._percentile}, hedged={self._hedged}/{self._requests})"
+        )
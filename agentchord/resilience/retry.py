@@ -168,6 +168,10 @@ class RetryPolicy:
 
                 if attempt < self._max_retries:
                     delay = self.get_delay(attempt)
+                    # Never retry sooner than the provider asked us to
+                    retry_after = getattr(e, "retry_after", None)
+                    if isinstance(e, RateLimitError) and retry_after:
+                        delay = max(delay, retry_after)
                     await asyncio.sleep(delay)
 
         # Should not reach here, but satisfy type checker
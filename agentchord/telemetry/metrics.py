@@ -4,7 +4,10 @@ Tracks latency, token counts, costs, and error rates.
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agentchord.resilience.adaptive import AdaptiveConcurrencyLimiter
 
 try:
     from opentelemetry import metrics
@@ -22,6 +25,7 @@ class AgentChordMetrics:
     - tokens_used: Counter of tokens consumed
     - cost_total: Counter of estimated USD cost
     - errors: Counter of errors by type
+    - concurrency_limit: Gauge of adaptive concurrency limits
     """
 
     def __init__(self, meter_name: str = "agentchord") -> None:
@@ -56,6 +60,19 @@ class AgentChordMetrics:
             description="Total errors by type",
             unit="1",
         )
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._concurrency_limit = meter.create_observable_gauge(
+            "agentchord.concurrency.limit",
+            callbacks=[self._observe_concurrency],
+            description="Current adaptive concurrency limit",
+            unit="1",
+        )
+        self._concurrency_in_flight = meter.create_observable_gauge(
+            "agentchord.concurrency.in_flight",
+            callbacks=[self._observe_in_flight],
+            description="Calls holding an adaptive concurrency slot",
+            unit="1",
+        )
 
     def record_agent_run(
         self,
@@ -81,3 +98,23 @@ class AgentChordMetrics:
         if not self._enabled:
             return
         self._errors.add(1, {"agent_name": agent_name, "error_type": error_type})
+
+    def observe_concurrency_limiter(
+        self, name: str, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        """Report a limiter's current limit and in-flight calls as gauges."""
+        if not self._enabled:
+            return
+        self._limiters[name] = limiter
+
+    def _observe_concurrency(self, options: Any) -> list[Any]:
+        return [
+            metrics.Observation(limiter.limit, {"limiter": name})
+            for name, limiter in self._limiters.items()
+        ]
+
+    def _observe_in_flight(self, options: Any) -> list[Any]:
+        return [
+            metrics.Observation(limiter.in_flight, {"limiter": name})
+            for name, limiter in self._limiters.items()
+        ]
@@ -6,6 +6,12 @@ Provides a way to register Python functions as tools that agents can use.
 from agentchord.tools.base import Tool, ToolParameter, ToolResult
 from agentchord.tools.decorator import tool
 from agentchord.tools.executor import ToolExecutor
+from agentchord.tools.pool import (
+    ToolExecutionMode,
+    ToolTimeoutError,
+    ToolWorkerPool,
+    get_default_worker_pool,
+)
 from agentchord.tools.web_search import create_web_search_tool
 
 __all__ = [
@@ -14,5 +20,9 @@ __all__ = [
     "ToolResult",
     "tool",
     "ToolExecutor",
+    "ToolExecutionMode",
+    "ToolWorkerPool",
+    "ToolTimeoutError",
+    "get_default_worker_pool",
     "create_web_search_tool",
 ]
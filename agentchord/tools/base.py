@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Callable, Awaitable
+from typing import Any, Callable, Awaitable, TYPE_CHECKING
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+from agentchord.tools.pool import (
+    ToolExecutionMode,
+    ToolTimeoutError,
+    get_default_worker_pool,
+    run_with_timeout,
+)
+
+if TYPE_CHECKING:
+    from agentchord.tools.pool import ToolWorkerPool
 
 
 class ToolParameter(BaseModel):
@@ -59,6 +69,27 @@ class Tool(BaseModel):
     description: str
     parameters: list[ToolParameter] = Field(default_factory=list)
     func: Callable[..., Any] | Callable[..., Awaitable[Any]]
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum concurrent executions of this tool (None = unlimited)",
+    )
+    execution_mode: ToolExecutionMode = Field(
+        default=ToolExecutionMode.THREAD,
+        description="Where a sync func runs: inline, thread pool, or process pool",
+    )
+    timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds before the call is abandoned (None = no timeout)",
+    )
+
+    @model_validator(mode="after")
+    def _check_execution_mode(self) -> "Tool":
+        """Process mode only makes sense for sync functions."""
+        if self.execution_mode == ToolExecutionMode.PROCESS and self.is_async:
+            raise ValueError("execution_mode='process' requires a sync function")
+        return self
 
     @property
     def is_async(self) -> bool:
@@ -67,12 +98,42 @@ class Tool(BaseModel):
 
     async def execute(self, **kwargs: Any) -> ToolResult:
         """Execute the tool with given arguments."""
+        return await self.invoke(kwargs)
+
+    async def invoke(
+        self,
+        arguments: dict[str, Any],
+        worker_pool: "ToolWorkerPool | None" = None,
+    ) -> ToolResult:
+        """Execute the tool, running sync functions per ``execution_mode``.
+
+        Args:
+            arguments: Arguments to pass to the tool function.
+            worker_pool: Pool for thread/process execution. Defaults to the
+                process-wide pool.
+
+        Returns:
+            ToolResult with success/failure and result/error.
+        """
         try:
             if self.is_async:
-                result = await self.func(**kwargs)
+                call = self.func(**arguments)
+                if self.timeout is None:
+                    result = await call
+                else:
+                    result = await run_with_timeout(call, self.timeout)
             else:
-                result = self.func(**kwargs)
+                pool = worker_pool or get_default_worker_pool()
+                result = await pool.run(
+                    self.func, arguments, mode=self.execution_mode, timeout=self.timeout
+                )
             return ToolResult.success_result(self.name, result)
+        except ToolTimeoutError:
+            # Only our own deadline; a TimeoutError raised by the tool is
+            # reported with its own message below
+            return ToolResult.error_result(
+                self.name, f"Tool '{self.name}' timed out after {self.timeout}s"
+            )
         except Exception as e:
             return ToolResult.error_result(self.name, str(e))
 
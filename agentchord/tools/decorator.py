@@ -6,6 +6,7 @@ import inspect
 from typing import Any, Callable, TypeVar, get_type_hints
 
 from agentchord.tools.base import Tool, ToolParameter
+from agentchord.tools.pool import ToolExecutionMode
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -75,9 +76,22 @@ def _extract_parameters(func: Callable[..., Any]) -> list[ToolParameter]:
 def tool(
     name: str | None = None,
     description: str | None = None,
+    max_concurrency: int | None = None,
+    execution_mode: ToolExecutionMode | str = ToolExecutionMode.THREAD,
+    timeout: float | None = None,
 ) -> Callable[[F], Tool]:
     """Decorator to convert a function into a Tool.
 
+    Args:
+        name: Tool name. Defaults to the function name.
+        description: Tool description. Defaults to the docstring's first line.
+        max_concurrency: Maximum concurrent executions of this tool
+            (None = unlimited).
+        execution_mode: Where a sync function runs: "inline" on the event
+            loop, "thread" pool (default), or "process" pool for picklable
+            CPU-bound module-level functions.
+        timeout: Seconds before the call is abandoned (None = no timeout).
+
     Example:
         @tool(description="Add two numbers together")
         def add(a: int, b: int) -> int:
@@ -101,6 +115,9 @@ def tool(
             description=tool_description,
             parameters=parameters,
             func=func,
+            max_concurrency=max_concurrency,
+            execution_mode=ToolExecutionMode(execution_mode),
+            timeout=timeout,
         )
 
     return decorator
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
 from typing import Any
 
 from agentchord.tools.base import Tool, ToolResult
+from agentchord.tools.pool import ToolWorkerPool
 
 
 class ToolExecutor:
@@ -16,21 +19,48 @@ class ToolExecutor:
         >>> print(result.result)  # 3
     """
 
-    def __init__(self, tools: list[Tool] | None = None) -> None:
-        """Initialize with a list of tools."""
+    def __init__(
+        self,
+        tools: list[Tool] | None = None,
+        worker_pool: ToolWorkerPool | None = None,
+    ) -> None:
+        """Initialize with a list of tools.
+
+        Args:
+            tools: Tools to register.
+            worker_pool: Pool used to run sync tools off the event loop.
+                Defaults to the process-wide pool shared by all executors.
+        """
+        self._worker_pool = worker_pool
         self._tools: dict[str, Tool] = {}
+        # Semaphores bind to the loop that first waits on them, so each
+        # running loop gets its own set (created on first use).
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
         if tools:
             for t in tools:
                 self.register(t)
 
+    @property
+    def worker_pool(self) -> ToolWorkerPool | None:
+        """Pool for sync tools (None means the process-wide default)."""
+        return self._worker_pool
+
+    @worker_pool.setter
+    def worker_pool(self, pool: ToolWorkerPool | None) -> None:
+        self._worker_pool = pool
+
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._drop_semaphores(tool.name)
 
     def unregister(self, name: str) -> bool:
         """Unregister a tool by name. Returns True if found."""
         if name in self._tools:
             del self._tools[name]
+            self._drop_semaphores(name)
             return True
         return False
 
@@ -55,6 +85,9 @@ class ToolExecutor:
     ) -> ToolResult:
         """Execute a tool by name.
 
+        Tools with ``max_concurrency`` set wait for a free slot, so
+        concurrent callers never exceed the tool's limit.
+
         Args:
             name: Name of the tool to execute.
             tool_call_id: Optional ID for this tool call.
@@ -71,11 +104,32 @@ class ToolExecutor:
                 tool_call_id,
             )
 
-        result = await tool.execute(**arguments)
+        semaphore = self._semaphore_for(tool)
+        if semaphore is not None:
+            async with semaphore:
+                result = await tool.invoke(arguments, self._worker_pool)
+        else:
+            result = await tool.invoke(arguments, self._worker_pool)
         if tool_call_id:
             result.tool_call_id = tool_call_id
         return result
 
+    def _semaphore_for(self, tool: Tool) -> asyncio.Semaphore | None:
+        """Get ``tool``'s concurrency semaphore on the running loop."""
+        if tool.max_concurrency is None:
+            return None
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(tool.name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(tool.max_concurrency)
+            semaphores[tool.name] = semaphore
+        return semaphore
+
+    def _drop_semaphores(self, name: str) -> None:
+        """Forget ``name``'s semaphores so the next call uses current limits."""
+        for semaphores in self._semaphores.values():
+            semaphores.pop(name, None)
+
     def to_openai_tools(self) -> list[dict[str, Any]]:
         """Convert all tools to OpenAI format."""
         return [tool.to_openai_schema() for tool in self._tools.values()]
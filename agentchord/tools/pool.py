@@ -0,0 +1,237 @@
+"""Worker pools for running sync tools off the event loop.
+
+A blocking ``@tool`` (file parsing, ``requests``, pandas) executed directly on
+the event loop stalls every other agent, stream and team member in the
+process. ``ToolWorkerPool`` dispatches sync tool functions to a shared thread
+pool or, for picklable CPU-bound functions, to a process pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ToolExecutionMode(str, Enum):
+    """Where a sync tool function runs."""
+
+    INLINE = "inline"    # Directly on the event loop (cheap, non-blocking functions)
+    THREAD = "thread"    # Shared thread pool (blocking I/O, GIL-releasing work)
+    PROCESS = "process"  # Shared process pool (picklable CPU-bound functions)
+
+
+class ToolTimeoutError(asyncio.TimeoutError):
+    """A tool call ran past its timeout.
+
+    Distinct from a ``TimeoutError`` raised by the tool itself, which is
+    the same class as ``asyncio.TimeoutError`` on Python 3.11+.
+    """
+
+
+async def run_with_timeout(awaitable: Awaitable[T], timeout: float) -> T:
+    """Await ``awaitable``, cancelling it after ``timeout`` seconds.
+
+    Args:
+        awaitable: Coroutine or future to wait for.
+        timeout: Seconds to wait.
+
+    Returns:
+        The awaitable's result. Its own exceptions propagate unchanged.
+
+    Raises:
+        ToolTimeoutError: If ``timeout`` elapses first.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if not done:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        raise ToolTimeoutError(f"timed out after {timeout}s")
+    return task.result()
+
+
+def _resolve_callable(module: str, qualname: str) -> Callable[..., Any]:
+    """Import a module-level function inside a worker process.
+
+    ``@tool`` replaces the function's module attribute with a ``Tool``, so
+    the function cannot be pickled by reference. Resolve it by name instead
+    and unwrap the ``Tool`` if needed.
+    """
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return getattr(obj, "func", obj)
+
+
+def _call_by_name(module: str, qualname: str, kwargs: dict[str, Any]) -> Any:
+    """Process-pool entry point: resolve the function and call it."""
+    return _resolve_callable(module, qualname)(**kwargs)
+
+
+class ToolWorkerPool:
+    """Shared thread and process pools for sync tool execution.
+
+    Pools are created lazily on first use and are independent of any event
+    loop, so one pool can serve every ``ToolExecutor`` in the process.
+
+    Timeouts: async tools are cancelled and thread-mode calls stop being
+    awaited (Python threads cannot be killed, so the thread finishes in the
+    background). A timed-out process-mode call is actually stopped: the
+    process pool's workers are terminated and the pool is recreated, which
+    also fails any other process-mode call in flight at that moment.
+
+    Example:
+        >>> pool = ToolWorkerPool(max_threads=16, max_processes=4)
+        >>> executor = ToolExecutor([parse_pdf, crunch], worker_pool=pool)
+        >>> ...
+        >>> pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_threads: int | None = None,
+        max_processes: int | None = None,
+        mp_context: Any | None = None,
+    ) -> None:
+        """Initialize worker pool.
+
+        Args:
+            max_threads: Thread pool size (None uses the ThreadPoolExecutor default).
+            max_processes: Process pool size (None uses the CPU count).
+            mp_context: Multiprocessing context for the process pool.
+        """
+        if max_threads is not None and max_threads < 1:
+            raise ValueError("max_threads must be at least 1")
+        if max_processes is not None and max_processes < 1:
+            raise ValueError("max_processes must be at least 1")
+
+        self._max_threads = max_threads
+        self._max_processes = max_processes
+        self._mp_context = mp_context
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """Thread pool, created on first access."""
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers=self._max_threads,
+                    thread_name_prefix="agentchord-tool",
+                )
+            return self._threads
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """Process pool, created on first access."""
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self._max_processes,
+                    mp_context=self._mp_context or multiprocessing.get_context(),
+                )
+            return self._processes
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        kwargs: dict[str, Any],
+        mode: ToolExecutionMode = ToolExecutionMode.THREAD,
+        timeout: float | None = None,
+    ) -> Any:
+        """Run a sync function according to ``mode``.
+
+        Args:
+            func: Sync function to call.
+            kwargs: Keyword arguments for ``func``.
+            mode: Where to run the function.
+            timeout: Seconds to wait before giving up (ignored for INLINE).
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            ToolTimeoutError: If ``timeout`` elapses first.
+        """
+        if mode == ToolExecutionMode.INLINE:
+            return func(**kwargs)
+
+        loop = asyncio.get_running_loop()
+        if mode == ToolExecutionMode.PROCESS:
+            pool: Executor = self.process_pool
+            call = self._process_call(func, kwargs)
+        else:
+            pool = self.thread_pool
+            ctx = contextvars.copy_context()
+            call = functools.partial(ctx.run, functools.partial(func, **kwargs))
+
+        future = loop.run_in_executor(pool, call)
+        if timeout is None:
+            return await future
+
+        try:
+            return await run_with_timeout(future, timeout)
+        except ToolTimeoutError:
+            if mode == ToolExecutionMode.PROCESS:
+                self._recycle_processes(pool)
+            raise
+
+    @staticmethod
+    def _process_call(func: Callable[..., Any], kwargs: dict[str, Any]) -> Callable[[], Any]:
+        """Build a picklable zero-argument call for the process pool."""
+        module = getattr(func, "__module__", None)
+        qualname = getattr(func, "__qualname__", "")
+        if module and qualname and "<locals>" not in qualname:
+            return functools.partial(_call_by_name, module, qualname, kwargs)
+        # Lambdas, closures and callable objects: rely on regular pickling
+        return functools.partial(func, **kwargs)
+
+    def _recycle_processes(self, pool: Executor) -> None:
+        """Terminate the given process pool's workers and drop the pool."""
+        with self._lock:
+            if self._processes is pool:
+                self._processes = None
+        assert isinstance(pool, ProcessPoolExecutor)
+        workers = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for proc in workers:
+            if proc.is_alive():
+                proc.terminate()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down both pools. They are recreated on next use."""
+        with self._lock:
+            threads, self._threads = self._threads, None
+            processes, self._processes = self._processes, None
+        if threads is not None:
+            threads.shutdown(wait=wait)
+        if processes is not None:
+            processes.shutdown(wait=wait)
+
+
+_default_pool: ToolWorkerPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_worker_pool() -> ToolWorkerPool:
+    """Get the process-wide default tool worker pool."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ToolWorkerPool()
+        return _default_pool
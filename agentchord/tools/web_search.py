@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import httpx
-
 from agentchord.tools.base import Tool, ToolParameter
+from agentchord.utils.http import get_http_client
+
+_TAVILY_SEARCH_URL = "https://api.tavily.com/search"
 
 
 def create_web_search_tool(api_key: str, max_results: int = 5) -> Tool:
@@ -19,18 +20,19 @@ def create_web_search_tool(api_key: str, max_results: int = 5) -> Tool:
     """
 
     async def web_search(query: str) -> str:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.post(
-                "https://api.tavily.com/search",
-                json={
-                    "api_key": api_key,
-                    "query": query,
-                    "max_results": max_results,
-                    "include_answer": True,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = get_http_client(_TAVILY_SEARCH_URL)
+        resp = await client.post(
+            _TAVILY_SEARCH_URL,
+            json={
+                "api_key": api_key,
+                "query": query,
+                "max_results": max_results,
+                "include_answer": True,
+            },
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         answer = data.get("answer", "")
         results = data.get("results", [])
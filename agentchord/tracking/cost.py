@@ -98,6 +98,7 @@ class CostTracker:
         model: str,
         usage: TokenUsage,
         agent_name: str | None = None,
+        cache_hit: bool = False,
         **metadata: any,
     ) -> CostEntry:
         """Convenience method to track usage with auto-calculated cost.
@@ -106,17 +107,20 @@ class CostTracker:
             model: Model name.
             usage: Token usage.
             agent_name: Optional agent name.
+            cache_hit: Whether the usage was served from a response cache.
+                Cached usage is recorded at zero cost.
             **metadata: Additional metadata.
 
         Returns:
             The created CostEntry.
         """
-        cost = calculate_cost(model, usage)
+        cost = 0.0 if cache_hit else calculate_cost(model, usage)
         entry = CostEntry(
             model=model,
             usage=usage,
             cost_usd=cost,
             agent_name=agent_name,
+            cache_hit=cache_hit,
             metadata=metadata,
         )
         self.track(entry)
@@ -13,6 +13,8 @@ class TokenUsage(BaseModel):
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -25,6 +27,8 @@ class TokenUsage(BaseModel):
         return TokenUsage(
             prompt_tokens=self.prompt_tokens + other.prompt_tokens,
             completion_tokens=self.completion_tokens + other.completion_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
         )
 
 
@@ -37,6 +41,7 @@ class CostEntry(BaseModel):
     cost_usd: float
     agent_name: str | None = None
     request_id: str | None = None
+    cache_hit: bool = False
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -48,6 +53,10 @@ class CostSummary(BaseModel):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     request_count: int = 0
+    cache_hit_count: int = 0
+    cached_tokens: int = 0  # served by a response cache
+    cache_read_tokens: int = 0  # read from the provider's prompt cache
+    cache_write_tokens: int = 0  # written to the provider's prompt cache
     by_model: dict[str, float] = Field(default_factory=dict)
     by_agent: dict[str, float] = Field(default_factory=dict)
 
@@ -60,6 +69,10 @@ class CostSummary(BaseModel):
         total_cost = 0.0
         total_prompt = 0
         total_completion = 0
+        cache_hit_count = 0
+        cached_tokens = 0
+        cache_read_tokens = 0
+        cache_write_tokens = 0
         by_model: dict[str, float] = {}
         by_agent: dict[str, float] = {}
 
@@ -67,6 +80,12 @@ class CostSummary(BaseModel):
             total_cost += entry.cost_usd
             total_prompt += entry.usage.prompt_tokens
             total_completion += entry.usage.completion_tokens
+            cache_read_tokens += entry.usage.cache_read_tokens
+            cache_write_tokens += entry.usage.cache_write_tokens
+
+            if entry.cache_hit:
+                cache_hit_count += 1
+                cached_tokens += entry.usage.total_tokens
 
             # Aggregate by model
             by_model[entry.model] = by_model.get(entry.model, 0.0) + entry.cost_usd
@@ -83,6 +102,10 @@ class CostSummary(BaseModel):
             prompt_tokens=total_prompt,
             completion_tokens=total_completion,
             request_count=len(entries),
+            cache_hit_count=cache_hit_count,
+            cached_tokens=cached_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
             by_model=by_model,
             by_agent=by_agent,
         )
@@ -32,6 +32,23 @@ MODEL_PRICING: dict[str, tuple[float, float]] = {
 # Default pricing for unknown models
 DEFAULT_PRICING: tuple[float, float] = (1.00, 2.00)
 
+# Prompt cache pricing as multipliers of the input price:
+# (cache_read_multiplier, cache_write_multiplier), matched by model prefix
+CACHE_PRICING: dict[str, tuple[float, float]] = {
+    # Anthropic: reads at 10%, 5-minute cache writes at 125%
+    "claude": (0.10, 1.25),
+    # OpenAI: automatic caching, reads at 50%, writes free
+    "gpt-": (0.50, 1.00),
+    "o1": (0.50, 1.00),
+    "o3": (0.50, 1.00),
+    "o4": (0.50, 1.00),
+    # Gemini implicit caching: reads at 25%
+    "gemini": (0.25, 1.00),
+}
+
+# Default cache pricing: no discount, no premium
+DEFAULT_CACHE_PRICING: tuple[float, float] = (1.00, 1.00)
+
 
 def get_model_pricing(model: str) -> tuple[float, float]:
     """Get pricing for a model.
@@ -55,9 +72,29 @@ def get_model_pricing(model: str) -> tuple[float, float]:
     return DEFAULT_PRICING
 
 
+def get_cache_pricing(model: str) -> tuple[float, float]:
+    """Get prompt cache multipliers for a model.
+
+    Args:
+        model: Model name or ID.
+
+    Returns:
+        Tuple of (cache_read_multiplier, cache_write_multiplier) applied
+        to the model's input price.
+    """
+    model_lower = model.lower()
+    for prefix, multipliers in CACHE_PRICING.items():
+        if model_lower.startswith(prefix):
+            return multipliers
+    return DEFAULT_CACHE_PRICING
+
+
 def calculate_cost(model: str, usage: TokenUsage) -> float:
     """Calculate cost in USD for token usage.
 
+    Prompt tokens read from or written to the provider's prompt cache
+    are billed at the cache rates; ``prompt_tokens`` includes them.
+
     Args:
         model: Model name.
         usage: Token usage.
@@ -66,9 +103,19 @@ def calculate_cost(model: str, usage: TokenUsage) -> float:
         Cost in USD.
     """
     input_price, output_price = get_model_pricing(model)
+    read_multiplier, write_multiplier = get_cache_pricing(model)
+
+    uncached = max(
+        0, usage.prompt_tokens - usage.cache_read_tokens - usage.cache_write_tokens
+    )
+    prompt_units = (
+        uncached
+        + usage.cache_read_tokens * read_multiplier
+        + usage.cache_write_tokens * write_multiplier
+    )
 
     # Convert from per-1M to actual cost
-    input_cost = (usage.prompt_tokens / 1_000_000) * input_price
+    input_cost = (prompt_units / 1_000_000) * input_price
     output_cost = (usage.completion_tokens / 1_000_000) * output_price
 
     return input_cost + output_cost
@@ -0,0 +1,315 @@
+"""Shared, pooled HTTP clients for httpx-based components.
+
+Providers, embeddings, loaders and tools that talk HTTP directly used to open
+a new ``httpx.AsyncClient`` per request and paid a fresh TCP/TLS handshake
+every time. ``HTTPClientManager`` keeps one keep-alive client per origin
+(scheme + host + port) and hands it out to every caller in the process.
+
+httpx clients hold connections bound to the event loop that opened them, so
+clients are kept per running loop. Timeouts, headers and redirect handling
+are passed per request, letting components with different settings share a
+pool. Each client counts its in-flight requests so that releasing the
+manager never cuts off a request that is still running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from http.cookiejar import Cookie, CookieJar
+from typing import Any, AsyncIterator, Awaitable, Callable
+from urllib.parse import urlsplit
+
+import httpx
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+def _origin(url: str) -> str:
+    """Normalize a URL to its origin (``scheme://host:port``)."""
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.hostname:
+        raise ValueError(f"URL must be absolute: {url!r}")
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that reports when the response is closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, on_close: Callable[[], Awaitable[None]]
+    ) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], Awaitable[None]] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            await on_close()
+
+
+class _NullCookieJar(CookieJar):
+    """Cookie jar that never stores cookies."""
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        pass
+
+    def extract_cookies(self, response: Any, request: Any) -> None:
+        pass
+
+
+class _PooledClient(httpx.AsyncClient):
+    """Keep-alive client that tracks requests still in flight.
+
+    A streamed response counts as in flight until it is closed. Once
+    detached from the manager, the client closes itself after its last
+    request finishes. Response cookies are never stored, so components
+    sharing the client don't see each other's ``Set-Cookie`` values.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("cookies", _NullCookieJar())
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self._close_when_idle = False
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether no request is in flight."""
+        return self.in_flight == 0
+
+    async def send(
+        self, request: httpx.Request, *, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        self.in_flight += 1
+        try:
+            response = await super().send(request, stream=stream, **kwargs)
+        except BaseException:
+            await self._finish()
+            raise
+        if stream and not response.is_closed:
+            response.stream = _ReleasingStream(response.stream, self._finish)
+        else:
+            await self._finish()
+        return response
+
+    async def close_when_idle(self) -> None:
+        """Close now if idle, otherwise after the last in-flight request."""
+        self._close_when_idle = True
+        if self.is_idle:
+            await self.aclose()
+
+    async def _finish(self) -> None:
+        self.in_flight -= 1
+        if self._close_when_idle and self.is_idle:
+            await self.aclose()
+
+
+class HTTPClientManager:
+    """Process-wide registry of keep-alive ``httpx.AsyncClient`` pools.
+
+    Components call ``get_client(url)`` instead of creating their own client.
+    Clients are created lazily, one per origin and event loop, and reused
+    until ``aclose()`` is called or the last user ``release()``s the manager.
+    Releasing only closes idle clients; a client with requests in flight
+    (e.g. from a component used outside any agent context) is closed once
+    those requests finish.
+
+    Example:
+        >>> manager = get_http_client_manager()
+        >>> manager.configure(http2=True, limits=httpx.Limits(max_connections=50))
+        >>> await manager.warmup(["http://localhost:11434"])
+        >>> client = manager.get_client("http://localhost:11434/v1/chat/completions")
+        >>> response = await client.post(url, json=payload, timeout=30.0)
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        timeout: float = 60.0,
+    ) -> None:
+        """Initialize client manager.
+
+        Args:
+            limits: Connection pool limits applied to every client.
+            http2: Whether to negotiate HTTP/2 (requires the ``h2`` package).
+            timeout: Default timeout for requests that don't pass their own.
+        """
+        self._limits = limits or DEFAULT_LIMITS
+        self._http2 = http2
+        self._timeout = timeout
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._users = 0
+
+    @property
+    def http2(self) -> bool:
+        """Whether new clients negotiate HTTP/2."""
+        return self._http2
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Connection pool limits for new clients."""
+        return self._limits
+
+    @property
+    def users(self) -> int:
+        """Number of active ``acquire()`` holders."""
+        return self._users
+
+    def configure(
+        self,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Change settings for clients created from now on.
+
+        Existing clients keep their settings until closed.
+
+        Args:
+            limits: New connection pool limits.
+            http2: Enable or disable HTTP/2.
+            timeout: New default request timeout.
+        """
+        if limits is not None:
+            self._limits = limits
+        if http2 is not None:
+            self._http2 = http2
+        if timeout is not None:
+            self._timeout = timeout
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """Get the shared client for ``url``'s origin on the running loop.
+
+        Args:
+            url: Any absolute URL on the target origin.
+
+        Returns:
+            A keep-alive client. Do not close it; use ``aclose()`` instead.
+        """
+        loop = asyncio.get_running_loop()
+        origin = _origin(url)
+        clients = self._clients.setdefault(loop, {})
+        client = clients.get(origin)
+        if client is None or client.is_closed:
+            client = self._create_client()
+            clients[origin] = client
+        return client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a new pooled client with the current settings."""
+        http2 = self._http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the h2 package. "
+                "Install with: pip install agentchord[http2]"
+            )
+        return _PooledClient(
+            limits=self._limits,
+            http2=http2,
+            timeout=self._timeout,
+        )
+
+    async def warmup(self, urls: list[str], *, timeout: float = 5.0) -> list[str]:
+        """Pre-connect to origins so the first real request skips the handshake.
+
+        Sends a ``HEAD`` request to each origin. Any HTTP response counts as
+        connected; connection errors are ignored.
+
+        Args:
+            urls: URLs (or base URLs) to pre-connect to.
+            timeout: Timeout for each warm-up request.
+
+        Returns:
+            Origins that accepted a connection.
+        """
+        origins = list(dict.fromkeys(_origin(u) for u in urls))
+
+        async def _warm(origin: str) -> str | None:
+            try:
+                await self.get_client(origin).head(origin, timeout=timeout)
+            except httpx.HTTPError:
+                return None
+            return origin
+
+        results = await asyncio.gather(*(_warm(o) for o in origins))
+        return [o for o in results if o is not None]
+
+    def acquire(self) -> None:
+        """Register a user (e.g. an agent context) of the shared clients."""
+        self._users += 1
+
+    async def release(self) -> None:
+        """Unregister a user; close the loop's clients when none remain.
+
+        Clients with requests in flight are closed once those requests
+        finish; later ``get_client()`` calls get a fresh client.
+        """
+        self._users = max(0, self._users - 1)
+        if self._users > 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        clients = self._clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                if isinstance(client, _PooledClient):
+                    await client.close_when_idle()
+                else:
+                    await client.aclose()
+            except Exception:
+                pass  # Closing is best effort
+
+    async def aclose(self) -> None:
+        """Close every client created on the running event loop.
+
+        Unlike ``release()``, this closes clients with requests in flight.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        clients = self._clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception:
+                pass  # Closing is best effort
+
+    def __repr__(self) -> str:
+        count = sum(len(c) for c in self._clients.values())
+        return f"HTTPClientManager(clients={count}, http2={self._http2})"
+
+
+_default_manager: HTTPClientManager | None = None
+
+
+def get_http_client_manager() -> HTTPClientManager:
+    """Get the process-wide HTTP client manager."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = HTTPClientManager()
+    return _default_manager
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Shortcut for ``get_http_client_manager().get_client(url)``."""
+    return get_http_client_manager().get_client(url)
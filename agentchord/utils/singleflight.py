@@ -0,0 +1,138 @@
+"""Coalescing of identical in-flight async calls ("singleflight").
+
+When a workflow fans out or many users send the same prompt at once,
+identical requests would otherwise go upstream in parallel. ``SingleFlight``
+runs one shared call per key and lets every concurrent caller await it.
+
+Cancellation: each caller waits on the shared call through
+``asyncio.shield``, so cancelling one caller never cancels the call for the
+others. The shared call is cancelled only when every caller has gone away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Coalescing statistics for a ``SingleFlight`` group."""
+
+    calls: int = 0       # Upstream calls actually started
+    coalesced: int = 0   # Callers that joined an in-flight call
+    cancelled: int = 0   # Upstream calls cancelled after every caller left
+
+    @property
+    def requests(self) -> int:
+        """Total callers."""
+        return self.calls + self.coalesced
+
+    @property
+    def coalesce_rate(self) -> float:
+        """Fraction of callers served by another caller's upstream call."""
+        return self.coalesced / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, including derived values."""
+        data = asdict(self)
+        data["requests"] = self.requests
+        data["coalesce_rate"] = self.coalesce_rate
+        return data
+
+
+class _Flight(Generic[T]):
+    """One shared upstream call and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time, sharing its result.
+
+    Shared calls are tasks on the running event loop, so a group should be
+    used from one loop at a time.
+
+    Example:
+        >>> group: SingleFlight[str] = SingleFlight()
+        >>> results = await asyncio.gather(
+        ...     group.do("k", fetch),
+        ...     group.do("k", fetch),  # joins the first call
+        ... )
+        >>> group.stats.coalesced
+        1
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight[T]] = {}
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Coalescing statistics."""
+        return self._stats
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._flights)
+
+    def reset_stats(self) -> SingleFlightStats:
+        """Reset statistics and return the previous values."""
+        previous, self._stats = self._stats, SingleFlightStats()
+        return previous
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Request key; callers with equal keys share one call.
+            fn: Zero-argument coroutine function making the upstream call.
+
+        Returns:
+            The shared call's result (exceptions are shared too).
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(
+                lambda _task, key=key, flight=flight: self._forget(key, flight)
+            )
+            self._stats.calls += 1
+        else:
+            self._stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # This caller was cancelled; stop the call if nobody else waits
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+                self._forget(key, flight)
+                self._stats.cancelled += 1
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight[T]) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception retrieved when no caller was left to see it
+        if flight.task.done() and not flight.task.cancelled():
+            flight.task.exception()
+
+    def __repr__(self) -> str:
+        return (
+            f"SingleFlight(in_flight={len(self._flights)}, "
+            f"coalesced={self._stats.coalesced})"
+        )
@@ -0,0 +1,150 @@
+"""Fast local token estimation.
+
+Exact counts need the provider's tokenizer, which is slow to load and not
+available for every model. For budgeting a prompt a per-family character
+ratio is close enough: ASCII text is counted at characters-per-token, and
+other scripts (Korean, Japanese, Chinese, ...) per character.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentchord.core.types import Message
+
+# (ASCII characters per token, tokens per non-ASCII character),
+# matched by model prefix
+TOKEN_RATIOS: dict[str, tuple[float, float]] = {
+    "gpt-4o": (4.0, 0.6),
+    "gpt-4.1": (4.0, 0.6),
+    "o1": (4.0, 0.6),
+    "o3": (4.0, 0.6),
+    "o4": (4.0, 0.6),
+    "gpt-": (4.0, 1.0),
+    "claude": (3.5, 1.0),
+    "gemini": (4.0, 0.5),
+    "ollama/": (3.8, 1.0),
+}
+
+DEFAULT_TOKEN_RATIO: tuple[float, float] = (4.0, 1.0)
+
+# Context window sizes in tokens, matched by model prefix. Add entries for
+# models not listed here; unknown models get no default prompt budget.
+CONTEXT_WINDOWS: dict[str, int] = {
+    "gpt-4o": 128_000,
+    "gpt-4.1": 1_000_000,
+    "gpt-4-turbo": 128_000,
+    "gpt-4": 8_192,
+    "gpt-3.5-turbo": 16_385,
+    "o1": 200_000,
+    "o3": 200_000,
+    "o4": 200_000,
+    "claude": 200_000,
+    "gemini": 1_000_000,
+}
+
+# Role markers and separators the API adds around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+TRUNCATION_MARKER = "\n[... {tokens} tokens truncated ...]\n"
+
+
+def _match_prefix(model: str | None, table: dict[str, Any], default: Any) -> Any:
+    if not model:
+        return default
+    model_lower = model.lower()
+    for prefix, value in table.items():
+        if model_lower.startswith(prefix):
+            return value
+    return default
+
+
+def get_token_ratio(model: str | None) -> tuple[float, float]:
+    """Get the estimation ratios for a model family.
+
+    Args:
+        model: Model name or ID.
+
+    Returns:
+        Tuple of (ASCII characters per token, tokens per non-ASCII character).
+    """
+    return _match_prefix(model, TOKEN_RATIOS, DEFAULT_TOKEN_RATIO)
+
+
+def get_context_window(model: str | None) -> int | None:
+    """Get a model's context window size in tokens.
+
+    Args:
+        model: Model name or ID.
+
+    Returns:
+        Context window size, or None for models not in ``CONTEXT_WINDOWS``.
+    """
+    return _match_prefix(model, CONTEXT_WINDOWS, None)
+
+
+def estimate_tokens(text: str, model: str | None = None) -> int:
+    """Estimate the number of tokens in ``text``.
+
+    Args:
+        text: Text to estimate.
+        model: Model name used to pick the ratio.
+
+    Returns:
+        Estimated token count.
+    """
+    if not text:
+        return 0
+    chars_per_token, non_ascii_weight = get_token_ratio(model)
+    if text.isascii():
+        return math.ceil(len(text) / chars_per_token)
+    # CJK characters take 3 bytes in UTF-8, i.e. 2 more than ASCII
+    extra_bytes = len(text.encode("utf-8")) - len(text)
+    non_ascii = min(len(text), (extra_bytes + 1) // 2)
+    ascii_chars = len(text) - non_ascii
+    return math.ceil(ascii_chars / chars_per_token + non_ascii * non_ascii_weight)
+
+
+def estimate_message_tokens(message: Message, model: str | None = None) -> int:
+    """Estimate the tokens a message adds to a prompt, including overhead."""
+    tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.content, model)
+    if message.tool_calls:
+        for tc in message.tool_calls:
+            tokens += estimate_tokens(tc.name, model)
+            tokens += estimate_tokens(json.dumps(tc.arguments), model)
+    return tokens
+
+
+def estimate_json_tokens(value: Any, model: str | None = None) -> int:
+    """Estimate the tokens of a JSON-serializable value (e.g. tool schemas)."""
+    if not value:
+        return 0
+    return estimate_tokens(json.dumps(value, separators=(",", ":")), model)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str | None = None) -> str:
+    """Shorten ``text`` to about ``max_tokens``, keeping its start and end.
+
+    The removed middle is replaced by a marker saying how many tokens were
+    cut, so the model knows the content is incomplete.
+
+    Args:
+        text: Text to shorten.
+        max_tokens: Token budget for the result, marker included.
+        model: Model name used to pick the ratio.
+
+    Returns:
+        ``text`` unchanged if it fits, otherwise the shortened text.
+    """
+    total = estimate_tokens(text, model)
+    if total <= max_tokens:
+        return text
+    marker = TRUNCATION_MARKER.format(tokens=total - max_tokens)
+    keep_tokens = max(0, max_tokens - estimate_tokens(marker, model))
+    keep_chars = int(len(text) * keep_tokens / total)
+    head = keep_chars * 2 // 3
+    tail = keep_chars - head
+    return text[:head] + marker + (text[-tail:] if tail else "")
@@ -8,7 +8,7 @@ from typing import Any
 import pytest
 
 from agentchord.core.agent import Agent
-from agentchord.core.types import LLMResponse, Message, StreamChunk, Usage
+from agentchord.core.types import LLMResponse, Message, StreamChunk, ToolCall, Usage
 from agentchord.llm.base import BaseLLMProvider
 
 
@@ -75,6 +75,39 @@ class BenchmarkProvider(BaseLLMProvider):
         return 0.0
 
 
+class ToolRoundBenchmarkProvider(BenchmarkProvider):
+    """Mock provider that requests a fixed set of tool calls, then answers.
+
+    Odd calls return ``tool_calls``; even calls return the final text, so
+    every ``agent.run()`` performs exactly one tool round.
+    """
+
+    def __init__(self, tool_calls: list[ToolCall], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._tool_calls = tool_calls
+        self._calls = 0
+
+    async def complete(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Alternate between a tool-call round and a final answer."""
+        self._calls += 1
+        if self._calls % 2:
+            return LLMResponse(
+                content="",
+                model=self._model,
+                usage=Usage(prompt_tokens=10, completion_tokens=5),
+                finish_reason="tool_calls",
+                tool_calls=self._tool_calls,
+            )
+        return await super().complete(messages, temperature=temperature, max_tokens=max_tokens)
+
+
 @pytest.fixture
 def bench_provider() -> BenchmarkProvider:
     """Create a benchmark provider."""
@@ -612,3 +612,56 @@ class TestToolExecutionBenchmarks:
         elapsed_ms = (time.perf_counter() - start) * 1000
 
         assert elapsed_ms < 100, f"500 async tool executions took {elapsed_ms:.2f}ms"
+
+    @pytest.mark.asyncio
+    async def test_tool_round_concurrent_latency(self) -> None:
+        """Latency of one LLM round that requests several I/O-bound tools.
+
+        Five tools that each wait 20ms should cost roughly one tool's latency
+        when run concurrently, versus the sum when run sequentially.
+        Target: concurrent round < 2x a single tool, and < 50% of sequential.
+        """
+        import asyncio
+
+        from agentchord.core.types import ToolCall
+        from agentchord.tools.decorator import tool
+
+        from benchmarks.conftest import ToolRoundBenchmarkProvider
+
+        delay = 0.02
+        n_tools = 5
+
+        @tool(description="Simulated network-bound lookup")
+        async def lookup(query: str) -> str:
+            await asyncio.sleep(delay)
+            return query
+
+        tool_calls = [
+            ToolCall(id=f"tc_{i}", name="lookup", arguments={"query": f"q{i}"})
+            for i in range(n_tools)
+        ]
+
+        async def measure(max_concurrent_tools: int | None) -> float:
+            agent = Agent(
+                name="tool-round-bench",
+                role="Benchmark",
+                llm_provider=ToolRoundBenchmarkProvider(tool_calls),
+                tools=[lookup],
+                max_concurrent_tools=max_concurrent_tools,
+            )
+            times: list[float] = []
+            for _ in range(5):
+                start = time.perf_counter()
+                await agent.run("Look everything up")
+                times.append(time.perf_counter() - start)
+            return sum(times) / len(times)
+
+        concurrent_s = await measure(None)
+        sequential_s = await measure(1)
+
+        assert concurrent_s < delay * 2, (
+            f"Concurrent round took {concurrent_s * 1000:.1f}ms for {n_tools} tools"
+        )
+        assert concurrent_s < sequential_s * 0.5, (
+            f"Concurrent {concurrent_s * 1000:.1f}ms vs sequential {sequential_s * 1000:.1f}ms"
+        )
@@ -0,0 +1,110 @@
+"""Provider message conversion benchmarks.
+
+Simulates the growing conversation of a tool-calling agent: every round
+appends an assistant tool call and a 50 KB tool output, then the provider
+converts the whole conversation again for the next request.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+import pytest
+
+from agentchord.core.conversation import Conversation
+from agentchord.core.types import Message, MessageRole, ToolCall
+from agentchord.llm.anthropic import AnthropicProvider
+from agentchord.llm.ollama import OllamaProvider
+from agentchord.llm.openai import OpenAIProvider
+
+ROUNDS = 10
+TOOL_OUTPUT = "x" * 50_000
+
+
+def _run_rounds(
+    messages: list[Message], convert: Callable[[list[Message]], Any]
+) -> float:
+    """Append ROUNDS tool rounds, converting before each.
+
+    Returns:
+        Seconds spent converting.
+    """
+    elapsed = 0.0
+    for i in range(ROUNDS):
+        start = time.perf_counter()
+        convert(messages)
+        elapsed += time.perf_counter() - start
+        messages.append(Message(
+            role=MessageRole.ASSISTANT,
+            content="",
+            tool_calls=[ToolCall(
+                id=f"call_{i}",
+                name="fetch",
+                arguments={"url": f"https://example.com/{i}", "fields": list(range(200))},
+            )],
+        ))
+        messages.append(Message(
+            role=MessageRole.TOOL, content=TOOL_OUTPUT, tool_call_id=f"call_{i}"
+        ))
+    start = time.perf_counter()
+    convert(messages)
+    return elapsed + time.perf_counter() - start
+
+
+def _initial() -> list[Message]:
+    return [Message.system("You are a research agent. " * 200), Message.user("Research this")]
+
+
+PROVIDERS: dict[str, Callable[[], Callable[[list[Message]], Any]]] = {
+    "openai": lambda: OpenAIProvider(api_key="bench")._convert_messages,
+    "anthropic": lambda: AnthropicProvider(api_key="bench")._extract_system_and_messages,
+    "ollama": lambda: OllamaProvider(model="ollama/llama3.2")._convert_messages,
+}
+
+# Minimum speedup per provider. OpenAI-format conversion re-serializes tool
+# call arguments to JSON, so caching pays off most there; Anthropic passes
+# arguments through as dicts and mostly saves dict construction.
+MIN_SPEEDUP: dict[str, float] = {"openai": 2.0, "ollama": 2.0, "anthropic": 0.75}
+
+
+class TestConversationBenchmarks:
+    """Incremental vs full message conversion across tool rounds."""
+
+    @pytest.mark.parametrize("provider", sorted(PROVIDERS))
+    def test_incremental_conversion_faster(self, provider: str) -> None:
+        """Conversation should convert only new messages each round.
+
+        Target: MIN_SPEEDUP over converting a plain list for 10 rounds
+        with 50 KB tool outputs (best of 20 runs).
+        """
+        convert = PROVIDERS[provider]()
+
+        plain = min(_run_rounds(_initial(), convert) for _ in range(20))
+        cached = min(_run_rounds(Conversation(_initial()), convert) for _ in range(20))
+
+        print(
+            f"\n{provider}: plain {plain * 1000:.3f}ms, "
+            f"conversation {cached * 1000:.3f}ms ({plain / cached:.1f}x)"
+        )
+        assert plain / cached >= MIN_SPEEDUP[provider], (
+            f"Incremental conversion {cached * 1000:.3f}ms vs full conversion "
+            f"{plain * 1000:.3f}ms is below {MIN_SPEEDUP[provider]}x"
+        )
+
+    def test_each_message_converted_once(self) -> None:
+        """Over 10 rounds each message should be converted exactly once."""
+        provider = OpenAIProvider(api_key="bench")
+        calls = 0
+        original = provider._convert_message
+
+        def counting(message: Message) -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            return original(message)
+
+        provider._convert_message = counting  # type: ignore[method-assign]
+        conversation = Conversation(_initial())
+        _run_rounds(conversation, provider._convert_messages)
+
+        assert calls == len(conversation) == 2 + 2 * ROUNDS
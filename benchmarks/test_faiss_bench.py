@@ -0,0 +1,114 @@
+"""FAISS index benchmarks.
+
+Measures recall@10 against the exact flat index, and search latency, for
+each approximate index type across its query-time knob.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from agentchord.rag.types import Chunk
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("faiss")
+
+from agentchord.rag.vectorstore.faiss import FAISSVectorStore  # noqa: E402
+
+VECTORS = 50_000
+DIMENSIONS = 64
+CLUSTERS = 200
+QUERIES = 200
+K = 10
+
+
+@pytest.fixture(scope="module")
+def dataset() -> tuple[list[Chunk], list[list[float]]]:
+    """Clustered synthetic embeddings and queries drawn near them."""
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(CLUSTERS, DIMENSIONS))
+    labels = rng.integers(CLUSTERS, size=VECTORS)
+    vectors = centers[labels] + rng.normal(scale=0.5, size=(VECTORS, DIMENSIONS))
+    queries = vectors[rng.choice(VECTORS, QUERIES)] + rng.normal(
+        scale=0.3, size=(QUERIES, DIMENSIONS)
+    )
+    chunks = [
+        Chunk(id=f"c{i}", content="", embedding=vector)
+        for i, vector in enumerate(vectors.astype(np.float32).tolist())
+    ]
+    return chunks, queries.tolist()
+
+
+async def _measure(
+    store: FAISSVectorStore, queries: list[list[float]], **kwargs
+) -> tuple[list[list[str]], float]:
+    start = time.perf_counter()
+    batch = await store.search_batch(queries, limit=K, **kwargs)
+    per_query = (time.perf_counter() - start) / len(queries)
+    return [[r.chunk.id for r in results] for results in batch], per_query
+
+
+def _recall(found: list[list[str]], truth: list[list[str]]) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / (len(truth) * K)
+
+
+class TestFAISSBenchmarks:
+    """Recall versus latency of the approximate index types."""
+
+    @pytest.mark.asyncio
+    async def test_recall_vs_latency(self, dataset) -> None:
+        """Sweep nprobe/efSearch and compare with the flat index.
+
+        Targets: recall@10 of at least 0.9 for HNSW (efSearch=128) and
+        IVF-Flat (nprobe=32), at least 0.4 for IVF-PQ (nprobe=32), and
+        recall that does not drop as the knob grows.
+        """
+        chunks, queries = dataset
+
+        flat = FAISSVectorStore(DIMENSIONS)
+        await flat.add(chunks)
+        truth, flat_s = await _measure(flat, queries)
+        print(f"\n{VECTORS}x{DIMENSIONS}, recall@{K} / latency per query")
+        print(f"  flat             1.000  {flat_s * 1e3:.3f}ms")
+
+        configs = [
+            ("hnsw", {"hnsw_m": 32}, "ef_search", [16, 64, 128], 0.9),
+            ("ivf", {"nlist": 256}, "nprobe", [1, 8, 32], 0.9),
+            (
+                "ivfpq",
+                {"nlist": 256, "pq_m": 16, "max_train_size": 16_384},
+                "nprobe",
+                [1, 8, 32],
+                0.4,
+            ),
+            # OPQ training is iterative; a smaller sample keeps the build short
+            (
+                "ivfpq+opq",
+                {"nlist": 256, "pq_m": 16, "opq": True, "max_train_size": 4_096},
+                "nprobe",
+                [8, 32],
+                0.4,
+            ),
+        ]
+        for name, options, knob, values, target in configs:
+            index_type = name.split("+")[0]
+            store = FAISSVectorStore(DIMENSIONS, index_type, **options)
+            start = time.perf_counter()
+            await store.add(chunks)
+            await store.train()
+            build_s = time.perf_counter() - start
+
+            recalls = []
+            for value in values:
+                found, per_query = await _measure(store, queries, **{knob: value})
+                recalls.append(_recall(found, truth))
+                print(
+                    f"  {name:<10} {knob}={value:<4} {recalls[-1]:.3f}  "
+                    f"{per_query * 1e3:.3f}ms (build {build_s:.1f}s)"
+                )
+
+            assert recalls[-1] >= recalls[0]
+            assert recalls[-1] >= target
@@ -0,0 +1,88 @@
+"""Import-time benchmarks.
+
+Each measurement runs a fresh interpreter with ``python -X importtime``
+and reads the cumulative time of the top-level module, so results reflect
+a cold start (as in a CLI or serverless entry point).
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+RUNS = 5
+
+# Cumulative import time budgets in microseconds (best of RUNS)
+MAX_IMPORT_US = 20_000
+
+# Modules that ``import agentchord`` must not load
+HEAVY_MODULES = (
+    "agentchord.core",
+    "agentchord.errors",
+    "agentchord.llm",
+    "agentchord.memory",
+    "agentchord.resilience",
+    "agentchord.tracking",
+    "pydantic",
+    "httpx",
+    "rich",
+)
+
+
+def _import_time_us(statement: str, module: str) -> int:
+    """Cumulative import time of ``module`` while running ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def _best_import_time_us(statement: str, module: str) -> int:
+    return min(_import_time_us(statement, module) for _ in range(RUNS))
+
+
+class TestImportBenchmarks:
+    """Cold import cost of the top-level package."""
+
+    def test_import_agentchord(self) -> None:
+        """``import agentchord`` should only load the package itself.
+
+        Target: under MAX_IMPORT_US cumulative (best of 5 cold starts).
+        """
+        elapsed = _best_import_time_us("import agentchord", "agentchord")
+        print(f"\nimport agentchord: {elapsed / 1000:.1f}ms")
+        assert elapsed < MAX_IMPORT_US
+
+    def test_import_loads_no_submodules(self) -> None:
+        """Public names are loaded on first access, not at import."""
+        script = (
+            "import sys, agentchord; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.parametrize(
+        ("statement", "module"),
+        [
+            ("from agentchord import Agent", "agentchord.core.agent"),
+            ("from agentchord import Workflow", "agentchord.core.workflow"),
+        ],
+    )
+    def test_first_access_cost(self, statement: str, module: str) -> None:
+        """Report what the first use of a public name costs (no target)."""
+        elapsed = _best_import_time_us(statement, module)
+        print(f"\n{statement}: {elapsed / 1000:.1f}ms")
+        assert elapsed > 0
@@ -0,0 +1,96 @@
+"""Workflow state benchmarks.
+
+Long workflows append one result per step. With structural sharing each
+step should cost the same, however long the history already is.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.executor import SequentialExecutor
+from agentchord.core.state import WorkflowState
+from agentchord.core.types import AgentResult, Usage
+
+STEPS = 5_000
+
+
+def _result(i: int) -> AgentResult:
+    return AgentResult(
+        output=f"step {i}",
+        messages=[],
+        usage=Usage(prompt_tokens=10, completion_tokens=5),
+        cost=0.0,
+        duration_ms=1,
+        metadata={"agent_name": "bench"},
+    )
+
+
+def _grow(state: WorkflowState, results: list[AgentResult]) -> WorkflowState:
+    for result in results:
+        state = state.with_result(result)
+    return state
+
+
+class TestStateBenchmarks:
+    """Cost of growing WorkflowState history."""
+
+    def test_step_cost_is_flat(self) -> None:
+        """The last steps of a long workflow should cost about the first.
+
+        Target: steps 4001-5000 under 3x the time of steps 1-1000.
+        """
+        results = [_result(i) for i in range(STEPS)]
+        state = WorkflowState(input="go")
+
+        start = time.perf_counter()
+        state = _grow(state, results[:1000])
+        early = time.perf_counter() - start
+
+        state = _grow(state, results[1000:4000])
+
+        start = time.perf_counter()
+        state = _grow(state, results[4000:])
+        late = time.perf_counter() - start
+
+        print(f"\nsteps 1-1000: {early * 1000:.1f}ms, 4001-5000: {late * 1000:.1f}ms")
+        assert len(state.history) == STEPS
+        assert late < early * 3
+
+    def test_history_memory_is_linear(self) -> None:
+        """Snapshots share one backing list instead of copying it.
+
+        Target: keeping every intermediate state allocates under 1KB per step.
+        """
+        results = [_result(i) for i in range(STEPS)]
+        snapshots = [WorkflowState(input="go")]
+
+        tracemalloc.start()
+        for result in results:
+            snapshots.append(snapshots[-1].with_result(result))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"\n{STEPS} snapshots: {peak / 1024:.0f}KB peak, {peak / STEPS:.0f}B/step")
+        assert snapshots[0].history == []
+        assert snapshots[10].history == results[:10]
+        assert peak / STEPS < 1024
+
+    @pytest.mark.asyncio
+    async def test_long_sequential_workflow(self, bench_agent: Agent) -> None:
+        """A 1000-step sequential run should stay under 5ms per step."""
+        steps = 1000
+        executor = SequentialExecutor(["bench"] * steps)
+
+        start = time.perf_counter()
+        state = await executor.execute({"bench": bench_agent}, WorkflowState(input="go"))
+        elapsed = time.perf_counter() - start
+
+        per_step_ms = elapsed / steps * 1000
+        print(f"\n{steps} steps: {elapsed * 1000:.0f}ms ({per_step_ms:.2f}ms/step)")
+        assert len(state.history) == steps
+        assert per_step_ms < 5
@@ -0,0 +1,114 @@
+"""Streaming throughput benchmarks.
+
+Measures the per-chunk cost of building stream chunks and of passing a
+token stream through ``Agent.stream``, with and without coalescing.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.streaming import FastStreamChunk, coalesce_chunks, validate_chunks
+from agentchord.core.types import Message, StreamChunk, Usage
+from benchmarks.conftest import BenchmarkProvider
+
+TOKENS = 20_000
+
+
+class TokenStreamProvider(BenchmarkProvider):
+    """Mock provider that streams one fast chunk per token."""
+
+    def __init__(self, tokens: int = TOKENS) -> None:
+        super().__init__()
+        self._tokens = tokens
+
+    def stream(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        return validate_chunks(self.stream_chunks(messages, **kwargs))
+
+    async def stream_chunks(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> AsyncIterator[FastStreamChunk]:
+        for _ in range(self._tokens):
+            yield FastStreamChunk(content="", delta="tok ")
+        yield FastStreamChunk(
+            content="",
+            delta="",
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=10, completion_tokens=self._tokens),
+        )
+
+
+class TestStreamBenchmarks:
+    """Stream chunk construction and throughput."""
+
+    def test_fast_chunk_construction(self) -> None:
+        """FastStreamChunk should be much cheaper to build than StreamChunk.
+
+        Target: at least 2x faster than the validated model.
+        """
+
+        def build(cls: Any) -> float:
+            start = time.perf_counter()
+            for _ in range(TOKENS):
+                cls(content="accumulated text", delta="text", finish_reason=None)
+            return time.perf_counter() - start
+
+        validated = min(build(StreamChunk) for _ in range(3))
+        fast = min(build(FastStreamChunk) for _ in range(3))
+        print(
+            f"\nStreamChunk: {validated / TOKENS * 1e6:.2f}us/chunk, "
+            f"FastStreamChunk: {fast / TOKENS * 1e6:.2f}us/chunk"
+        )
+        assert fast * 2 < validated
+
+    @pytest.mark.asyncio
+    async def test_agent_stream_throughput(self) -> None:
+        """Agent.stream should pass at least 100k chunks per second."""
+        agent = Agent(
+            name="bench", role="Benchmark", model="bench-model",
+            llm_provider=TokenStreamProvider(),
+        )
+
+        start = time.perf_counter()
+        count = 0
+        async for _ in agent.stream("go"):
+            count += 1
+        elapsed = time.perf_counter() - start
+
+        rate = count / elapsed
+        print(f"\nAgent.stream: {rate:,.0f} chunks/s")
+        assert count == TOKENS + 1
+        assert rate > 100_000
+
+    @pytest.mark.asyncio
+    async def test_coalesced_stream(self) -> None:
+        """Size-window coalescing should cut the chunk count without losing text."""
+        agent = Agent(
+            name="bench", role="Benchmark", model="bench-model",
+            llm_provider=TokenStreamProvider(),
+        )
+
+        start = time.perf_counter()
+        chunks = [c async for c in coalesce_chunks(agent.stream("go"), max_chars=256)]
+        elapsed = time.perf_counter() - start
+
+        print(f"\ncoalesced to {len(chunks)} chunks in {elapsed * 1000:.1f}ms")
+        assert len(chunks) <= TOKENS * 4 // 256 + 2
+        assert sum(len(c.delta) for c in chunks) == TOKENS * 4
@@ -0,0 +1,153 @@
+"""Vector store search benchmarks.
+
+Compares the numpy matrix backend of ``InMemoryVectorStore`` with the
+pure-Python fallback on the same random corpus, one batched search with
+a loop of single searches, and a cold start from a saved store with
+rebuilding it from chunks.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from agentchord.rag.types import Chunk
+from agentchord.rag.vectorstore.in_memory import NUMPY_AVAILABLE, InMemoryVectorStore
+
+VECTORS = 10_000
+DIMENSIONS = 256
+QUERIES = 5
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+def _vector(rng: random.Random) -> list[float]:
+    return [rng.uniform(-1, 1) for _ in range(DIMENSIONS)]
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[Chunk]:
+    rng = random.Random(0)
+    return [
+        Chunk(id=f"c{i}", content="", embedding=_vector(rng), metadata={"shard": i % 10})
+        for i in range(VECTORS)
+    ]
+
+
+async def _time_search(store: InMemoryVectorStore, queries: list[list[float]], **kwargs) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        await store.search(query, limit=10, **kwargs)
+    return (time.perf_counter() - start) / len(queries)
+
+
+class TestVectorStoreBenchmarks:
+    """Search latency of the in-memory backends."""
+
+    @pytest.mark.asyncio
+    async def test_matrix_search_latency(self, corpus: list[Chunk]) -> None:
+        """One search over 10k x 256 vectors.
+
+        Target: under 10ms per query and at least 20x faster than pure Python.
+        """
+        rng = random.Random(1)
+        queries = [_vector(rng) for _ in range(QUERIES)]
+        fast = InMemoryVectorStore(use_numpy=True)
+        slow = InMemoryVectorStore(use_numpy=False)
+        await fast.add(corpus)
+        await slow.add(corpus)
+
+        fast_s = await _time_search(fast, queries)
+        slow_s = await _time_search(slow, queries)
+
+        print(
+            f"\n{VECTORS}x{DIMENSIONS}: numpy {fast_s * 1000:.2f}ms, "
+            f"python {slow_s * 1000:.0f}ms ({slow_s / fast_s:.0f}x)"
+        )
+        assert fast_s < 0.01
+        assert slow_s / fast_s > 20
+
+    @pytest.mark.asyncio
+    async def test_search_after_deletes(self, corpus: list[Chunk]) -> None:
+        """Tombstoned rows should not slow searches down.
+
+        Target: with 20% of rows deleted, search stays under 10ms.
+        """
+        rng = random.Random(2)
+        queries = [_vector(rng) for _ in range(QUERIES)]
+        store = InMemoryVectorStore(use_numpy=True)
+        await store.add(corpus)
+        await store.delete([f"c{i}" for i in range(0, VECTORS, 5)])
+
+        elapsed = await _time_search(store, queries)
+        filtered = await _time_search(store, queries, filter={"shard": 3})
+
+        print(
+            f"\n{await store.count()} live rows: {elapsed * 1000:.2f}ms, "
+            f"filtered {filtered * 1000:.2f}ms"
+        )
+        assert elapsed < 0.01
+
+    @pytest.mark.asyncio
+    async def test_batch_search(self, corpus: list[Chunk]) -> None:
+        """100 queries through search_batch versus one search each.
+
+        Target: the batch is at least 2x faster than the loop.
+        """
+        rng = random.Random(3)
+        queries = [_vector(rng) for _ in range(100)]
+        store = InMemoryVectorStore(use_numpy=True)
+        await store.add(corpus)
+
+        start = time.perf_counter()
+        batch = await store.search_batch(queries, limit=10)
+        batch_s = time.perf_counter() - start
+
+        loop_s = await _time_search(store, queries) * len(queries)
+
+        print(
+            f"\n{len(queries)} queries: batch {batch_s * 1000:.1f}ms, "
+            f"loop {loop_s * 1000:.1f}ms ({loop_s / batch_s:.1f}x)"
+        )
+        assert len(batch) == len(queries)
+        assert loop_s / batch_s > 2
+
+    @pytest.mark.asyncio
+    async def test_cold_start(self, corpus: list[Chunk], tmp_path: Path) -> None:
+        """Load a saved 10k x 256 store versus rebuilding it from a JSON dump.
+
+        The dump holds chunks with their embeddings, so the rebuild skips
+        re-embedding and only parses and adds them.
+
+        Target: a memory-mapped load plus the first search is at least 2x
+        faster than the rebuild.
+        """
+        dump = tmp_path / "chunks.jsonl"
+        dump.write_text("\n".join(chunk.model_dump_json() for chunk in corpus))
+        store = InMemoryVectorStore(use_numpy=True)
+        await store.add(corpus)
+        await store.save(tmp_path / "store")
+        query = _vector(random.Random(4))
+
+        start = time.perf_counter()
+        rebuilt = InMemoryVectorStore(use_numpy=True)
+        await rebuilt.add([Chunk.model_validate_json(line) for line in dump.open()])
+        await rebuilt.search(query, limit=10)
+        rebuild_s = time.perf_counter() - start
+
+        timings = {}
+        for mmap in (True, False):
+            start = time.perf_counter()
+            loaded = await InMemoryVectorStore.load(tmp_path / "store", mmap=mmap)
+            results = await loaded.search(query, limit=10)
+            timings[mmap] = time.perf_counter() - start
+            assert len(results) == 10
+
+        print(
+            f"\ncold start: mmap {timings[True] * 1000:.0f}ms, "
+            f"read {timings[False] * 1000:.0f}ms, rebuild {rebuild_s * 1000:.0f}ms"
+        )
+        assert rebuild_s / timings[True] > 2
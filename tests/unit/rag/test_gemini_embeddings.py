@@ -1,6 +1,6 @@
 """Tests for GeminiEmbeddings provider.
 
-Tests the Gemini embedding provider implementation using mocked httpx.AsyncClient
+Tests the Gemini embedding provider implementation using a mocked shared HTTP client
 to avoid requiring actual API credentials or network calls.
 """
 
@@ -12,10 +12,11 @@ import httpx
 import pytest
 
 from agentchord.rag.embeddings.gemini import GeminiEmbeddings
+from agentchord.utils.http import HTTPClientManager
 
 
 class TestGeminiEmbeddings:
-    """Tests for GeminiEmbeddings with mocked httpx.AsyncClient."""
+    """Tests for GeminiEmbeddings with a mocked shared HTTP client."""
 
     def _mock_response(self, values: list[float]) -> MagicMock:
         """Create a mock httpx response with embedding data."""
@@ -55,11 +56,10 @@ class TestGeminiEmbeddings:
         """embed() sends POST to embedContent endpoint with correct payload."""
         expected = [0.1, 0.2, 0.3]
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=self._mock_response(expected))
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(
                 model="gemini-embedding-001", api_key="test-key"
@@ -69,9 +69,9 @@ class TestGeminiEmbeddings:
         assert result == expected
         mock_client.post.assert_awaited_once()
         call_args = mock_client.post.call_args
-        assert (
-            call_args[0][0]
-            == "https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:embedContent"
+        assert call_args[0][0] == (
+            "https://generativelanguage.googleapis.com/v1beta/models/"
+            "gemini-embedding-001:embedContent"
         )
         assert call_args.kwargs["params"] == {"key": "test-key"}
         assert call_args.kwargs["json"] == {
@@ -84,11 +84,10 @@ class TestGeminiEmbeddings:
         """embed() uses custom model name in URL and request body."""
         expected = [0.5, 0.6]
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=self._mock_response(expected))
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(model="gemini-embedding-001", api_key="test-key")
             result = await provider.embed("test text")
@@ -103,13 +102,12 @@ class TestGeminiEmbeddings:
         """embed_batch() with single item uses batchEmbedContents endpoint."""
         expected = [[0.1, 0.2, 0.3]]
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(
                 return_value=self._mock_batch_response(expected)
             )
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             result = await provider.embed_batch(["single text"])
@@ -121,13 +119,12 @@ class TestGeminiEmbeddings:
         """embed_batch() sends multiple texts to batchEmbedContents endpoint."""
         embeddings = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(
                 return_value=self._mock_batch_response(embeddings)
             )
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             result = await provider.embed_batch(["text a", "text b", "text c"])
@@ -158,11 +155,10 @@ class TestGeminiEmbeddings:
             batch_sizes.append(n)
             return self._mock_batch_response([single_emb] * n)
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(side_effect=mock_post)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             result = await provider.embed_batch(texts)
@@ -174,15 +170,14 @@ class TestGeminiEmbeddings:
 
     async def test_embed_error_handling_non_200(self):
         """embed() propagates HTTP errors when API returns non-200."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             error_resp = MagicMock()
             error_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "400 Bad Request", request=MagicMock(), response=error_resp
             )
             mock_client.post = AsyncMock(return_value=error_resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             with pytest.raises(httpx.HTTPStatusError):
@@ -190,13 +185,12 @@ class TestGeminiEmbeddings:
 
     async def test_embed_error_handling_network_error(self):
         """embed() propagates network errors from httpx."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(
                 side_effect=httpx.ConnectError("Connection failed")
             )
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             with pytest.raises(httpx.ConnectError):
@@ -204,15 +198,14 @@ class TestGeminiEmbeddings:
 
     async def test_embed_batch_error_handling(self):
         """embed_batch() propagates HTTP errors from API."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             error_resp = MagicMock()
             error_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "500 Internal Server Error", request=MagicMock(), response=error_resp
             )
             mock_client.post = AsyncMock(return_value=error_resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             with pytest.raises(httpx.HTTPStatusError):
@@ -220,13 +213,12 @@ class TestGeminiEmbeddings:
 
     async def test_embed_url_construction_with_model_name(self):
         """embed() constructs correct URL with model name."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(
                 return_value=self._mock_response([0.1, 0.2])
             )
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(model="custom-model-v2", api_key="test-key")
             await provider.embed("test")
@@ -239,13 +231,12 @@ class TestGeminiEmbeddings:
 
     async def test_embed_api_key_in_url_params(self):
         """embed() includes API key in query parameters."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(
                 return_value=self._mock_response([0.1, 0.2])
             )
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="my-secret-key-123")
             await provider.embed("test")
@@ -255,13 +246,12 @@ class TestGeminiEmbeddings:
 
     async def test_embed_batch_request_body_format(self):
         """embed_batch() sends requests array with correct structure."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(
                 return_value=self._mock_batch_response([[0.1], [0.2]])
             )
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(model="test-model", api_key="test-key")
             await provider.embed_batch(["text1", "text2"])
@@ -302,10 +292,9 @@ class TestGeminiEmbeddings:
 
     async def test_embed_batch_empty_list(self):
         """embed_batch() with empty list returns empty without API call."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = GeminiEmbeddings(api_key="test-key")
             result = await provider.embed_batch([])
@@ -0,0 +1,193 @@
+"""Unit tests for adaptive (AIMD) concurrency limiting."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentchord.errors.exceptions import RateLimitError, TimeoutError
+from agentchord.resilience.adaptive import AdaptiveConcurrencyLimiter
+from agentchord.resilience.config import ResilienceConfig
+from agentchord.resilience.retry import RetryPolicy
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    async def test_bounds_in_flight_calls(self) -> None:
+        """No more than `limit` calls should run at once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        active = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await asyncio.gather(*(limiter.execute(call) for _ in range(10)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+        assert limiter.waiting == 0
+
+    async def test_additive_increase_while_saturated(self) -> None:
+        """Healthy calls at the limit should grow it by about one per window."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+
+        async def call() -> str:
+            await asyncio.sleep(0.005)
+            return "ok"
+
+        await asyncio.gather(*(limiter.execute(call) for _ in range(12)))
+
+        assert 3 <= limiter.limit <= 6
+        assert limiter.stats.increases >= 1
+
+    async def test_no_increase_when_idle(self) -> None:
+        """Sequential calls don't use the limit, so it shouldn't grow."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        async def call() -> None:
+            return None
+
+        for _ in range(20):
+            await limiter.execute(call)
+
+        assert limiter.limit == 4
+
+    async def test_multiplicative_decrease_on_rate_limit(self) -> None:
+        """A rate limit error should halve the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        async def call() -> None:
+            raise RateLimitError("429", provider="mock")
+
+        with pytest.raises(RateLimitError):
+            await limiter.execute(call)
+
+        assert limiter.limit == 4
+        assert limiter.stats.overloads == 1
+
+    async def test_one_decrease_per_round_trip(self) -> None:
+        """Concurrent failures from the same window should cut only once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        async def call() -> None:
+            await asyncio.sleep(0.01)
+            raise TimeoutError("slow", provider="mock", timeout_seconds=1)
+
+        await asyncio.gather(
+            *(limiter.execute(call) for _ in range(4)), return_exceptions=True
+        )
+
+        assert limiter.limit == 4
+        assert limiter.stats.decreases == 1
+
+    async def test_never_below_min_limit(self) -> None:
+        """The limit should stay at or above min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2)
+        for _ in range(5):
+            limiter.record_overload()
+        assert limiter.limit == 2
+
+    async def test_latency_spike_decreases(self) -> None:
+        """A call much slower than the smoothed latency should cut the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_samples=3)
+        for _ in range(5):
+            limiter.record_success(0.1)
+
+        limiter.record_success(1.0)
+
+        assert limiter.limit == 4
+        assert limiter.stats.latency_spikes == 1
+
+    async def test_other_errors_do_not_change_limit(self) -> None:
+        """Non-overload errors should leave the limit alone."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        async def call() -> None:
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await limiter.execute(call)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_releases_nothing(self) -> None:
+        """Cancelling a queued call should not leak a slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        gate = asyncio.Event()
+
+        async def call() -> None:
+            await gate.wait()
+
+        first = asyncio.create_task(limiter.execute(call))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(limiter.execute(call))
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        gate.set()
+        await first
+
+        assert limiter.in_flight == 0
+        assert limiter.waiting == 0
+
+    def test_invalid_parameters(self) -> None:
+        """Invalid configuration should raise ValueError."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(backoff_ratio=1.5)
+
+    def test_stats_to_dict(self) -> None:
+        """Stats should expose the current limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=5)
+        assert limiter.stats.to_dict()["limit"] == 5
+
+
+class TestResilienceConfigConcurrency:
+    """Tests for adaptive concurrency in ResilienceConfig."""
+
+    async def test_disabled_by_default(self) -> None:
+        """Concurrency limiting should be opt-in."""
+        config = ResilienceConfig()
+        assert config.get_concurrency_limiter() is None
+
+    async def test_default_limiter_is_kept(self) -> None:
+        """The default limiter should persist between calls."""
+        config = ResilienceConfig(concurrency_limit_enabled=True)
+        assert config.get_concurrency_limiter() is config.get_concurrency_limiter()
+
+    async def test_execute_uses_limiter_per_attempt(self) -> None:
+        """Each retry attempt should report to the limiter."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        config = ResilienceConfig(
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0.001),
+            concurrency_limit_enabled=True,
+            concurrency_limiter=limiter,
+            timeout_enabled=False,
+        )
+        calls = 0
+
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RateLimitError("429", provider="mock")
+            return "ok"
+
+        assert await config.execute(flaky) == "ok"
+        assert limiter.limit == 4
+        assert limiter.stats.successes == 1
+        assert limiter.in_flight == 0
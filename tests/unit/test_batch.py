@@ -0,0 +1,254 @@
+"""Tests for batch execution (Agent.run_many / Workflow.run_many)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.batch import BatchProgress, run_batch
+from agentchord.core.state import WorkflowStatus
+from agentchord.core.types import LLMResponse, Message, Usage
+from agentchord.core.workflow import Workflow
+from agentchord.errors.exceptions import RateLimitError
+from agentchord.tracking.cost import CostTracker
+from tests.conftest import MockLLMProvider
+
+
+class EchoProvider(MockLLMProvider):
+    """Mock provider that echoes the user input after a per-input delay."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+        self._fail_on = fail_on
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        text = messages[-1].content
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.001 * (len(text) % 5))
+            if text == self._fail_on:
+                raise ValueError(f"bad input: {text}")
+            return LLMResponse(
+                content=f"echo:{text}",
+                model=self.model,
+                usage=Usage(prompt_tokens=10, completion_tokens=5),
+                finish_reason="stop",
+            )
+        finally:
+            self.active -= 1
+
+
+class TestRunBatch:
+    """Tests for the run_batch engine."""
+
+    async def test_bounded_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def work(x: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return x * 2
+
+        results = [r async for r in run_batch(work, range(20), concurrency=4)]
+
+        assert peak == 4
+        assert sorted(r.result for r in results) == [x * 2 for x in range(20)]
+
+    async def test_ordered_yields_input_order(self):
+        async def work(x: int) -> int:
+            await asyncio.sleep(0.001 * (5 - x % 5))
+            return x
+
+        results = [r async for r in run_batch(work, range(12), concurrency=3, ordered=True)]
+
+        assert [r.index for r in results] == list(range(12))
+        assert [r.result for r in results] == list(range(12))
+
+    async def test_errors_captured_per_item(self):
+        async def work(x: int) -> int:
+            if x == 2:
+                raise ValueError("boom")
+            return x
+
+        results = [r async for r in run_batch(work, range(4), ordered=True)]
+
+        assert [r.ok for r in results] == [True, True, False, True]
+        assert isinstance(results[2].error, ValueError)
+
+    async def test_inputs_consumed_lazily(self):
+        started: list[int] = []
+
+        async def source():
+            for i in range(100):
+                started.append(i)
+                yield i
+
+        async def work(x: int) -> int:
+            return x
+
+        batch = run_batch(work, source(), concurrency=2)
+        first = await batch.__anext__()
+        await batch.aclose()
+
+        assert first.ok
+        assert len(started) <= 3
+
+    async def test_progress_callback(self):
+        snapshots: list[tuple[int, int, int | None]] = []
+
+        async def on_progress(progress: BatchProgress) -> None:
+            snapshots.append((progress.completed, progress.failed, progress.total))
+
+        async def work(x: int) -> int:
+            if x == 0:
+                raise RuntimeError("x")
+            return x
+
+        [r async for r in run_batch(work, [0, 1, 2], on_progress=on_progress)]
+
+        assert [s[0] for s in snapshots] == [1, 2, 3]
+        assert snapshots[-1] == (3, 1, 3)
+
+    async def test_rate_limit_pauses_and_retries(self):
+        attempts: dict[int, int] = {}
+
+        async def work(x: int) -> int:
+            attempts[x] = attempts.get(x, 0) + 1
+            if x == 1 and attempts[x] == 1:
+                raise RateLimitError("slow down", provider="mock", retry_after=0.01)
+            return x
+
+        results = [r async for r in run_batch(work, range(3), ordered=True)]
+
+        assert all(r.ok for r in results)
+        assert results[1].attempts == 2
+
+    async def test_rate_limit_retries_exhausted(self):
+        async def work(x: int) -> int:
+            raise RateLimitError("slow down", provider="mock", retry_after=0.001)
+
+        results = [r async for r in run_batch(work, [1], max_rate_limit_retries=2)]
+
+        assert isinstance(results[0].error, RateLimitError)
+        assert results[0].attempts == 3
+
+    async def test_budget_stops_new_items(self):
+        tracker = CostTracker(budget_limit=0.01)
+
+        async def work(x: int) -> int:
+            tracker.track_usage("gpt-4o", usage=_usage(1000))
+            return x
+
+        progress_seen: list[BatchProgress] = []
+        results = [
+            r async for r in run_batch(
+                work, range(50), concurrency=1, cost_trackers=[tracker],
+                on_progress=progress_seen.append,
+            )
+        ]
+
+        assert len(results) < 50
+        assert progress_seen[-1].budget_exceeded
+
+    async def test_invalid_concurrency(self):
+        async def work(x: int) -> int:
+            return x
+
+        with pytest.raises(ValueError):
+            [r async for r in run_batch(work, [1], concurrency=0)]
+
+
+def _usage(tokens: int):
+    from agentchord.tracking.models import TokenUsage
+    return TokenUsage(prompt_tokens=tokens, completion_tokens=tokens)
+
+
+class TestAgentRunMany:
+    """Tests for Agent.run_many."""
+
+    async def test_run_many_yields_agent_results(self):
+        provider = EchoProvider(fail_on="b")
+        agent = Agent(name="a", role="r", llm_provider=provider)
+
+        results = [
+            r async for r in agent.run_many(["a", "b", "c", "d"], concurrency=2, ordered=True)
+        ]
+
+        assert [r.input for r in results] == ["a", "b", "c", "d"]
+        assert results[0].result.output == "echo:a"
+        assert not results[1].ok
+        assert provider.max_active <= 2
+
+    async def test_run_many_passes_kwargs(self):
+        provider = EchoProvider()
+        agent = Agent(name="a", role="r", llm_provider=provider)
+
+        results = [r async for r in agent.run_many(["x"], max_tool_rounds=1)]
+
+        assert results[0].ok
+
+
+class TestWorkflowRunMany:
+    """Tests for Workflow.run_many."""
+
+    async def test_workflow_run_many(self):
+        first = Agent(name="first", role="r", llm_provider=EchoProvider())
+        second = Agent(name="second", role="r", llm_provider=EchoProvider())
+        workflow = Workflow(agents=[first, second], flow="first -> second")
+
+        results = [
+            r async for r in workflow.run_many(["p", "q", "r"], concurrency=2, ordered=True)
+        ]
+
+        assert [r.result.status for r in results] == [WorkflowStatus.COMPLETED] * 3
+        assert results[0].result.output == "echo:echo:p"
+
+    async def test_workflow_rate_limit_pauses_and_retries(self):
+        class RateLimitedOnce(EchoProvider):
+            def __init__(self) -> None:
+                super().__init__()
+                self.calls = 0
+
+            async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+                self.calls += 1
+                if self.calls == 1:
+                    raise RateLimitError("slow down", provider="mock", retry_after=0.01)
+                return await super().complete(messages, **kwargs)
+
+        first = Agent(name="first", role="r", llm_provider=EchoProvider())
+        second = Agent(name="second", role="r", llm_provider=RateLimitedOnce())
+        workflow = Workflow(agents=[first, second], flow="first -> second")
+        snapshots: list[int] = []
+
+        results = [
+            r
+            async for r in workflow.run_many(
+                ["p"], on_progress=lambda p: snapshots.append(p.rate_limited)
+            )
+        ]
+
+        assert results[0].ok
+        assert results[0].attempts == 2
+        assert results[0].result.status == WorkflowStatus.COMPLETED
+        assert results[0].result.output == "echo:echo:p"
+        assert snapshots == [1]
+
+    async def test_workflow_other_errors_are_failed_results(self):
+        agent = Agent(name="a", role="r", llm_provider=EchoProvider(fail_on="bad"))
+        workflow = Workflow(agents=[agent], flow="a")
+
+        results = [r async for r in workflow.run_many(["ok", "bad"], ordered=True)]
+
+        assert [r.ok for r in results] == [True, True]
+        assert results[1].attempts == 1
+        assert results[1].result.status == WorkflowStatus.FAILED
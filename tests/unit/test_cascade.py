@@ -0,0 +1,276 @@
+"""Unit tests for CascadeProvider."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from agentchord.core.agent import Agent
+from agentchord.core.structured import OutputSchema
+from agentchord.core.types import LLMResponse, Message, MessageRole, ToolCall
+from agentchord.errors.exceptions import APIError
+from agentchord.llm.cascade import (
+    CascadeProvider,
+    confidence_verifier,
+    parse_confidence,
+)
+from tests.conftest import MockLLMProvider
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class FailingProvider(MockLLMProvider):
+    """Mock provider whose calls always fail."""
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        self.call_count += 1
+        raise APIError("unavailable", provider="mock", status_code=503)
+
+
+MESSAGES = [Message.user("question")]
+
+
+class TestCascadeProvider:
+    """Tests for CascadeProvider."""
+
+    async def test_cheap_answer_accepted(self) -> None:
+        cheap = MockLLMProvider(model="cheap", response_content='{"answer": "42"}')
+        strong = MockLLMProvider(model="strong", response_content='{"answer": "42"}')
+        cascade = CascadeProvider([cheap, strong], verifier=OutputSchema(Answer))
+
+        response = await cascade.complete(MESSAGES)
+
+        assert response.model == "cheap"
+        assert strong.call_count == 0
+        assert cascade.stats.escalation_rate == 0.0
+        assert cascade.current is cheap
+
+    async def test_escalates_on_schema_failure(self) -> None:
+        cheap = MockLLMProvider(model="cheap", response_content="not json")
+        strong = MockLLMProvider(model="strong", response_content='{"answer": "42"}')
+        cascade = CascadeProvider([cheap, strong], verifier=OutputSchema(Answer))
+
+        response = await cascade.complete(MESSAGES)
+
+        assert response.model == "strong"
+        assert cascade.current is strong
+        # Reported model and pricing stay on the first tier
+        assert cascade.model == "cheap"
+        stats = cascade.stats
+        assert stats.requests == 1
+        assert stats.escalated_requests == 1
+        assert stats.tiers[0].escalated == 1
+        assert stats.tiers[1].accepted == 1
+        # Both answers were paid for
+        assert stats.tiers[0].cost > 0
+        assert stats.cost == pytest.approx(stats.tiers[0].cost + stats.tiers[1].cost)
+        # ...and the returned response is billed for both
+        assert response.cost == pytest.approx(stats.cost)
+        assert response.usage.prompt_tokens == 20
+
+    async def test_last_tier_is_not_verified(self) -> None:
+        cheap = MockLLMProvider(model="cheap", response_content="bad")
+        strong = MockLLMProvider(model="strong", response_content="also bad")
+        cascade = CascadeProvider([cheap, strong], verifier=lambda r, m: False)
+
+        response = await cascade.complete(MESSAGES)
+
+        assert response.content == "also bad"
+
+    async def test_escalation_rate_over_requests(self) -> None:
+        answers = iter(["confidence: 0.9", "confidence: 0.2", "confidence: 0.95", "no idea"])
+
+        class Scripted(MockLLMProvider):
+            async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+                self._response_content = next(answers)
+                return await super().complete(messages, **kwargs)
+
+        cascade = CascadeProvider(
+            [Scripted(model="cheap"), MockLLMProvider(model="strong")],
+            verifier=confidence_verifier(0.7),
+        )
+        for _ in range(4):
+            await cascade.complete(MESSAGES)
+
+        assert cascade.stats.escalation_rate == 0.5
+        assert cascade.stats.tiers[0].escalation_rate == 0.5
+        assert cascade.stats.to_dict()["tiers"][1]["calls"] == 2
+
+    async def test_async_verifier_receives_messages(self) -> None:
+        seen: list[list[Message]] = []
+
+        async def verify(response: LLMResponse, messages: list[Message]) -> bool:
+            seen.append(messages)
+            return True
+
+        cascade = CascadeProvider(
+            [MockLLMProvider(model="cheap"), MockLLMProvider(model="strong")],
+            verifier=verify,
+        )
+        await cascade.complete(MESSAGES)
+
+        assert seen == [MESSAGES]
+
+    async def test_tool_calls_are_not_verified(self) -> None:
+        cheap = MockLLMProvider(
+            model="cheap", response_content="", tool_calls=[ToolCall(id="1", name="t")]
+        )
+        strong = MockLLMProvider(model="strong")
+        cascade = CascadeProvider([cheap, strong], verifier=lambda r, m: False)
+
+        response = await cascade.complete(MESSAGES)
+
+        assert response.tool_calls
+        assert strong.call_count == 0
+
+    async def test_escalates_on_error(self) -> None:
+        strong = MockLLMProvider(model="strong")
+        cascade = CascadeProvider(
+            [FailingProvider(model="cheap"), strong], verifier=lambda r, m: True
+        )
+
+        response = await cascade.complete(MESSAGES)
+
+        assert response.model == "strong"
+        assert cascade.stats.tiers[0].errors == 1
+
+    async def test_error_raised_without_escalate_on_error(self) -> None:
+        cascade = CascadeProvider(
+            [FailingProvider(model="cheap"), MockLLMProvider(model="strong")],
+            verifier=lambda r, m: True,
+            escalate_on_error=False,
+        )
+        with pytest.raises(APIError):
+            await cascade.complete(MESSAGES)
+
+    async def test_stream_yields_verified_answer(self) -> None:
+        cheap = MockLLMProvider(model="cheap", response_content="bad")
+        strong = MockLLMProvider(model="strong", response_content='{"answer": "ok"}')
+        cascade = CascadeProvider([cheap, strong], verifier=OutputSchema(Answer))
+
+        chunks = [c async for c in cascade.stream(MESSAGES)]
+
+        assert len(chunks) == 1
+        assert chunks[0].content == '{"answer": "ok"}'
+        assert chunks[0].usage is not None
+
+    async def test_with_agent(self) -> None:
+        cheap = MockLLMProvider(model="cheap", response_content="I think confidence: 30%")
+        strong = MockLLMProvider(model="strong", response_content="Sure. Confidence: 90%")
+        cascade = CascadeProvider([cheap, strong], verifier=confidence_verifier(0.8))
+        agent = Agent(name="a", role="r", llm_provider=cascade)
+
+        result = await agent.run("question")
+
+        assert result.output == "Sure. Confidence: 90%"
+        assert cascade.stats.escalated_requests == 1
+
+    async def test_agent_cost_includes_discarded_tiers(self) -> None:
+        from agentchord.tracking.cost import CostTracker
+
+        cheap = MockLLMProvider(model="cheap", response_content="no")
+        strong = MockLLMProvider(model="strong", response_content="yes")
+        cascade = CascadeProvider([cheap, strong], verifier=lambda r, m: r.content == "yes")
+        tracker = CostTracker()
+        agent = Agent(name="a", role="r", llm_provider=cascade, cost_tracker=tracker)
+
+        result = await agent.run("question")
+
+        assert result.cost == pytest.approx(cascade.stats.cost)
+        assert result.usage.total_tokens == 30
+        summary = tracker.get_summary()
+        assert summary.total_cost_usd == pytest.approx(cascade.stats.cost)
+        assert summary.total_tokens == 30
+
+    async def test_tools_converted_per_tier(self) -> None:
+        from agentchord.tools import tool
+
+        @tool(description="Look something up")
+        def lookup(query: str) -> str:
+            return query
+
+        class NamedProvider(MockLLMProvider):
+            def __init__(self, model: str, name: str) -> None:
+                super().__init__(model=model, response_content=model)
+                self.name = name
+                self.seen_tools: list[dict[str, Any]] = []
+
+            @property
+            def provider_name(self) -> str:
+                return self.name
+
+            async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+                self.seen_tools = kwargs["tools"]
+                return await super().complete(messages, **kwargs)
+
+        cheap = NamedProvider("gpt-4o-mini", "openai")
+        strong = NamedProvider("claude", "anthropic")
+        cascade = CascadeProvider([cheap, strong], verifier=lambda r, m: False)
+        agent = Agent(name="a", role="r", llm_provider=cascade, tools=[lookup])
+
+        await agent.run("question")
+
+        assert cheap.seen_tools[0]["function"]["name"] == "lookup"
+        assert strong.seen_tools[0]["input_schema"]["required"] == ["query"]
+
+    async def test_response_format_adapted_per_tier(self) -> None:
+        class RecordingProvider(MockLLMProvider):
+            def __init__(self, model: str, name: str, content: str) -> None:
+                super().__init__(model=model, response_content=content)
+                self.name = name
+                self.seen: list[tuple[list[Message], dict[str, Any]]] = []
+
+            @property
+            def provider_name(self) -> str:
+                return self.name
+
+            async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+                self.seen.append((messages, kwargs))
+                return await super().complete(messages, **kwargs)
+
+        cheap = RecordingProvider("gpt-4o-mini", "openai", "not json")
+        strong = RecordingProvider("claude", "anthropic", '{"answer": "42"}')
+        cascade = CascadeProvider([cheap, strong], verifier=OutputSchema(Answer))
+        agent = Agent(name="a", role="r", llm_provider=cascade)
+
+        result = await agent.run("question", output_schema=OutputSchema(Answer))
+
+        assert result.parsed_output == {"answer": "42"}
+        assert "response_format" in cheap.seen[0][1]
+        messages, kwargs = strong.seen[0]
+        assert "response_format" not in kwargs
+        assert messages[0].role == MessageRole.SYSTEM
+        assert '"answer"' in messages[0].content
+        assert messages[0].content.startswith(cheap.seen[0][0][0].content)
+
+    def test_requires_two_tiers(self) -> None:
+        with pytest.raises(ValueError):
+            CascadeProvider([MockLLMProvider()], verifier=lambda r, m: True)
+
+
+class TestParseConfidence:
+    """Tests for parse_confidence."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Confidence: 0.85", 0.85),
+            ("confidence = 70%", 0.7),
+            ('{"answer": "x", "confidence": 0.4}', 0.4),
+            ("CONFIDENCE: 95", 0.95),
+            ("confidence: 0.2 ... revised confidence: 0.9", 0.9),
+        ],
+    )
+    def test_formats(self, text: str, expected: float) -> None:
+        assert parse_confidence(text) == pytest.approx(expected)
+
+    def test_missing(self) -> None:
+        assert parse_confidence("the answer is 42") is None
+
+    def test_verifier_threshold_validation(self) -> None:
+        with pytest.raises(ValueError):
+            confidence_verifier(1.5)
@@ -0,0 +1,186 @@
+"""Tests for token estimation and budgeted context assembly."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.context import ContextBuilder
+from agentchord.core.conversation import Conversation
+from agentchord.core.types import MessageRole
+from agentchord.memory.base import MemoryEntry
+from agentchord.memory.conversation import ConversationMemory
+from agentchord.tools import tool
+from agentchord.utils.tokens import (
+    estimate_tokens,
+    get_context_window,
+    get_token_ratio,
+    truncate_to_tokens,
+)
+from tests.conftest import MockLLMProvider
+
+
+def _memory(*contents: str) -> ConversationMemory:
+    memory = ConversationMemory()
+    start = datetime(2025, 1, 1)
+    for i, content in enumerate(contents):
+        role = "user" if i % 2 == 0 else "assistant"
+        memory.add(MemoryEntry(content=content, role=role, timestamp=start + timedelta(seconds=i)))
+    return memory
+
+
+class TestTokenEstimation:
+    """Tests for agentchord.utils.tokens."""
+
+    def test_ascii_ratio_per_family(self) -> None:
+        text = "a" * 700
+        assert estimate_tokens(text, "gpt-4o-mini") == 175
+        assert estimate_tokens(text, "claude-3-5-sonnet") == 200
+        assert estimate_tokens("") == 0
+
+    def test_non_ascii_counted_per_character(self) -> None:
+        text = "안녕하세요" * 10
+        assert estimate_tokens(text, "claude-3-haiku") == 50
+        assert estimate_tokens(text, "gpt-4o") == 30
+
+    def test_family_lookup(self) -> None:
+        assert get_token_ratio("unknown") == (4.0, 1.0)
+        assert get_context_window("claude-3-opus") == 200_000
+        assert get_context_window("gpt-4") == 8_192
+        assert get_context_window("my-local-model") is None
+        assert get_context_window(None) is None
+
+    def test_truncate_keeps_start_and_end(self) -> None:
+        text = "START" + "x" * 10_000 + "END"
+        truncated = truncate_to_tokens(text, 100, "gpt-4o")
+
+        assert truncated.startswith("START")
+        assert truncated.endswith("END")
+        assert "tokens truncated" in truncated
+        assert estimate_tokens(truncated, "gpt-4o") <= 100
+
+    def test_truncate_short_text_unchanged(self) -> None:
+        assert truncate_to_tokens("short", 100) == "short"
+
+
+class TestContextBuilder:
+    """Tests for ContextBuilder."""
+
+    def test_keeps_newest_within_budget(self) -> None:
+        memory = _memory("a" * 400, "b" * 400, "c" * 400, "d" * 400)
+        builder = ContextBuilder(max_tokens=300, oversized="elide")
+
+        window = builder.build(system_prompt="sys", input="hi", memory=memory, model="gpt-4o")
+
+        history = [m.content[0] for m in window.messages[1:-1]]
+        assert history == ["c", "d"]
+        assert window.report.memory_entries == 2
+        assert window.report.dropped == 2
+        assert window.report.total <= 300
+
+    def test_chronological_order_and_roles(self) -> None:
+        window = ContextBuilder().build(
+            system_prompt="sys", input="now", memory=_memory("q", "a"), model="gpt-4o"
+        )
+        roles = [m.role for m in window.messages]
+        assert roles == [
+            MessageRole.SYSTEM, MessageRole.USER, MessageRole.ASSISTANT, MessageRole.USER,
+        ]
+        assert isinstance(window.messages, Conversation)
+
+    def test_oversized_entry_truncated(self) -> None:
+        memory = _memory("z" * 40_000, "small")
+        builder = ContextBuilder(max_entry_tokens=200)
+
+        window = builder.build(system_prompt="s", input="i", memory=memory, model="gpt-4o")
+
+        assert window.report.truncated == 1
+        assert "tokens truncated" in window.messages[1].content
+        assert window.report.memory < 250
+
+    def test_oversized_entry_elided(self) -> None:
+        memory = _memory("z" * 40_000, "small")
+        builder = ContextBuilder(max_entry_tokens=200, oversized="elide")
+
+        window = builder.build(system_prompt="s", input="i", memory=memory, model="gpt-4o")
+
+        assert window.messages[1].content == "[... 10000 tokens elided ...]"
+        assert window.messages[2].content == "small"
+        assert window.report.elided == 1
+
+    def test_partial_fit_truncated(self) -> None:
+        memory = _memory("x" * 4_000)
+        builder = ContextBuilder(max_tokens=500)
+
+        window = builder.build(system_prompt="s", input="i", memory=memory, model="gpt-4o")
+
+        assert window.report.memory_entries == 1
+        assert window.report.truncated == 1
+        assert window.report.total <= 500
+
+    def test_default_budget_reserves_output(self) -> None:
+        assert ContextBuilder().budget_for("gpt-4", max_output_tokens=1_000) == 7_192
+
+    def test_unknown_window_has_no_budget(self) -> None:
+        memory = _memory(*("x" * 40_000 for _ in range(4)))
+        window = ContextBuilder().build(
+            system_prompt="s", input="i", memory=memory, model="my-local-model"
+        )
+
+        assert window.report.budget is None
+        assert window.report.memory_entries == 4
+        assert window.report.truncated == 0
+
+    def test_tools_counted(self) -> None:
+        tools = [{"type": "function", "function": {"name": "search", "parameters": {}}}]
+        window = ContextBuilder().build(system_prompt="s", input="i", tools=tools)
+        assert window.report.tools > 0
+
+    def test_invalid_parameters(self) -> None:
+        with pytest.raises(ValueError):
+            ContextBuilder(max_tokens=0)
+        with pytest.raises(ValueError):
+            ContextBuilder(oversized="drop")  # type: ignore[arg-type]
+
+
+class TestAgentContext:
+    """Agent reports context sections in AgentResult.metadata."""
+
+    async def test_metadata_reports_sections(self) -> None:
+        @tool(description="Search the web")
+        def search(query: str) -> str:
+            return query
+
+        agent = Agent(
+            name="a",
+            role="r",
+            llm_provider=MockLLMProvider(),
+            memory=_memory("earlier question", "earlier answer"),
+            tools=[search],
+        )
+
+        result = await agent.run("hello")
+        context = result.metadata["context"]
+
+        assert context["memory_entries"] == 2
+        assert all(context["tokens"][k] > 0 for k in ("system", "memory", "input", "tools"))
+        assert context["tokens"]["total"] == sum(
+            context["tokens"][k] for k in ("system", "memory", "input", "tools")
+        )
+
+    async def test_huge_memory_entry_bounded(self) -> None:
+        memory = _memory("x" * 400_000, "ok")
+        agent = Agent(
+            name="a",
+            role="r",
+            llm_provider=MockLLMProvider(),
+            memory=memory,
+            context=ContextBuilder(max_tokens=2_000),
+        )
+
+        result = await agent.run("hi")
+
+        assert result.metadata["context"]["tokens"]["total"] <= 2_000
+        assert sum(len(m.content) for m in result.messages) < 10_000
@@ -0,0 +1,149 @@
+"""Tests for Conversation payload caching."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from agentchord.core.conversation import Conversation, convert_messages
+from agentchord.core.types import Message, MessageRole, ToolCall
+from agentchord.llm.anthropic import AnthropicProvider
+from agentchord.llm.ollama import OllamaProvider
+from agentchord.llm.openai import OpenAIProvider
+
+
+class CountingConverter:
+    """Converter that records which messages it converted."""
+
+    def __init__(self) -> None:
+        self.converted: list[str] = []
+
+    def __call__(self, message: Message) -> dict[str, Any]:
+        self.converted.append(message.content)
+        return {"role": message.role.value, "content": message.content}
+
+
+class TestConversation:
+    """Tests for Conversation.converted()."""
+
+    def test_only_new_messages_converted(self) -> None:
+        convert = CountingConverter()
+        conversation = Conversation([Message.system("sys"), Message.user("hi")])
+
+        first = conversation.converted("fmt", convert)
+        conversation.append(Message.assistant("hello"))
+        second = conversation.converted("fmt", convert)
+
+        assert convert.converted == ["sys", "hi", "hello"]
+        assert second[0] is first[0]
+        assert [p["content"] for p in second] == ["sys", "hi", "hello"]
+
+    def test_replaced_message_reconverted(self) -> None:
+        convert = CountingConverter()
+        conversation = Conversation([Message.system("old"), Message.user("hi")])
+        conversation.converted("fmt", convert)
+
+        conversation[0] = Message.system("new")
+        payloads = conversation.converted("fmt", convert)
+
+        assert payloads[0]["content"] == "new"
+        assert convert.converted == ["old", "hi", "new"]
+
+    def test_reassigned_field_reconverted(self) -> None:
+        convert = CountingConverter()
+        message = Message.user("draft")
+        conversation = Conversation([message])
+        conversation.converted("fmt", convert)
+
+        message.content = "final"
+
+        assert conversation.converted("fmt", convert)[0]["content"] == "final"
+
+    def test_formats_cached_separately(self) -> None:
+        a, b = CountingConverter(), CountingConverter()
+        conversation = Conversation([Message.user("hi")])
+        conversation.converted("a", a)
+        conversation.converted("b", b)
+        conversation.converted("a", a)
+        assert (a.converted, b.converted) == (["hi"], ["hi"])
+
+    def test_removed_messages_dropped_from_cache(self) -> None:
+        conversation = Conversation([Message.user("a"), Message.user("b")])
+        conversation.converted("fmt", CountingConverter())
+        conversation.pop()
+        conversation.converted("fmt", CountingConverter())
+        assert len(conversation._payloads["fmt"]) == 1
+
+    def test_copy_keeps_cache(self) -> None:
+        convert = CountingConverter()
+        conversation = Conversation([Message.user("hi")])
+        conversation.converted("fmt", convert)
+
+        clone = conversation.copy()
+        clone.append(Message.assistant("yo"))
+        clone.converted("fmt", convert)
+
+        assert isinstance(clone, Conversation)
+        assert convert.converted == ["hi", "yo"]
+        assert len(conversation) == 1
+
+    def test_plain_list_converts_every_time(self) -> None:
+        convert = CountingConverter()
+        messages = [Message.user("hi")]
+        convert_messages(messages, "fmt", convert)
+        convert_messages(messages, "fmt", convert)
+        assert convert.converted == ["hi", "hi"]
+
+
+class TestProviderConversion:
+    """Providers reuse cached payloads across tool rounds."""
+
+    def _rounds(self) -> Conversation:
+        return Conversation([
+            Message.system("sys"),
+            Message.user("go"),
+            Message(
+                role=MessageRole.ASSISTANT,
+                content="",
+                tool_calls=[ToolCall(id="1", name="t", arguments={"q": 1})],
+            ),
+            Message(role=MessageRole.TOOL, content="x" * 1000, tool_call_id="1"),
+        ])
+
+    def test_openai_payloads_reused(self) -> None:
+        provider = OpenAIProvider(api_key="k")
+        conversation = self._rounds()
+
+        first = provider._convert_messages(conversation)
+        conversation.append(Message.assistant("done"))
+        second = provider._convert_messages(conversation)
+
+        assert all(a is b for a, b in zip(first, second))
+        assert second[2]["tool_calls"][0]["function"]["arguments"] == '{"q": 1}'
+
+    def test_ollama_matches_uncached(self) -> None:
+        provider = OllamaProvider(model="ollama/llama3.2")
+        conversation = self._rounds()
+        provider._convert_messages(conversation)
+        assert provider._convert_messages(conversation) == provider._convert_messages(
+            list(conversation)
+        )
+
+    def test_anthropic_payloads_reused(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        conversation = self._rounds()
+
+        system, first = provider._extract_system_and_messages(conversation)
+        _, second = provider._extract_system_and_messages(conversation)
+
+        assert system == "sys"
+        assert len(first) == 3
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_anthropic_breakpoints_do_not_touch_cache(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        conversation = self._rounds()
+
+        provider._build_request(conversation, 0.7, 1024, {})
+        _, payloads = provider._extract_system_and_messages(conversation)
+
+        assert all("cache_control" not in block for block in payloads[1]["content"])
@@ -0,0 +1,223 @@
+"""Unit tests for DAGExecutor and the dependency graph flow syntax."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.executor import DAGExecutor, MergeStrategy
+from agentchord.core.state import WorkflowState, WorkflowStatus
+from agentchord.core.types import LLMResponse, Message
+from agentchord.core.workflow import FlowParser, Workflow
+from agentchord.errors.exceptions import (
+    AgentNotFoundInFlowError,
+    InvalidFlowError,
+    WorkflowExecutionError,
+)
+from tests.conftest import MockLLMProvider
+
+
+class Tracker:
+    """Records call order and peak concurrency across providers."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.finished: list[str] = []
+        self.inputs: dict[str, str] = {}
+
+
+class DelayProvider(MockLLMProvider):
+    """Mock provider that echoes its name after a delay."""
+
+    def __init__(self, name: str, tracker: Tracker, delay: float, fail: bool) -> None:
+        super().__init__(response_content=name)
+        self.name = name
+        self.tracker = tracker
+        self.delay = delay
+        self.fail = fail
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        tracker = self.tracker
+        tracker.inputs[self.name] = messages[-1].content
+        tracker.running += 1
+        tracker.peak = max(tracker.peak, tracker.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            tracker.running -= 1
+        if self.fail:
+            raise RuntimeError(f"{self.name} broke")
+        tracker.finished.append(self.name)
+        return await super().complete(messages, **kwargs)
+
+
+def make_agents(
+    tracker: Tracker,
+    delays: dict[str, float],
+    fail: tuple[str, ...] = (),
+) -> list[Agent]:
+    return [
+        Agent(
+            name=name,
+            role="test",
+            llm_provider=DelayProvider(name, tracker, delay, name in fail),
+        )
+        for name, delay in delays.items()
+    ]
+
+
+DIAMOND = "a -> b, a -> c, b -> d, c -> e, d + e -> f"
+
+
+class TestFlowParserDAG:
+    """Tests for FlowParser.parse_dag."""
+
+    def test_parses_edges_and_joins(self) -> None:
+        executor = FlowParser().parse_dag(DIAMOND, list("abcdef"))
+
+        assert executor.dependencies == {
+            "a": [],
+            "b": ["a"],
+            "c": ["a"],
+            "d": ["b"],
+            "e": ["c"],
+            "f": ["d", "e"],
+        }
+        assert executor.sinks == ["f"]
+
+    def test_chains_and_fan_in(self) -> None:
+        executor = FlowParser().parse_dag("a -> b -> c, x, a + x -> c", ["a", "b", "c", "x"])
+        assert executor.dependencies["c"] == ["b", "a", "x"]
+        assert executor.dependencies["x"] == []
+
+    def test_is_dag(self) -> None:
+        assert FlowParser.is_dag(DIAMOND)
+        assert FlowParser.is_dag("a + b -> c")
+        assert not FlowParser.is_dag("a -> [b, c] -> d")
+        assert not FlowParser.is_dag("a -> b")
+
+    def test_cycle_is_rejected(self) -> None:
+        with pytest.raises(InvalidFlowError, match="Cycle"):
+            FlowParser().parse_dag("a -> b, b -> c, c -> a", ["a", "b", "c"])
+        with pytest.raises(InvalidFlowError, match="itself"):
+            FlowParser().parse_dag("a -> a, b", ["a", "b"])
+
+    def test_unknown_agent(self) -> None:
+        with pytest.raises(AgentNotFoundInFlowError):
+            FlowParser().parse_dag("a -> z, a -> b", ["a", "b"])
+
+
+class TestDAGExecutor:
+    """Tests for DAGExecutor scheduling."""
+
+    async def test_branch_does_not_wait_for_sibling(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"a": 0, "b": 0, "c": 0.1, "d": 0})
+        workflow = Workflow(agents, flow="a -> b, a -> c, b -> d")
+
+        await workflow.run("go")
+
+        # d depends only on b, so it finishes while c is still running
+        assert tracker.finished.index("d") < tracker.finished.index("c")
+
+    async def test_join_merges_inputs_in_declared_order(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"a": 0, "b": 0, "c": 0.02, "d": 0, "e": 0, "f": 0})
+        workflow = Workflow(agents, flow=DIAMOND)
+
+        result = await workflow.run("go")
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert tracker.inputs["a"] == "go"
+        assert tracker.inputs["b"] == "a"
+        assert tracker.inputs["f"] == "d\n\ne"
+        assert result.output == "f"
+        assert len(result.state.history) == 6
+
+    async def test_per_join_merge_strategy(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"a": 0, "b": 0, "c": 0})
+        executor = DAGExecutor(
+            {"c": ["a", "b"]},
+            merge_strategies={"c": MergeStrategy.LAST},
+        )
+        await executor.execute({a.name: a for a in agents}, WorkflowState(input="go"))
+        assert tracker.inputs["c"] == "b"
+
+    async def test_multiple_sinks_are_merged(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"a": 0, "b": 0, "c": 0})
+        executor = DAGExecutor({"b": ["a"], "c": ["a"]}, merge_strategy=MergeStrategy.CONCAT)
+
+        state = await executor.execute({a.name: a for a in agents}, WorkflowState(input="go"))
+
+        assert state.output == "bc"
+
+    async def test_global_concurrency_limit(self) -> None:
+        tracker = Tracker()
+        delays = {name: 0.02 for name in ["root", "w1", "w2", "w3", "w4"]}
+        agents = make_agents(tracker, delays)
+        executor = DAGExecutor(
+            {name: ["root"] for name in ["w1", "w2", "w3", "w4"]},
+            max_concurrency=2,
+        )
+
+        await executor.execute({a.name: a for a in agents}, WorkflowState(input="go"))
+
+        assert tracker.peak == 2
+
+    async def test_per_agent_limit_holds_across_runs(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"slow": 0.02})
+        executor = DAGExecutor({"slow": []}, agent_concurrency={"slow": 1})
+        workflow = Workflow(agents, flow=executor)
+
+        await asyncio.gather(*(workflow.run(str(i)) for i in range(3)))
+
+        assert tracker.peak == 1
+
+    def test_limits_work_across_event_loops(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"slow": 0.01})
+        executor = DAGExecutor({"slow": []}, max_concurrency=1, agent_concurrency={"slow": 1})
+        workflow = Workflow(agents, flow=executor)
+
+        async def run() -> list[WorkflowState]:
+            return await asyncio.gather(*(workflow.run(str(i)) for i in range(3)))
+
+        for _ in range(2):
+            states = asyncio.run(run())
+            assert all(s.status == WorkflowStatus.COMPLETED for s in states)
+
+        assert tracker.peak == 1
+
+    async def test_failure_cancels_running_agents(self) -> None:
+        tracker = Tracker()
+        agents = make_agents(tracker, {"a": 0, "bad": 0, "slow": 1.0}, fail=("bad",))
+        executor = DAGExecutor({"bad": ["a"], "slow": ["a"]})
+
+        with pytest.raises(WorkflowExecutionError) as exc_info:
+            await asyncio.wait_for(
+                executor.execute({a.name: a for a in agents}, WorkflowState(input="go")), 0.5
+            )
+
+        assert exc_info.value.failed_agent == "bad"
+        assert "slow" not in tracker.finished
+        assert tracker.running == 0
+
+    async def test_missing_agent(self) -> None:
+        executor = DAGExecutor({"b": ["a"]})
+        with pytest.raises(AgentNotFoundInFlowError):
+            await executor.execute({}, WorkflowState(input="go"))
+
+    def test_validation(self) -> None:
+        with pytest.raises(InvalidFlowError):
+            DAGExecutor({"a": ["b"], "b": ["a"]})
+        with pytest.raises(ValueError):
+            DAGExecutor({"a": []}, max_concurrency=0)
+        with pytest.raises(ValueError):
+            DAGExecutor({"a": []}, agent_concurrency={"a": 0})
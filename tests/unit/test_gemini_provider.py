@@ -6,6 +6,7 @@ from agentchord.llm.gemini import GeminiProvider, MODEL_COSTS
 from agentchord.core.types import Message, MessageRole, ToolCall
 from agentchord.errors.exceptions import APIError, AuthenticationError, MissingAPIKeyError
 from agentchord.errors.exceptions import TimeoutError as AgentChordTimeoutError
+from agentchord.utils.http import HTTPClientManager
 
 
 class TestGeminiProviderInit:
@@ -64,10 +65,8 @@ class TestGeminiComplete:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="test-key")
             messages = [Message(role=MessageRole.USER, content="Hi")]
             result = await provider.complete(messages)
@@ -97,10 +96,8 @@ class TestGeminiComplete:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="test-key")
             messages = [Message(role=MessageRole.USER, content="Search")]
             result = await provider.complete(messages)
@@ -121,10 +118,8 @@ class TestGeminiComplete:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="my-secret-key")
             await provider.complete([Message(role=MessageRole.USER, content="Hi")])
 
@@ -140,10 +135,8 @@ class TestGeminiErrors:
     async def test_connect_error(self):
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="test-key")
             with pytest.raises(APIError, match="Failed to connect"):
                 await provider.complete([Message(role=MessageRole.USER, content="Hi")])
@@ -152,10 +145,8 @@ class TestGeminiErrors:
     async def test_timeout_error(self):
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("timed out"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="test-key")
             with pytest.raises(AgentChordTimeoutError):
                 await provider.complete([Message(role=MessageRole.USER, content="Hi")])
@@ -170,10 +161,8 @@ class TestGeminiErrors:
         mock_client.post = AsyncMock(
             side_effect=httpx.HTTPStatusError("401", request=MagicMock(), response=mock_response)
         )
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="bad-key")
             with pytest.raises(AuthenticationError):
                 await provider.complete([Message(role=MessageRole.USER, content="Hi")])
@@ -188,10 +177,8 @@ class TestGeminiErrors:
         mock_client.post = AsyncMock(
             side_effect=httpx.HTTPStatusError("500", request=MagicMock(), response=mock_response)
         )
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.gemini.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = GeminiProvider(api_key="test-key")
             with pytest.raises(APIError, match="500"):
                 await provider.complete([Message(role=MessageRole.USER, content="Hi")])
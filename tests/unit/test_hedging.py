@@ -0,0 +1,299 @@
+"""Unit tests for hedged requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.types import LLMResponse, Message
+from agentchord.resilience.config import ResilienceConfig
+from agentchord.resilience.hedge import HedgePolicy
+from agentchord.tracking.cost import CostTracker
+from tests.conftest import MockLLMProvider
+
+
+class SlowProvider(MockLLMProvider):
+    """Mock provider that takes `latency` seconds per call."""
+
+    def __init__(self, model: str, latency: float, content: str = "ok") -> None:
+        super().__init__(model=model, response_content=content)
+        self.latency = latency
+        self.cancelled = 0
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return await super().complete(messages, **kwargs)
+
+
+class TestHedgePolicy:
+    """Tests for HedgePolicy."""
+
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        policy = HedgePolicy(delay=0.05)
+        hedge_calls = 0
+
+        async def primary() -> str:
+            return "primary"
+
+        async def hedge() -> str:
+            nonlocal hedge_calls
+            hedge_calls += 1
+            return "hedge"
+
+        assert await policy.execute(primary, hedge) == "primary"
+        assert hedge_calls == 0
+        assert policy.stats.hedged == 0
+        assert policy.stats.primary_wins == 1
+
+    async def test_slow_primary_loses_and_is_cancelled(self) -> None:
+        policy = HedgePolicy(delay=0.01)
+        cancelled = asyncio.Event()
+
+        async def primary() -> str:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "primary"
+
+        async def hedge() -> str:
+            return "hedge"
+
+        assert await policy.execute(primary, hedge) == "hedge"
+        assert cancelled.is_set()
+        stats = policy.stats
+        assert (stats.requests, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+        assert stats.hedge_rate == 1.0
+
+    async def test_primary_still_wins_after_hedge_fires(self) -> None:
+        policy = HedgePolicy(delay=0.01)
+
+        async def primary() -> str:
+            await asyncio.sleep(0.03)
+            return "primary"
+
+        async def hedge() -> str:
+            await asyncio.sleep(1)
+            return "hedge"
+
+        assert await policy.execute(primary, hedge) == "primary"
+        assert policy.stats.hedged == 1
+        assert policy.stats.primary_wins == 1
+
+    async def test_failed_leg_falls_back_to_other(self) -> None:
+        policy = HedgePolicy(delay=0.01)
+
+        async def primary() -> str:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("primary down")
+
+        async def hedge() -> str:
+            await asyncio.sleep(0.05)
+            return "hedge"
+
+        assert await policy.execute(primary, hedge) == "hedge"
+
+    async def test_both_fail_raises_primary_error(self) -> None:
+        policy = HedgePolicy(delay=0.01)
+
+        async def primary() -> str:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("primary down")
+
+        async def hedge() -> str:
+            raise ValueError("hedge down")
+
+        with pytest.raises(RuntimeError, match="primary down"):
+            await policy.execute(primary, hedge)
+        assert policy.stats.failures == 1
+
+    async def test_outer_cancellation_cancels_both_legs(self) -> None:
+        policy = HedgePolicy(delay=0.01)
+        cancelled: list[str] = []
+
+        def leg(name: str):
+            async def call() -> str:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+                return name
+            return call
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(policy.execute(leg("primary"), leg("hedge")), 0.05)
+        assert sorted(cancelled) == ["hedge", "primary"]
+
+    def test_delay_follows_rolling_percentile(self) -> None:
+        policy = HedgePolicy(initial_delay=3.0, percentile=0.9, min_samples=10)
+        assert policy.delay == 3.0
+
+        for i in range(1, 11):
+            policy.record_latency(i / 10)
+
+        assert policy.delay == pytest.approx(0.9)
+
+    def test_delay_is_clamped(self) -> None:
+        policy = HedgePolicy(min_delay=0.5, max_delay=2.0, min_samples=1)
+        policy.record_latency(0.1)
+        assert policy.delay == 0.5
+
+        policy.reset()
+        policy.record_latency(10.0)
+        assert policy.delay == 2.0
+
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=0)
+        with pytest.raises(ValueError):
+            HedgePolicy(delay=-1)
+        with pytest.raises(ValueError):
+            HedgePolicy(min_delay=2.0, max_delay=1.0)
+
+
+class TestResilienceConfigHedging:
+    """Tests for the hedging layer in ResilienceConfig."""
+
+    async def test_hedge_layer_used_when_enabled(self) -> None:
+        config = ResilienceConfig(
+            hedging_enabled=True,
+            hedge_policy=HedgePolicy(delay=0.01),
+            retry_enabled=False,
+        )
+
+        async def primary() -> str:
+            await asyncio.sleep(1)
+            return "primary"
+
+        async def hedge() -> str:
+            return "hedge"
+
+        assert await config.execute(primary, hedge=hedge) == "hedge"
+
+    async def test_hedge_ignored_when_disabled(self) -> None:
+        config = ResilienceConfig(retry_enabled=False)
+
+        async def primary() -> str:
+            await asyncio.sleep(0.02)
+            return "primary"
+
+        async def hedge() -> str:
+            return "hedge"
+
+        assert await config.execute(primary, hedge=hedge) == "primary"
+        assert config.get_hedge_policy() is None
+
+    def test_default_policy_is_kept(self) -> None:
+        config = ResilienceConfig(hedging_enabled=True)
+        assert config.get_hedge_policy() is config.get_hedge_policy()
+
+
+class TestAgentHedging:
+    """Tests for hedged LLM calls in Agent."""
+
+    def _agent(
+        self, primary: SlowProvider, backup: SlowProvider | None, tracker: CostTracker
+    ) -> Agent:
+        return Agent(
+            name="hedger",
+            role="test",
+            model=primary.model,
+            llm_provider=primary,
+            cost_tracker=tracker,
+            resilience=ResilienceConfig(
+                hedging_enabled=True,
+                hedge_policy=HedgePolicy(backup, delay=0.01),
+                retry_enabled=False,
+            ),
+        )
+
+    async def test_hedge_winner_and_cancelled_primary_are_tracked(self) -> None:
+        primary = SlowProvider("gpt-4o", latency=1.0, content="slow")
+        backup = SlowProvider("gpt-4o-mini", latency=0.0, content="fast")
+        tracker = CostTracker()
+        agent = self._agent(primary, backup, tracker)
+
+        result = await agent.run("hello")
+
+        assert result.output == "fast"
+        assert primary.cancelled == 1
+        assert result.metadata["hedged_requests"] == 1
+
+        entries = {e.metadata["hedge"]: e for e in tracker.get_entries()}
+        assert set(entries) == {"won", "lost"}
+        assert entries["won"].model == "gpt-4o-mini"
+        assert entries["won"].usage.prompt_tokens == 10
+        # The cancelled call is billed on an estimate of its prompt
+        assert entries["lost"].model == "gpt-4o"
+        assert entries["lost"].metadata["estimated"] is True
+        assert entries["lost"].usage.prompt_tokens > 0
+        assert entries["lost"].usage.completion_tokens == 0
+
+        # Both calls count towards the run's cost; usage is the answer's
+        assert result.cost == pytest.approx(result.metadata["hedge_cost"])
+        assert result.usage.prompt_tokens == 10
+
+    async def test_primary_winner_and_cancelled_hedge_are_tracked(self) -> None:
+        primary = SlowProvider("gpt-4o", latency=0.03, content="primary")
+        backup = SlowProvider("gpt-4o-mini", latency=1.0, content="backup")
+        tracker = CostTracker()
+        agent = self._agent(primary, backup, tracker)
+
+        result = await agent.run("hello")
+
+        assert result.output == "primary"
+        assert backup.cancelled == 1
+        entries = tracker.get_entries()
+        assert len(entries) == 2
+        hedge_entry = next(e for e in entries if e.metadata.get("hedge"))
+        assert hedge_entry.model == "gpt-4o-mini"
+        assert hedge_entry.metadata["hedge"] == "lost"
+        run_entry = next(e for e in entries if not e.metadata.get("hedge"))
+        assert run_entry.model == "gpt-4o"
+        assert run_entry.usage.prompt_tokens == 10
+
+    async def test_cached_hedge_winner_counted_once(self) -> None:
+        class CachedBackup(SlowProvider):
+            async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+                response = await super().complete(messages, **kwargs)
+                return response.model_copy(update={"cache_hit": True})
+
+        primary = SlowProvider("gpt-4o", latency=1.0, content="slow")
+        backup = CachedBackup("gpt-4o-mini", latency=0.0, content="cached")
+        tracker = CostTracker()
+        agent = self._agent(primary, backup, tracker)
+
+        result = await agent.run("hello")
+
+        assert result.output == "cached"
+        assert result.metadata["hedged_requests"] == 1
+        entries = tracker.get_entries()
+        assert [e.metadata.get("hedge") for e in entries if e.cache_hit] == [None]
+        assert not any(e.metadata.get("hedge") == "won" for e in entries)
+        # Only the cancelled primary costs anything
+        assert [e.metadata.get("hedge") for e in entries if not e.cache_hit] == ["lost"]
+        assert result.cost == pytest.approx(result.metadata["hedge_cost"])
+        assert result.metadata["cache_hits"] == 1
+        assert result.usage.prompt_tokens == 10
+
+    async def test_no_hedge_tracks_single_call(self) -> None:
+        primary = SlowProvider("gpt-4o", latency=0.0)
+        backup = SlowProvider("gpt-4o-mini", latency=0.0)
+        tracker = CostTracker()
+        agent = self._agent(primary, backup, tracker)
+
+        result = await agent.run("hello")
+
+        assert backup.call_count == 0
+        assert result.metadata["hedged_requests"] == 0
+        assert result.metadata["hedge_cost"] == 0.0
+        assert len(tracker.get_entries()) == 1
@@ -0,0 +1,297 @@
+"""Tests for the shared HTTP client manager."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.workflow import Workflow
+from agentchord.utils.http import (
+    HTTPClientManager,
+    _PooledClient,
+    _origin,
+    get_http_client,
+    get_http_client_manager,
+)
+
+
+def _mock_transport_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _pooled_mock_client(handler) -> _PooledClient:
+    return _PooledClient(transport=httpx.MockTransport(handler))
+
+
+class TestOrigin:
+    """Tests for URL origin normalization."""
+
+    def test_default_ports(self):
+        assert _origin("https://api.example.com/v1/x") == "https://api.example.com:443"
+        assert _origin("http://localhost/api") == "http://localhost:80"
+
+    def test_explicit_port(self):
+        assert _origin("http://localhost:11434/v1") == "http://localhost:11434"
+
+    def test_relative_url_rejected(self):
+        with pytest.raises(ValueError, match="absolute"):
+            _origin("/v1/chat")
+
+
+class TestHTTPClientManager:
+    """Tests for HTTPClientManager."""
+
+    async def test_same_origin_shares_client(self):
+        manager = HTTPClientManager()
+        a = manager.get_client("http://localhost:11434/v1/chat/completions")
+        b = manager.get_client("http://localhost:11434/api/embeddings")
+        c = manager.get_client("https://example.com/")
+
+        assert a is b
+        assert a is not c
+        await manager.aclose()
+
+    async def test_aclose_closes_and_recreates(self):
+        manager = HTTPClientManager()
+        client = manager.get_client("https://example.com")
+
+        await manager.aclose()
+
+        assert client.is_closed
+        assert manager.get_client("https://example.com") is not client
+        await manager.aclose()
+
+    def test_clients_are_per_event_loop(self):
+        manager = HTTPClientManager()
+
+        async def _get() -> httpx.AsyncClient:
+            client = manager.get_client("https://example.com")
+            assert manager.get_client("https://example.com") is client
+            return client
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get())
+
+        assert first is not second
+
+    async def test_configure_applies_to_new_clients(self):
+        manager = HTTPClientManager()
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        manager.configure(limits=limits, timeout=10.0)
+
+        assert manager.limits is limits
+        with patch("agentchord.utils.http._PooledClient") as MockClient:
+            manager.get_client("https://example.com")
+
+        kwargs = MockClient.call_args.kwargs
+        assert kwargs["limits"] is limits
+        assert kwargs["timeout"] == 10.0
+        assert kwargs["http2"] is False
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("h2") is not None, reason="h2 is installed"
+    )
+    async def test_http2_without_h2_raises(self):
+        manager = HTTPClientManager(http2=True)
+
+        with pytest.raises(ImportError, match="agentchord\\[http2\\]"):
+            manager.get_client("https://example.com")
+
+    async def test_warmup_reports_reachable_origins(self):
+        manager = HTTPClientManager()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "down.example.com":
+                raise httpx.ConnectError("refused", request=request)
+            assert request.method == "HEAD"
+            return httpx.Response(404)
+
+        with patch.object(
+            manager, "_create_client", side_effect=lambda: _mock_transport_client(handler)
+        ):
+            warmed = await manager.warmup([
+                "https://up.example.com/v1/models",
+                "https://up.example.com/v1/chat",
+                "https://down.example.com",
+            ])
+
+        assert warmed == ["https://up.example.com:443"]
+        await manager.aclose()
+
+    async def test_release_closes_after_last_user(self):
+        manager = HTTPClientManager()
+        manager.acquire()
+        manager.acquire()
+        client = manager.get_client("https://example.com")
+
+        await manager.release()
+        assert not client.is_closed
+        assert manager.users == 1
+
+        await manager.release()
+        assert client.is_closed
+        assert manager.users == 0
+
+    async def test_release_waits_for_in_flight_request(self):
+        manager = HTTPClientManager()
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            started.set()
+            await finish.wait()
+            return httpx.Response(200, text="ok")
+
+        with patch.object(
+            manager, "_create_client", side_effect=lambda: _pooled_mock_client(handler)
+        ):
+            client = manager.get_client("https://example.com")
+
+        # A component outside any agent context is mid-request
+        request = asyncio.create_task(client.get("https://example.com/slow"))
+        await started.wait()
+
+        manager.acquire()
+        await manager.release()
+
+        assert not client.is_closed
+        finish.set()
+        response = await request
+        assert response.text == "ok"
+        assert client.is_closed
+        assert manager.get_client("https://example.com") is not client
+        await manager.aclose()
+
+    async def test_release_waits_for_open_stream(self):
+        manager = HTTPClientManager()
+
+        async def body():
+            yield b"chunk"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        with patch.object(
+            manager, "_create_client", side_effect=lambda: _pooled_mock_client(handler)
+        ):
+            client = manager.get_client("https://example.com")
+
+        manager.acquire()
+        async with client.stream("GET", "https://example.com/stream") as response:
+            await manager.release()
+            assert not client.is_closed
+            assert await response.aread() == b"chunk"
+
+        assert client.is_closed
+
+    async def test_release_closes_idle_clients_immediately(self):
+        manager = HTTPClientManager()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200)
+
+        with patch.object(
+            manager, "_create_client", side_effect=lambda: _pooled_mock_client(handler)
+        ):
+            client = manager.get_client("https://example.com")
+
+        await client.get("https://example.com/")
+        assert client.in_flight == 0
+
+        manager.acquire()
+        await manager.release()
+        assert client.is_closed
+
+    async def test_response_cookies_not_shared(self):
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=abc; Path=/"})
+
+        client = _pooled_mock_client(handler)
+        await client.get("https://example.com/login")
+        await client.get("https://example.com/other")
+
+        assert seen == [None, None]
+        assert not client.cookies
+        await client.aclose()
+
+    async def test_aclose_closes_busy_clients(self):
+        manager = HTTPClientManager()
+        client = manager.get_client("https://example.com")
+        client.in_flight = 1
+
+        await manager.aclose()
+        assert client.is_closed
+
+
+class TestDefaultManager:
+    """Tests for the process-wide manager and agent lifecycle."""
+
+    async def test_get_http_client_uses_default_manager(self):
+        client = get_http_client("https://example.com/a")
+        assert client is get_http_client_manager().get_client("https://example.com/b")
+
+    async def test_agent_context_acquires_and_releases(self):
+        manager = get_http_client_manager()
+        before = manager.users
+        agent = Agent(name="a", role="r", model="gpt-4o-mini")
+
+        async with agent:
+            assert manager.users == before + 1
+            # Re-entering does not acquire twice
+            await agent.__aenter__()
+            assert manager.users == before + 1
+
+        assert manager.users == before
+        await agent.close()
+        assert manager.users == before
+
+    async def test_close_releases_after_plain_run(self):
+        from tests.conftest import MockLLMProvider
+
+        manager = get_http_client_manager()
+        before = manager.users
+        agent = Agent(name="a", role="r", llm_provider=MockLLMProvider())
+
+        await agent.run("hi")
+        assert manager.users == before + 1
+        await agent.close()
+        assert manager.users == before
+
+        # A closed agent that runs again holds the clients until closed again
+        await agent.run("again")
+        assert manager.users == before + 1
+        await agent.close()
+        assert manager.users == before
+
+    async def test_workflow_context_acquires_and_releases(self):
+        manager = get_http_client_manager()
+        before = manager.users
+        workflow = Workflow(
+            agents=[Agent(name="a", role="r", model="gpt-4o-mini")], flow="a"
+        )
+
+        async with workflow:
+            # One hold for the workflow itself plus one per agent
+            assert manager.users == before + 2
+
+        assert manager.users == before
+        await workflow.close()
+        assert manager.users == before
+
+    async def test_empty_workflow_context_still_acquires(self):
+        manager = get_http_client_manager()
+        before = manager.users
+        workflow = Workflow(agents=[])
+
+        async with workflow:
+            assert manager.users == before + 1
+
+        assert manager.users == before
@@ -0,0 +1,261 @@
+"""Tests for the exact-match LLM response cache."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.types import LLMResponse, Message, ToolCall, Usage
+from agentchord.llm.cache import (
+    AIOSQLITE_AVAILABLE,
+    CachedProvider,
+    ResponseCache,
+    SQLiteResponseStore,
+    make_cache_key,
+)
+from agentchord.tracking.cost import CostTracker
+from tests.conftest import MockLLMProvider
+
+
+def _response(content: str = "cached answer") -> LLMResponse:
+    return LLMResponse(
+        content=content,
+        model="mock-model",
+        usage=Usage(prompt_tokens=10, completion_tokens=5),
+        finish_reason="stop",
+    )
+
+
+class TestMakeCacheKey:
+    """Tests for canonical cache keys."""
+
+    def test_identical_requests_share_key(self):
+        messages = [Message.system("sys"), Message.user("hi")]
+        a = make_cache_key("mock", "m", messages, temperature=0, tools=[{"b": 1, "a": 2}])
+        b = make_cache_key("mock", "m", list(messages), tools=[{"a": 2, "b": 1}], temperature=0)
+        assert a == b
+
+    def test_any_difference_changes_key(self):
+        messages = [Message.user("hi")]
+        base = make_cache_key("mock", "m", messages, temperature=0)
+
+        assert make_cache_key("mock", "m2", messages, temperature=0) != base
+        assert make_cache_key("other", "m", messages, temperature=0) != base
+        assert make_cache_key("mock", "m", [Message.user("hi!")], temperature=0) != base
+        assert make_cache_key("mock", "m", messages, temperature=0.5) != base
+
+
+class TestResponseCache:
+    """Tests for the in-memory LRU tier."""
+
+    async def test_miss_then_hit(self):
+        cache = ResponseCache()
+        assert await cache.get("k") is None
+
+        await cache.set("k", _response())
+        hit = await cache.get("k")
+
+        assert hit is not None and hit.content == "cached answer"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    async def test_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+        await cache.set("a", _response("a"))
+        await cache.set("b", _response("b"))
+        await cache.get("a")  # a is now most recently used
+        await cache.set("c", _response("c"))
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    async def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=10)
+        await cache.set("k", _response())
+
+        with patch("agentchord.llm.cache.time.time", return_value=time.time() + 11):
+            assert await cache.get("k") is None
+
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_size=0)
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=0)
+
+
+@pytest.mark.skipif(not AIOSQLITE_AVAILABLE, reason="aiosqlite not installed")
+class TestSQLiteResponseStore:
+    """Tests for the persistent tier."""
+
+    async def test_store_survives_new_cache(self, tmp_path):
+        db = tmp_path / "cache.db"
+        first = ResponseCache(store=SQLiteResponseStore(db))
+        await first.set("k", _response())
+
+        second = ResponseCache(store=SQLiteResponseStore(db))
+        hit = await second.get("k")
+
+        assert hit is not None and hit.content == "cached answer"
+        assert second.stats.store_hits == 1
+        # Promoted into memory
+        await second.get("k")
+        assert second.stats.memory_hits == 1
+
+    async def test_expired_store_entry_removed(self):
+        store = SQLiteResponseStore()
+        await store.set("k", _response(), expires_at=time.time() - 1)
+        cache = ResponseCache(store=store)
+
+        assert await cache.get("k") is None
+        assert await store.get("k") is None
+        assert cache.stats.expirations == 1
+        await store.close()
+
+
+class TestCachedProvider:
+    """Tests for the CachedProvider wrapper."""
+
+    async def test_complete_served_from_cache(self):
+        inner = MockLLMProvider()
+        provider = CachedProvider(inner)
+        messages = [Message.user("hello")]
+
+        first = await provider.complete(messages, temperature=0)
+        second = await provider.complete(messages, temperature=0)
+
+        assert inner.call_count == 1
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert second.content == first.content
+        assert provider.cache.stats.saved_tokens == 15
+        assert provider.cache.stats.saved_cost_usd == pytest.approx(
+            inner.calculate_cost(10, 5)
+        )
+
+    async def test_nonzero_temperature_not_cached_by_default(self):
+        inner = MockLLMProvider()
+        provider = CachedProvider(inner)
+
+        await provider.complete([Message.user("hi")], temperature=0.7)
+        await provider.complete([Message.user("hi")], temperature=0.7)
+
+        assert inner.call_count == 2
+        assert provider.cache.stats.requests == 0
+
+    async def test_only_deterministic_false_caches_everything(self):
+        inner = MockLLMProvider()
+        provider = CachedProvider(inner, only_deterministic=False)
+
+        await provider.complete([Message.user("hi")], temperature=0.7)
+        await provider.complete([Message.user("hi")], temperature=0.7)
+
+        assert inner.call_count == 1
+
+    async def test_stream_replays_cached_response(self):
+        inner = MockLLMProvider(response_content="one two three")
+        provider = CachedProvider(inner)
+        messages = [Message.user("hi")]
+        await provider.complete(messages, temperature=0)
+
+        chunks = [c async for c in provider.stream(messages, temperature=0)]
+
+        assert inner.call_count == 1
+        assert [c.delta for c in chunks] == ["one ", "two ", "three"]
+        assert chunks[-1].content == "one two three"
+        assert chunks[-1].finish_reason == "stop"
+        assert chunks[-1].usage.total_tokens == 15
+        assert all(c.cache_hit for c in chunks)
+
+    async def test_completed_stream_is_cached(self):
+        inner = MockLLMProvider(response_content="streamed")
+        provider = CachedProvider(inner)
+        messages = [Message.user("hi")]
+
+        [c async for c in provider.stream(messages, temperature=0)]
+        response = await provider.complete(messages, temperature=0)
+
+        assert inner.call_count == 1
+        assert response.cache_hit
+        assert response.content == "streamed"
+
+    async def test_tool_call_response_replayed_as_stream(self):
+        inner = MockLLMProvider(
+            tool_calls=[ToolCall(id="1", name="search", arguments={})]
+        )
+        provider = CachedProvider(inner)
+        messages = [Message.user("hi")]
+        await provider.complete(messages, temperature=0)
+
+        chunks = [c async for c in provider.stream(messages, temperature=0)]
+
+        assert inner.call_count == 1
+        assert chunks[-1].tool_calls[0].name == "search"
+
+    def test_delegates_provider_properties(self):
+        inner = MockLLMProvider(model="m")
+        provider = CachedProvider(inner)
+
+        assert provider.model == "m"
+        assert provider.provider_name == "mock"
+        assert provider.calculate_cost(1000, 1000) == inner.calculate_cost(1000, 1000)
+
+
+class TestAgentCacheReporting:
+    """Tests for cached usage and cost reporting in Agent."""
+
+    async def test_agent_cache_option_reports_cached_usage(self):
+        inner = MockLLMProvider()
+        tracker = CostTracker()
+        agent = Agent(
+            name="a",
+            role="r",
+            temperature=0,
+            llm_provider=inner,
+            cost_tracker=tracker,
+            cache=ResponseCache(),
+        )
+
+        first = await agent.run("question")
+        second = await agent.run("question")
+
+        assert inner.call_count == 1
+        assert first.cost > 0
+        assert first.metadata["cache_hits"] == 0
+        assert second.cost == 0
+        assert second.usage.total_tokens == 15
+        assert second.metadata["cache_hits"] == 1
+        assert second.metadata["cached_tokens"] == 15
+
+        summary = tracker.get_summary()
+        assert summary.request_count == 2
+        assert summary.cache_hit_count == 1
+        assert summary.cached_tokens == 15
+
+    async def test_stream_tracks_cache_hit(self):
+        inner = MockLLMProvider()
+        tracker = CostTracker()
+        agent = Agent(
+            name="a",
+            role="r",
+            temperature=0,
+            llm_provider=inner,
+            cost_tracker=tracker,
+            cache=ResponseCache(),
+        )
+
+        [c async for c in agent.stream("question")]
+        [c async for c in agent.stream("question")]
+
+        entries = tracker.get_entries()
+        assert inner.call_count == 1
+        assert [e.cache_hit for e in entries] == [False, True]
+        assert entries[1].cost_usd == 0.0
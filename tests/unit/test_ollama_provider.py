@@ -12,6 +12,7 @@ from agentchord.core.types import Message, MessageRole, ToolCall, Usage
 from agentchord.errors.exceptions import APIError
 from agentchord.errors.exceptions import TimeoutError as AgentweaveTimeoutError
 from agentchord.llm.ollama import OllamaProvider
+from agentchord.utils.http import HTTPClientManager
 
 
 class TestOllamaProviderInit:
@@ -77,13 +78,11 @@ class TestOllamaComplete:
         }
         mock_response.raise_for_status = MagicMock()
 
-        # Mock httpx.AsyncClient
+        # Mock the shared HTTP client
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.ollama.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = OllamaProvider(model="ollama/llama3.2")
             messages = [Message(role=MessageRole.USER, content="Hello")]
 
@@ -128,13 +127,11 @@ class TestOllamaComplete:
         }
         mock_response.raise_for_status = MagicMock()
 
-        # Mock httpx.AsyncClient
+        # Mock the shared HTTP client
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.ollama.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = OllamaProvider(model="ollama/llama3.2")
             messages = [Message(role=MessageRole.USER, content="What's the weather?")]
 
@@ -164,11 +161,9 @@ class TestOllamaComplete:
         }
         mock_response.raise_for_status = MagicMock()
 
-        # Mock httpx.AsyncClient
+        # Mock the shared HTTP client
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
         tools_param = [
             {
@@ -180,7 +175,7 @@ class TestOllamaComplete:
             }
         ]
 
-        with patch("agentchord.llm.ollama.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = OllamaProvider(model="ollama/llama3.2")
             messages = [Message(role=MessageRole.USER, content="Check weather")]
 
@@ -199,13 +194,11 @@ class TestOllamaErrors:
     @pytest.mark.asyncio
     async def test_connect_error(self):
         """Test ConnectError is converted to APIError with helpful message."""
-        # Mock httpx.AsyncClient to raise ConnectError
+        # Mock the shared HTTP client to raise ConnectError
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.ollama.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = OllamaProvider(model="ollama/llama3.2")
             messages = [Message(role=MessageRole.USER, content="Hello")]
 
@@ -221,13 +214,11 @@ class TestOllamaErrors:
     @pytest.mark.asyncio
     async def test_timeout_error(self):
         """Test TimeoutException is converted to AgentweaveTimeoutError."""
-        # Mock httpx.AsyncClient to raise TimeoutException
+        # Mock the shared HTTP client to raise TimeoutException
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.ollama.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = OllamaProvider(model="ollama/llama3.2", timeout=30.0)
             messages = [Message(role=MessageRole.USER, content="Hello")]
 
@@ -257,13 +248,11 @@ class TestOllamaErrors:
 
         mock_response.raise_for_status = MagicMock(side_effect=http_error)
 
-        # Mock httpx.AsyncClient
+        # Mock the shared HTTP client
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("agentchord.llm.ollama.httpx.AsyncClient", return_value=mock_client):
+        with patch.object(HTTPClientManager, "get_client", return_value=mock_client):
             provider = OllamaProvider(model="ollama/llama3.2")
             messages = [Message(role=MessageRole.USER, content="Hello")]
 
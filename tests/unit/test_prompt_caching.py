@@ -0,0 +1,226 @@
+"""Tests for provider prompt caching and cached-token accounting."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.types import LLMResponse, Message, MessageRole, ToolCall, Usage
+from agentchord.llm.anthropic import AnthropicProvider
+from agentchord.llm.openai import OpenAIProvider
+from agentchord.tracking.cost import CostTracker
+from agentchord.tracking.models import CostEntry, CostSummary, TokenUsage
+from agentchord.tracking.pricing import calculate_cost, get_cache_pricing
+from tests.conftest import MockLLMProvider
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+class CachingProvider(MockLLMProvider):
+    """Mock provider that reports prompt cache reads like a real API."""
+
+    cache_read_cost_multiplier = 0.1
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        self.call_count += 1
+        return LLMResponse(
+            content="cached answer",
+            model=self.model,
+            usage=Usage(prompt_tokens=1000, completion_tokens=10, cache_read_tokens=800),
+            finish_reason="stop",
+        )
+
+
+class TestCachedTokenAccounting:
+    """Usage, pricing and CostTracker report cache reads and writes."""
+
+    def test_usage_uncached_prompt_tokens(self) -> None:
+        usage = Usage(
+            prompt_tokens=1000, completion_tokens=5, cache_read_tokens=600, cache_write_tokens=100
+        )
+        assert usage.uncached_prompt_tokens == 300
+        assert usage.total_tokens == 1005
+
+    def test_token_usage_addition(self) -> None:
+        total = TokenUsage(prompt_tokens=10, cache_read_tokens=4) + TokenUsage(
+            prompt_tokens=20, cache_write_tokens=15
+        )
+        assert (total.cache_read_tokens, total.cache_write_tokens) == (4, 15)
+
+    def test_cache_pricing_lookup(self) -> None:
+        assert get_cache_pricing("claude-3-5-sonnet-latest") == (0.10, 1.25)
+        assert get_cache_pricing("gpt-4o-mini") == (0.50, 1.00)
+        assert get_cache_pricing("unknown-model") == (1.00, 1.00)
+
+    def test_calculate_cost_discounts_reads_and_charges_writes(self) -> None:
+        # claude-3-5-sonnet: $3 / 1M input
+        plain = calculate_cost("claude-3-5-sonnet", TokenUsage(prompt_tokens=1_000_000))
+        read = calculate_cost(
+            "claude-3-5-sonnet",
+            TokenUsage(prompt_tokens=1_000_000, cache_read_tokens=1_000_000),
+        )
+        write = calculate_cost(
+            "claude-3-5-sonnet",
+            TokenUsage(prompt_tokens=1_000_000, cache_write_tokens=1_000_000),
+        )
+        assert plain == pytest.approx(3.00)
+        assert read == pytest.approx(0.30)
+        assert write == pytest.approx(3.75)
+
+    def test_summary_totals(self) -> None:
+        entries = [
+            CostEntry(
+                model="m",
+                usage=TokenUsage(prompt_tokens=100, cache_read_tokens=80),
+                cost_usd=0,
+            ),
+            CostEntry(
+                model="m",
+                usage=TokenUsage(prompt_tokens=100, cache_write_tokens=90),
+                cost_usd=0,
+            ),
+        ]
+        summary = CostSummary.from_entries(entries)
+        assert summary.cache_read_tokens == 80
+        assert summary.cache_write_tokens == 90
+        assert summary.cached_tokens == 0
+
+    def test_provider_calculate_cost(self) -> None:
+        provider = AnthropicProvider(model="claude-3-5-sonnet-latest", api_key="k")
+        full = provider.calculate_cost(1000, 0)
+        cached = provider.calculate_cost(1000, 0, cache_read_tokens=1000)
+        assert cached == pytest.approx(full * 0.1)
+
+    def test_provider_multipliers_follow_cache_pricing(self) -> None:
+        for provider in (
+            AnthropicProvider(model="claude-3-5-sonnet-latest", api_key="k"),
+            OpenAIProvider(model="gpt-4o-mini", api_key="k"),
+        ):
+            assert (
+                provider.cache_read_cost_multiplier,
+                provider.cache_write_cost_multiplier,
+            ) == get_cache_pricing(provider.model)
+
+    async def test_agent_reports_cache_reads(self) -> None:
+        tracker = CostTracker()
+        provider = CachingProvider()
+        agent = Agent(name="a", role="r", llm_provider=provider, cost_tracker=tracker)
+
+        result = await agent.run("hi")
+
+        assert result.usage.cache_read_tokens == 800
+        assert result.metadata["cache_read_tokens"] == 800
+        assert result.cost == pytest.approx(provider.calculate_cost(1000, 10) - 0.9 * 0.8 * 0.001)
+        assert tracker.get_summary().cache_read_tokens == 800
+
+
+class TestAnthropicCacheBreakpoints:
+    """AnthropicProvider marks stable prefixes with cache_control."""
+
+    def _request(self, provider: AnthropicProvider, messages: list[Message], **kwargs: Any) -> dict:
+        return provider._build_request(messages, 0.7, 1024, kwargs)
+
+    def test_system_tools_and_history_marked(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        tools = [{"name": "a", "input_schema": {}}, {"name": "b", "input_schema": {}}]
+        messages = [
+            Message.system("You are helpful."),
+            Message.user("first"),
+            Message.assistant("reply"),
+            Message.user("second"),
+        ]
+
+        request = self._request(provider, messages, tools=tools)
+
+        assert request["system"] == [
+            {"type": "text", "text": "You are helpful.", "cache_control": EPHEMERAL}
+        ]
+        assert "cache_control" not in request["tools"][0]
+        assert request["tools"][1]["cache_control"] == EPHEMERAL
+        assert request["messages"][1]["content"] == [
+            {"type": "text", "text": "reply", "cache_control": EPHEMERAL}
+        ]
+        assert request["messages"][2]["content"] == "second"
+        # The caller's tool definitions are not mutated
+        assert "cache_control" not in tools[1]
+
+    def test_tool_round_history_marked(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        messages = [
+            Message.user("go"),
+            Message(
+                role=MessageRole.ASSISTANT,
+                content="",
+                tool_calls=[ToolCall(id="1", name="t")],
+            ),
+            Message(role=MessageRole.TOOL, content="done", tool_call_id="1"),
+        ]
+
+        request = self._request(provider, messages)
+
+        tool_use = request["messages"][1]["content"][-1]
+        assert tool_use["type"] == "tool_use"
+        assert tool_use["cache_control"] == EPHEMERAL
+
+    def test_single_message_not_marked(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        request = self._request(provider, [Message.user("hi")])
+        assert request["messages"] == [{"role": "user", "content": "hi"}]
+
+    def test_disabled(self) -> None:
+        provider = AnthropicProvider(api_key="k", prompt_caching=False)
+        request = self._request(provider, [Message.system("sys"), Message.user("hi")])
+        assert request["system"] == "sys"
+
+    def test_caller_breakpoints_respected(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        tools = [{"name": "a", "input_schema": {}, "cache_control": EPHEMERAL}]
+        request = self._request(provider, [Message.system("sys"), Message.user("hi")], tools=tools)
+        assert request["system"] == "sys"
+
+    def test_usage_includes_cached_tokens(self) -> None:
+        usage = AnthropicProvider._convert_usage(SimpleNamespace(
+            input_tokens=50,
+            output_tokens=20,
+            cache_read_input_tokens=900,
+            cache_creation_input_tokens=100,
+        ))
+        assert usage.prompt_tokens == 1050
+        assert (usage.cache_read_tokens, usage.cache_write_tokens) == (900, 100)
+
+
+class TestOpenAIStablePrefix:
+    """OpenAIProvider lays out requests for automatic prompt caching."""
+
+    def test_message_order_preserved(self) -> None:
+        provider = OpenAIProvider(api_key="k")
+        converted = provider._convert_messages([
+            Message.system("S1"),
+            Message.user("u1"),
+            Message.assistant("a1"),
+            Message.system("Now answer in French"),
+            Message.user("u2"),
+        ])
+        assert [m["content"] for m in converted] == [
+            "S1", "u1", "a1", "Now answer in French", "u2",
+        ]
+
+    def test_tools_sorted_by_name(self) -> None:
+        kwargs: dict[str, Any] = {"tools": [
+            {"type": "function", "function": {"name": "zeta"}},
+            {"type": "function", "function": {"name": "alpha"}},
+        ]}
+        OpenAIProvider._order_tools(kwargs)
+        assert [t["function"]["name"] for t in kwargs["tools"]] == ["alpha", "zeta"]
+
+    def test_usage_reads_cached_tokens(self) -> None:
+        usage = OpenAIProvider._convert_usage(SimpleNamespace(
+            prompt_tokens=2000,
+            completion_tokens=10,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1536),
+        ))
+        assert usage.cache_read_tokens == 1536
+        assert usage.prompt_tokens == 2000
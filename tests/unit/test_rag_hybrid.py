@@ -149,3 +149,24 @@ class TestHybridSearch:
         await hybrid.add(chunks)
         result = await hybrid.search("document testing", limit=3)
         assert len(result.results) <= 3
+
+    async def test_search_batch_matches_search(self, hybrid, mock_embedding_provider):
+        chunks = [
+            Chunk(id=f"c{i}", content=f"document number {i} about topic {i % 3}")
+            for i in range(10)
+        ]
+        await hybrid.add(chunks)
+        queries = ["topic 1", "   ", "document number 4"]
+        calls = mock_embedding_provider.call_count
+
+        batch = await hybrid.search_batch(queries, limit=3)
+
+        assert mock_embedding_provider.call_count == calls + 1
+        assert [r.query for r in batch] == queries
+        assert batch[1].results == []
+        for query, result in zip(queries, batch):
+            if query.strip():
+                single = await hybrid.search(query, limit=3)
+                assert [r.chunk.id for r in result.results] == [
+                    r.chunk.id for r in single.results
+                ]
@@ -21,6 +21,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from agentchord.rag.types import Chunk, SearchResult
+from agentchord.utils.http import HTTPClientManager
 
 
 # ---------------------------------------------------------------------------
@@ -202,7 +203,7 @@ class TestOpenAIEmbeddings:
 
 
 class TestOllamaEmbeddings:
-    """Tests for OllamaEmbeddings with mocked httpx.AsyncClient."""
+    """Tests for OllamaEmbeddings with a mocked shared HTTP client."""
 
     def _mock_response(self, embedding: list[float]) -> MagicMock:
         """Create a mock httpx response with embedding data."""
@@ -217,11 +218,10 @@ class TestOllamaEmbeddings:
 
         expected = [0.1, 0.2, 0.3]
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=self._mock_response(expected))
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = OllamaEmbeddings(model="nomic-embed-text")
             result = await provider.embed("hello")
@@ -246,11 +246,10 @@ class TestOllamaEmbeddings:
             idx = ["a", "b", "c"].index(text)
             return self._mock_response(embeddings[idx])
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(side_effect=mock_post)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = OllamaEmbeddings()
             result = await provider.embed_batch(["a", "b", "c"])
@@ -287,11 +286,10 @@ class TestOllamaEmbeddings:
         """Custom base_url with trailing slash is normalized."""
         from agentchord.rag.embeddings.ollama import OllamaEmbeddings
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=self._mock_response([0.1]))
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = OllamaEmbeddings(base_url="http://my-server:11434/")
             await provider.embed("test")
@@ -306,7 +304,7 @@ class TestOllamaEmbeddings:
 
         from agentchord.rag.embeddings.ollama import OllamaEmbeddings
 
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             error_resp = MagicMock()
             error_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -315,8 +313,7 @@ class TestOllamaEmbeddings:
                 response=error_resp,
             )
             mock_client.post = AsyncMock(return_value=error_resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             provider = OllamaEmbeddings()
             with pytest.raises(httpx.HTTPStatusError):
@@ -565,8 +562,20 @@ class TestChromaVectorStore:
             "distances": [[0.2, 0.8]],
             "documents": [["hello", "world"]],
             "metadatas": [[
-                {"_document_id": "doc1", "_start_index": 0, "_end_index": 5, "_parent_id": "", "topic": "a"},
-                {"_document_id": "doc2", "_start_index": 0, "_end_index": 5, "_parent_id": "p1", "topic": "b"},
+                {
+                    "_document_id": "doc1",
+                    "_start_index": 0,
+                    "_end_index": 5,
+                    "_parent_id": "",
+                    "topic": "a",
+                },
+                {
+                    "_document_id": "doc2",
+                    "_start_index": 0,
+                    "_end_index": 5,
+                    "_parent_id": "p1",
+                    "topic": "b",
+                },
             ]],
         }
         store = self._make_store(mock_collection)
@@ -639,7 +648,9 @@ class TestChromaVectorStore:
             "ids": [["c1"]],
             "distances": [[1.5]],  # distance > 1 -> score would be negative
             "documents": [["text"]],
-            "metadatas": [[{"_document_id": "", "_start_index": 0, "_end_index": 0, "_parent_id": ""}]],
+            "metadatas": [[
+                {"_document_id": "", "_start_index": 0, "_end_index": 0, "_parent_id": ""},
+            ]],
         }
         store = self._make_store(mock_collection)
 
@@ -664,6 +675,26 @@ class TestChromaVectorStore:
         assert results[0].chunk.parent_id is None
         assert results[1].chunk.parent_id == "p1"
 
+    async def test_search_batch_single_query_call(self):
+        """search_batch() sends every query in one collection.query call."""
+        _, _, mock_collection = self._make_mock_chromadb()
+        meta = {"_document_id": "", "_start_index": 0, "_end_index": 0, "_parent_id": ""}
+        mock_collection.query.return_value = {
+            "ids": [["c1"], ["c2", "c1"]],
+            "distances": [[0.1], [0.2, 0.3]],
+            "documents": [["a"], ["b", "a"]],
+            "metadatas": [[meta], [meta, meta]],
+        }
+        store = self._make_store(mock_collection)
+
+        results = await store.search_batch([[0.1], [0.2]], limit=2)
+
+        mock_collection.query.assert_called_once()
+        assert mock_collection.query.call_args.kwargs["query_embeddings"] == [[0.1], [0.2]]
+        assert [r.chunk.id for r in results[0]] == ["c1"]
+        assert [r.chunk.id for r in results[1]] == ["c2", "c1"]
+        assert results[1][1].score == pytest.approx(0.7)
+
     async def test_delete(self):
         """delete() calls collection.delete and returns count."""
         _, _, mock_collection = self._make_mock_chromadb()
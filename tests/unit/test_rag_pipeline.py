@@ -81,6 +81,12 @@ class TestRAGPipeline:
         # source_documents should contain unique document_ids from results
         assert isinstance(response.source_documents, list)
 
+    async def test_retrieve_batch(self, pipeline, sample_documents):
+        await pipeline.ingest_documents(sample_documents)
+        results = await pipeline.retrieve_batch(["AgentChord", "Python"], limit=2)
+        assert [r.query for r in results] == ["AgentChord", "Python"]
+        assert all(len(r.results) <= 2 for r in results)
+
     async def test_retrieve_with_limit(self, pipeline, sample_documents):
         await pipeline.ingest_documents(sample_documents)
         result = await pipeline.retrieve("AgentChord", limit=1)
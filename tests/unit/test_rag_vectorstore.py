@@ -1,7 +1,11 @@
 """Tests for vector store implementations."""
+import asyncio
+import random
+import time
+
 import pytest
 from agentchord.rag.types import Chunk, SearchResult
-from agentchord.rag.vectorstore.in_memory import InMemoryVectorStore
+from agentchord.rag.vectorstore.in_memory import NUMPY_AVAILABLE, InMemoryVectorStore
 
 # Check if faiss is available for FAISS tests
 try:
@@ -12,9 +16,11 @@ except ImportError:
 
 
 class TestInMemoryVectorStore:
-    @pytest.fixture
-    def store(self):
-        return InMemoryVectorStore()
+    @pytest.fixture(params=["numpy", "python"])
+    def store(self, request):
+        if request.param == "numpy" and not NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        return InMemoryVectorStore(use_numpy=request.param == "numpy")
 
     @pytest.fixture
     def chunks_with_embeddings(self):
@@ -97,6 +103,23 @@ class TestInMemoryVectorStore:
         results = await store.search([1.0, 0.0], filter={"type": "nonexistent"})
         assert results == []
 
+    async def test_search_batch_matches_search(self, store):
+        chunks = random_chunks(50, 8)
+        await store.add(chunks)
+        queries = [c.embedding for c in random_chunks(4, 8, seed=5)]
+
+        batch = await store.search_batch(queries, limit=5, filter={"group": 2})
+
+        assert len(batch) == 4
+        for query, results in zip(queries, batch):
+            single = await store.search(query, limit=5, filter={"group": 2})
+            assert [r.chunk.id for r in results] == [r.chunk.id for r in single]
+
+    async def test_search_batch_empty(self, store, chunks_with_embeddings):
+        assert await store.search_batch([[1.0, 0.0, 0.0]]) == [[]]
+        await store.add(chunks_with_embeddings)
+        assert await store.search_batch([]) == []
+
     async def test_add_duplicate_id_overwrites(self, store):
         c1 = Chunk(id="dup", content="first", embedding=[1.0, 0.0])
         c2 = Chunk(id="dup", content="second", embedding=[0.0, 1.0])
@@ -131,6 +154,215 @@ class TestInMemoryVectorStore:
         assert store._dimensions == 3
 
 
+def random_chunks(n: int, dim: int, seed: int = 0) -> list[Chunk]:
+    rng = random.Random(seed)
+    return [
+        Chunk(
+            id=f"c{i}",
+            content=f"chunk {i}",
+            embedding=[rng.uniform(-1, 1) for _ in range(dim)],
+            metadata={"group": i % 3},
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+class TestInMemoryMatrixBackend:
+    """Tests specific to the numpy matrix backend."""
+
+    async def test_matches_python_backend(self):
+        chunks = random_chunks(300, 16)
+        fast = InMemoryVectorStore(use_numpy=True)
+        slow = InMemoryVectorStore(use_numpy=False)
+        await fast.add(chunks)
+        await slow.add(chunks)
+        query = random_chunks(1, 16, seed=1)[0].embedding
+
+        for filter in (None, {"group": 1}):
+            expected = await slow.search(query, limit=7, filter=filter)
+            actual = await fast.search(query, limit=7, filter=filter)
+            assert [r.chunk.id for r in actual] == [r.chunk.id for r in expected]
+            for a, e in zip(actual, expected):
+                assert a.score == pytest.approx(e.score, abs=1e-5)
+
+    async def test_matrix_grows(self):
+        store = InMemoryVectorStore(use_numpy=True)
+        for start in range(0, 200, 50):
+            await store.add(random_chunks(200, 4)[start : start + 50])
+        assert await store.count() == 200
+        assert len(store._matrix) >= 200
+        results = await store.search(store._chunks["c150"].embedding, limit=1)
+        assert results[0].chunk.id == "c150"
+
+    async def test_deleted_rows_are_tombstoned_then_compacted(self):
+        store = InMemoryVectorStore(use_numpy=True)
+        chunks = random_chunks(10, 4)
+        await store.add(chunks)
+
+        await store.delete(["c0", "c1", "c2"])
+        results = await store.search(chunks[0].embedding, limit=10)
+        assert len(results) == 7
+        assert "c0" not in {r.chunk.id for r in results}
+
+        assert await store.compact() == 3
+        assert store._size == 7
+        assert await store.compact() == 0
+        after = await store.search(chunks[0].embedding, limit=10)
+        assert [r.chunk.id for r in after] == [r.chunk.id for r in results]
+
+        # Re-adding a deleted ID gets a fresh row
+        await store.add([chunks[0]])
+        results = await store.search(chunks[0].embedding, limit=1)
+        assert results[0].chunk.id == "c0"
+
+    async def test_compacts_automatically(self):
+        store = InMemoryVectorStore(use_numpy=True)
+        await store.add(random_chunks(2000, 2))
+        await store.delete([f"c{i}" for i in range(1500)])
+        assert store._tombstones == 0
+        assert store._size == 500
+
+    async def test_zero_vectors_score_zero(self):
+        store = InMemoryVectorStore(use_numpy=True)
+        await store.add([Chunk(id="z", content="z", embedding=[0.0, 0.0])])
+        results = await store.search([0.0, 0.0])
+        assert results[0].score == 0.0
+
+    async def test_search_batch_in_blocks(self, monkeypatch):
+        from agentchord.rag.vectorstore import in_memory
+
+        store = InMemoryVectorStore(use_numpy=True)
+        chunks = random_chunks(40, 4)
+        await store.add(chunks)
+        await store.delete(["c3"])
+        queries = [c.embedding for c in chunks[:6]]
+        expected = await store.search_batch(queries, limit=3)
+
+        # Force one query per score block
+        monkeypatch.setattr(in_memory, "_MAX_BLOCK_SCORES", 1)
+        blocked = await store.search_batch(queries, limit=3)
+
+        assert [[r.chunk.id for r in rs] for rs in blocked] == [
+            [r.chunk.id for r in rs] for rs in expected
+        ]
+        assert "c3" not in {r.chunk.id for rs in blocked for r in rs}
+
+    async def test_bad_batch_adds_nothing(self):
+        store = InMemoryVectorStore(use_numpy=True)
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            await store.add([
+                Chunk(id="a", content="x", embedding=[1.0, 0.0]),
+                Chunk(id="b", content="y", embedding=[1.0]),
+            ])
+        assert await store.count() == 0
+        assert store._dimensions is None
+
+
+class TestInMemoryPersistence:
+    """Tests for InMemoryVectorStore.save and load."""
+
+    @pytest.fixture(params=["numpy", "python"])
+    def use_numpy(self, request):
+        if request.param == "numpy" and not NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        return request.param == "numpy"
+
+    async def test_round_trip(self, use_numpy, tmp_path):
+        chunks = random_chunks(50, 8)
+        store = InMemoryVectorStore(use_numpy=use_numpy)
+        await store.add(chunks)
+        await store.delete(["c3"])
+        await store.save(tmp_path)
+
+        loaded = await InMemoryVectorStore.load(tmp_path, use_numpy=use_numpy)
+
+        assert await loaded.count() == 49
+        assert await loaded.get("c3") is None
+        chunk = await loaded.get("c4")
+        assert chunk.content == "chunk 4"
+        assert chunk.metadata == {"group": 1}
+        assert chunk.embedding is None
+        for filter in (None, {"group": 2}):
+            expected = await store.search(chunks[0].embedding, limit=5, filter=filter)
+            actual = await loaded.search(chunks[0].embedding, limit=5, filter=filter)
+            assert [r.chunk.id for r in actual] == [r.chunk.id for r in expected]
+
+    async def test_empty_store(self, use_numpy, tmp_path):
+        await InMemoryVectorStore(use_numpy=use_numpy).save(tmp_path)
+        loaded = await InMemoryVectorStore.load(tmp_path, use_numpy=use_numpy)
+        assert await loaded.count() == 0
+        assert await loaded.search([1.0, 0.0]) == []
+
+    async def test_missing_directory(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            await InMemoryVectorStore.load(tmp_path / "missing")
+
+    async def test_save_snapshots_before_concurrent_changes(self, use_numpy, tmp_path):
+        import asyncio
+        import threading
+        from unittest.mock import patch
+
+        from agentchord.rag.vectorstore import in_memory
+
+        chunks = random_chunks(50, 8)
+        store = InMemoryVectorStore(use_numpy=use_numpy)
+        await store.add(chunks[:40])
+        writing = threading.Event()
+        resume = threading.Event()
+        real_replace_file = in_memory.replace_file
+
+        def slow_replace_file(path, write):
+            writing.set()
+            resume.wait(5)
+            real_replace_file(path, write)
+
+        with patch.object(in_memory, "replace_file", slow_replace_file):
+            save = asyncio.create_task(store.save(tmp_path))
+            await asyncio.to_thread(writing.wait, 5)
+            # Mutate the store while the thread is writing
+            await store.delete([f"c{i}" for i in range(10)])
+            await store.add(chunks[40:])
+            if use_numpy:
+                await store.compact()
+            resume.set()
+            await save
+
+        loaded = await InMemoryVectorStore.load(tmp_path, use_numpy=use_numpy)
+        assert await loaded.count() == 40
+        assert await loaded.get("c0") is not None
+        assert await loaded.get("c45") is None
+        results = await loaded.search(chunks[5].embedding, limit=1)
+        assert results[0].chunk.id == "c5"
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    async def test_mmap_is_copy_on_write(self, tmp_path):
+        import numpy as np
+
+        chunks = random_chunks(20, 4)
+        store = InMemoryVectorStore()
+        await store.add(chunks)
+        await store.save(tmp_path)
+        saved = (tmp_path / "embeddings.f32").read_bytes()
+
+        loaded = await InMemoryVectorStore.load(tmp_path)
+        assert isinstance(loaded._matrix, np.memmap)
+        await loaded.add([Chunk(id="c0", content="moved", embedding=[1.0, 0.0, 0.0, 0.0])])
+        await loaded.delete(["c1"])
+        await loaded.compact()
+        await loaded.add(random_chunks(100, 4, seed=1)[20:])
+
+        assert (tmp_path / "embeddings.f32").read_bytes() == saved
+        results = await loaded.search([1.0, 0.0, 0.0, 0.0], limit=1)
+        assert results[0].chunk.content == "moved"
+
+        # Saving over the mapped files replaces them
+        await loaded.save(tmp_path)
+        reloaded = await InMemoryVectorStore.load(tmp_path, mmap=False)
+        assert await reloaded.count() == 99
+        assert not isinstance(reloaded._matrix, np.memmap)
+
+
 @pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss-cpu not installed")
 class TestFAISSVectorStore:
     """FAISS vector store tests - requires faiss-cpu installation."""
@@ -163,8 +395,18 @@ class TestFAISSVectorStore:
         assert results[0].chunk.id == "c1"
         assert results[0].score > results[1].score
 
+    async def test_search_batch(self, store, chunks_3d):
+        """search_batch returns one ranked list per query."""
+        await store.add(chunks_3d)
+        results = await store.search_batch(
+            [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], limit=2
+        )
+        assert [r.chunk.id for r in results[0]][0] == "c1"
+        assert [r.chunk.id for r in results[1]][0] == "c3"
+        assert all(len(r) == 2 for r in results)
+
     async def test_delete_soft_delete(self, store, chunks_3d):
-        """H1: Delete performs soft-delete, excluded from search."""
+        """H1: Deleted chunks are excluded from search and count."""
         await store.add(chunks_3d)
         deleted = await store.delete(["c1"])
         assert deleted == 1
@@ -205,8 +447,284 @@ class TestFAISSVectorStore:
         with pytest.raises(ValueError, match="dimension mismatch"):
             await store_3d.add([c2])
 
+    async def test_writes_wait_for_running_searches(self, store, chunks_3d):
+        """Index changes wait until searches running in threads finish."""
+        await store.add(chunks_3d)
+        index = store._index
+        events: list[str] = []
+
+        class SlowIndex:
+            def __getattr__(self, name):
+                return getattr(index, name)
+
+            def search(self, *args, **kwargs):
+                events.append("search start")
+                time.sleep(0.05)
+                events.append("search end")
+                return index.search(*args, **kwargs)
+
+        store._index = SlowIndex()
+        searches = asyncio.gather(
+            store.search([1.0, 0.0, 0.0], limit=3),
+            store.search([0.0, 1.0, 0.0], limit=3),
+        )
+        await asyncio.sleep(0.01)
+        await store.delete(["c1"])
+        events.append("deleted")
+        first, _ = await searches
+
+        assert events[-1] == "deleted"
+        assert events[:2] == ["search start", "search start"]  # searches overlap
+        assert first[0].chunk.id == "c1"
+
     async def test_unsupported_index_type(self):
         """H2: Unsupported index_type raises ValueError."""
         from agentchord.rag.vectorstore.faiss import FAISSVectorStore
         with pytest.raises(ValueError, match="Unsupported index_type"):
-            FAISSVectorStore(dimensions=3, index_type="hnsw")
+            FAISSVectorStore(dimensions=3, index_type="lsh")
+
+
+@pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss-cpu not installed")
+class TestFAISSApproximateIndexes:
+    """Tests for the HNSW and IVF index types."""
+
+    async def test_hnsw_finds_nearest(self):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=8, index_type="hnsw", hnsw_m=8)
+        chunks = random_chunks(200, 8)
+        await store.add(chunks)
+
+        assert store.is_trained
+        results = await store.search(chunks[42].embedding, limit=1, ef_search=64)
+        assert results[0].chunk.id == "c42"
+
+    async def test_ivf_buffers_until_trained(self):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=8, index_type="ivf", nlist=4, train_size=100)
+        chunks = random_chunks(150, 8)
+
+        await store.add(chunks[:60])
+        assert not store.is_trained
+        # Untrained searches are exact over the buffer
+        results = await store.search(chunks[7].embedding, limit=1)
+        assert results[0].chunk.id == "c7"
+
+        await store.add(chunks[60:])
+        assert store.is_trained
+        assert await store.count() == 150
+        # Scanning every cell is exact again
+        results = await store.search(chunks[120].embedding, limit=1, nprobe=4)
+        assert results[0].chunk.id == "c120"
+
+    async def test_explicit_train(self):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=8, index_type="ivf", nlist=16)
+        await store.add(random_chunks(10, 8))
+        with pytest.raises(ValueError, match="at least 16"):
+            await store.train()
+
+        await store.add(random_chunks(40, 8, seed=1)[10:])
+        await store.train()
+        assert store.is_trained
+        assert await store.count() == 40
+
+        await store.clear()
+        assert not store.is_trained
+
+    @pytest.mark.parametrize("opq", [False, True])
+    async def test_ivfpq(self, opq):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(
+            dimensions=8, index_type="ivfpq", nlist=4, pq_m=4, pq_bits=4, opq=opq
+        )
+        chunks = random_chunks(300, 8)
+        await store.add(chunks)
+        await store.train()
+
+        assert store.is_trained
+        results = await store.search_batch(
+            [c.embedding for c in chunks[:20]], limit=5, nprobe=4
+        )
+        # Quantized scores are approximate; the query should still rank near the top
+        hits = sum(f"c{i}" in {r.chunk.id for r in rs} for i, rs in enumerate(results))
+        assert hits >= 15
+
+    def test_invalid_parameters(self):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        with pytest.raises(ValueError, match="must divide"):
+            FAISSVectorStore(dimensions=10, index_type="ivfpq", pq_m=4)
+        with pytest.raises(ValueError, match="opq"):
+            FAISSVectorStore(dimensions=8, index_type="ivf", opq=True)
+
+
+@pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss-cpu not installed")
+class TestFAISSDeletionAndFiltering:
+    """Tests for FAISS deletion, compaction and filtered search."""
+
+    @pytest.fixture(params=["flat", "hnsw", "ivf"])
+    async def store(self, request):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(
+            dimensions=8, index_type=request.param, nlist=8, nprobe=1, ef_search=4
+        )
+        await store.add(random_chunks(400, 8))
+        await store.train()
+        return store
+
+    async def test_selective_filter_fills_limit(self, store):
+        chunks = random_chunks(400, 8)
+        await store.add([
+            Chunk(id=f"rare{i}", content="", embedding=chunks[i * 50].embedding,
+                  metadata={"kind": "rare"})
+            for i in range(5)
+        ])
+
+        results = await store.search(chunks[0].embedding, limit=5, filter={"kind": "rare"})
+
+        assert sorted(r.chunk.id for r in results) == [f"rare{i}" for i in range(5)]
+        assert results[0].chunk.id == "rare0"
+
+    async def test_delete_removes_vectors(self, store):
+        chunks = random_chunks(400, 8)
+
+        assert await store.delete(["c1", "c2", "missing"]) == 2
+
+        assert await store.count() == 398
+        results = await store.search(chunks[1].embedding, limit=400, nprobe=8, ef_search=512)
+        assert len(results) == 398
+        assert {"c1", "c2"}.isdisjoint(r.chunk.id for r in results)
+        if store.index_type == "hnsw":
+            assert store._index.ntotal == 400
+            assert await store.compact() == 2
+        assert store._index.ntotal == 398
+        assert await store.compact() == 0
+
+    async def test_readd_replaces_vector(self, store):
+        moved = Chunk(id="c5", content="moved", embedding=[1.0] * 8)
+        await store.add([moved])
+
+        assert await store.count() == 400
+        assert store._index.ntotal == (401 if store.index_type == "hnsw" else 400)
+        results = await store.search([1.0] * 8, limit=1, nprobe=8, ef_search=64)
+        assert results[0].chunk.content == "moved"
+
+    async def test_hnsw_compacts_automatically(self):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=4, index_type="hnsw", hnsw_m=8)
+        await store.add(random_chunks(2000, 4))
+
+        await store.delete([f"c{i}" for i in range(1200)])
+
+        assert store._deleted_ids == set()
+        assert store._index.ntotal == 800
+
+    async def test_delete_before_training(self):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=8, index_type="ivf", nlist=4)
+        await store.add(random_chunks(50, 8))
+        await store.delete(["c0"])
+        await store.train()
+
+        assert store._index.ntotal == 49
+        assert await store.get("c0") is None
+
+
+@pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss-cpu not installed")
+class TestFAISSPersistence:
+    """Tests for FAISSVectorStore.save and load."""
+
+    @pytest.fixture(params=["flat", "hnsw", "ivf", "ivfpq"])
+    async def store(self, request):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(
+            dimensions=8, index_type=request.param, nlist=4, pq_m=4, pq_bits=4,
+            nprobe=4, ef_search=32,
+        )
+        await store.add(random_chunks(300, 8))
+        await store.train()
+        await store.delete(["c1"])
+        return store
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    async def test_round_trip(self, store, mmap, tmp_path):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        await store.save(tmp_path)
+        loaded = await FAISSVectorStore.load(tmp_path, mmap=mmap)
+
+        assert loaded.index_type == store.index_type
+        assert loaded.nprobe == 4
+        assert await loaded.count() == 299
+        assert await loaded.get("c1") is None
+        assert (await loaded.get("c2")).metadata == {"group": 2}
+        queries = [c.embedding for c in random_chunks(10, 8)]
+        for filter in (None, {"group": 0}):
+            expected = await store.search_batch(queries, limit=5, filter=filter)
+            actual = await loaded.search_batch(queries, limit=5, filter=filter)
+            assert [[r.chunk.id for r in rs] for rs in actual] == [
+                [r.chunk.id for r in rs] for rs in expected
+            ]
+
+    async def test_changes_after_mmap_load(self, store, tmp_path):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        await store.save(tmp_path)
+        saved = (tmp_path / "index.faiss").read_bytes()
+        loaded = await FAISSVectorStore.load(tmp_path)
+        assert loaded._mapped_from is not None
+
+        await loaded.add([Chunk(id="new", content="new", embedding=[1.0] * 8)])
+        await loaded.delete(["c2"])
+        await loaded.compact()
+
+        assert loaded._mapped_from is None
+        assert (tmp_path / "index.faiss").read_bytes() == saved
+        assert await loaded.count() == 299
+        results = await loaded.search([1.0] * 8, limit=1)
+        assert results[0].chunk.id == "new"
+
+        await loaded.save(tmp_path)
+        reloaded = await FAISSVectorStore.load(tmp_path)
+        assert await reloaded.get("c2") is None
+        assert await reloaded.get("new") is not None
+
+    async def test_hnsw_keeps_deleted_ids(self, tmp_path):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=4, index_type="hnsw")
+        chunks = random_chunks(20, 4)
+        await store.add(chunks)
+        await store.delete(["c0"])
+        await store.save(tmp_path)
+
+        loaded = await FAISSVectorStore.load(tmp_path)
+
+        assert loaded._deleted_ids == {0}
+        results = await loaded.search(chunks[0].embedding, limit=20)
+        assert "c0" not in {r.chunk.id for r in results}
+        assert await loaded.compact() == 1
+
+    async def test_untrained_buffer(self, tmp_path):
+        from agentchord.rag.vectorstore.faiss import FAISSVectorStore
+
+        store = FAISSVectorStore(dimensions=8, index_type="ivf", nlist=4)
+        await store.add(random_chunks(50, 8))
+        await store.save(tmp_path)
+
+        loaded = await FAISSVectorStore.load(tmp_path)
+
+        assert not loaded.is_trained
+        assert await loaded.count() == 50
+        await loaded.train()
+        assert loaded._index.ntotal == 50
+        await loaded.save(tmp_path)
+        assert not (tmp_path / "buffer.faiss").exists()
@@ -9,6 +9,7 @@ import pytest
 
 from agentchord.rag.loaders.web import WebLoader
 from agentchord.rag.types import Document
+from agentchord.utils.http import HTTPClientManager
 
 
 class TestWebLoader:
@@ -26,11 +27,10 @@ class TestWebLoader:
 
     async def test_basic_load(self, mock_response):
         """Test basic HTML page loading with text extraction."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=mock_response)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com"])
             docs = await loader.load()
@@ -43,7 +43,7 @@ class TestWebLoader:
 
     async def test_multiple_urls(self):
         """Test loading multiple URLs returns multiple documents."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
 
             # Create two different responses
@@ -60,8 +60,7 @@ class TestWebLoader:
             resp2.raise_for_status = MagicMock()
 
             mock_client.get = AsyncMock(side_effect=[resp1, resp2])
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com/1", "https://example.com/2"])
             docs = await loader.load()
@@ -74,7 +73,7 @@ class TestWebLoader:
 
     async def test_empty_html_skipped(self):
         """Test that URLs with empty body are skipped."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
 
             # Empty response
@@ -92,8 +91,7 @@ class TestWebLoader:
             valid_resp.raise_for_status = MagicMock()
 
             mock_client.get = AsyncMock(side_effect=[empty_resp, valid_resp])
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com/empty", "https://example.com/valid"])
             docs = await loader.load()
@@ -104,7 +102,7 @@ class TestWebLoader:
 
     async def test_html_tags_removed(self):
         """Test that HTML tags are properly stripped from content."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
 
             resp = MagicMock(spec=httpx.Response)
@@ -117,8 +115,7 @@ class TestWebLoader:
             resp.raise_for_status = MagicMock()
 
             mock_client.get = AsyncMock(return_value=resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com"])
             docs = await loader.load()
@@ -134,7 +131,7 @@ class TestWebLoader:
 
     async def test_script_style_removed(self):
         """Test that script and style blocks are removed from content."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
 
             resp = MagicMock(spec=httpx.Response)
@@ -149,8 +146,7 @@ class TestWebLoader:
             resp.raise_for_status = MagicMock()
 
             mock_client.get = AsyncMock(return_value=resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com"])
             docs = await loader.load()
@@ -163,11 +159,10 @@ class TestWebLoader:
 
     async def test_metadata_included(self, mock_response):
         """Test that url, status_code, and content_type are in metadata."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=mock_response)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com"])
             docs = await loader.load()
@@ -180,7 +175,7 @@ class TestWebLoader:
 
     async def test_custom_headers(self):
         """Test that custom headers override defaults."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
 
             resp = MagicMock(spec=httpx.Response)
@@ -190,21 +185,21 @@ class TestWebLoader:
             resp.raise_for_status = MagicMock()
 
             mock_client.get = AsyncMock(return_value=resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             custom_headers = {"User-Agent": "CustomBot/1.0"}
             loader = WebLoader(["https://example.com"], headers=custom_headers)
             await loader.load()
 
-            # Verify AsyncClient was created with custom headers
-            MockClient.assert_called_once()
-            call_kwargs = MockClient.call_args.kwargs
+            # Verify the request was sent with custom headers
+            MockClient.assert_called_once_with("https://example.com")
+            call_kwargs = mock_client.get.call_args.kwargs
             assert call_kwargs["headers"] == custom_headers
+            assert call_kwargs["follow_redirects"] is True
 
     async def test_http_error_raised(self):
         """Test that HTTP errors are raised when status is 404."""
-        with patch("httpx.AsyncClient") as MockClient:
+        with patch.object(HTTPClientManager, "get_client") as MockClient:
             mock_client = AsyncMock()
 
             resp = MagicMock(spec=httpx.Response)
@@ -218,8 +213,7 @@ class TestWebLoader:
             ))
 
             mock_client.get = AsyncMock(return_value=resp)
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+            MockClient.return_value = mock_client
 
             loader = WebLoader(["https://example.com/notfound"])
             with pytest.raises(httpx.HTTPStatusError):
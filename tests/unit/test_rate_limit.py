@@ -0,0 +1,394 @@
+"""Tests for client-side RPM/TPM rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from agentchord.core.types import LLMResponse, Message, StreamChunk, Usage
+from agentchord.errors.exceptions import APIError, RateLimitError
+from agentchord.llm.rate_limit import (
+    RateLimitedProvider,
+    RateLimiter,
+    TokenBucket,
+    _parse_duration,
+    parse_retry_after,
+)
+from agentchord.llm.registry import ProviderRegistry
+from agentchord.resilience.retry import RetryPolicy
+from tests.conftest import MockLLMProvider
+
+
+class HeaderProvider(MockLLMProvider):
+    """Mock provider that reports rate limit headers like a real API."""
+
+    def __init__(self, headers: dict[str, str] | None = None, fail: bool = False) -> None:
+        super().__init__()
+        self._api_key = "sk-test"
+        self._headers = headers or {}
+        self._fail = fail
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        self.call_count += 1
+        self._report_response_headers(self._headers)
+        if self._fail:
+            raise RateLimitError("429", provider="mock", retry_after=0.05)
+        return LLMResponse(
+            content="ok",
+            model=self.model,
+            usage=Usage(prompt_tokens=10, completion_tokens=5),
+            finish_reason="stop",
+        )
+
+
+class ChunkedProvider(MockLLMProvider):
+    """Mock provider streaming several chunks without a usage chunk."""
+
+    async def stream(self, messages: list[Message], **kwargs: Any):
+        for word in ("a", "b", "c"):
+            yield StreamChunk(content=word, delta=word)
+
+
+class FailingProvider(MockLLMProvider):
+    """Mock provider failing with a non-rate-limit error."""
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        raise APIError("server error", provider="mock", status_code=500)
+
+
+def _tpm_limiter() -> RateLimiter:
+    limiter = RateLimiter(tpm=10_000)
+    limiter._tokens = TokenBucket(10_000, period=3600.0)
+    return limiter
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_reserve_within_capacity_is_free(self):
+        bucket = TokenBucket(10, period=1.0)
+        wait, amount = bucket.reserve(4)
+        assert wait == 0
+        assert amount == 4
+
+    def test_reserve_over_capacity_waits_for_debt(self):
+        bucket = TokenBucket(10, period=1.0)
+        bucket.reserve(10)
+        wait, _ = bucket.reserve(5)
+        assert wait == pytest.approx(0.5, abs=0.05)
+
+    def test_amount_capped_at_capacity(self):
+        bucket = TokenBucket(10, period=1.0)
+        _, amount = bucket.reserve(50)
+        assert amount == 10
+
+    def test_give_back_and_limit_to(self):
+        bucket = TokenBucket(10, period=60.0)
+        bucket.reserve(6)
+        bucket.give_back(6)
+        assert bucket.available == pytest.approx(10, abs=0.01)
+        bucket.limit_to(2)
+        assert bucket.available == pytest.approx(2, abs=0.01)
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestHeaderParsing:
+    """Tests for header helpers."""
+
+    def test_parse_duration(self):
+        assert _parse_duration("1s") == 1.0
+        assert _parse_duration("6m0s") == 360.0
+        assert _parse_duration("20ms") == pytest.approx(0.02)
+        assert _parse_duration("1h2m3.5s") == pytest.approx(3723.5)
+        assert _parse_duration("soon") is None
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after({"Retry-After": "7"}) == 7.0
+        assert parse_retry_after({"retry-after-ms": "250", "retry-after": "1"}) == 0.25
+        assert parse_retry_after({}) is None
+        assert parse_retry_after(None) is None
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    async def test_unlimited_never_waits(self):
+        limiter = RateLimiter()
+        for _ in range(100):
+            assert await limiter.acquire(10_000) == 0
+        assert limiter.stats.requests == 100
+        assert limiter.stats.wait_seconds == 0
+
+    async def test_rpm_throttles(self):
+        limiter = RateLimiter(rpm=600)  # 10 requests per second
+        limiter._requests = TokenBucket(2, period=0.2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.15
+        assert limiter.stats.throttled >= 1
+
+    async def test_tpm_throttles(self):
+        limiter = RateLimiter(tpm=1000)
+        limiter._tokens = TokenBucket(100, period=0.2)
+
+        await limiter.acquire(100)
+        await limiter.acquire(50)
+
+        assert limiter.stats.wait_seconds == pytest.approx(0.1, abs=0.05)
+
+    async def test_record_refunds_overestimate(self):
+        limiter = RateLimiter(tpm=1000)
+        reserved = await limiter.acquire(800)
+        limiter.record(reserved, actual=100)
+        assert limiter._tokens.available == pytest.approx(900, abs=1)
+
+    async def test_record_reconciles_capped_reservation(self):
+        limiter = RateLimiter(tpm=1000)
+        reserved = await limiter.acquire(5000)
+        assert reserved == 1000
+
+        limiter.record(reserved, actual=100)
+        assert limiter._tokens.available == pytest.approx(900, abs=1)
+
+    async def test_cancelled_acquire_refunds(self):
+        limiter = RateLimiter(tpm=1000)
+        limiter._tokens = TokenBucket(100, period=10.0)
+        await limiter.acquire(100)
+
+        task = asyncio.create_task(limiter.acquire(100))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter._tokens.available > -1
+
+    async def test_block_delays_acquire(self):
+        limiter = RateLimiter()
+        limiter.block(0.05)
+        await limiter.acquire()
+        assert limiter.stats.wait_seconds >= 0.04
+
+    def test_learns_openai_headers(self):
+        limiter = RateLimiter()
+        limiter.update_from_headers({
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "1000",
+        })
+        assert limiter.rpm == 500
+        assert limiter.tpm == 30000
+        assert limiter._tokens.available == pytest.approx(1000, abs=1)
+        assert limiter.stats.header_updates == 1
+
+    def test_learns_anthropic_headers(self):
+        limiter = RateLimiter()
+        limiter.update_from_headers({
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-tokens-limit": "40000",
+        })
+        assert (limiter.rpm, limiter.tpm) == (50, 40000)
+
+    def test_configured_limit_is_ceiling(self):
+        limiter = RateLimiter(rpm=100)
+        limiter.update_from_headers({"x-ratelimit-limit-requests": "500"})
+        assert limiter.rpm == 100
+        limiter.update_from_headers({"x-ratelimit-limit-requests": "20"})
+        assert limiter.rpm == 20
+
+    def test_exhausted_requests_block_until_reset(self):
+        limiter = RateLimiter()
+        limiter.update_from_headers({
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "2s",
+        })
+        assert limiter._blocked_until - time.monotonic() > 1.5
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rpm=0)
+
+
+class TestRateLimitedProvider:
+    """Tests for RateLimitedProvider."""
+
+    async def test_headers_feed_limiter(self):
+        inner = HeaderProvider({"x-ratelimit-limit-tokens": "90000"})
+        limiter = RateLimiter()
+        provider = RateLimitedProvider(inner, limiter)
+
+        response = await provider.complete([Message.user("hi")], max_tokens=100)
+
+        assert response.content == "ok"
+        assert limiter.tpm == 90000
+        assert provider.provider_name == "mock"
+
+    async def test_existing_headers_hook_kept(self):
+        inner = HeaderProvider({"x-ratelimit-limit-tokens": "90000"})
+        seen: list[dict[str, str]] = []
+        inner.response_headers_hook = lambda headers: seen.append(dict(headers))
+        limiter = RateLimiter()
+        provider = RateLimitedProvider(inner, limiter)
+
+        await provider.complete([Message.user("hi")], max_tokens=100)
+
+        assert seen == [{"x-ratelimit-limit-tokens": "90000"}]
+        assert limiter.tpm == 90000
+
+    async def test_rate_limit_error_blocks_limiter(self):
+        limiter = RateLimiter()
+        provider = RateLimitedProvider(HeaderProvider(fail=True), limiter)
+
+        with pytest.raises(RateLimitError):
+            await provider.complete([Message.user("hi")])
+
+        assert limiter.stats.rate_limit_errors == 1
+        assert limiter._blocked_until > time.monotonic()
+
+    async def test_stream_passthrough(self):
+        limiter = RateLimiter(rpm=10)
+        provider = RateLimitedProvider(MockLLMProvider(response_content="hello"), limiter)
+
+        chunks = [c async for c in provider.stream([Message.user("hi")])]
+
+        assert chunks[-1].content == "hello"
+        assert limiter.stats.requests == 1
+
+    async def test_success_charges_actual_usage(self):
+        limiter = _tpm_limiter()
+        provider = RateLimitedProvider(MockLLMProvider(), limiter)
+
+        await provider.complete([Message.user("hi")], max_tokens=1000)
+
+        assert limiter._tokens.available == pytest.approx(10_000 - 15, abs=1)
+
+    async def test_failed_call_refunds_estimate(self):
+        limiter = _tpm_limiter()
+        provider = RateLimitedProvider(FailingProvider(), limiter)
+
+        with pytest.raises(APIError):
+            await provider.complete([Message.user("hi")], max_tokens=1000)
+
+        assert limiter._tokens.available == pytest.approx(10_000)
+
+    async def test_cancelled_call_refunds_estimate(self):
+        limiter = _tpm_limiter()
+        started = asyncio.Event()
+
+        class SlowProvider(MockLLMProvider):
+            async def complete(self, messages, **kwargs):
+                started.set()
+                await asyncio.sleep(10)
+
+        provider = RateLimitedProvider(SlowProvider(), limiter)
+        task = asyncio.create_task(
+            provider.complete([Message.user("hi")], max_tokens=1000)
+        )
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter._tokens.available == pytest.approx(10_000)
+
+    async def test_stream_charges_usage_chunk(self):
+        limiter = _tpm_limiter()
+        provider = RateLimitedProvider(MockLLMProvider(), limiter)
+
+        _ = [c async for c in provider.stream([Message.user("hi")], max_tokens=1000)]
+
+        assert limiter._tokens.available == pytest.approx(10_000 - 15, abs=1)
+
+    async def test_stream_without_usage_refunds_estimate(self):
+        limiter = _tpm_limiter()
+        provider = RateLimitedProvider(ChunkedProvider(), limiter)
+
+        chunks = [c async for c in provider.stream([Message.user("hi")], max_tokens=1000)]
+
+        assert [c.content for c in chunks] == ["a", "b", "c"]
+        assert limiter._tokens.available == pytest.approx(10_000)
+
+    async def test_stream_stopped_early_refunds_estimate(self):
+        limiter = _tpm_limiter()
+        provider = RateLimitedProvider(ChunkedProvider(), limiter)
+
+        stream = provider.stream([Message.user("hi")], max_tokens=1000)
+        async for _ in stream:
+            break
+        assert limiter._tokens.available < 10_000
+
+        await stream.aclose()
+        assert limiter._tokens.available == pytest.approx(10_000)
+
+
+class TestRegistryRateLimits:
+    """Tests for ProviderRegistry rate limit configuration."""
+
+    def _registry(self) -> ProviderRegistry:
+        registry = ProviderRegistry()
+        registry.register("mock", lambda **kw: HeaderProvider(), ["mock-"])
+        return registry
+
+    def test_no_limit_by_default(self):
+        provider = self._registry().create_provider("mock-1")
+        assert isinstance(provider, HeaderProvider)
+
+    def test_providers_share_limiter_per_model_and_key(self):
+        registry = self._registry()
+        registry.set_rate_limit("mock", rpm=60, tpm=10_000)
+
+        a = registry.create_provider("mock-1")
+        b = registry.create_provider("mock-1")
+        c = registry.create_provider("mock-2")
+
+        assert isinstance(a, RateLimitedProvider)
+        assert a.limiter is b.limiter
+        assert a.limiter is not c.limiter
+        assert a.limiter.rpm == 60
+
+    def test_different_keys_get_different_limiters(self):
+        registry = self._registry()
+        registry.set_rate_limit("mock", rpm=60)
+        assert registry.get_rate_limiter("mock", "m", "k1") is not registry.get_rate_limiter(
+            "mock", "m", "k2"
+        )
+
+    def test_clear_and_unknown_provider(self):
+        registry = self._registry()
+        registry.set_rate_limit("mock", rpm=60)
+        assert registry.clear_rate_limit("mock")
+        assert isinstance(registry.create_provider("mock-1"), HeaderProvider)
+        with pytest.raises(KeyError):
+            registry.set_rate_limit("nope", rpm=1)
+
+
+class TestRetryHonoursRetryAfter:
+    """RetryPolicy waits at least the provider's retry_after."""
+
+    async def test_retry_after_used_as_minimum_delay(self):
+        policy = RetryPolicy(max_retries=1, base_delay=0.001, jitter=False)
+        calls = 0
+
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RateLimitError("429", provider="mock", retry_after=3.0)
+            return "ok"
+
+        with patch("agentchord.resilience.retry.asyncio.sleep") as sleep:
+            assert await policy.execute(flaky) == "ok"
+        sleep.assert_called_once_with(3.0)
@@ -0,0 +1,261 @@
+"""Unit tests for RoutedProvider."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+import pytest
+
+from agentchord.core.types import LLMResponse, Message, StreamChunk
+from agentchord.errors.exceptions import APIError, CostLimitExceededError
+from agentchord.llm.router import RoutedProvider
+from agentchord.resilience.circuit_breaker import CircuitOpenError, CircuitState
+from tests.conftest import MockLLMProvider
+
+
+class FakeProvider(MockLLMProvider):
+    """Mock provider with configurable latency, failures and price."""
+
+    def __init__(
+        self,
+        model: str,
+        latency: float = 0.0,
+        fail: bool = False,
+        cost_per_1k: float = 0.001,
+    ) -> None:
+        super().__init__(model=model, response_content=model)
+        self.latency = latency
+        self.fail = fail
+        self.cost_per_1k = cost_per_1k
+        self.name = "mock"
+        self.seen_tools: list[list[dict[str, Any]]] = []
+
+    @property
+    def provider_name(self) -> str:
+        return self.name
+
+    @property
+    def cost_per_1k_input_tokens(self) -> float:
+        return self.cost_per_1k
+
+    @property
+    def cost_per_1k_output_tokens(self) -> float:
+        return self.cost_per_1k
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        if "tools" in kwargs:
+            self.seen_tools.append(kwargs["tools"])
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            self.call_count += 1
+            raise APIError("unavailable", provider="fake", status_code=503)
+        return await super().complete(messages, **kwargs)
+
+    async def stream(self, messages: list[Message], **kwargs: Any) -> AsyncIterator[StreamChunk]:
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            self.call_count += 1
+            raise APIError("unavailable", provider="fake", status_code=503)
+        async for chunk in super().stream(messages, **kwargs):
+            yield chunk
+
+
+MESSAGES = [Message.user("hello")]
+
+
+class TestRoutedProvider:
+    """Tests for RoutedProvider."""
+
+    async def test_routes_to_fastest_candidate(self) -> None:
+        slow = FakeProvider("slow", latency=0.03)
+        fast = FakeProvider("fast", latency=0.0)
+        router = RoutedProvider([slow, fast])
+
+        # Each untried candidate is measured once, in order
+        assert (await router.complete(MESSAGES)).content == "slow"
+        assert (await router.complete(MESSAGES)).content == "fast"
+
+        for _ in range(3):
+            assert (await router.complete(MESSAGES)).content == "fast"
+        assert slow.call_count == 1
+        assert router.current is fast
+        # Reported model and pricing stay on the first candidate
+        assert router.model == "slow"
+
+    async def test_fails_over_on_error(self) -> None:
+        broken = FakeProvider("broken", fail=True)
+        backup = FakeProvider("backup")
+        router = RoutedProvider([broken, backup])
+
+        response = await router.complete(MESSAGES)
+
+        assert response.content == "backup"
+        stats = {s.model: s for s in router.stats}
+        assert stats["broken"].failures == 1
+        assert stats["broken"].error_rate > 0
+        assert stats["backup"].error_rate == 0.0
+
+        # The failed candidate is now ranked last
+        assert (await router.complete(MESSAGES)).content == "backup"
+        assert broken.call_count == 1
+
+    async def test_open_circuit_stops_traffic(self) -> None:
+        broken = FakeProvider("broken", fail=True)
+        backup = FakeProvider("backup", latency=0.01)
+        router = RoutedProvider([broken, backup], failure_threshold=2)
+
+        # A degraded provider with a lower latency than the backup
+        router.routes[0].latency = 0.0
+        for _ in range(2):
+            await router.complete(MESSAGES)
+        assert router.routes[0].breaker.state == CircuitState.OPEN
+
+        calls = broken.call_count
+        for _ in range(3):
+            assert (await router.complete(MESSAGES)).content == "backup"
+        assert broken.call_count == calls
+
+    async def test_half_open_candidate_gets_trial_call(self) -> None:
+        flaky = FakeProvider("flaky", fail=True)
+        backup = FakeProvider("backup")
+        router = RoutedProvider([flaky, backup], failure_threshold=1, recovery_timeout=0.01)
+
+        await router.complete(MESSAGES)
+        assert router.routes[0].breaker.state == CircuitState.OPEN
+
+        flaky.fail = False
+        await asyncio.sleep(0.02)
+        assert (await router.complete(MESSAGES)).content == "flaky"
+
+    async def test_all_failing_raises_last_error(self) -> None:
+        router = RoutedProvider([FakeProvider("a", fail=True), FakeProvider("b", fail=True)])
+        with pytest.raises(APIError):
+            await router.complete(MESSAGES)
+
+    async def test_all_circuits_open(self) -> None:
+        router = RoutedProvider([FakeProvider("a", fail=True)], failure_threshold=1)
+        with pytest.raises(APIError):
+            await router.complete(MESSAGES)
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await router.complete(MESSAGES)
+        assert exc_info.value.retry_after is not None
+        assert exc_info.value.retry_after > 0
+
+    async def test_cost_ceiling_skips_expensive_candidates(self) -> None:
+        expensive = FakeProvider("expensive", cost_per_1k=1.0)
+        cheap = FakeProvider("cheap", latency=0.01, cost_per_1k=0.0001)
+        router = RoutedProvider([expensive, cheap], max_cost=0.01)
+
+        for _ in range(3):
+            response = await router.complete(MESSAGES, max_tokens=100)
+            assert response.content == "cheap"
+        assert expensive.call_count == 0
+
+    async def test_cost_ceiling_with_no_affordable_candidate(self) -> None:
+        router = RoutedProvider([FakeProvider("expensive", cost_per_1k=1.0)], max_cost=0.001)
+        with pytest.raises(CostLimitExceededError):
+            await router.complete(MESSAGES, max_tokens=100)
+
+    async def test_stream_tracks_ttft_and_fails_over(self) -> None:
+        broken = FakeProvider("broken", fail=True)
+        backup = FakeProvider("backup")
+        router = RoutedProvider([broken, backup])
+
+        chunks = [chunk async for chunk in router.stream(MESSAGES)]
+
+        assert chunks[-1].content == "backup"
+        stats = {s.model: s for s in router.stats}
+        assert stats["backup"].ttft is not None
+        assert stats["broken"].failures == 1
+        assert router.routes[0].breaker.failure_count == 1
+
+    async def test_tools_converted_per_candidate(self) -> None:
+        from agentchord.core.agent import Agent
+        from agentchord.tools import tool
+
+        @tool(description="Look something up")
+        def lookup(query: str) -> str:
+            return query
+
+        openai = FakeProvider("gpt", fail=True)
+        openai.name = "openai"
+        anthropic = FakeProvider("claude")
+        anthropic.name = "anthropic"
+        agent = Agent(
+            name="a", role="r", llm_provider=RoutedProvider([openai, anthropic]), tools=[lookup]
+        )
+
+        await agent.run("hi")
+
+        assert openai.seen_tools[0][0]["function"]["name"] == "lookup"
+        assert anthropic.seen_tools[0][0]["name"] == "lookup"
+        assert "input_schema" in anthropic.seen_tools[0][0]
+
+    async def test_openai_only_kwargs_adapted_per_candidate(self) -> None:
+        openai = FakeProvider("gpt", fail=True)
+        openai.name = "openai"
+        gemini = FakeProvider("gemini")
+        gemini.name = "gemini"
+        seen: list[tuple[list[Message], dict[str, Any]]] = []
+        original = gemini.complete
+
+        async def recording(messages: list[Message], **kwargs: Any) -> LLMResponse:
+            seen.append((messages, kwargs))
+            return await original(messages, **kwargs)
+
+        gemini.complete = recording  # type: ignore[method-assign]
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": "A", "schema": {"type": "object"}},
+        }
+
+        await RoutedProvider([openai, gemini]).complete(
+            [Message.system("Be brief."), *MESSAGES],
+            response_format=response_format,
+            parallel_tool_calls=False,
+        )
+
+        messages, kwargs = seen[0]
+        assert "response_format" not in kwargs
+        assert "parallel_tool_calls" not in kwargs
+        assert messages[0].content.startswith("Be brief.")
+        assert "valid JSON" in messages[0].content
+        assert len(messages) == 2
+
+    async def test_cost_priced_per_response(self) -> None:
+        from agentchord.core.agent import Agent
+        from agentchord.tracking.cost import CostTracker
+
+        cheap = FakeProvider("cheap", cost_per_1k=0.001)
+        pricey = FakeProvider("pricey", latency=0.01, cost_per_1k=1.0)
+        router = RoutedProvider([pricey, cheap])
+        tracker = CostTracker()
+        agent = Agent(name="a", role="r", llm_provider=router, cost_tracker=tracker)
+
+        first = await agent.run("hi")   # untried: pricey
+        await router.complete(MESSAGES)  # untried: cheap
+        second = await agent.run("hi")  # fastest: cheap
+
+        assert first.cost == pytest.approx(pricey.calculate_cost(10, 5))
+        assert second.cost == pytest.approx(cheap.calculate_cost(10, 5))
+        entries = tracker.get_entries()
+        assert [e.model for e in entries] == ["pricey", "cheap"]
+        assert [e.cost_usd for e in entries] == [first.cost, second.cost]
+
+    def test_model_strings_use_registry(self) -> None:
+        router = RoutedProvider(["ollama/llama3.2"])
+        assert router.routes[0].provider.model == "ollama/llama3.2"
+
+    def test_stats_to_dict(self) -> None:
+        router = RoutedProvider([FakeProvider("a")])
+        data = router.stats[0].to_dict()
+        assert data["model"] == "a"
+        assert data["state"] == "closed"
+        assert data["latency"] is None
+
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            RoutedProvider([])
+        with pytest.raises(ValueError):
+            RoutedProvider([FakeProvider("a")], max_cost=0)
@@ -0,0 +1,279 @@
+"""Tests for singleflight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.types import LLMResponse, Message, Usage
+from agentchord.llm.coalesce import CoalescingProvider
+from agentchord.rag.embeddings.coalesce import CoalescingEmbeddings
+from agentchord.utils.singleflight import SingleFlight
+from tests.conftest import MockEmbeddingProvider, MockLLMProvider
+
+
+class SlowLLMProvider(MockLLMProvider):
+    """Mock provider whose complete() takes a while."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        super().__init__()
+        self._delay = delay
+
+    async def complete(self, messages: list[Message], **kwargs: Any) -> LLMResponse:
+        self.call_count += 1
+        await asyncio.sleep(self._delay)
+        return LLMResponse(
+            content=messages[-1].content.upper(),
+            model=self.model,
+            usage=Usage(prompt_tokens=10, completion_tokens=5),
+            finish_reason="stop",
+        )
+
+
+class CountingEmbeddings(MockEmbeddingProvider):
+    """Mock embedding provider that records upstream calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+        self.singles: list[str] = []
+
+    async def embed(self, text: str) -> list[float]:
+        self.singles.append(text)
+        await asyncio.sleep(0.02)
+        return await super().embed(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        await asyncio.sleep(0.02)
+        return await super().embed_batch(texts)
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight primitive."""
+
+    async def test_concurrent_callers_share_one_call(self):
+        group: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return 42
+
+        results = await asyncio.gather(*(group.do("k", fetch) for _ in range(5)))
+
+        assert results == [42] * 5
+        assert calls == 1
+        assert group.stats.calls == 1
+        assert group.stats.coalesced == 4
+        assert group.stats.coalesce_rate == pytest.approx(0.8)
+        assert group.in_flight == 0
+
+    async def test_different_keys_run_separately(self):
+        group: SingleFlight[str] = SingleFlight()
+
+        async def fetch(value: str) -> str:
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            group.do("a", lambda: fetch("a")),
+            group.do("b", lambda: fetch("b")),
+        )
+
+        assert results == ["a", "b"]
+        assert group.stats.calls == 2
+
+    async def test_sequential_calls_are_not_coalesced(self):
+        group: SingleFlight[int] = SingleFlight()
+
+        async def fetch() -> int:
+            return 1
+
+        await group.do("k", fetch)
+        await group.do("k", fetch)
+
+        assert group.stats.calls == 2
+        assert group.stats.coalesced == 0
+
+    async def test_exception_shared_with_all_callers(self):
+        group: SingleFlight[int] = SingleFlight()
+
+        async def fail() -> int:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            group.do("k", fail), group.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert group.stats.calls == 1
+
+    async def test_one_waiter_cancelling_keeps_shared_call(self):
+        group: SingleFlight[str] = SingleFlight()
+        started = asyncio.Event()
+
+        async def fetch() -> str:
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(group.do("k", fetch))
+        second = asyncio.create_task(group.do("k", fetch))
+        await started.wait()
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        assert await second == "done"
+        assert group.stats.cancelled == 0
+
+    async def test_last_waiter_cancelling_cancels_call(self):
+        group: SingleFlight[str] = SingleFlight()
+        started = asyncio.Event()
+        upstream_cancelled = asyncio.Event()
+
+        async def fetch() -> str:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                upstream_cancelled.set()
+                raise
+            return "never"
+
+        waiter = asyncio.create_task(group.do("k", fetch))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        await asyncio.wait_for(upstream_cancelled.wait(), timeout=1)
+        assert group.stats.cancelled == 1
+        assert group.in_flight == 0
+
+
+class TestCoalescingProvider:
+    """Tests for CoalescingProvider."""
+
+    async def test_identical_requests_coalesced(self):
+        inner = SlowLLMProvider()
+        provider = CoalescingProvider(inner)
+        messages = [Message.user("hi")]
+
+        results = await asyncio.gather(
+            *(provider.complete(messages, temperature=0) for _ in range(4))
+        )
+
+        assert inner.call_count == 1
+        assert {r.content for r in results} == {"HI"}
+        assert provider.stats.coalesced == 3
+
+    async def test_followers_get_unbilled_copies(self):
+        inner = SlowLLMProvider()
+        provider = CoalescingProvider(inner)
+        messages = [Message.user("hi")]
+
+        results = await asyncio.gather(
+            *(provider.complete(messages, temperature=0) for _ in range(3))
+        )
+
+        leader, *followers = results
+        assert not leader.coalesced and leader.cost is None
+        assert all(r.coalesced and r.cost == 0.0 for r in followers)
+        assert all(r is not leader for r in followers)
+
+    async def test_agents_billed_once_for_shared_call(self):
+        inner = SlowLLMProvider()
+        provider = CoalescingProvider(inner)
+        agents = [
+            Agent(name="a", role="r", llm_provider=provider, temperature=0)
+            for _ in range(3)
+        ]
+
+        results = await asyncio.gather(*(agent.run("hi") for agent in agents))
+
+        assert inner.call_count == 1
+        assert sum(r.cost for r in results) == pytest.approx(
+            inner.calculate_cost(10, 5)
+        )
+
+    async def test_different_messages_not_coalesced(self):
+        inner = SlowLLMProvider()
+        provider = CoalescingProvider(inner)
+
+        results = await asyncio.gather(
+            provider.complete([Message.user("a")], temperature=0),
+            provider.complete([Message.user("b")], temperature=0),
+        )
+
+        assert inner.call_count == 2
+        assert [r.content for r in results] == ["A", "B"]
+
+    async def test_sampling_requests_not_coalesced_by_default(self):
+        inner = SlowLLMProvider()
+        provider = CoalescingProvider(inner)
+        messages = [Message.user("hi")]
+
+        await asyncio.gather(
+            *(provider.complete(messages, temperature=0.7) for _ in range(3))
+        )
+        assert inner.call_count == 3
+
+        provider = CoalescingProvider(inner, only_deterministic=False)
+        await asyncio.gather(
+            *(provider.complete(messages, temperature=0.7) for _ in range(3))
+        )
+        assert inner.call_count == 4
+
+    async def test_stream_passthrough(self):
+        inner = MockLLMProvider(response_content="streamed")
+        provider = CoalescingProvider(inner)
+
+        chunks = [c async for c in provider.stream([Message.user("hi")])]
+
+        assert chunks[-1].content == "streamed"
+        assert provider.provider_name == "mock"
+
+
+class TestCoalescingEmbeddings:
+    """Tests for CoalescingEmbeddings."""
+
+    async def test_concurrent_embed_coalesced(self):
+        inner = CountingEmbeddings()
+        embeddings = CoalescingEmbeddings(inner)
+
+        results = await asyncio.gather(*(embeddings.embed("query") for _ in range(5)))
+
+        assert inner.singles == ["query"]
+        assert all(r == results[0] for r in results)
+        assert embeddings.stats.coalesced == 4
+
+    async def test_batch_deduplicates_texts(self):
+        inner = CountingEmbeddings()
+        embeddings = CoalescingEmbeddings(inner)
+
+        vectors = await embeddings.embed_batch(["a", "b", "a"])
+
+        assert inner.batches == [["a", "b"]]
+        assert vectors[0] == vectors[2]
+        assert len(vectors) == 3
+
+    async def test_concurrent_identical_batches_coalesced(self):
+        inner = CountingEmbeddings()
+        embeddings = CoalescingEmbeddings(inner)
+
+        await asyncio.gather(
+            embeddings.embed_batch(["x", "y"]),
+            embeddings.embed_batch(["x", "y"]),
+        )
+
+        assert len(inner.batches) == 1
+        assert embeddings.dimensions == inner.dimensions
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from agentchord.core.state import WorkflowResult, WorkflowState, WorkflowStatus
+from agentchord.core.state import History, WorkflowResult, WorkflowState, WorkflowStatus
 from agentchord.core.types import AgentResult, Usage
 
 
@@ -113,6 +113,65 @@ class TestWorkflowState:
         assert state.effective_input == "original"
 
 
+class TestHistory:
+    """Tests for the persistent History sequence."""
+
+    def test_appended_leaves_original_unchanged(self) -> None:
+        """appended() should return a new history sharing the prefix."""
+        first = History([1, 2])
+        second = first.appended(3)
+
+        assert list(first) == [1, 2]
+        assert list(second) == [1, 2, 3]
+        assert second._items is first._items
+
+    def test_branches_do_not_see_each_other(self) -> None:
+        """Appending to an older history should copy its prefix."""
+        base = History([1])
+        left = base.appended(2)
+        right = base.appended(3)
+
+        assert list(left) == [1, 2]
+        assert list(right) == [1, 3]
+        assert list(base) == [1]
+        assert list(left.appended(4)) == [1, 2, 4]
+
+    def test_list_like_reads(self) -> None:
+        """History should index, slice and compare like a list."""
+        history = History(["a", "b"]).appended("c")
+
+        assert history[0] == "a"
+        assert history[-1] == "c"
+        assert history[1:] == ["b", "c"]
+        assert "b" in history
+        assert history == ["a", "b", "c"]
+        assert history == ("a", "b", "c")
+        assert history != ["a", "b"]
+        with pytest.raises(IndexError):
+            history[3]
+
+    def test_state_history_round_trips(self) -> None:
+        """WorkflowState should accept lists and serialize history as a list."""
+        result = create_agent_result("out")
+        state = WorkflowState(input="test", history=[result]).with_result(result)
+
+        assert isinstance(state.history, History)
+        dumped = state.model_dump()
+        assert isinstance(dumped["history"], list)
+        assert len(dumped["history"]) == 2
+
+        restored = WorkflowState.model_validate_json(state.model_dump_json())
+        assert restored.history == state.history
+
+    def test_with_current_agent(self) -> None:
+        """with_current_agent should not touch history."""
+        state = WorkflowState(input="test").with_result(create_agent_result("x"))
+        new_state = state.with_current_agent("writer")
+
+        assert new_state.current_agent == "writer"
+        assert new_state.history is state.history
+
+
 class TestWorkflowResult:
     """Tests for WorkflowResult aggregations."""
 
@@ -0,0 +1,208 @@
+"""Unit tests for FastStreamChunk and chunk coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.streaming import (
+    AnyStreamChunk,
+    FastStreamChunk,
+    coalesce_chunks,
+    to_stream_chunk,
+    validate_chunks,
+)
+from agentchord.core.types import Message, StreamChunk, ToolCall, Usage
+from agentchord.llm.cache import CachedProvider
+from tests.conftest import MockLLMProvider
+
+
+async def token_stream(
+    tokens: list[str], *, delay: float = 0.0, final: bool = True
+) -> AsyncIterator[AnyStreamChunk]:
+    content = ""
+    for token in tokens:
+        if delay:
+            await asyncio.sleep(delay)
+        content += token
+        yield FastStreamChunk(content=content, delta=token)
+    if final:
+        yield FastStreamChunk(
+            content=content,
+            delta="",
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=3, completion_tokens=len(tokens)),
+        )
+
+
+class TestFastStreamChunk:
+    """Tests for FastStreamChunk."""
+
+    def test_defaults_match_stream_chunk(self) -> None:
+        fast = FastStreamChunk(content="Hi", delta="Hi")
+        assert fast == StreamChunk(content="Hi", delta="Hi")
+        assert fast.finish_reason is None
+        assert fast.usage is None
+        assert fast.tool_calls is None
+        assert fast.cache_hit is False
+
+    def test_is_slotted(self) -> None:
+        chunk = FastStreamChunk(content="a", delta="a")
+        assert not hasattr(chunk, "__dict__")
+        with pytest.raises(AttributeError):
+            chunk.extra = 1  # type: ignore[attr-defined]
+
+    def test_to_model_validates(self) -> None:
+        tool_call = ToolCall(id="1", name="search")
+        fast = FastStreamChunk(
+            content="done",
+            delta="",
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=1, completion_tokens=2),
+            tool_calls=[tool_call],
+        )
+
+        model = to_stream_chunk(fast)
+
+        assert isinstance(model, StreamChunk)
+        assert model.usage.total_tokens == 3
+        assert model.tool_calls == [tool_call]
+        assert fast.model_dump() == model.model_dump()
+
+        fast.content = None  # type: ignore[assignment]
+        with pytest.raises(ValueError):
+            fast.to_model()
+
+    def test_to_stream_chunk_keeps_models(self) -> None:
+        chunk = StreamChunk(content="a", delta="a")
+        assert to_stream_chunk(chunk) is chunk
+
+    async def test_cache_replay_yields_fast_chunks(self) -> None:
+        provider = CachedProvider(MockLLMProvider(response_content="one two three"))
+        messages = [Message.user("hi")]
+        [chunk async for chunk in provider.stream(messages, temperature=0)]
+
+        replayed = [
+            chunk async for chunk in provider.stream_chunks(messages, temperature=0)
+        ]
+
+        assert all(isinstance(c, FastStreamChunk) for c in replayed)
+        assert all(c.cache_hit for c in replayed)
+        assert replayed[-1].content == "one two three"
+
+    async def test_public_streams_yield_models(self) -> None:
+        provider = CachedProvider(MockLLMProvider(response_content="one two three"))
+        messages = [Message.user("hi")]
+        [chunk async for chunk in provider.stream(messages, temperature=0)]
+
+        replayed = [chunk async for chunk in provider.stream(messages, temperature=0)]
+        agent = Agent(name="a", role="r", llm_provider=provider, temperature=0)
+        streamed = [chunk async for chunk in agent.stream("hi")]
+
+        for chunk in replayed + streamed:
+            assert type(chunk) is StreamChunk
+            assert chunk.model_copy(update={"delta": ""}).delta == ""
+        assert '"cache_hit":true' in replayed[-1].model_dump_json()
+
+    async def test_validate_chunks_closes_source(self) -> None:
+        closed = False
+
+        async def source() -> AsyncIterator[AnyStreamChunk]:
+            nonlocal closed
+            try:
+                yield FastStreamChunk(content="a", delta="a")
+                yield FastStreamChunk(content="ab", delta="b")
+            finally:
+                closed = True
+
+        stream = validate_chunks(source())
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert isinstance(first, StreamChunk)
+        assert closed
+
+
+class TestCoalesceChunks:
+    """Tests for coalesce_chunks."""
+
+    async def test_size_window(self) -> None:
+        tokens = ["ab"] * 10
+
+        chunks = [c async for c in coalesce_chunks(token_stream(tokens), max_chars=6)]
+
+        assert [c.delta for c in chunks] == ["ababab", "ababab", "ababab", "ab"]
+        assert chunks[-1].content == "ab" * 10
+        assert chunks[-1].finish_reason == "stop"
+        assert chunks[-1].usage.completion_tokens == 10
+
+    async def test_time_window(self) -> None:
+        tokens = ["x"] * 6
+
+        chunks = [
+            c async for c in coalesce_chunks(
+                token_stream(tokens, delay=0.02), interval=0.05
+            )
+        ]
+
+        assert 1 < len(chunks) < len(tokens) + 1
+        assert "".join(c.delta for c in chunks) == "x" * 6
+        assert chunks[-1].content == "x" * 6
+        assert chunks[-1].finish_reason == "stop"
+
+    async def test_time_window_flushes_while_stream_is_quiet(self) -> None:
+        async def stalled() -> AsyncIterator[AnyStreamChunk]:
+            yield FastStreamChunk(content="a", delta="a")
+            await asyncio.sleep(10)
+            yield FastStreamChunk(content="ab", delta="b")
+
+        stream = coalesce_chunks(stalled(), interval=0.01)
+        first = await asyncio.wait_for(stream.__anext__(), 1)
+        assert first.delta == "a"
+        await stream.aclose()
+
+    async def test_tool_calls_are_not_held_back(self) -> None:
+        tool_call = ToolCall(id="1", name="search")
+
+        async def stream() -> AsyncIterator[AnyStreamChunk]:
+            yield FastStreamChunk(content="a", delta="a")
+            yield FastStreamChunk(content="a", delta="", tool_calls=[tool_call])
+            yield FastStreamChunk(content="ab", delta="b")
+
+        chunks = [c async for c in coalesce_chunks(stream(), max_chars=100)]
+
+        assert chunks[0].delta == "a"
+        assert chunks[0].tool_calls == [tool_call]
+        assert chunks[1].delta == "b"
+
+    async def test_single_chunk_passes_through(self) -> None:
+        original = StreamChunk(content="a", delta="a", finish_reason="stop")
+
+        async def stream() -> AsyncIterator[AnyStreamChunk]:
+            yield original
+
+        chunks = [c async for c in coalesce_chunks(stream(), max_chars=10)]
+
+        assert chunks == [original]
+        assert chunks[0] is original
+
+    async def test_merged_chunks_keep_model_type(self) -> None:
+        async def stream() -> AsyncIterator[AnyStreamChunk]:
+            yield StreamChunk(content="a", delta="a")
+            yield StreamChunk(content="ab", delta="b", finish_reason="stop")
+
+        chunks = [c async for c in coalesce_chunks(stream(), max_chars=10)]
+
+        assert chunks == [StreamChunk(content="ab", delta="ab", finish_reason="stop")]
+        assert type(chunks[0]) is StreamChunk
+
+    async def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            [c async for c in coalesce_chunks(token_stream([]))]
+        with pytest.raises(ValueError):
+            [c async for c in coalesce_chunks(token_stream([]), interval=0)]
+        with pytest.raises(ValueError):
+            [c async for c in coalesce_chunks(token_stream([]), max_chars=0)]
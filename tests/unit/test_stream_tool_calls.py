@@ -0,0 +1,342 @@
+"""Tests for streamed tool calls (provider assembly and Agent.stream rounds)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.types import Message, StreamChunk, ToolCall, Usage
+from agentchord.llm.ollama import OllamaProvider
+from agentchord.llm.tool_stream import ToolCallAccumulator
+from agentchord.tools import tool
+from agentchord.utils.http import HTTPClientManager
+from tests.conftest import MockLLMProvider
+
+
+class StreamingToolProvider(MockLLMProvider):
+    """Mock provider that streams tool calls, then a final text answer."""
+
+    supports_streaming_tool_calls = True
+
+    def __init__(self, rounds: list[list[StreamChunk]]) -> None:
+        super().__init__()
+        self._rounds = rounds
+        self.seen_messages: list[list[Message]] = []
+        self.events: list[str] = []
+
+    async def stream(self, messages: list[Message], **kwargs: Any) -> AsyncIterator[StreamChunk]:
+        self.seen_messages.append(list(messages))
+        chunks = self._rounds[self.call_count]
+        self.call_count += 1
+        for chunk in chunks:
+            self.events.append(f"chunk:{chunk.delta or 'tool'}")
+            yield chunk
+            await asyncio.sleep(0.01)
+        self.events.append("stream_end")
+
+
+def _tool_chunk(tc: ToolCall, finish: str | None = None) -> StreamChunk:
+    return StreamChunk(content="", delta="", tool_calls=[tc], finish_reason=finish)
+
+
+def _text_rounds(text: str) -> list[StreamChunk]:
+    chunks = []
+    content = ""
+    words = text.split(" ")
+    for i, word in enumerate(words):
+        piece = word if i == 0 else " " + word
+        content += piece
+        last = i == len(words) - 1
+        chunks.append(StreamChunk(
+            content=content,
+            delta=piece,
+            finish_reason="stop" if last else None,
+            usage=Usage(prompt_tokens=10, completion_tokens=5) if last else None,
+        ))
+    return chunks
+
+
+class TestToolCallAccumulator:
+    """Tests for ToolCallAccumulator."""
+
+    def test_openai_deltas_complete_on_next_index(self):
+        acc = ToolCallAccumulator()
+
+        assert acc.feed_openai([
+            {"index": 0, "id": "a", "function": {"name": "add", "arguments": '{"a": '}},
+        ]) == []
+        assert acc.feed_openai([{"index": 0, "function": {"arguments": "1}"}}]) == []
+        done = acc.feed_openai([
+            {"index": 1, "id": "b", "function": {"name": "mul", "arguments": "{}"}},
+        ])
+
+        assert done == [ToolCall(id="a", name="add", arguments={"a": 1})]
+        assert acc.finish_all() == [ToolCall(id="b", name="mul", arguments={})]
+
+    def test_sdk_objects_and_missing_index(self):
+        acc = ToolCallAccumulator()
+        delta = MagicMock(index=None, id="x")
+        delta.function.name = "search"
+        delta.function.arguments = '{"q": "hi"}'
+
+        acc.feed_openai([delta])
+
+        assert acc.finish_all() == [ToolCall(id="x", name="search", arguments={"q": "hi"})]
+
+    def test_invalid_json_arguments(self):
+        acc = ToolCallAccumulator()
+        acc.start(0, id="a", name="t")
+        acc.append(0, "{not json")
+        with pytest.raises(ValueError, match="invalid JSON arguments"):
+            acc.finish(0)
+
+        acc.start(1, id="b", name="t")
+        acc.append(1, "[1, 2]")
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            acc.finish(1)
+
+    def test_whole_calls_without_index_in_separate_chunks(self):
+        acc = ToolCallAccumulator()
+
+        assert acc.feed_openai([
+            {"id": "a", "function": {"name": "f", "arguments": {"x": 1}}},
+        ]) == []
+        done = acc.feed_openai([
+            {"id": "b", "function": {"name": "g", "arguments": {"y": 2}}},
+        ])
+
+        assert done == [ToolCall(id="a", name="f", arguments={"x": 1})]
+        assert acc.finish_all() == [ToolCall(id="b", name="g", arguments={"y": 2})]
+
+    def test_whole_calls_without_ids_start_new_calls(self):
+        acc = ToolCallAccumulator()
+
+        acc.feed_openai([{"function": {"name": "f", "arguments": '{"x": 1}'}}])
+        done = acc.feed_openai([{"function": {"name": "g", "arguments": "{}"}}])
+
+        assert [(tc.id, tc.name) for tc in done] == [("call_0", "f")]
+        assert [(tc.id, tc.name) for tc in acc.finish_all()] == [("call_1", "g")]
+
+    def test_several_whole_calls_in_one_chunk(self):
+        acc = ToolCallAccumulator()
+
+        done = acc.feed_openai([
+            {"id": "a", "function": {"name": "f", "arguments": {}}},
+            {"id": "b", "function": {"name": "g", "arguments": {}}},
+        ])
+
+        assert [tc.id for tc in done] == ["a"]
+        assert [tc.id for tc in acc.finish_all()] == ["b"]
+
+    def test_finish_is_idempotent(self):
+        acc = ToolCallAccumulator()
+        acc.start(2, name="t")
+        assert acc.finish(2).id == "call_2"
+        assert acc.finish(2) is None
+        acc.append(2, "{}")
+        assert acc.pending == 0
+
+
+class TestOllamaStreamToolCalls:
+    """Ollama assembles tool calls from SSE deltas."""
+
+    async def test_stream_yields_completed_tool_calls(self):
+        events = [
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 0, "id": "c1", "function": {"name": "add", "arguments": '{"a": 1,'}},
+            ]}}]},
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 0, "function": {"arguments": ' "b": 2}'}},
+            ]}}]},
+            {"choices": [{"delta": {"content": None}, "finish_reason": "tool_calls"}]},
+        ]
+        lines = [f"data: {json.dumps(e)}" for e in events] + ["data: [DONE]"]
+
+        async def aiter_lines():
+            for line in lines:
+                yield line
+
+        response = MagicMock()
+        response.aiter_lines = aiter_lines
+
+        @asynccontextmanager
+        async def fake_stream(*args: Any, **kwargs: Any):
+            yield response
+
+        client = MagicMock()
+        client.stream = fake_stream
+
+        provider = OllamaProvider(model="ollama/llama3.2")
+        with patch.object(HTTPClientManager, "get_client", return_value=client):
+            chunks = [c async for c in provider.stream([Message.user("hi")], tools=[])]
+
+        calls = [tc for c in chunks for tc in (c.tool_calls or [])]
+        assert calls == [ToolCall(id="c1", name="add", arguments={"a": 1, "b": 2})]
+        assert chunks[-1].finish_reason == "tool_calls"
+        assert provider.supports_streaming_tool_calls
+
+
+class TestAgentStreamingToolRounds:
+    """Agent.stream streams every round when the provider supports it."""
+
+    async def test_final_text_streams_token_by_token(self):
+        @tool(description="Add numbers")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        provider = StreamingToolProvider([
+            [_tool_chunk(ToolCall(id="c1", name="add", arguments={"a": 2, "b": 3}), "tool_calls")],
+            _text_rounds("The answer is 5"),
+        ])
+        agent = Agent(name="a", role="r", llm_provider=provider, tools=[add])
+
+        chunks = [c async for c in agent.stream("add")]
+        text = [c.delta for c in chunks if c.delta]
+
+        assert text == ["The", " answer", " is", " 5"]
+        assert chunks[0].tool_calls[0].name == "add"
+        tool_message = provider.seen_messages[1][-1]
+        assert tool_message.tool_call_id == "c1"
+        assert tool_message.content == "5"
+
+    async def test_tool_starts_before_stream_ends(self):
+        @tool(description="Record start")
+        async def slow(label: str) -> str:
+            provider.events.append(f"tool:{label}")
+            await asyncio.sleep(0.01)
+            return label
+
+        provider = StreamingToolProvider([
+            [
+                _tool_chunk(ToolCall(id="1", name="slow", arguments={"label": "first"})),
+                _tool_chunk(
+                    ToolCall(id="2", name="slow", arguments={"label": "second"}), "tool_calls"
+                ),
+            ],
+            _text_rounds("done"),
+        ])
+        agent = Agent(name="a", role="r", llm_provider=provider, tools=[slow])
+
+        [c async for c in agent.stream("go")]
+
+        assert provider.events.index("tool:first") < provider.events.index("stream_end")
+        # TOOL messages keep the order of the calls
+        assert [m.tool_call_id for m in provider.seen_messages[1][-2:]] == ["1", "2"]
+
+    async def test_usage_tracked_for_streamed_rounds(self):
+        from agentchord.tracking.cost import CostTracker
+
+        @tool(description="Noop")
+        def noop() -> str:
+            return "ok"
+
+        provider = StreamingToolProvider([
+            [_tool_chunk(ToolCall(id="1", name="noop"), "tool_calls")],
+            _text_rounds("fine"),
+        ])
+        tracker = CostTracker()
+        agent = Agent(name="a", role="r", llm_provider=provider, tools=[noop], cost_tracker=tracker)
+
+        [c async for c in agent.stream("go")]
+
+        assert tracker.get_summary().total_tokens == 15
+
+    async def test_consumer_stopping_early_cancels_tools(self):
+        cancelled = asyncio.Event()
+
+        @tool(description="Never finishes")
+        async def hang() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "never"
+
+        provider = StreamingToolProvider([
+            [
+                _tool_chunk(ToolCall(id="1", name="hang")),
+                StreamChunk(content="x", delta="x"),
+            ],
+        ])
+        agent = Agent(name="a", role="r", llm_provider=provider, tools=[hang])
+
+        stream = agent.stream("go")
+        await stream.__anext__()
+        await asyncio.sleep(0)
+        await stream.aclose()
+
+        assert cancelled.is_set()
+
+    async def test_failed_stream_open_is_retried_then_trips_breaker(self):
+        from agentchord.errors.exceptions import APIError, AgentExecutionError
+        from agentchord.resilience import CircuitBreaker, CircuitState, RetryPolicy
+        from agentchord.resilience.config import ResilienceConfig
+
+        @tool(description="Noop")
+        def noop() -> str:
+            return "ok"
+
+        class FlakyProvider(StreamingToolProvider):
+            def __init__(self, rounds: list[list[StreamChunk]], failures: int) -> None:
+                super().__init__(rounds)
+                self.failures = failures
+                self.attempts = 0
+
+            async def stream(
+                self, messages: list[Message], **kwargs: Any
+            ) -> AsyncIterator[StreamChunk]:
+                self.attempts += 1
+                if self.failures:
+                    self.failures -= 1
+                    raise APIError("overloaded", provider="mock", status_code=529)
+                async for chunk in super().stream(messages, **kwargs):
+                    yield chunk
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        resilience = ResilienceConfig(
+            retry_policy=RetryPolicy(max_retries=1, base_delay=0.001, jitter=False),
+            circuit_breaker_enabled=True,
+            circuit_breaker=breaker,
+        )
+
+        provider = FlakyProvider([_text_rounds("recovered")], failures=1)
+        agent = Agent(
+            name="a", role="r", llm_provider=provider, tools=[noop], resilience=resilience
+        )
+        chunks = [c async for c in agent.stream("go")]
+
+        assert provider.attempts == 2
+        assert chunks[-1].content == "recovered"
+        assert breaker.state == CircuitState.CLOSED
+
+        provider = FlakyProvider([], failures=2)
+        agent = Agent(
+            name="a", role="r", llm_provider=provider, tools=[noop], resilience=resilience
+        )
+        with pytest.raises(AgentExecutionError):
+            [c async for c in agent.stream("go")]
+
+        assert provider.attempts == 2
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(AgentExecutionError):
+            [c async for c in agent.stream("go")]
+        assert provider.attempts == 2
+
+    async def test_falls_back_without_streaming_support(self):
+        @tool(description="Noop")
+        def noop() -> str:
+            return "ok"
+
+        provider = MockLLMProvider(response_content="plain")
+        agent = Agent(name="a", role="r", llm_provider=provider, tools=[noop])
+
+        chunks = [c async for c in agent.stream("go")]
+
+        assert [c.content for c in chunks] == ["plain"]
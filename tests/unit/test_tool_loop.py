@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
 
 from agentchord import Agent, AgentResult
@@ -282,6 +285,133 @@ class TestToolLoopMessages:
         assert assistant_msgs[0].tool_calls[0].name == "echo"
 
 
+class TestToolLoopConcurrency:
+    """Tests for concurrent execution of a round's tool calls."""
+
+    @staticmethod
+    def _make_sleep_tool(delays: dict[str, float], finished: list[str]):
+        @tool(description="Sleep then return the label")
+        async def sleep_tool(label: str) -> str:
+            await asyncio.sleep(delays[label])
+            finished.append(label)
+            return label
+        return sleep_tool
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self) -> None:
+        """A round with several slow tools should take about as long as the slowest."""
+        delays = {"a": 0.05, "b": 0.05, "c": 0.05}
+        tool_calls = [
+            ToolCall(id=f"tc_{k}", name="sleep_tool", arguments={"label": k})
+            for k in delays
+        ]
+        provider = MockToolCallProvider(
+            tool_calls_sequence=[tool_calls, None],
+            responses=["", "Done"],
+        )
+        agent = Agent(
+            name="test", role="Test", llm_provider=provider,
+            tools=[self._make_sleep_tool(delays, [])],
+        )
+
+        start = time.perf_counter()
+        await agent.run("Go")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.12
+
+    @pytest.mark.asyncio
+    async def test_tool_messages_keep_request_order(self) -> None:
+        """TOOL messages follow tool_calls order even if calls finish out of order."""
+        delays = {"slow": 0.04, "fast": 0.0, "mid": 0.02}
+        finished: list[str] = []
+        tool_calls = [
+            ToolCall(id=f"tc_{k}", name="sleep_tool", arguments={"label": k})
+            for k in delays
+        ]
+        provider = MockToolCallProvider(
+            tool_calls_sequence=[tool_calls, None],
+            responses=["", "Done"],
+        )
+        agent = Agent(
+            name="test", role="Test", llm_provider=provider,
+            tools=[self._make_sleep_tool(delays, finished)],
+        )
+
+        await agent.run("Go")
+
+        assert finished == ["fast", "mid", "slow"]
+        tool_msgs = [
+            m for m in provider.received_messages[1] if m.role == MessageRole.TOOL
+        ]
+        assert [m.tool_call_id for m in tool_msgs] == ["tc_slow", "tc_fast", "tc_mid"]
+        assert [m.content for m in tool_msgs] == ["slow", "fast", "mid"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_tools_one_is_sequential(self) -> None:
+        """max_concurrent_tools=1 should run calls one after another."""
+        delays = {"slow": 0.03, "fast": 0.0}
+        finished: list[str] = []
+        tool_calls = [
+            ToolCall(id=f"tc_{k}", name="sleep_tool", arguments={"label": k})
+            for k in delays
+        ]
+        provider = MockToolCallProvider(
+            tool_calls_sequence=[tool_calls, None],
+            responses=["", "Done"],
+        )
+        agent = Agent(
+            name="test", role="Test", llm_provider=provider,
+            tools=[self._make_sleep_tool(delays, finished)],
+            max_concurrent_tools=1,
+        )
+
+        await agent.run("Go")
+
+        assert finished == ["slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_callbacks_fire_per_call(self) -> None:
+        """tool_start and tool_end should fire once for every call."""
+        from agentchord.tracking.callbacks import CallbackEvent, CallbackManager
+
+        events: list[tuple[str, str]] = []
+        callbacks = CallbackManager()
+        callbacks.register(
+            CallbackEvent.TOOL_START,
+            lambda ctx: events.append(("start", ctx.data["tool_name"])),
+        )
+        callbacks.register(
+            CallbackEvent.TOOL_END,
+            lambda ctx: events.append(("end", ctx.data["tool_name"])),
+        )
+        tool_calls = [
+            ToolCall(id="tc_1", name="add", arguments={"a": 1, "b": 2}),
+            ToolCall(id="tc_2", name="echo", arguments={"text": "hi"}),
+        ]
+        provider = MockToolCallProvider(
+            tool_calls_sequence=[tool_calls, None],
+            responses=["", "Done"],
+        )
+        agent = Agent(
+            name="test", role="Test", llm_provider=provider,
+            tools=[_make_add_tool(), _make_echo_tool()],
+            callbacks=callbacks,
+        )
+
+        await agent.run("Go")
+
+        assert sorted(events) == [
+            ("end", "add"), ("end", "echo"), ("start", "add"), ("start", "echo"),
+        ]
+
+    def test_invalid_max_concurrent_tools(self) -> None:
+        """max_concurrent_tools below 1 should be rejected."""
+        provider = MockLLMProvider()
+        with pytest.raises(ValueError):
+            Agent(name="test", role="Test", llm_provider=provider, max_concurrent_tools=0)
+
+
 class TestToolLoopBackwardCompat:
     """Tests ensuring backward compatibility."""
 
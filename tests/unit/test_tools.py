@@ -2,11 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import time
+
 import pytest
 
 from agentchord.tools.base import Tool, ToolParameter, ToolResult
 from agentchord.tools.decorator import tool, _python_type_to_json_type
 from agentchord.tools.executor import ToolExecutor
+from agentchord.tools.pool import ToolExecutionMode, ToolWorkerPool
+
+
+@tool(description="Square a number in a worker process", execution_mode="process")
+def square_in_process(x: int) -> int:
+    return x * x
+
+
+@tool(description="Report the worker PID", execution_mode="process", timeout=0.5)
+def sleep_in_process(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
 
 
 class TestToolParameter:
@@ -244,6 +261,43 @@ class TestToolExecutor:
         assert result.success is False
         assert "not found" in result.error
 
+    @pytest.mark.asyncio
+    async def test_execute_respects_tool_max_concurrency(self) -> None:
+        """Concurrent calls should not exceed the tool's max_concurrency."""
+        active = 0
+        peak = 0
+
+        @tool(description="Slow", max_concurrency=2)
+        async def slow(x: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return x
+
+        executor = ToolExecutor([slow])
+        results = await asyncio.gather(*(executor.execute("slow", x=i) for i in range(6)))
+
+        assert [r.result for r in results] == list(range(6))
+        assert peak == 2
+
+    def test_max_concurrency_across_event_loops(self) -> None:
+        """A limited tool should keep working when reused from a new loop."""
+        @tool(description="Slow", max_concurrency=1)
+        async def slow(x: int) -> int:
+            await asyncio.sleep(0.01)
+            return x
+
+        executor = ToolExecutor([slow])
+
+        async def run() -> list[ToolResult]:
+            return await asyncio.gather(*(executor.execute("slow", x=i) for i in range(3)))
+
+        for _ in range(2):
+            results = asyncio.run(run())
+            assert all(r.success for r in results)
+
     def test_to_openai_tools(self) -> None:
         """Should convert all tools to OpenAI format."""
         @tool(description="Add")
@@ -255,3 +309,135 @@ class TestToolExecutor:
 
         assert len(tools) == 1
         assert tools[0]["type"] == "function"
+
+
+class TestToolExecutionModes:
+    """Tests for inline/thread/process execution of sync tools."""
+
+    @pytest.mark.asyncio
+    async def test_sync_tool_defaults_to_thread_pool(self) -> None:
+        """Sync tools should run off the event loop thread by default."""
+        @tool(description="Report thread")
+        def which_thread() -> int:
+            return threading.get_ident()
+
+        assert which_thread.execution_mode == ToolExecutionMode.THREAD
+        result = await which_thread.execute()
+
+        assert result.success is True
+        assert result.result != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_runs_on_loop_thread(self) -> None:
+        """Inline mode should call the function directly."""
+        @tool(description="Report thread", execution_mode="inline")
+        def which_thread() -> int:
+            return threading.get_ident()
+
+        result = await which_thread.execute()
+
+        assert result.result == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_blocking_tool_does_not_stall_loop(self) -> None:
+        """A blocking thread-mode tool should let other coroutines progress."""
+        @tool(description="Block")
+        def block() -> str:
+            time.sleep(0.1)
+            return "done"
+
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        result, _ = await asyncio.gather(block.execute(), ticker())
+
+        assert result.result == "done"
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_process_mode(self) -> None:
+        """Process mode should run module-level functions in a worker process."""
+        pool = ToolWorkerPool(max_processes=1)
+        try:
+            executor = ToolExecutor([square_in_process], worker_pool=pool)
+            result = await executor.execute("square_in_process", x=7)
+        finally:
+            pool.shutdown()
+
+        assert result.success is True
+        assert result.result == 49
+
+    @pytest.mark.asyncio
+    async def test_process_timeout_stops_worker(self) -> None:
+        """A timed-out process call should terminate its worker."""
+        pool = ToolWorkerPool(max_processes=1)
+        try:
+            executor = ToolExecutor([sleep_in_process], worker_pool=pool)
+            warm = await executor.execute("sleep_in_process", seconds=0)
+            timed_out = await executor.execute("sleep_in_process", seconds=30)
+            after = await executor.execute("sleep_in_process", seconds=0)
+        finally:
+            pool.shutdown()
+
+        assert timed_out.success is False
+        assert "timed out" in timed_out.error
+        assert after.success is True
+        assert after.result != warm.result  # fresh worker after recycling
+
+    @pytest.mark.asyncio
+    async def test_async_tool_timeout(self) -> None:
+        """Async tools should be cancelled when they exceed their timeout."""
+        cancelled = False
+
+        @tool(description="Hang", timeout=0.05)
+        async def hang() -> str:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return "never"
+
+        result = await hang.execute()
+
+        assert result.success is False
+        assert "timed out" in result.error
+        assert cancelled is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("timeout", [None, 5.0])
+    async def test_tool_raised_timeout_keeps_message(self, timeout: float | None) -> None:
+        """A TimeoutError raised by the tool itself is not reported as our timeout."""
+        @tool(description="Call upstream", timeout=timeout)
+        async def upstream() -> str:
+            raise asyncio.TimeoutError("upstream took too long")
+
+        @tool(description="Call upstream", timeout=timeout, execution_mode="thread")
+        def upstream_sync() -> str:
+            raise TimeoutError("upstream took too long")
+
+        for t in (upstream, upstream_sync):
+            result = await t.execute()
+            assert result.success is False
+            assert result.error == "upstream took too long"
+
+    def test_process_mode_rejects_async(self) -> None:
+        """Process mode should be rejected for async functions."""
+        async def afunc() -> None:
+            pass
+
+        with pytest.raises(ValueError):
+            Tool(name="a", description="a", func=afunc, execution_mode="process")
+
+    def test_executor_uses_configured_pool(self) -> None:
+        """ToolExecutor should expose its shared worker pool."""
+        pool = ToolWorkerPool(max_threads=2)
+        executor = ToolExecutor(worker_pool=pool)
+
+        assert executor.worker_pool is pool
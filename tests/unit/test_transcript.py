@@ -0,0 +1,157 @@
+"""Unit tests for transcript retention."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentchord.core.agent import Agent
+from agentchord.core.state import WorkflowState
+from agentchord.core.transcript import (
+    FileTranscriptSpool,
+    SQLiteTranscriptSpool,
+    TranscriptPolicy,
+)
+from agentchord.core.types import AgentResult, Message, Usage
+from agentchord.core.workflow import Workflow
+from tests.conftest import MockLLMProvider
+
+
+def create_result(n: int) -> AgentResult:
+    return AgentResult(
+        output="done",
+        messages=[Message.user(f"message {i}") for i in range(n)],
+        usage=Usage(prompt_tokens=1, completion_tokens=1),
+        cost=0.0,
+        duration_ms=1,
+        metadata={"agent_name": "a"},
+    )
+
+
+def create_agent(name: str, **kwargs) -> Agent:
+    return Agent(
+        name=name,
+        role="test",
+        llm_provider=MockLLMProvider(response_content=f"{name} output"),
+        **kwargs,
+    )
+
+
+class TestTranscriptPolicy:
+    """Tests for TranscriptPolicy.apply."""
+
+    async def test_full_keeps_result(self) -> None:
+        result = create_result(5)
+        assert await TranscriptPolicy.full().apply(result) is result
+
+    async def test_last_n(self) -> None:
+        result = create_result(5)
+
+        retained = await TranscriptPolicy.last(2).apply(result)
+
+        assert [m.content for m in retained.messages] == ["message 3", "message 4"]
+        assert retained.metadata["transcript_length"] == 5
+        assert len(result.messages) == 5
+
+    async def test_none(self) -> None:
+        retained = await TranscriptPolicy.none().apply(create_result(5))
+        assert retained.messages == []
+        assert await retained.load_messages() == []
+
+    async def test_spooled_transcript_loads_lazily(self, tmp_path: Path) -> None:
+        spool = FileTranscriptSpool(tmp_path / "spool")
+        result = create_result(4)
+
+        retained = await TranscriptPolicy.none(spool=spool).apply(result)
+
+        assert retained.messages == []
+        assert await retained.load_messages() == result.messages
+
+        # Results restored from JSON load through an explicit spool
+        restored = AgentResult.model_validate_json(retained.model_dump_json())
+        assert await restored.load_messages() == []
+        assert await restored.load_messages(spool) == result.messages
+
+    async def test_spooled_once(self, tmp_path: Path) -> None:
+        spool = FileTranscriptSpool(tmp_path)
+        once = await TranscriptPolicy.last(3, spool=spool).apply(create_result(5))
+        twice = await TranscriptPolicy.last(1, spool=spool).apply(once)
+
+        assert twice.metadata["transcript_id"] == once.metadata["transcript_id"]
+        assert len(twice.messages) == 1
+        assert len(list(tmp_path.iterdir())) == 1
+        assert len(await twice.load_messages()) == 5
+
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            TranscriptPolicy.last(-1)
+
+
+class TestTranscriptSpools:
+    """Tests for the spool backends."""
+
+    async def test_file_spool_round_trip(self, tmp_path: Path) -> None:
+        spool = FileTranscriptSpool(tmp_path)
+        messages = [Message.system("sys"), Message.user("hi")]
+
+        transcript_id = await spool.save(messages)
+
+        assert await spool.load(transcript_id) == messages
+        assert await spool.delete(transcript_id) is True
+        assert await spool.delete(transcript_id) is False
+        with pytest.raises(KeyError):
+            await spool.load(transcript_id)
+
+    async def test_file_spool_rejects_paths(self, tmp_path: Path) -> None:
+        with pytest.raises(KeyError):
+            await FileTranscriptSpool(tmp_path).load("../etc/passwd")
+
+    async def test_sqlite_spool_round_trip(self) -> None:
+        pytest.importorskip("aiosqlite")
+        spool = SQLiteTranscriptSpool()
+        messages = [Message.user("hi"), Message.assistant("hello")]
+        try:
+            transcript_id = await spool.save(messages)
+            assert await spool.load(transcript_id) == messages
+            assert await spool.delete(transcript_id) is True
+            with pytest.raises(KeyError):
+                await spool.load(transcript_id)
+        finally:
+            await spool.close()
+
+
+class TestTranscriptRetention:
+    """Tests for retention on Agent and Workflow."""
+
+    async def test_agent_policy(self) -> None:
+        agent = create_agent("a", transcript=TranscriptPolicy.last(1))
+
+        result = await agent.run("hello")
+
+        assert len(result.messages) == 1
+        assert result.messages[0].content == "a output"
+        assert result.metadata["transcript_length"] > 1
+
+    async def test_workflow_policy_applies_to_history(self, tmp_path: Path) -> None:
+        spool = FileTranscriptSpool(tmp_path)
+        workflow = Workflow(
+            agents=[create_agent("a"), create_agent("b")],
+            flow="a -> b",
+            transcript=TranscriptPolicy.none(spool=spool),
+        )
+
+        result = await workflow.run("go")
+
+        assert result.output == "b output"
+        assert all(r.messages == [] for r in result.agent_results)
+        full = await result.agent_results[1].load_messages()
+        assert full[-1].content == "b output"
+
+    async def test_state_policy_is_carried_over(self) -> None:
+        state = WorkflowState(input="x").with_transcript(TranscriptPolicy.none())
+        state = state.with_output("y")
+
+        state = await state.add_result(create_result(3))
+
+        assert state.history[0].messages == []